@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from inspect import isawaitable
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Callable
 
 from aion.api.control_plane import (
@@ -25,6 +28,28 @@ if TYPE_CHECKING:
 RuntimeContextProvider = Callable[[Any | None], "AionRuntimeContext | None"]
 """Callable that extracts an Aion runtime context from ADK context."""
 
+DEFAULT_MAX_CACHED_TOOLSETS = 64
+"""Default number of ADK MCP toolsets kept open by one Aion toolset."""
+
+DEFAULT_TOOLSET_IDLE_TTL = 900.0
+"""Default seconds an unused ADK MCP toolset stays open."""
+
+
+@dataclass
+class _CachedToolset:
+    """An ADK MCP toolset, the credentials it sends and the runs using it.
+
+    ``users`` counts ``get_tools`` calls and tool calls in progress. A retired
+    toolset - replaced after a credential change, or evicted - is closed when
+    the last of them ends, so closing it never cuts off a concurrent run.
+    """
+
+    toolset: Any
+    credentials: dict[str, str] = field(default_factory=dict)
+    last_used: float = 0.0
+    users: int = 0
+    retired: bool = False
+
 
 def aion_adk_mcp_toolset(
     *,
@@ -37,9 +62,18 @@ def aion_adk_mcp_toolset(
     tool_filter: Any | None = None,
     tool_name_prefix: str | None = None,
     require_confirmation: bool | Callable[..., bool] = False,
+    max_cached_toolsets: int = DEFAULT_MAX_CACHED_TOOLSETS,
+    toolset_idle_ttl: float | None = DEFAULT_TOOLSET_IDLE_TTL,
 ) -> Any:
     """Create a context-aware ADK ``BaseToolset`` for Aion MCP endpoints.
 
+    One ADK ``McpToolset`` is kept per endpoint and principal, sending that
+    principal's current credentials. When they change (a refreshed token), a
+    toolset with the new credentials takes its place. Toolsets beyond
+    ``max_cached_toolsets``, or unused for ``toolset_idle_ttl`` seconds, are
+    dropped. A replaced or dropped toolset is closed once the ``get_tools``
+    calls and tool calls using it have ended.
+
     Args:
         capability_references: Explicit MCP references to load. Use these when
             addressing primary capabilities or subjects derived from runtime
@@ -57,6 +91,10 @@ def aion_adk_mcp_toolset(
         tool_name_prefix: Optional prefix forwarded to ADK's ``McpToolset``.
         require_confirmation: ADK confirmation policy forwarded to
             ``McpToolset``.
+        max_cached_toolsets: Maximum number of ADK MCP toolsets kept open;
+            the least recently used one is closed first.
+        toolset_idle_ttl: Seconds after which an unused ADK MCP toolset is
+            closed, or ``None`` to keep toolsets until evicted by count.
 
     Returns:
         A Google ADK ``BaseToolset`` that resolves Aion MCP tools at runtime.
@@ -73,11 +111,16 @@ def aion_adk_mcp_toolset(
     references = tuple(capability_references)
     runtime_references = tuple(runtime_capability_references)
 
+    if max_cached_toolsets < 1:
+        raise ValueError("max_cached_toolsets must be at least 1")
+
     class AionAdkMcpToolset(BaseToolset):
         """ADK toolset that resolves Aion MCP endpoints per invocation."""
 
         def __init__(self) -> None:
-            self._toolsets: dict[tuple[Any, ...], Any] = {}
+            self._toolsets: OrderedDict[tuple[Any, ...], _CachedToolset] = OrderedDict()
+            # Retired toolsets still in use, closed on their last release.
+            self._retired: dict[int, _CachedToolset] = {}
 
         async def get_tools(self, readonly_context: Any | None = None) -> list[Any]:
             """Return ADK tools available to the current Aion runtime context."""
@@ -92,35 +135,99 @@ def aion_adk_mcp_toolset(
             )
             tools: list[Any] = []
             for endpoint in endpoints:
-                toolset = self._toolset_for(endpoint)
-                result = toolset.get_tools(readonly_context)
-                if isawaitable(result):
-                    result = await result
-                tools.extend(result)
+                entry = await self._toolset_for(endpoint)
+                entry.users += 1
+                try:
+                    result = entry.toolset.get_tools(readonly_context)
+                    if isawaitable(result):
+                        result = await result
+                finally:
+                    await self._release(entry)
+                tools.extend(self._leased(tool, entry) for tool in result)
+            await self._evict()
             return tools
 
         async def close(self) -> None:
             """Close cached ADK MCP toolsets when they expose a close method."""
-            for toolset in self._toolsets.values():
-                close = getattr(toolset, "close", None)
-                if close is None:
-                    continue
-                result = close()
-                if isawaitable(result):
-                    await result
-
-        def _toolset_for(self, endpoint: AionMcpEndpoint) -> Any:
-            key = _endpoint_cache_key(endpoint)
-            toolset = self._toolsets.get(key)
-            if toolset is None:
-                toolset = _adk_mcp_toolset_from_endpoint(
-                    endpoint,
-                    tool_filter=tool_filter,
-                    tool_name_prefix=tool_name_prefix,
-                    require_confirmation=require_confirmation,
+            cached = [*self._toolsets.values(), *self._retired.values()]
+            self._toolsets.clear()
+            self._retired.clear()
+            for entry in cached:
+                await _close_toolset(entry.toolset)
+
+        async def _toolset_for(self, endpoint: AionMcpEndpoint) -> _CachedToolset:
+            key = endpoint.identity
+            credentials = endpoint.credential_headers
+            entry = self._toolsets.get(key)
+            if entry is not None and entry.credentials != credentials:
+                # ADK pools sessions by their headers, so the old credentials'
+                # sessions go with the toolset rather than stay open beside new ones.
+                del self._toolsets[key]
+                await self._retire(entry)
+                entry = None
+            if entry is None:
+                entry = _CachedToolset(
+                    toolset=_adk_mcp_toolset_from_endpoint(
+                        endpoint,
+                        tool_filter=tool_filter,
+                        tool_name_prefix=tool_name_prefix,
+                        require_confirmation=require_confirmation,
+                    ),
+                    credentials=credentials,
                 )
-                self._toolsets[key] = toolset
-            return toolset
+                self._toolsets[key] = entry
+
+            entry.last_used = monotonic()
+            self._toolsets.move_to_end(key)
+            return entry
+
+        def _leased(self, tool: Any, entry: _CachedToolset) -> Any:
+            """Count calls of ``tool`` as uses of the toolset it came from."""
+            run_async = getattr(tool, "run_async", None)
+            if run_async is None:
+                return tool
+
+            async def leased_run_async(*args: Any, **kwargs: Any) -> Any:
+                entry.users += 1
+                try:
+                    return await run_async(*args, **kwargs)
+                finally:
+                    await self._release(entry)
+
+            tool.run_async = leased_run_async
+            return tool
+
+        async def _release(self, entry: _CachedToolset) -> None:
+            entry.users -= 1
+            if entry.retired and entry.users == 0:
+                # A tool called after its toolset was closed reopens a
+                # session, which this closes again when the call ends.
+                self._retired.pop(id(entry), None)
+                await _close_toolset(entry.toolset)
+
+        async def _retire(self, entry: _CachedToolset) -> None:
+            entry.retired = True
+            if entry.users:
+                self._retired[id(entry)] = entry
+            else:
+                await _close_toolset(entry.toolset)
+
+        async def _evict(self) -> None:
+            """Retire toolsets over the size limit or idle past the TTL."""
+            expired: list[_CachedToolset] = []
+            while len(self._toolsets) > max_cached_toolsets:
+                expired.append(self._toolsets.popitem(last=False)[1])
+            if toolset_idle_ttl is not None:
+                cutoff = monotonic() - toolset_idle_ttl
+                # Least recently used first: stop at the first one still in use.
+                while self._toolsets:
+                    key, entry = next(iter(self._toolsets.items()))
+                    if entry.last_used >= cutoff:
+                        break
+                    del self._toolsets[key]
+                    expired.append(entry)
+            for entry in expired:
+                await self._retire(entry)
 
     return AionAdkMcpToolset()
 
@@ -277,6 +384,15 @@ def _endpoints_sync(
     return endpoints
 
 
+async def _close_toolset(toolset: Any) -> None:
+    close = getattr(toolset, "close", None)
+    if close is None:
+        return
+    result = close()
+    if isawaitable(result):
+        await result
+
+
 def _adk_mcp_toolset_from_endpoint(
     endpoint: AionMcpEndpoint,
     *,
@@ -303,15 +419,6 @@ def _adk_mcp_toolset_from_endpoint(
     )
 
 
-def _endpoint_cache_key(endpoint: AionMcpEndpoint) -> tuple[Any, ...]:
-    return (
-        endpoint.name,
-        endpoint.url,
-        endpoint.transport,
-        tuple(sorted(endpoint.headers.items())),
-    )
-
-
 __all__ = [
     "aion_adk_mcp_toolset",
     "aion_adk_mcp_toolsets_sync",
@@ -37,6 +37,18 @@ class FakeSyncTokenManager:
         return "jwt-token"
 
 
+class RotatingTokenManager:
+    """Async token manager that hands out a new token on every call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_token(self) -> str:
+        """Return a token that differs from the previous one."""
+        self.calls += 1
+        return f"jwt-token-{self.calls}"
+
+
 class FakeRuntimeContext:
     """Runtime context carrying an environment principal selector."""
 
@@ -71,7 +83,24 @@ def install_fake_google_adk(monkeypatch):
             self.url = url
             self.headers = headers
 
+    class McpTool:
+        """Fake tool whose calls wait for ``gate`` when one is set."""
+
+        def __init__(self, name, gate):
+            self.name = name
+            self.gate = gate
+
+        async def run_async(self, *, args, tool_context):
+            if self.gate is not None:
+                await self.gate.wait()
+            return {"called": self.name}
+
     class McpToolset:
+        """Fake toolset that pools one session per distinct header set, as ADK does."""
+
+        created: list = []
+        gate = None
+
         def __init__(
             self,
             *,
@@ -79,18 +108,31 @@ def install_fake_google_adk(monkeypatch):
             tool_filter,
             tool_name_prefix,
             require_confirmation,
+            header_provider=None,
         ):
             self.connection_params = connection_params
             self.tool_filter = tool_filter
             self.tool_name_prefix = tool_name_prefix
             self.require_confirmation = require_confirmation
+            self.header_provider = header_provider
+            self.sessions: set = set()
+            self.closed = False
+            McpToolset.created.append(self)
 
         async def get_tools(self, readonly_context=None):
-            return [f"tool:{self.connection_params.url}"]
+            headers = dict(self.connection_params.headers)
+            if self.header_provider and readonly_context:
+                headers.update(self.header_provider(readonly_context))
+            self.sessions.add(tuple(sorted(headers.items())))
+            return [McpTool(f"tool:{self.connection_params.url}", McpToolset.gate)]
 
         async def close(self):
+            self.sessions.clear()
             self.closed = True
 
+    McpToolset.created = []
+    McpToolset.gate = None
+
     base_toolset.BaseToolset = BaseToolset
     session_manager.StreamableHTTPConnectionParams = StreamableHTTPConnectionParams
     mcp_toolset.McpToolset = McpToolset
@@ -112,6 +154,7 @@ def install_fake_google_adk(monkeypatch):
         "google.adk.tools.mcp_tool.mcp_session_manager",
         session_manager,
     )
+    return McpToolset
 
 
 def test_default_adk_runtime_context_reads_state() -> None:
@@ -198,9 +241,150 @@ def test_aion_adk_mcp_toolset_resolves_tools_at_runtime(monkeypatch) -> None:
     )
     tools = asyncio.run(toolset.get_tools(readonly_context))
 
-    assert tools == [
+    assert [tool.name for tool in tools] == [
         "tool:https://api.example.test/mcp/capabilities/mcp.aion.metatools",
         "tool:https://api.example.test/environments/env-id/"
         "mcp/capabilities/mcp.twitter.distribution",
         "tool:https://api.example.test/distributions/distribution-id/mcp",
     ]
+
+
+def test_aion_adk_mcp_toolset_replaces_toolset_on_token_rotation(monkeypatch) -> None:
+    """Verify a refreshed token replaces the toolset and closes the old one."""
+    fake_toolset = install_fake_google_adk(monkeypatch)
+    readonly_context = SimpleNamespace(state={})
+    toolset = aion_adk_mcp_toolset(
+        capability_references=[CapabilityReference.global_mcp()],
+        jwt_manager=RotatingTokenManager(),
+        base_url="https://api.example.test",
+    )
+
+    async def run() -> None:
+        for _ in range(3):
+            await toolset.get_tools(readonly_context)
+
+    asyncio.run(run())
+
+    assert [adk_toolset.closed for adk_toolset in fake_toolset.created] == [True, True, False]
+    assert fake_toolset.created[-1].sessions == {(("Authorization", "Bearer jwt-token-3"),)}
+
+
+def test_aion_adk_mcp_toolset_sends_credentials_without_context(monkeypatch) -> None:
+    """Verify the bearer token is sent when ADK gives no readonly context."""
+    fake_toolset = install_fake_google_adk(monkeypatch)
+    toolset = aion_adk_mcp_toolset(
+        capability_references=[CapabilityReference.global_mcp()],
+        jwt_manager=FakeAsyncTokenManager(),
+        base_url="https://api.example.test",
+    )
+
+    asyncio.run(toolset.get_tools(None))
+
+    (adk_toolset,) = fake_toolset.created
+    assert adk_toolset.sessions == {(("Authorization", "Bearer jwt-token"),)}
+
+
+def test_aion_adk_mcp_toolset_closes_replaced_toolset_after_in_flight_calls(monkeypatch) -> None:
+    """Verify a rotation does not close a toolset a concurrent run is calling."""
+    fake_toolset = install_fake_google_adk(monkeypatch)
+    readonly_context = SimpleNamespace(state={})
+    toolset = aion_adk_mcp_toolset(
+        capability_references=[CapabilityReference.global_mcp()],
+        jwt_manager=RotatingTokenManager(),
+        base_url="https://api.example.test",
+    )
+
+    async def run() -> None:
+        fake_toolset.gate = asyncio.Event()
+        (tool,) = await toolset.get_tools(readonly_context)
+        call = asyncio.create_task(tool.run_async(args={}, tool_context=None))
+        await asyncio.sleep(0)
+
+        await toolset.get_tools(readonly_context)
+        old, new = fake_toolset.created
+        assert not old.closed
+
+        fake_toolset.gate.set()
+        assert await call == {"called": tool.name}
+        assert old.closed and not new.closed
+
+        await toolset.close()
+        assert new.closed
+
+    asyncio.run(run())
+
+
+def test_aion_adk_mcp_toolset_evicts_least_recently_used(monkeypatch) -> None:
+    """Verify principals beyond the cache size close their toolsets."""
+    fake_toolset = install_fake_google_adk(monkeypatch)
+    readonly_context = SimpleNamespace(state={})
+    selected = {}
+    toolset = aion_adk_mcp_toolset(
+        capability_references=[CapabilityReference.global_mcp()],
+        jwt_manager=FakeAsyncTokenManager(),
+        base_url="https://api.example.test",
+        max_cached_toolsets=2,
+    )
+    monkeypatch.setattr(
+        "aion.adk.authoring.mcp.toolsets.aion_mcp_endpoint",
+        _endpoint_for_principal(selected),
+    )
+
+    async def run() -> None:
+        for principal in ("env-1", "env-2", "env-1", "env-3"):
+            selected["principal"] = principal
+            await toolset.get_tools(readonly_context)
+
+    asyncio.run(run())
+
+    assert len(fake_toolset.created) == 3
+    assert [adk_toolset.closed for adk_toolset in fake_toolset.created] == [False, True, False]
+
+    asyncio.run(toolset.close())
+    assert all(adk_toolset.closed for adk_toolset in fake_toolset.created)
+
+
+def test_aion_adk_mcp_toolset_closes_idle_toolsets(monkeypatch) -> None:
+    """Verify toolsets unused past the idle TTL are closed."""
+    fake_toolset = install_fake_google_adk(monkeypatch)
+    readonly_context = SimpleNamespace(state={})
+    selected = {}
+    clock = [1000.0]
+    monkeypatch.setattr("aion.adk.authoring.mcp.toolsets.monotonic", lambda: clock[0])
+    monkeypatch.setattr(
+        "aion.adk.authoring.mcp.toolsets.aion_mcp_endpoint",
+        _endpoint_for_principal(selected),
+    )
+    toolset = aion_adk_mcp_toolset(
+        capability_references=[CapabilityReference.global_mcp()],
+        jwt_manager=FakeAsyncTokenManager(),
+        base_url="https://api.example.test",
+        toolset_idle_ttl=60.0,
+    )
+
+    async def call(principal: str) -> None:
+        selected["principal"] = principal
+        await toolset.get_tools(readonly_context)
+
+    asyncio.run(call("env-1"))
+    clock[0] += 61.0
+    asyncio.run(call("env-2"))
+
+    assert [adk_toolset.closed for adk_toolset in fake_toolset.created] == [True, False]
+
+
+def _endpoint_for_principal(selected: dict):
+    """Build endpoints whose principal header follows ``selected``."""
+    from aion.mcp import AionMcpEndpoint
+
+    async def endpoint(reference, **kwargs):
+        return AionMcpEndpoint(
+            name="aion_metatools",
+            url="https://api.example.test/mcp/capabilities/mcp.aion.metatools",
+            headers={
+                "Authorization": "Bearer jwt-token",
+                "Aion-Principal-Selector": f"aion://agent/environment/{selected['principal']}",
+            },
+        )
+
+    return endpoint
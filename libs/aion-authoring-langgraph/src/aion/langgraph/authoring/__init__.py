@@ -6,12 +6,21 @@ Provides abstractions for building Aion-powered LangGraph agents:
 - Threading: Thread and Message abstractions for agent-side streaming
 - Emission: Helper functions for emitting events (messages, cards, artifacts, reactions)
 - MCP tools: LangGraph-native MCP resolver and client factory
+- Files: content-addressed file references in message state
 """
 
+from .files import (
+    FileContentStore,
+    InMemoryFileContentStore,
+    get_file_content_store,
+    resolve_file_references,
+    set_file_content_store,
+)
 from .handlers import AionEventRouter, create_event_router
 from .mcp import (
     AionLangGraphMcpResolver,
     aion_langgraph_mcp_client,
+    aion_mcp_tool_catalog,
     load_aion_mcp_tools,
 )
 from .models import aion_chat_model, aion_chat_openai
@@ -27,6 +36,7 @@ __all__ = [
     "create_event_router",
     "AionLangGraphMcpResolver",
     "aion_langgraph_mcp_client",
+    "aion_mcp_tool_catalog",
     "aion_chat_model",
     "aion_chat_openai",
     "Message",
@@ -35,4 +45,9 @@ __all__ = [
     "emit_card",
     "emit_message",
     "load_aion_mcp_tools",
+    "FileContentStore",
+    "InMemoryFileContentStore",
+    "get_file_content_store",
+    "resolve_file_references",
+    "set_file_content_store",
 ]
@@ -0,0 +1,180 @@
+"""Content-addressed file references for LangGraph message state.
+
+When the Aion server is configured to keep uploaded files out of graph state,
+inbound file parts reach the graph as file blocks whose ``url`` points into a
+:class:`FileContentStore` (``aion-file://sha256/<digest>``) instead of blocks
+carrying the base64 payload. The bytes are stored once and are not written
+again into every checkpoint of the thread, and they are kept for as long as a
+thread that stored them keeps its checkpoints.
+
+Such references are not understood by model providers. Resolve them right
+before the model call:
+
+    messages = await resolve_file_references(state["messages"])
+    response = await llm.ainvoke(messages)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.messages.content import FileContentBlock, create_file_block
+
+FILE_REFERENCE_PREFIX = "aion-file://sha256/"
+
+
+class FileContentStore(ABC):
+    """Stores file bytes under the SHA-256 digest of their content.
+
+    Storing the same bytes twice keeps one copy, so a file re-sent in a later
+    turn costs nothing more. Contents are stored on behalf of the thread whose
+    state refers to them, and are deleted once no such thread has checkpoints
+    left. Contents only ever stored without a thread are kept.
+    """
+
+    @abstractmethod
+    async def put(self, data: bytes, thread_id: Optional[str] = None) -> str:
+        """Store bytes for a thread and return their hex SHA-256 digest."""
+
+    @abstractmethod
+    async def get(self, digest: str) -> Optional[bytes]:
+        """Return the bytes stored under a digest, or ``None`` when unknown."""
+
+    def release_thread(self, thread_id: str) -> None:
+        """Drop the contents only a thread refers to, once its checkpoints are deleted.
+
+        Stores that find unreferenced contents on their own keep this no-op.
+        """
+
+
+class InMemoryFileContentStore(FileContentStore):
+    """Process-local store. Contents are lost on restart.
+
+    Each content counts the threads that stored it and is deleted when the
+    last of them is released.
+    """
+
+    def __init__(self) -> None:
+        self._contents: dict[str, bytes] = {}
+        # digest -> threads that stored it
+        self._holders: dict[str, set[str]] = {}
+        # thread_id -> digests it stored
+        self._threads: dict[str, set[str]] = {}
+        # digests stored without a thread, never deleted
+        self._pinned: set[str] = set()
+
+    async def put(self, data: bytes, thread_id: Optional[str] = None) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        self._contents.setdefault(digest, data)
+        if thread_id is None:
+            self._pinned.add(digest)
+        else:
+            self._holders.setdefault(digest, set()).add(thread_id)
+            self._threads.setdefault(thread_id, set()).add(digest)
+        return digest
+
+    def release_thread(self, thread_id: str) -> None:
+        for digest in self._threads.pop(thread_id, ()):
+            holders = self._holders[digest]
+            holders.discard(thread_id)
+            if holders:
+                continue
+            del self._holders[digest]
+            if digest not in self._pinned:
+                del self._contents[digest]
+
+    async def get(self, digest: str) -> Optional[bytes]:
+        return self._contents.get(digest)
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+
+_file_content_store: FileContentStore = InMemoryFileContentStore()
+
+
+def get_file_content_store() -> FileContentStore:
+    """Return the store file references of this process resolve against."""
+    return _file_content_store
+
+
+def set_file_content_store(store: FileContentStore) -> None:
+    """Replace the process-wide store; the server does this at startup."""
+    global _file_content_store
+    _file_content_store = store
+
+
+def file_reference_block(digest: str, mime_type: str) -> FileContentBlock:
+    """Build a file block that refers to stored content by digest."""
+    return create_file_block(url=f"{FILE_REFERENCE_PREFIX}{digest}", mime_type=mime_type)
+
+
+def file_reference_digest(block: Any) -> Optional[str]:
+    """Return the digest a content block refers to, or ``None`` for any other block."""
+    if not isinstance(block, dict) or block.get("type") != "file":
+        return None
+    url = block.get("url")
+    if not isinstance(url, str) or not url.startswith(FILE_REFERENCE_PREFIX):
+        return None
+    return url[len(FILE_REFERENCE_PREFIX):]
+
+
+async def resolve_file_references(
+        messages: Sequence[BaseMessage],
+        store: Optional[FileContentStore] = None,
+) -> list[BaseMessage]:
+    """Replace file references with inline base64 blocks for a model call.
+
+    Messages without references are returned as they are; the others are
+    copied, so the graph state itself keeps the references.
+
+    Args:
+        messages: Messages about to be sent to a model.
+        store: Store to read from. Defaults to :func:`get_file_content_store`.
+
+    Returns:
+        The messages, with every reference replaced by its content.
+
+    Raises:
+        LookupError: If a referenced file is not in the store.
+    """
+    store = store or get_file_content_store()
+    cache: dict[str, str] = {}
+    resolved = []
+    for message in messages:
+        content = message.content
+        if isinstance(content, str) or not any(file_reference_digest(block) for block in content):
+            resolved.append(message)
+            continue
+
+        blocks = []
+        for block in content:
+            digest = file_reference_digest(block)
+            if digest is None:
+                blocks.append(block)
+                continue
+            if digest not in cache:
+                data = await store.get(digest)
+                if data is None:
+                    raise LookupError(f"File content {digest} is not in the file content store")
+                cache[digest] = base64.b64encode(data).decode()
+            blocks.append(create_file_block(base64=cache[digest], mime_type=block.get("mime_type")))
+        resolved.append(message.model_copy(update={"content": blocks}))
+    return resolved
+
+
+__all__ = [
+    "FILE_REFERENCE_PREFIX",
+    "FileContentStore",
+    "InMemoryFileContentStore",
+    "file_reference_block",
+    "file_reference_digest",
+    "get_file_content_store",
+    "resolve_file_references",
+    "set_file_content_store",
+]
@@ -2,6 +2,8 @@
 
 from .tools import (
     AionLangGraphMcpResolver,
+    AionMcpToolCatalog,
+    aion_mcp_tool_catalog,
     aion_langgraph_mcp_client,
     aion_langgraph_mcp_server_config,
     aion_langgraph_mcp_server_config_sync,
@@ -10,6 +12,8 @@ from .tools import (
 
 __all__ = [
     "AionLangGraphMcpResolver",
+    "AionMcpToolCatalog",
+    "aion_mcp_tool_catalog",
     "aion_langgraph_mcp_client",
     "aion_langgraph_mcp_server_config",
     "aion_langgraph_mcp_server_config_sync",
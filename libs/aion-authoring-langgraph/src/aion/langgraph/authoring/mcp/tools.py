@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import threading
+from collections import OrderedDict
+from collections.abc import Generator, Iterable
 from dataclasses import dataclass, field
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Callable
 
+import httpx
 from aion.api.control_plane import (
     CapabilityReference,
     PrincipalSelector,
@@ -25,6 +29,147 @@ if TYPE_CHECKING:
 ClientFactory = Callable[[dict[str, dict[str, Any]]], Any]
 """Factory that creates a LangChain MCP client from server config."""
 
+DEFAULT_TOOL_CATALOG_TTL = 300.0
+"""Default seconds a cached MCP tool catalog is served before it is reloaded."""
+
+DEFAULT_MAX_TOOL_CATALOGS = 128
+"""Default number of MCP tool catalogs kept in a catalog cache."""
+
+
+class _CredentialAuth(httpx.Auth):
+    """Adds the current credentials of a cached MCP server to each request.
+
+    Cached tools keep the connection config they were loaded with; the
+    credentials in it are swapped in place whenever the catalog is served
+    again, so tools always call with the latest token.
+    """
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = dict(headers)
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers.update(self.headers)
+        yield request
+
+
+@dataclass
+class _CatalogEntry:
+    """A loaded tool catalog with the client and credential holders behind it."""
+
+    client: Any
+    tools: list[Any]
+    auths: dict[str, _CredentialAuth]
+    expires_at: float | None
+
+
+class AionMcpToolCatalog:
+    """Process-level cache of MCP tool catalogs, keyed by endpoint and principal.
+
+    A catalog is the tool list of one set of endpoints, as loaded by one
+    ``MultiServerMCPClient``. Endpoints are identified by server, URL and
+    principal selector, never by their bearer token: a refreshed token is
+    handed to the cached client's connections instead of causing a reload.
+    Catalogs are reloaded after ``ttl`` seconds, or sooner when invalidated.
+    At most ``max_entries`` catalogs are kept, dropping the least recently
+    used first, and expired catalogs are dropped whenever the cache is read.
+
+    Concurrent misses for the same key may each load the catalog; the last
+    load wins. That costs a redundant ``tools/list`` but never a wrong answer.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = DEFAULT_TOOL_CATALOG_TTL,
+        max_entries: int = DEFAULT_MAX_TOOL_CATALOGS,
+    ) -> None:
+        """Initialize an empty catalog cache.
+
+        Args:
+            ttl: Seconds a catalog is served before it is reloaded, or
+                ``None`` to keep it until invalidated.
+            max_entries: Maximum number of catalogs kept; the least recently
+                used one is dropped to make room for a new one.
+
+        Raises:
+            ValueError: If ``max_entries`` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], _CatalogEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get_tools(
+        self,
+        endpoints: list[AionMcpEndpoint],
+        client_factory: ClientFactory,
+    ) -> list[Any]:
+        """Return the tools of the endpoints, loading them on a miss.
+
+        Args:
+            endpoints: Endpoints whose tools are wanted.
+            client_factory: Factory creating the MCP client on a miss.
+
+        Returns:
+            LangChain-compatible tools of all endpoints.
+        """
+        key = (client_factory, tuple(endpoint.identity for endpoint in endpoints))
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                for endpoint in endpoints:
+                    entry.auths[endpoint.name].headers = endpoint.credential_headers
+                return list(entry.tools)
+
+        auths = {
+            endpoint.name: _CredentialAuth(endpoint.credential_headers)
+            for endpoint in endpoints
+        }
+        client = client_factory(_multi_server_config(endpoints, auths=auths))
+        tools = list(await client.get_tools())
+        expires_at = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = _CatalogEntry(
+                client=client,
+                tools=tools,
+                auths=auths,
+                expires_at=expires_at,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return list(tools)
+
+    def invalidate(self, endpoint: AionMcpEndpoint | None = None) -> None:
+        """Drop cached catalogs so that they are reloaded on next use.
+
+        Args:
+            endpoint: Drop only catalogs including this endpoint's server and
+                principal; drop every catalog when omitted.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            identity = endpoint.identity
+            for key in [key for key in self._entries if identity in key[1]]:
+                del self._entries[key]
+
+    def _purge_expired(self) -> None:
+        """Drop catalogs past their TTL; the caller holds the lock."""
+        if self.ttl is None:
+            return
+        now = monotonic()
+        for key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[key]
+
+
+aion_mcp_tool_catalog = AionMcpToolCatalog()
+"""Tool catalog cache shared by the LangGraph MCP helpers of this process."""
+
 
 @dataclass(frozen=True)
 class AionLangGraphMcpResolver:
@@ -98,6 +243,7 @@ class AionLangGraphMcpResolver:
         context: AionRuntimeContext | None = None,
         *,
         client_factory: ClientFactory | None = None,
+        tool_catalog: AionMcpToolCatalog | None = aion_mcp_tool_catalog,
     ) -> list[Any]:
         """Load LangChain tools from the resolved Aion MCP endpoints.
 
@@ -106,6 +252,8 @@ class AionLangGraphMcpResolver:
                 capability references are configured.
             client_factory: Optional test or customization hook for creating
                 the MCP client.
+            tool_catalog: Catalog cache to serve tools from, or ``None`` to
+                load them from the MCP servers on every call.
 
         Returns:
             LangChain-compatible tools returned by ``MultiServerMCPClient``.
@@ -118,6 +266,7 @@ class AionLangGraphMcpResolver:
             jwt_manager=self.jwt_manager,
             base_url=self.base_url,
             client_factory=client_factory,
+            tool_catalog=tool_catalog,
         )
 
     def client(
@@ -278,9 +427,14 @@ async def load_aion_mcp_tools(
     jwt_manager: Any | None = None,
     base_url: str | None = None,
     client_factory: ClientFactory | None = None,
+    tool_catalog: AionMcpToolCatalog | None = aion_mcp_tool_catalog,
 ) -> list[Any]:
     """Load LangChain tools from Aion MCP endpoints.
 
+    Tools are served from ``tool_catalog`` when it holds them for the same
+    endpoints and principal, so repeated invocations skip the MCP handshake
+    and ``tools/list`` round trip and reuse the same client.
+
     Args:
         context: Optional Aion runtime context. Required when runtime
             capability references are supplied.
@@ -296,11 +450,13 @@ async def load_aion_mcp_tools(
         base_url: Optional Aion API base URL.
         client_factory: Optional test or customization hook for creating the
             MCP client.
+        tool_catalog: Catalog cache to serve tools from, or ``None`` to load
+            them from the MCP servers on every call.
 
     Returns:
         LangChain-compatible tools returned by ``MultiServerMCPClient``.
     """
-    config = await aion_langgraph_mcp_server_config(
+    endpoints = await _endpoints(
         context,
         capability_references=capability_references,
         runtime_capability_references=runtime_capability_references,
@@ -309,7 +465,10 @@ async def load_aion_mcp_tools(
         base_url=base_url,
     )
     factory = client_factory or _default_multi_server_client
-    client = factory(config)
+    if tool_catalog is not None:
+        return await tool_catalog.get_tools(endpoints, factory)
+
+    client = factory(_multi_server_config(endpoints))
     return await client.get_tools()
 
 
@@ -383,10 +542,28 @@ def _endpoints_sync(
 
 def _multi_server_config(
     endpoints: Iterable[AionMcpEndpoint],
+    *,
+    auths: dict[str, httpx.Auth] | None = None,
 ) -> dict[str, dict[str, Any]]:
     config: dict[str, dict[str, Any]] = {}
     for endpoint in endpoints:
-        config.update(endpoint.as_multi_server_config())
+        if auths is None or endpoint.name not in auths:
+            config.update(endpoint.as_multi_server_config())
+            continue
+        # Credentials travel through the auth hook; only identity headers stay.
+        server = endpoint.as_langchain_config()
+        credentials = endpoint.credential_headers
+        headers = {
+            name: value
+            for name, value in endpoint.headers.items()
+            if name not in credentials
+        }
+        if headers:
+            server["headers"] = headers
+        else:
+            server.pop("headers", None)
+        server["auth"] = auths[endpoint.name]
+        config[endpoint.name] = server
     return config
 
 
@@ -402,6 +579,8 @@ def _default_multi_server_client(config: dict[str, dict[str, Any]]) -> Any:
 
 __all__ = [
     "AionLangGraphMcpResolver",
+    "AionMcpToolCatalog",
+    "aion_mcp_tool_catalog",
     "aion_langgraph_mcp_client",
     "aion_langgraph_mcp_server_config",
     "aion_langgraph_mcp_server_config_sync",
@@ -0,0 +1,85 @@
+import base64
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages.content import create_text_block
+
+from aion.langgraph.authoring.files import (
+    InMemoryFileContentStore,
+    file_reference_block,
+    file_reference_digest,
+    get_file_content_store,
+    resolve_file_references,
+    set_file_content_store,
+)
+
+
+class TestInMemoryFileContentStore:
+    async def test_put_is_content_addressed(self):
+        store = InMemoryFileContentStore()
+        first = await store.put(b"same bytes")
+        second = await store.put(b"same bytes")
+
+        assert first == second
+        assert len(store) == 1
+        assert await store.get(first) == b"same bytes"
+        assert await store.get("unknown") is None
+
+    async def test_contents_are_deleted_with_the_last_thread_that_stored_them(self):
+        store = InMemoryFileContentStore()
+        shared = await store.put(b"shared", "a")
+        await store.put(b"shared", "b")
+        own = await store.put(b"own", "a")
+        pinned = await store.put(b"pinned")
+        await store.put(b"pinned", "a")
+
+        store.release_thread("a")
+
+        assert await store.get(own) is None
+        assert await store.get(shared) == b"shared"
+        assert await store.get(pinned) == b"pinned"
+
+        store.release_thread("b")
+        store.release_thread("unknown")
+        assert await store.get(shared) is None
+        assert len(store) == 1
+
+
+class TestResolveFileReferences:
+    async def test_references_are_replaced_with_base64(self):
+        store = InMemoryFileContentStore()
+        digest = await store.put(b"png bytes")
+        message = HumanMessage(content=[create_text_block(text="look"), file_reference_block(digest, "image/png")])
+
+        resolved = await resolve_file_references([message], store)
+
+        block = resolved[0].content[1]
+        assert base64.b64decode(block["base64"]) == b"png bytes"
+        assert block["mime_type"] == "image/png"
+        assert resolved[0].content[0]["text"] == "look"
+        assert file_reference_digest(message.content[1]) == digest
+
+    async def test_messages_without_references_are_returned_unchanged(self):
+        messages = [HumanMessage(content="plain"), AIMessage(content=[create_text_block(text="reply")])]
+
+        resolved = await resolve_file_references(messages, InMemoryFileContentStore())
+
+        assert all(after is before for after, before in zip(resolved, messages))
+
+    async def test_missing_content_raises_lookup_error(self):
+        message = HumanMessage(content=[file_reference_block("0" * 64, "application/pdf")])
+
+        with pytest.raises(LookupError):
+            await resolve_file_references([message], InMemoryFileContentStore())
+
+    async def test_defaults_to_process_wide_store(self):
+        previous = get_file_content_store()
+        store = InMemoryFileContentStore()
+        set_file_content_store(store)
+        try:
+            digest = await store.put(b"data")
+            resolved = await resolve_file_references([HumanMessage(content=[file_reference_block(digest, "text/plain")])])
+        finally:
+            set_file_content_store(previous)
+
+        assert base64.b64decode(resolved[0].content[0]["base64"]) == b"data"
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import httpx
+import pytest
 
 from aion.api.control_plane import (
     AION_PRINCIPAL_SELECTOR_HEADER,
@@ -13,9 +15,11 @@ from aion.api.control_plane import (
     RuntimeCapabilityReference,
 )
 from aion.langgraph.authoring.mcp import (
+    AionMcpToolCatalog,
     aion_langgraph_mcp_server_config_sync,
     load_aion_mcp_tools,
 )
+from aion.mcp import AionMcpEndpoint
 
 
 class FakeAsyncTokenManager:
@@ -34,6 +38,33 @@ class FakeSyncTokenManager:
         return "jwt-token"
 
 
+class RotatingTokenManager:
+    """Async token manager that hands out a new token on every call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_token(self) -> str:
+        """Return a token that differs from the previous one."""
+        self.calls += 1
+        return f"jwt-token-{self.calls}"
+
+
+class CountingClient:
+    """MultiServerMCPClient stand-in counting clients and tool listings."""
+
+    created: list["CountingClient"] = []
+
+    def __init__(self, config):
+        self.config = config
+        self.listings = 0
+        CountingClient.created.append(self)
+
+    async def get_tools(self):
+        self.listings += 1
+        return [f"tool:{name}" for name in self.config]
+
+
 class FakeRuntimeContext:
     """Runtime context carrying an environment principal selector."""
 
@@ -147,3 +178,109 @@ async def test_load_aion_mcp_tools_uses_client_factory() -> None:
 
     assert tools == ["tool-a", "tool-b"]
     assert "aion_metatools" in captured["config"]
+
+
+async def test_tool_catalog_is_reused_across_token_rotations() -> None:
+    """Verify repeated loads list tools once and send the newest token."""
+    CountingClient.created = []
+    catalog = AionMcpToolCatalog()
+    tokens = RotatingTokenManager()
+
+    for _ in range(10):
+        tools = await load_aion_mcp_tools(
+            FakeRuntimeContext(),
+            capability_references=[CapabilityReference.global_mcp()],
+            jwt_manager=tokens,
+            base_url="https://api.example.test",
+            client_factory=CountingClient,
+            tool_catalog=catalog,
+        )
+
+    assert tools == ["tool:aion_metatools"]
+    (client,) = CountingClient.created
+    assert client.listings == 1
+    server = client.config["aion_metatools"]
+    assert "Authorization" not in server["headers"]
+    assert server["headers"][AION_PRINCIPAL_SELECTOR_HEADER] == "aion://agent/environment/env-id"
+
+    request = httpx.Request("POST", server["url"])
+    next(server["auth"].auth_flow(request))
+    assert request.headers["Authorization"] == "Bearer jwt-token-10"
+
+
+async def test_tool_catalog_expires_and_invalidates() -> None:
+    """Verify catalogs reload after their TTL and after invalidation."""
+    CountingClient.created = []
+
+    async def load(catalog: AionMcpToolCatalog) -> None:
+        await load_aion_mcp_tools(
+            None,
+            capability_references=[CapabilityReference.global_mcp()],
+            jwt_manager=FakeAsyncTokenManager(),
+            base_url="https://api.example.test",
+            client_factory=CountingClient,
+            tool_catalog=catalog,
+        )
+
+    expiring = AionMcpToolCatalog(ttl=0)
+    await load(expiring)
+    await load(expiring)
+    assert len(CountingClient.created) == 2
+
+    cached = AionMcpToolCatalog(ttl=None)
+    await load(cached)
+    await load(cached)
+    assert len(CountingClient.created) == 3
+
+    cached.invalidate()
+    await load(cached)
+    assert len(CountingClient.created) == 4
+
+
+async def test_tool_catalog_evicts_least_recently_used() -> None:
+    """Verify the cache is bounded and reading it drops expired catalogs."""
+    CountingClient.created = []
+    catalog = AionMcpToolCatalog(ttl=None, max_entries=2)
+
+    def endpoint(name: str) -> list[AionMcpEndpoint]:
+        return [AionMcpEndpoint(name=name, url=f"https://api.example.test/{name}")]
+
+    await catalog.get_tools(endpoint("a"), CountingClient)
+    await catalog.get_tools(endpoint("b"), CountingClient)
+    await catalog.get_tools(endpoint("a"), CountingClient)
+    await catalog.get_tools(endpoint("c"), CountingClient)
+    assert len(catalog._entries) == 2
+    assert len(CountingClient.created) == 3
+
+    await catalog.get_tools(endpoint("a"), CountingClient)
+    assert len(CountingClient.created) == 3
+    await catalog.get_tools(endpoint("b"), CountingClient)
+    assert len(CountingClient.created) == 4
+
+    expiring = AionMcpToolCatalog(ttl=0)
+    await expiring.get_tools(endpoint("a"), CountingClient)
+    await expiring.get_tools(endpoint("b"), CountingClient)
+    assert len(expiring._entries) == 1
+
+    with pytest.raises(ValueError):
+        AionMcpToolCatalog(max_entries=0)
+
+
+async def test_tool_catalog_can_be_bypassed() -> None:
+    """Verify passing no catalog loads tools with the bearer header inline."""
+    CountingClient.created = []
+
+    for _ in range(2):
+        await load_aion_mcp_tools(
+            None,
+            capability_references=[CapabilityReference.global_mcp()],
+            jwt_manager=FakeAsyncTokenManager(),
+            base_url="https://api.example.test",
+            client_factory=CountingClient,
+            tool_catalog=None,
+        )
+
+    assert len(CountingClient.created) == 2
+    assert CountingClient.created[0].config["aion_metatools"]["headers"] == {
+        "Authorization": "Bearer jwt-token"
+    }
@@ -22,6 +22,8 @@ from .models import (
     A2AManifest,
     A2AOutbox,
     ContextsList,
+    ContextsPage,
+    ContextSummary,
     Conversation,
     ConversationTaskStatus,
 )
@@ -5,6 +5,7 @@ tracking within the Agent-to-Agent (A2A) protocol layer.
 """
 
 import copy
+from datetime import datetime
 from typing import Any, List, Dict, Optional, TYPE_CHECKING
 
 from a2a.types import Message, Artifact, Task, TaskState
@@ -21,6 +22,8 @@ __all__ = [
     "A2AOutbox",
     "Conversation",
     "ContextsList",
+    "ContextsPage",
+    "ContextSummary",
     "ConversationTaskStatus",
     "A2AManifest",
 ]
@@ -112,6 +115,11 @@ class Conversation(A2ABaseModel):
     """
     Current status of the conversation.
     """
+    next_cursor: Optional[str] = None
+    """
+    Message cursor continuing a windowed request in the same direction; absent
+    when the window reached the end of the conversation.
+    """
 
 
 class ContextsList(RootModel[List[str]]):
@@ -119,6 +127,45 @@ class ContextsList(RootModel[List[str]]):
     root: List[str] = Field(description="Ordered list of context identifiers, most recent first.")
 
 
+class ContextSummary(A2ABaseModel):
+    """What is known about a context without loading any of its tasks."""
+
+    context_id: str
+    """
+    Unique identifier for the conversation context.
+    """
+    last_activity: datetime
+    """
+    When a task of the context was last created or updated.
+    """
+    task_count: int
+    """
+    Number of tasks the context holds.
+    """
+    state: ProtobufEnum[TaskState]
+    """
+    State of the context's most recently created task.
+    """
+
+    @field_serializer('state')
+    def serialize_state(self, value: int) -> str:
+        """Serialize the TaskState protobuf enum to its string name."""
+        return TaskState.Name(value)
+
+
+class ContextsPage(A2ABaseModel):
+    """A page of context summaries, most recently active first."""
+
+    contexts: List[ContextSummary] = Field(default_factory=list)
+    """
+    Summaries on this page.
+    """
+    next_cursor: Optional[str] = None
+    """
+    Opaque cursor for the next page; absent on the last page.
+    """
+
+
 class A2AManifest(A2ABaseModel):
     """Data model for root manifest representation.
 
@@ -5,7 +5,7 @@ Defines request parameter structures for GetContext and GetContextsList methods.
 
 from typing import Optional, Dict, Any
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from aion.core.a2a import A2ABaseModel
 
@@ -21,8 +21,27 @@ class GetContextParams(A2ABaseModel):
     context_id: str = Field(..., description="Unique identifier of the conversation context to retrieve.")
     history_length: Optional[int] = Field(default=None, description="Maximum number of recent tasks to return. Defaults to server-defined limit.")
     history_offset: Optional[int] = Field(default=None, description="Number of most-recent messages to skip before returning results. Defaults to 0.")
+    message_limit: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of messages to return. Setting it, before or after answers with a "
+                    "message window instead of the messages of whole tasks.",
+    )
+    before: Optional[str] = Field(default=None, description="Message cursor: return messages older than it.")
+    after: Optional[str] = Field(default=None, description="Message cursor: return messages newer than it.")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
+    @model_validator(mode="after")
+    def _check_window_direction(self) -> "GetContextParams":
+        if self.before is not None and self.after is not None:
+            raise ValueError("'before' and 'after' cannot be combined")
+        return self
+
+    @property
+    def is_windowed(self) -> bool:
+        """Whether the caller asked for a message window."""
+        return self.message_limit is not None or self.before is not None or self.after is not None
+
 
 class GetContextsListParams(A2ABaseModel):
     """Parameters for the GetContexts (list) JSON-RPC method."""
@@ -32,4 +51,19 @@ class GetContextsListParams(A2ABaseModel):
         default=None,
         description="Number of most-recent contexts to skip before returning results. Defaults to 0.",
     )
+    page_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of context summaries per page. Setting it, or cursor, "
+                    "answers with a ContextsPage instead of a list of context ids.",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor.",
+    )
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+
+    @property
+    def is_paged(self) -> bool:
+        """Whether the caller asked for cursor-paged summaries."""
+        return self.page_size is not None or self.cursor is not None
@@ -4,10 +4,10 @@ Defines response structures for successful control-plane method invocations
 (GetContext, GetContextsList).
 """
 
-from typing import Literal
+from typing import Literal, Union
 
 from aion.core.a2a import A2ABaseModel
-from .models import Conversation, ContextsList
+from .models import Conversation, ContextsList, ContextsPage
 
 __all__ = [
     "GetContextSuccessResponse",
@@ -45,7 +45,7 @@ class GetContextsListSuccessResponse(A2ABaseModel):
     """
     Specifies the version of the JSON-RPC protocol. MUST be exactly "2.0".
     """
-    result: ContextsList
+    result: Union[ContextsList, ContextsPage]
     """
-    List of context ids
+    List of context ids, or a page of context summaries when the request was paged
     """
@@ -1,3 +1,4 @@
-"""HTTP utilities — standard response models."""
+"""HTTP utilities — standard response models and conditional-GET helpers."""
 
+from .conditional import *
 from .response import *
@@ -0,0 +1,49 @@
+"""Entity tags and conditional-GET helpers for documents served from memory."""
+
+import hashlib
+from typing import Optional
+
+__all__ = [
+    "compute_etag",
+    "etag_matches",
+]
+
+
+def compute_etag(body: bytes) -> str:
+    """Derive a strong entity tag from a document's bytes.
+
+    The tag is content-addressed, so two processes serving the same bytes hand
+    out the same tag and a client's cached copy survives a restart that changed
+    nothing.
+
+    Args:
+        body: Exact bytes sent as the response body.
+
+    Returns:
+        Quoted entity tag, ready for the ``ETag`` header.
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Report whether an ``If-None-Match`` header names the current entity.
+
+    Comparison is weak (RFC 9110 13.1.2): a ``W/`` prefix on either side is
+    ignored, which is the comparison GET and HEAD are specified to use.
+
+    Args:
+        if_none_match: Raw header value, or None when the client sent none.
+        etag: Entity tag of the document about to be served.
+
+    Returns:
+        True when the client's copy is current and a 304 may be answered.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == current for candidate in candidates)
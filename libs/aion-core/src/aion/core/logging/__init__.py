@@ -1,6 +1,26 @@
 """Logging subsystem — custom log record, logger type, and factory."""
 
-from .base import AionLogger, AionLogRecord
+from .base import (
+    CONTEXT_FIELDS,
+    AionLogger,
+    AionLogRecord,
+    LogRecordContext,
+    attach_context,
+    get_context_field,
+    get_context_fields,
+    get_message,
+)
 from .process import get_process_role, set_process_role
 
-__all__ = ["AionLogger", "AionLogRecord", "get_process_role", "set_process_role"]
+__all__ = [
+    "CONTEXT_FIELDS",
+    "AionLogger",
+    "AionLogRecord",
+    "LogRecordContext",
+    "attach_context",
+    "get_context_field",
+    "get_context_fields",
+    "get_message",
+    "get_process_role",
+    "set_process_role",
+]
@@ -7,16 +7,109 @@ tracing, authentication, and request correlation.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Any, Optional, Protocol
+
+CONTEXT_FIELDS = frozenset({
+    "trace_id",
+    "trace_span_id",
+    "trace_span_name",
+    "trace_parent_span_id",
+    "trace_baggage",
+    "transaction_id",
+    "transaction_name",
+    "http_request_method",
+    "http_request_target",
+    "aion_distribution_id",
+    "aion_version_id",
+    "aion_agent_environment_id",
+    "task_id",
+    "a2a_rpc_method",
+    "a2a_task_status",
+    "agent_trace_baggage",
+})
+"""Names of the context attributes a log record may carry."""
+
+
+_UNSET = object()
+
+_WRITTEN_FIELDS = "_aion_written_fields"
+"""Record attribute naming the context fields getMessage wrote onto the record."""
+
+
+class LogRecordContext(Protocol):
+    """Context captured for a log record, resolving its fields on demand."""
+
+    def get(self, name: str) -> Any:
+        """Return the value of a context field, or None if it has none."""
+        ...
+
+    def resolve(self) -> dict[str, Any]:
+        """Return the context fields by name; a missing one has no value."""
+        ...
+
+
+def get_context_field(record: logging.LogRecord, name: str) -> Any:
+    """Read a context field of any log record.
+
+    A value set on the record itself wins; otherwise the field is resolved
+    from the context captured under ``aion_context``, if any. Works for plain
+    ``LogRecord`` objects too, which records of loggers created before
+    ``AionLogger`` was installed are.
+    """
+    attributes = record.__dict__
+    value = attributes.get(name, _UNSET)
+    if value is not _UNSET:
+        return value
+    context = attributes.get("aion_context")
+    return context.get(name) if context is not None else None
+
+
+def attach_context(record: logging.LogRecord, context: LogRecordContext) -> None:
+    """Capture ``context`` for a record's context fields.
+
+    Fields an earlier formatter had written onto the record before any context
+    was captured are dropped, so they are resolved from ``context`` instead.
+    """
+    attributes = record.__dict__
+    attributes["aion_context"] = context
+    for name in attributes.pop(_WRITTEN_FIELDS, ()):
+        attributes.pop(name, None)
+
+
+def get_message(record: logging.LogRecord) -> str:
+    """Return a record's message without writing its context fields onto it.
+
+    For formatters that read context fields through :func:`get_context_field`
+    and so need none resolved for the message itself.
+    """
+    return logging.LogRecord.getMessage(record)
+
+
+def get_context_fields(record: logging.LogRecord) -> dict[str, Any]:
+    """Read every context field of any log record at once.
+
+    Cheaper than :func:`get_context_field` per field for a formatter that
+    writes all of them. A field missing from the result has no value.
+    """
+    attributes = record.__dict__
+    context = attributes.get("aion_context")
+    fields = context.resolve() if context is not None else {}
+    for name in attributes.keys() & CONTEXT_FIELDS:
+        fields[name] = attributes[name]
+    return fields
 
 
 class AionLogRecord(logging.LogRecord):
     """
     Custom LogRecord for Aion logging.
 
-    Declares all context attributes — initialized to None.
-    Attributes are populated by ServerAionContextFilter (aion-server) before
-    records reach any handler.
+    Declares all context attributes, which read as None until a context is
+    captured. ServerAionContextFilter (aion-server) captures one reference to
+    the current tracing and execution context as ``aion_context`` before
+    records reach any handler; each attribute is resolved from it only when
+    read. ``logging.Formatter`` reads the fields of its format string from
+    the record's ``__dict__`` rather than as attributes, so :meth:`getMessage`,
+    which every formatter calls first, writes the fields onto the record.
 
     Attributes:
         # OpenTelemetry tracing
@@ -63,24 +156,29 @@ class AionLogRecord(logging.LogRecord):
     a2a_task_status: Optional[str]
     agent_trace_baggage: Optional[dict]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.trace_id = None
-        self.trace_span_id = None
-        self.trace_span_name = None
-        self.trace_parent_span_id = None
-        self.trace_baggage = None
-        self.transaction_id = None
-        self.transaction_name = None
-        self.http_request_method = None
-        self.http_request_target = None
-        self.aion_distribution_id = None
-        self.aion_version_id = None
-        self.aion_agent_environment_id = None
-        self.task_id = None
-        self.a2a_rpc_method = None
-        self.a2a_task_status = None
-        self.agent_trace_baggage = None
+    aion_context: Optional[LogRecordContext] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set on the record.
+        if name in CONTEXT_FIELDS:
+            return get_context_field(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def getMessage(self) -> str:
+        """Return the message, first writing the context fields onto the record.
+
+        Fields already set on the record are kept. The rest are resolved from
+        the captured context in one pass, or written as None without one.
+        """
+        attributes = self.__dict__
+        if _WRITTEN_FIELDS not in attributes:
+            names = CONTEXT_FIELDS - attributes.keys()
+            context = attributes.get("aion_context")
+            fields = context.resolve() if context is not None and names else {}
+            for name in names:
+                attributes[name] = fields.get(name)
+            attributes[_WRITTEN_FIELDS] = names
+        return super().getMessage()
 
 
 class AionLogger(logging.Logger):
@@ -102,7 +200,7 @@ class AionLogger(logging.Logger):
         rv = AionLogRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo)
         if extra is not None:
             for key in extra:
-                if (key in ["message", "asctime"]) or (key in rv.__dict__):
+                if (key in ["message", "asctime", "aion_context", _WRITTEN_FIELDS]) or (key in rv.__dict__) or (key in CONTEXT_FIELDS):
                     raise KeyError("Attempt to overwrite %r in AionLogRecord" % key)
                 rv.__dict__[key] = extra[key]
         return rv
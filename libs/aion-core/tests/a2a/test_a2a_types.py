@@ -11,6 +11,7 @@ Focus areas:
     - ConversationTaskStatus: state serialized to string name
     - Conversation: construction, history/artifacts list, JSON round-trip
     - ContextsList: root model, list access
+    - ContextSummary / ContextsPage: state serialized to string name, optional cursor
     - A2AManifest: construction, endpoints dict, JSON serialization
 
   Extensions:
@@ -23,8 +24,9 @@ Focus areas:
                       Distribution, Behavior, Environment, DistributionExtensionV1
 
   Request / Response (aion.shared.types.a2a.request, request_params, response):
-    - GetContextParams: required context_id, optional pagination fields
-    - GetContextsListParams: optional pagination
+    - GetContextParams: required context_id, optional pagination fields and
+    message window (limit plus a before/after cursor)
+    - GetContextsListParams: optional pagination, cursor paging switch
     - GetContextRequest: jsonrpc default, method literal
     - GetContextsListRequest: method literal
     - GetContextSuccessResponse: result is Conversation
@@ -74,6 +76,8 @@ from aion.core.a2a.models import (
     Conversation,
     ConversationTaskStatus,
     ContextsList,
+    ContextsPage,
+    ContextSummary,
 )
 from aion.core.a2a.request import GetContextRequest, GetContextsListRequest
 from aion.core.a2a.request_params import GetContextParams, GetContextsListParams
@@ -289,6 +293,26 @@ class TestContextsList:
         assert data == ["a", "b"]
 
 
+class TestContextsPage:
+    def test_summary_state_serialized_to_name(self):
+        """ContextSummary serializes its state like ConversationTaskStatus does."""
+        summary = ContextSummary(
+            context_id="ctx-1",
+            last_activity="2026-01-01T12:00:00Z",
+            task_count=2,
+            state=TaskState.TASK_STATE_INPUT_REQUIRED,
+        )
+        data = summary.model_dump(mode="json")
+        assert data["state"] == "TASK_STATE_INPUT_REQUIRED"
+        assert data["taskCount"] == 2
+
+    def test_last_page_has_no_cursor(self):
+        """ContextsPage defaults to no summaries and no next cursor."""
+        page = ContextsPage()
+        assert page.contexts == []
+        assert page.next_cursor is None
+
+
 class TestA2AManifest:
     def test_basic_construction(self):
         """A2AManifest with api_version and name has empty endpoints by default."""
@@ -762,6 +786,22 @@ class TestRequestParams:
         with pytest.raises(Exception):
             GetContextParams()
 
+    @pytest.mark.parametrize("kwargs", [{"message_limit": 10}, {"before": "abc"}, {"after": "abc"}])
+    def test_get_context_params_windowed(self, kwargs):
+        """A message limit or a message cursor asks for a message window."""
+        assert GetContextParams(context_id="ctx-1", **kwargs).is_windowed is True
+        assert GetContextParams(context_id="ctx-1").is_windowed is False
+
+    def test_get_context_params_window_has_one_direction(self):
+        """A window reads either before or after a cursor, not both."""
+        with pytest.raises(ValidationError):
+            GetContextParams(context_id="ctx-1", before="a", after="b")
+
+    def test_get_context_params_camel_case_window(self):
+        """Window fields are read from their camelCase names."""
+        p = GetContextParams.model_validate({"contextId": "ctx-1", "messageLimit": 5})
+        assert p.message_limit == 5
+
     def test_get_contexts_list_params_all_optional(self):
         """GetContextsListParams constructed with no args has None pagination fields."""
         p = GetContextsListParams()
@@ -772,6 +812,17 @@ class TestRequestParams:
         """GetContextsListParams stores history_length when provided."""
         p = GetContextsListParams(history_length=20, history_offset=0)
         assert p.history_length == 20
+        assert p.is_paged is False
+
+    @pytest.mark.parametrize("kwargs", [{"page_size": 10}, {"cursor": "abc"}])
+    def test_get_contexts_list_params_paged(self, kwargs):
+        """Naming a page size or a cursor asks for cursor-paged summaries."""
+        assert GetContextsListParams(**kwargs).is_paged is True
+
+    def test_get_contexts_list_params_rejects_empty_pages(self):
+        """A page size must be positive."""
+        with pytest.raises(ValidationError):
+            GetContextsListParams(page_size=0)
 
 
 class TestRequestModels:
@@ -0,0 +1,31 @@
+"""Tests for entity tags and If-None-Match evaluation."""
+
+import pytest
+
+from aion.core.http import compute_etag, etag_matches
+
+
+def test_etag_is_quoted_and_content_addressed():
+    etag = compute_etag(b'{"name": "agent"}')
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == compute_etag(b'{"name": "agent"}')
+    assert etag != compute_etag(b'{"name": "other"}')
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        '"abc"',
+        'W/"abc"',
+        '"zzz", "abc"',
+        "*",
+    ],
+)
+def test_matching_header_allows_not_modified(header):
+    assert etag_matches(header, '"abc"') is True
+
+
+@pytest.mark.parametrize("header", [None, "", '"zzz"', '"ab"'])
+def test_missing_or_stale_header_requires_full_response(header):
+    assert etag_matches(header, '"abc"') is False
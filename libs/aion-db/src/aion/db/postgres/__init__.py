@@ -1,18 +1,20 @@
 from aion.db.postgres.fields import PydanticType, ProtobufType
-from aion.db.postgres.repositories import BaseRepository
-from aion.db.postgres.records import TaskRecord
-from aion.db.postgres.models import TaskRecordModel
+from aion.db.postgres.repositories import BaseRepository, ContextsRepository, TaskLeasesRepository, TasksRepository
+from aion.db.postgres.records import ContextRecord, TaskLeaseRecord, TaskRecord
+from aion.db.postgres.models import ContextRecordModel, TaskLeaseRecordModel, TaskRecordModel
 from aion.db.postgres.utils import convert_pg_url, verify_connection, validate_permissions
-from aion.db.postgres.constants import AION_SCHEMA, TASKS_TABLE
+from aion.db.postgres.constants import AION_SCHEMA, CONTEXTS_TABLE, TASK_LEASES_TABLE, TASKS_TABLE
 from aion.db.postgres.manager import DbManager, db_manager
 from aion.db.postgres.factory import DbFactory
 from aion.db.postgres.migrations import upgrade_to_head
 from aion.db.postgres.types import Pagination
 
 __all__ = [
-    "PydanticType", "ProtobufType", "BaseRepository", "TaskRecord", "TaskRecordModel",
+    "PydanticType", "ProtobufType", "BaseRepository", "ContextsRepository", "TaskLeasesRepository", "TasksRepository",
+    "ContextRecord", "TaskLeaseRecord", "TaskRecord",
+    "ContextRecordModel", "TaskLeaseRecordModel", "TaskRecordModel",
     "convert_pg_url", "verify_connection", "validate_permissions",
-    "AION_SCHEMA", "TASKS_TABLE",
+    "AION_SCHEMA", "CONTEXTS_TABLE", "TASK_LEASES_TABLE", "TASKS_TABLE",
     "DbManager", "db_manager", "DbFactory", "upgrade_to_head",
     "Pagination",
 ]
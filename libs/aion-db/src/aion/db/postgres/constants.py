@@ -3,3 +3,7 @@
 AION_SCHEMA = "aion"
 
 TASKS_TABLE = "tasks"
+
+CONTEXTS_TABLE = "contexts"
+
+TASK_LEASES_TABLE = "task_leases"
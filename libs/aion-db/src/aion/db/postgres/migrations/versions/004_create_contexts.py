@@ -0,0 +1,46 @@
+"""Create contexts table holding each context's head task; backfill it from tasks."""
+import logging
+from alembic import op
+import sqlalchemy as sa
+
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+from aion.db.postgres.constants import CONTEXTS_TABLE, TASKS_TABLE
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    """Create the contexts table and point every existing context at its newest task."""
+    logger.debug("Creating contexts table")
+    op.create_table(
+        CONTEXTS_TABLE,
+        sa.Column("context_id", sa.String(), primary_key=True),
+        sa.Column("head_task_id", sa.Uuid(), nullable=False),
+        sa.Column("head_state", sa.String(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    logger.debug("Backfilling contexts from tasks")
+    op.execute(
+        f"""
+        INSERT INTO {CONTEXTS_TABLE} (context_id, head_task_id, head_state, updated_at)
+        SELECT DISTINCT ON (context_id)
+               context_id, id, COALESCE(status->>'state', 'TASK_STATE_UNSPECIFIED'), updated_at
+        FROM {TASKS_TABLE}
+        ORDER BY context_id, created_at DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the contexts table."""
+    logger.debug("Dropping contexts table")
+    op.drop_table(CONTEXTS_TABLE)
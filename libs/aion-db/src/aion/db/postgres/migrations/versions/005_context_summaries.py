@@ -0,0 +1,57 @@
+"""Add task count and last activity to contexts; index contexts by activity."""
+import logging
+from alembic import op
+import sqlalchemy as sa
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+from aion.db.postgres.constants import CONTEXTS_TABLE, TASKS_TABLE
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    """Add task_count and last_activity_at, backfill them, and index by activity."""
+    logger.debug("Adding task_count and last_activity_at to contexts")
+    op.add_column(CONTEXTS_TABLE, sa.Column("task_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column(
+        CONTEXTS_TABLE,
+        sa.Column(
+            "last_activity_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    logger.debug("Backfilling contexts summaries from tasks")
+    op.execute(
+        f"""
+        UPDATE {CONTEXTS_TABLE} AS c
+        SET task_count = t.task_count, last_activity_at = t.last_activity_at
+        FROM (
+            SELECT context_id, count(*) AS task_count, max(updated_at) AS last_activity_at
+            FROM {TASKS_TABLE}
+            GROUP BY context_id
+        ) AS t
+        WHERE c.context_id = t.context_id
+        """
+    )
+
+    logger.debug("Creating index on contexts(last_activity_at, context_id)")
+    op.create_index(
+        "ix_contexts_last_activity_at_context_id",
+        CONTEXTS_TABLE,
+        ["last_activity_at", "context_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the activity index and the summary columns."""
+    logger.debug("Dropping index ix_contexts_last_activity_at_context_id")
+    op.drop_index("ix_contexts_last_activity_at_context_id", table_name=CONTEXTS_TABLE)
+
+    op.drop_column(CONTEXTS_TABLE, "last_activity_at")
+    op.drop_column(CONTEXTS_TABLE, "task_count")
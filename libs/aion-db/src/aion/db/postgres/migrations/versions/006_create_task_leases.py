@@ -0,0 +1,38 @@
+"""Create task_leases table holding the owner and heartbeat of each executing task."""
+import logging
+from alembic import op
+import sqlalchemy as sa
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+from aion.db.postgres.constants import TASK_LEASES_TABLE
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    """Create the task_leases table and index it by heartbeat."""
+    logger.debug("Creating task_leases table")
+    op.create_table(
+        TASK_LEASES_TABLE,
+        sa.Column("task_id", sa.Uuid(), primary_key=True),
+        sa.Column("owner", sa.String(), nullable=False),
+        sa.Column(
+            "heartbeat_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    logger.debug("Creating index on task_leases(heartbeat_at)")
+    op.create_index("ix_task_leases_heartbeat_at", TASK_LEASES_TABLE, ["heartbeat_at"])
+
+
+def downgrade() -> None:
+    """Drop the task_leases table."""
+    logger.debug("Dropping task_leases table")
+    op.drop_index("ix_task_leases_heartbeat_at", table_name=TASK_LEASES_TABLE)
+    op.drop_table(TASK_LEASES_TABLE)
@@ -0,0 +1,24 @@
+"""Add a token to task_leases naming each acquisition of a lease."""
+import logging
+from alembic import op
+import sqlalchemy as sa
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+from aion.db.postgres.constants import TASK_LEASES_TABLE
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    """Add the token column; existing leases get an empty token."""
+    logger.debug("Adding token to task_leases")
+    op.add_column(TASK_LEASES_TABLE, sa.Column("token", sa.String(), nullable=False, server_default=""))
+
+
+def downgrade() -> None:
+    """Drop the token column."""
+    logger.debug("Dropping token from task_leases")
+    op.drop_column(TASK_LEASES_TABLE, "token")
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import Column, DateTime, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
 from google.protobuf.struct_pb2 import Struct
 
-from .constants import TASKS_TABLE
+from .constants import CONTEXTS_TABLE, TASK_LEASES_TABLE, TASKS_TABLE
 from .fields import ProtobufType
 
 
@@ -22,6 +22,8 @@ except Exception as exc:  # pragma: no cover - explicit failure if missing
 
 __all__ = [
     "BaseModel",
+    "ContextRecordModel",
+    "TaskLeaseRecordModel",
     "TaskRecordModel",
 ]
 
@@ -78,3 +80,85 @@ class TaskRecordModel(BaseModel):
         server_default=func.now(),
         onupdate=func.now(),
         doc="Timestamp of last record update, refreshed automatically on every write.")
+
+
+class ContextRecordModel(BaseModel):
+    """Representation of a row in the ``contexts`` table.
+
+    One row per context, pointing at its most recently created task and
+    summarising the rest. Kept up to date by :class:`~aion.db.postgres.repositories.TasksRepository` in the
+    same transaction as the task write, so reading a context's head never has
+    to touch - or deserialize - the tasks themselves.
+    """
+
+    __tablename__ = CONTEXTS_TABLE
+
+    context_id = Column(
+        String,
+        primary_key=True,
+        doc="A2A context ID.")
+
+    head_task_id = Column(
+        UUID(as_uuid=True),
+        nullable=False,
+        doc="ID of the most recently created task of the context.")
+
+    head_state = Column(
+        String,
+        nullable=False,
+        doc="State of the head task, as the TaskState enum name.")
+
+    task_count = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        doc="Number of tasks the context holds.")
+
+    last_activity_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Timestamp of the last write to any task of the context.")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        doc="Timestamp of the last change to the head, refreshed on every write.")
+
+
+class TaskLeaseRecordModel(BaseModel):
+    """Representation of a row in the ``task_leases`` table.
+
+    One row per task some process is executing, naming that process and when
+    it last confirmed it is still alive. A lease whose heartbeat is older than
+    the lease TTL belongs to a process that died without settling its task.
+    Kept apart from ``tasks`` so that a heartbeat rewrites a few bytes rather
+    than a task row with its history.
+    """
+
+    __tablename__ = TASK_LEASES_TABLE
+
+    task_id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        doc="ID of the leased task. Not a foreign key: a lease may be taken before the task is first saved.")
+
+    owner = Column(
+        String,
+        nullable=False,
+        doc="Identity of the process holding the lease.")
+
+    token = Column(
+        String,
+        nullable=False,
+        server_default="",
+        doc="Names one acquisition of the lease, so a release issued for an earlier one spares it.")
+
+    heartbeat_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        index=True,
+        doc="Database time of the owner's last renewal.")
@@ -10,6 +10,8 @@ from a2a.types import Artifact, Message, Task, TaskStatus
 from google.protobuf.struct_pb2 import Struct
 
 __all__ = [
+    "ContextRecord",
+    "TaskLeaseRecord",
     "TaskRecord",
 ]
 
@@ -58,3 +60,33 @@ class TaskRecord(BaseModel):
             history=self.history,
             metadata=self.task_metadata,
         )
+
+
+class ContextRecord(BaseModel):
+    """Pydantic representation of a row from the ``contexts`` table."""
+
+    context_id: str
+    """A2A context ID."""
+    head_task_id: uuid.UUID
+    """ID of the most recently created task of the context."""
+    head_state: str
+    """State of the head task, as the ``TaskState`` enum name."""
+    task_count: int
+    """Number of tasks the context holds."""
+    last_activity_at: _dt.datetime
+    """Timestamp of the last write to any task of the context."""
+    updated_at: _dt.datetime
+    """Timestamp of the last change to the head."""
+
+
+class TaskLeaseRecord(BaseModel):
+    """Pydantic representation of a row from the ``task_leases`` table."""
+
+    task_id: uuid.UUID
+    """ID of the leased task."""
+    owner: str
+    """Identity of the process holding the lease."""
+    token: str = ""
+    """Names one acquisition of the lease."""
+    heartbeat_at: _dt.datetime
+    """Database time of the owner's last renewal."""
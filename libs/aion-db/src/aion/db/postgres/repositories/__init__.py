@@ -1,2 +1,4 @@
 from .base import BaseRepository
+from .contexts import ContextsRepository
+from .leases import TaskLeasesRepository
 from .tasks import STATUS_TIMESTAMP_SORT_KEY, TasksRepository
@@ -0,0 +1,3 @@
+from .repository import ContextsRepository
+
+__all__ = ["ContextsRepository"]
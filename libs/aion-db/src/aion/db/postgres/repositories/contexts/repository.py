@@ -0,0 +1,207 @@
+"""Context repository implementation."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import uuid
+from typing import List, Optional, Type
+
+from sqlalchemy import case, delete, desc, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aion.db.postgres.models import ContextRecordModel, TaskRecordModel
+from aion.db.postgres.records import ContextRecord
+from aion.db.postgres.repositories.base import BaseRepository
+from aion.db.postgres.types import Pagination
+
+UNSPECIFIED_STATE = "TASK_STATE_UNSPECIFIED"
+
+
+class ContextsRepository(BaseRepository[ContextRecordModel, ContextRecord]):
+    """Repository for the per-context head and summary records.
+
+    Rows are keyed by ``context_id`` rather than a UUID, so the ``*_by_id``
+    helpers of the base class do not apply; use :meth:`find_by_context_id`.
+    Writes are made by :class:`~aion.db.postgres.repositories.TasksRepository`
+    as part of saving or deleting a task.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the repository with an active SQLAlchemy session.
+
+        Args:
+            session: Async SQLAlchemy session used for all database operations.
+        """
+        super().__init__(session)
+
+    @property
+    def model_class(self) -> Type[ContextRecordModel]:
+        """SQLAlchemy ORM model for the contexts table."""
+        return ContextRecordModel
+
+    @property
+    def entity_class(self) -> Type[ContextRecord]:
+        """Pydantic domain entity used as the public return type."""
+        return ContextRecord
+
+    async def find_by_context_id(self, context_id: str) -> Optional[ContextRecord]:
+        """Find the head record of a context.
+
+        Args:
+            context_id: Context to look up.
+
+        Returns:
+            The context's head record, or ``None`` when it holds no tasks.
+        """
+        stmt = select(self.model_class).where(self.model_class.context_id == context_id)
+        return await self._execute_and_convert(stmt)
+
+    async def find_context_ids(self, pagination: Optional[Pagination] = None) -> List[str]:
+        """Find context ids, the one with the most recently created task first.
+
+        This is the order offset paging has always returned - the newest
+        ``created_at`` among a context's tasks - read through the head task,
+        which is that task, instead of grouping the tasks table. Activity
+        order is :meth:`find_page`'s.
+
+        Args:
+            pagination: Offset/limit window over the ordered result.
+
+        Returns:
+            Context ids ordered by their newest task's creation, newest first.
+        """
+        tasks = TaskRecordModel
+        stmt = (
+            select(self.model_class.context_id)
+            .join(tasks, tasks.id == self.model_class.head_task_id)
+            .order_by(desc(tasks.created_at), desc(self.model_class.context_id))
+        )
+        if pagination is not None:
+            stmt = self._apply_pagination(stmt, pagination)
+
+        result = await self._session.execute(stmt)
+        return [row[0] for row in result.fetchall()]
+
+    async def find_page(
+            self,
+            limit: int,
+            after: Optional[tuple[_dt.datetime, str]] = None,
+    ) -> List[ContextRecord]:
+        """Find a page of contexts, most recently active first.
+
+        Keyset pagination over ``(last_activity_at, context_id)``: the page
+        starts strictly after the ``after`` position, so its cost does not
+        grow with how deep into the listing the caller is.
+
+        Args:
+            limit: Maximum number of records to return.
+            after: ``(last_activity_at, context_id)`` of the last record of the
+                previous page, or ``None`` for the first page.
+
+        Returns:
+            Context records in activity order.
+        """
+        stmt = select(self.model_class).order_by(*self._activity_order()).limit(limit)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(self.model_class.last_activity_at, self.model_class.context_id)
+                < tuple_(
+                    literal(after[0], self.model_class.last_activity_at.type),
+                    literal(after[1], self.model_class.context_id.type),
+                )
+            )
+        return await self._execute_and_convert_many(stmt)
+
+    def _activity_order(self):
+        return desc(self.model_class.last_activity_at), desc(self.model_class.context_id)
+
+    async def task_created(self, context_id: str, task_id: uuid.UUID, state: str) -> None:
+        """Make a new task the head of its context, creating the row if needed.
+
+        Args:
+            context_id: Context the task belongs to.
+            task_id: The newly created task.
+            state: The task's state, as the ``TaskState`` enum name.
+        """
+        stmt = insert(self.model_class).values(
+            context_id=context_id,
+            head_task_id=task_id,
+            head_state=state,
+            task_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model_class.context_id],
+            set_={
+                "head_task_id": stmt.excluded.head_task_id,
+                "head_state": stmt.excluded.head_state,
+                "task_count": self.model_class.task_count + 1,
+                "last_activity_at": func.now(),
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def task_updated(self, context_id: str, task_id: uuid.UUID, state: str) -> None:
+        """Record activity on a task, and its new state if it is the head.
+
+        Args:
+            context_id: Context the task belongs to.
+            task_id: The updated task.
+            state: The task's new state, as the ``TaskState`` enum name.
+        """
+        model = self.model_class
+        stmt = (
+            update(model)
+            .where(model.context_id == context_id)
+            .values(
+                head_state=case((model.head_task_id == task_id, state), else_=model.head_state),
+                last_activity_at=func.now(),
+                updated_at=func.now(),
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def task_deleted(self, context_id: str, task_id: uuid.UUID) -> None:
+        """Account for a deleted task, moving the head to the next most recent one.
+
+        Drops the row when the deleted task was the context's last.
+
+        Args:
+            context_id: Context the deleted task belonged to.
+            task_id: The deleted task.
+        """
+        head = await self.find_by_context_id(context_id)
+        if head is None:
+            return
+
+        if head.task_count <= 1:
+            await self._session.execute(
+                delete(self.model_class).where(self.model_class.context_id == context_id)
+            )
+            return
+
+        values = dict(task_count=self.model_class.task_count - 1, updated_at=func.now())
+        if head.head_task_id == task_id:
+            tasks = TaskRecordModel
+            # An unspecified state is omitted from the stored JSON.
+            stmt = (
+                select(tasks.id, func.coalesce(tasks.status["state"].astext, literal(UNSPECIFIED_STATE)))
+                .where(tasks.context_id == context_id)
+                .order_by(desc(tasks.created_at))
+                .limit(1)
+            )
+            result = await self._session.execute(stmt)
+            successor = result.first()
+            if successor is None:
+                await self._session.execute(
+                    delete(self.model_class).where(self.model_class.context_id == context_id)
+                )
+                return
+            values.update(head_task_id=successor[0], head_state=successor[1])
+
+        await self._session.execute(
+            update(self.model_class)
+            .where(self.model_class.context_id == context_id)
+            .values(**values)
+        )
@@ -0,0 +1,3 @@
+from .repository import TaskLeasesRepository
+
+__all__ = ["TaskLeasesRepository"]
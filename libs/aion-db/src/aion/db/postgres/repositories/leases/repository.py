@@ -0,0 +1,165 @@
+"""Task lease repository implementation."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import uuid
+from typing import List, Optional, Type
+
+from sqlalchemy import Interval, delete, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aion.db.postgres.models import TaskLeaseRecordModel
+from aion.db.postgres.records import TaskLeaseRecord
+from aion.db.postgres.repositories.base import BaseRepository
+
+
+class TaskLeasesRepository(BaseRepository[TaskLeaseRecordModel, TaskLeaseRecord]):
+    """Repository for the leases processes hold on the tasks they execute.
+
+    Rows are keyed by ``task_id`` rather than ``id``, so the ``*_by_id``
+    helpers of the base class do not apply. Every timestamp is the database's
+    ``now()``: replicas compare heartbeats written by each other, and their own
+    clocks need not agree.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the repository with an active SQLAlchemy session.
+
+        Args:
+            session: Async SQLAlchemy session used for all database operations.
+        """
+        super().__init__(session)
+
+    @property
+    def model_class(self) -> Type[TaskLeaseRecordModel]:
+        """SQLAlchemy ORM model for the task_leases table."""
+        return TaskLeaseRecordModel
+
+    @property
+    def entity_class(self) -> Type[TaskLeaseRecord]:
+        """Pydantic domain entity used as the public return type."""
+        return TaskLeaseRecord
+
+    async def acquire(self, task_id: uuid.UUID, owner: str) -> str:
+        """Take the lease of a task for ``owner``, replacing any previous holder.
+
+        Args:
+            task_id: Task about to be executed.
+            owner: Identity of the executing process.
+
+        Returns:
+            Token naming this acquisition, for :meth:`release`.
+        """
+        token = uuid.uuid4().hex
+        stmt = insert(self.model_class).values(task_id=task_id, owner=owner, token=token)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model_class.task_id],
+            set_={"owner": stmt.excluded.owner, "token": stmt.excluded.token, "heartbeat_at": func.now()},
+        )
+        await self._session.execute(stmt)
+        return token
+
+    async def renew(self, owner: str) -> List[uuid.UUID]:
+        """Refresh the heartbeat of every lease ``owner`` holds.
+
+        Args:
+            owner: Identity of the renewing process.
+
+        Returns:
+            IDs of the tasks still leased to ``owner``.
+        """
+        model = self.model_class
+        stmt = (
+            update(model)
+            .where(model.owner == owner)
+            .values(heartbeat_at=func.now())
+            .returning(model.task_id)
+        )
+        result = await self._session.execute(stmt)
+        return [row[0] for row in result.fetchall()]
+
+    async def release(
+            self,
+            owner: str,
+            task_ids: List[uuid.UUID],
+            tokens: Optional[List[str]] = None,
+    ) -> None:
+        """Drop leases of ``owner``; leases taken over by another process are kept.
+
+        Args:
+            owner: Identity of the releasing process.
+            task_ids: Tasks whose leases are released.
+            tokens: Tokens returned by :meth:`acquire`, one per task. A lease
+                acquired again since then carries a new token and is kept.
+                Omit to release whatever lease ``owner`` holds.
+        """
+        if not task_ids:
+            return
+
+        model = self.model_class
+        stmt = delete(model).where(model.owner == owner)
+        if tokens is None:
+            stmt = stmt.where(model.task_id.in_(task_ids))
+        else:
+            stmt = stmt.where(tuple_(model.task_id, model.token).in_(list(zip(task_ids, tokens))))
+        await self._session.execute(stmt)
+
+    async def lock_held(self, task_id: uuid.UUID, owner: str) -> bool:
+        """Lock the lease of a task if ``owner`` holds it, until the transaction ends.
+
+        An acquisition by another process waits for the lock, so whatever the
+        transaction writes lands before the task changes hands.
+
+        Args:
+            task_id: Leased task.
+            owner: Identity of the expected holder.
+
+        Returns:
+            Whether ``owner`` holds the lease.
+        """
+        model = self.model_class
+        stmt = (
+            select(model.task_id)
+            .where(model.task_id == task_id)
+            .where(model.owner == owner)
+            .with_for_update()
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def claim_expired(self, owner: str, ttl_seconds: float, limit: int) -> List[uuid.UUID]:
+        """Take over leases whose heartbeat is older than ``ttl_seconds``.
+
+        One statement served by the heartbeat index. Rows another claimer has
+        locked are skipped rather than waited on, so replicas sweeping at the
+        same time split the expired leases between them instead of settling
+        the same task twice. A claimed lease gets a fresh heartbeat, so it is
+        not claimed again while its new owner settles the task.
+
+        Args:
+            owner: Identity of the claiming process.
+            ttl_seconds: Age past which a heartbeat counts as expired.
+            limit: Maximum number of leases to claim.
+
+        Returns:
+            IDs of the claimed tasks, oldest heartbeat first.
+        """
+        model = self.model_class
+        expired = (
+            select(model.task_id)
+            .where(model.heartbeat_at < func.now() - literal(_dt.timedelta(seconds=ttl_seconds), Interval))
+            .order_by(model.heartbeat_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(model)
+            .where(model.task_id.in_(expired))
+            .values(owner=owner, heartbeat_at=func.now())
+            .returning(model.task_id)
+        )
+        result = await self._session.execute(stmt)
+        return [row[0] for row in result.fetchall()]
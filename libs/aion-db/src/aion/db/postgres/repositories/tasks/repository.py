@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-from typing import List, Type, Optional
+import datetime as _dt
+import uuid
+from typing import AsyncIterator, Dict, List, Type, Optional
 
-from sqlalchemy import select, func, asc, desc
+from sqlalchemy import select, func, asc, desc, delete, case, cast, column, literal, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
 try:
-    from a2a.types import Artifact
+    from a2a.types import Artifact, Message, TaskState
 except Exception as exc:
     raise ImportError("The 'a2a-sdk' package is required to use this repository") from exc
 
+from aion.core.a2a import A2AMetadataKey, MessageType
 from aion.db.postgres.records import TaskRecord
 from aion.db.postgres.repositories.base import BaseRepository
+from aion.db.postgres.repositories.contexts import ContextsRepository
+from aion.db.postgres.fields import ProtobufType
 from aion.db.postgres.models import TaskRecordModel
 from aion.db.postgres.types import Pagination, Sorting
 from aion.db.postgres.repositories.tasks.selectors import latest_artifacts, artifacts_by_version, all_versions_by_name
@@ -32,6 +38,12 @@ an absent timestamp means "unknown", not "oldest".
 """
 
 
+MessagePosition = tuple[_dt.datetime, uuid.UUID, int]
+"""Position of a message in a context: its task's creation time and id, and
+the message's 1-based index within the task's history followed by its status
+message, counted before non-conversation messages are filtered out."""
+
+
 class TasksRepository(BaseRepository[TaskRecordModel, TaskRecord]):
     """Repository for Task operations using entities."""
 
@@ -148,7 +160,14 @@ class TasksRepository(BaseRepository[TaskRecordModel, TaskRecord]):
         return [str(row[0]) for row in result.fetchall()]
 
     async def save(self, entity: TaskRecord) -> None:
-        """Save or update a task entity."""
+        """Save or update a task entity.
+
+        The context's record is maintained in the same transaction: a new task
+        becomes the head of its context and adds to its task count, and any
+        write marks the context active, refreshing the head state when the
+        head task is the one written. Every save therefore also writes the
+        context's row, an update of that one row by primary key.
+        """
         stmt = select(self.model_class).where(self.model_class.id == entity.id)
         result = await self._session.execute(stmt)
         existing_model = result.scalar_one_or_none()
@@ -172,6 +191,28 @@ class TasksRepository(BaseRepository[TaskRecordModel, TaskRecord]):
 
         await self._session.flush()
 
+        contexts = ContextsRepository(self._session)
+        state = TaskState.Name(entity.status.state)
+        if existing_model:
+            await contexts.task_updated(entity.context_id, entity.id, state)
+        else:
+            await contexts.task_created(entity.context_id, entity.id, state)
+
+    async def delete_by_id(self, id: uuid.UUID) -> bool:
+        """Delete a task, moving its context's head to the next task if needed."""
+        stmt = (
+            delete(self.model_class)
+            .where(self.model_class.id == id)
+            .returning(self.model_class.context_id)
+        )
+        result = await self._session.execute(stmt)
+        context_id = result.scalar_one_or_none()
+        if context_id is None:
+            return False
+
+        await ContextsRepository(self._session).task_deleted(context_id, id)
+        return True
+
     async def find(
             self,
             task_id: Optional[str] = None,
@@ -215,6 +256,115 @@ class TasksRepository(BaseRepository[TaskRecordModel, TaskRecord]):
         result = await self._session.execute(stmt)
         return [row[0] for row in result.fetchall()]
 
+    async def stream_messages(
+            self,
+            context_id: str,
+            before: Optional[MessagePosition] = None,
+            after: Optional[MessagePosition] = None,
+            limit: Optional[int] = None,
+    ) -> AsyncIterator[tuple[MessagePosition, Message]]:
+        """Stream the conversation messages of a context, one row at a time.
+
+        Each task's history, followed by its status message, is unnested in
+        the database and filtered down to conversation messages there, so
+        events never leave it and only the window's rows are decoded. Tasks
+        without history contribute nothing. Rows come newest first, or oldest
+        first when ``after`` is given so a limited window stays next to its
+        cursor.
+
+        Args:
+            context_id: Context whose messages are wanted.
+            before: Only messages older than this position.
+            after: Only messages newer than this position.
+            limit: Maximum number of messages.
+
+        Yields:
+            Each message with its position.
+        """
+        tasks = self.model_class
+        empty = cast(literal("[]"), JSONB)
+        status_message = case(
+            (tasks.status["message"].isnot(None), func.jsonb_build_array(tasks.status["message"])),
+            else_=empty,
+        )
+        conversation = case(
+            (func.jsonb_array_length(func.coalesce(tasks.history, empty)) > 0,
+             tasks.history.op("||")(status_message)),
+            else_=empty,
+        )
+        elements = (
+            func.jsonb_array_elements(conversation)
+            .table_valued(column("value", ProtobufType(Message)), with_ordinality="ordinality")
+            .lateral("message")
+        )
+        # Only untyped messages and messages typed "message" are conversation.
+        message_type = elements.c.value["metadata"][A2AMetadataKey.MESSAGE_TYPE.value].astext
+        position = tuple_(tasks.created_at, tasks.id, elements.c.ordinality)
+
+        stmt = (
+            select(tasks.created_at, tasks.id, elements.c.ordinality, elements.c.value)
+            .select_from(tasks)
+            .join(elements, literal(True))
+            .where(tasks.context_id == context_id)
+            .where((message_type.is_(None)) | (message_type == MessageType.MESSAGE.value))
+        )
+        if before is not None:
+            stmt = stmt.where(position < self._position_literal(before))
+        if after is not None:
+            stmt = stmt.where(position > self._position_literal(after))
+
+        order = asc if after is not None else desc
+        stmt = stmt.order_by(order(tasks.created_at), order(tasks.id), order(elements.c.ordinality))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self._session.stream(stmt)
+        async for created_at, task_id, ordinality, message in result:
+            yield (created_at, task_id, ordinality), message
+
+    def _position_literal(self, position: MessagePosition):
+        created_at, task_id, ordinality = position
+        return tuple_(
+            literal(created_at, self.model_class.created_at.type),
+            literal(task_id, self.model_class.id.type),
+            literal(ordinality),
+        )
+
+    async def find_by_ids(self, task_ids: List[uuid.UUID]) -> List[TaskRecord]:
+        """Find the tasks with the given IDs in one query.
+
+        Args:
+            task_ids: Tasks wanted.
+
+        Returns:
+            The tasks found, in no particular order; unknown IDs are omitted.
+        """
+        if not task_ids:
+            return []
+
+        stmt = select(self.model_class).where(self.model_class.id.in_(task_ids))
+        return await self._execute_and_convert_many(stmt)
+
+    async def find_task_artifacts(self, task_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[Artifact]]:
+        """Find the artifacts of the given tasks without loading anything else of them.
+
+        Args:
+            task_ids: Tasks whose artifacts are wanted.
+
+        Returns:
+            Each task's artifacts by task id; tasks without artifacts are omitted.
+        """
+        if not task_ids:
+            return {}
+
+        stmt = (
+            select(self.model_class.id, self.model_class.artifacts)
+            .where(self.model_class.id.in_(task_ids))
+            .where(self.model_class.artifacts.isnot(None))
+        )
+        result = await self._session.execute(stmt)
+        return {task_id: artifacts for task_id, artifacts in result.fetchall()}
+
     async def find_artifacts(
             self,
             task_id: Optional[str] = None,
@@ -36,6 +36,10 @@ class SyncTokenManager(Protocol):
         """Return a current Aion bearer token, if authentication succeeds."""
 
 
+CREDENTIAL_HEADERS = frozenset({"authorization"})
+"""Lower-cased names of headers that carry rotating credentials rather than identity."""
+
+
 @dataclass(frozen=True)
 class AionMcpEndpoint:
     """Connection information for an Aion remote MCP server.
@@ -73,6 +77,37 @@ class AionMcpEndpoint:
             config["headers"] = dict(self.headers)
         return config
 
+    @property
+    def credential_headers(self) -> dict[str, str]:
+        """Headers carrying credentials, such as the bearer token.
+
+        These change whenever a token is refreshed, so they should be supplied
+        per request rather than baked into long-lived MCP clients.
+        """
+        return {
+            name: value
+            for name, value in self.headers.items()
+            if name.lower() in CREDENTIAL_HEADERS
+        }
+
+    @property
+    def identity(self) -> tuple[Any, ...]:
+        """Hashable identity of the server and principal this endpoint addresses.
+
+        Two endpoints with the same identity differ at most in their
+        credentials, so one MCP client can serve both.
+        """
+        return (
+            self.name,
+            self.url,
+            self.transport,
+            tuple(sorted(
+                (name, value)
+                for name, value in self.headers.items()
+                if name.lower() not in CREDENTIAL_HEADERS
+            )),
+        )
+
     def as_multi_server_config(self) -> dict[str, dict[str, Any]]:
         """Return this endpoint keyed by :attr:`name` for MCP clients.
 
@@ -83,6 +83,23 @@ def test_endpoint_returns_langchain_multi_server_config() -> None:
     }
 
 
+def test_endpoint_identity_ignores_rotating_credentials() -> None:
+    def endpoint(token: str, principal: str) -> AionMcpEndpoint:
+        return AionMcpEndpoint(
+            name="aion_metatools",
+            url="https://api.example.com/mcp/capabilities/mcp.aion.metatools",
+            headers={"Authorization": f"Bearer {token}", "Aion-Principal-Selector": principal},
+        )
+
+    first = endpoint("token-1", "aion://agent/environment/env-1")
+    rotated = endpoint("token-2", "aion://agent/environment/env-1")
+    other_principal = endpoint("token-1", "aion://agent/environment/env-2")
+
+    assert first.identity == rotated.identity
+    assert first.identity != other_principal.identity
+    assert rotated.credential_headers == {"Authorization": "Bearer token-2"}
+
+
 def test_authorization_headers_require_a_token() -> None:
     with pytest.raises(AionAuthenticationError):
         aion_mcp_authorization_headers(None)
@@ -1,4 +1,5 @@
 """CLI command for serving AION agents and proxy"""
+import asyncio
 import logging
 import asyncclick as click
 from aion.core.config.reader import ConfigurationError, AionConfigReader
@@ -114,11 +115,15 @@ async def serve(
     setup_root_logger()
 
     from aion.cli.handlers.serve import ServeHandler
+    from aion.server.utils.timing import StartupTimer
 
     try:
-        # Load configuration
-        reader = AionConfigReader()
-        config = reader.load_and_validate_config()
+        # Load configuration once, off the event loop; agents receive their
+        # validated section rather than reading the file again
+        timer = StartupTimer()
+        with timer.phase("config"):
+            reader = AionConfigReader()
+            config = await asyncio.to_thread(reader.load_and_validate_config)
 
         if not config.agents:
             raise ConfigurationError(
@@ -141,7 +146,8 @@ async def serve(
             port_range_end=strategy.port_range_end,
             proxy_port_search_start=strategy.proxy_port_search_start,
             proxy_port_search_end=strategy.proxy_port_search_end,
-            startup_timeout=startup_timeout
+            startup_timeout=startup_timeout,
+            startup_timer=timer
         )
 
     except Exception as ex:
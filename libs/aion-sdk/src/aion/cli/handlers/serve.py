@@ -9,8 +9,10 @@ from aion.api.http import aion_jwt_manager
 from aion.core.config import AionConfig
 from aion.core.settings import api_settings
 from aion.server import services as aion_services
+from aion.proxy.constants import PLATFORM_LINK_STATE_MESSAGE
 from aion.server.core.platform import AionWebSocketManager, WebsocketTransportFactory
 from aion.server.utils.processes import ProcessManager
+from aion.server.utils.timing import StartupTimer
 
 from aion.cli.services import (
     EnvironmentContext,
@@ -103,7 +105,8 @@ class ServeHandler:
             port_range_end: int = 9000,
             proxy_port_search_start: int = 8000,
             proxy_port_search_end: int = 8100,
-            startup_timeout: int = 30
+            startup_timeout: int = 30,
+            startup_timer: Optional[StartupTimer] = None
     ) -> None:
         """
         Complete lifecycle: startup, broadcast config, monitor, and shutdown.
@@ -118,6 +121,8 @@ class ServeHandler:
             proxy_port_search_start: Starting port for proxy search if auto-finding
             proxy_port_search_end: Ending port for proxy search if auto-finding
             startup_timeout: Timeout in seconds for startup confirmation (0 to skip)
+            startup_timer: Timer already holding earlier phases, such as
+                configuration loading; the startup report continues it
         """
         try:
             self._setup_signal_handlers()
@@ -130,7 +135,8 @@ class ServeHandler:
                 port_range_end=port_range_end,
                 proxy_port_search_start=proxy_port_search_start,
                 proxy_port_search_end=proxy_port_search_end,
-                startup_timeout=startup_timeout
+                startup_timeout=startup_timeout,
+                startup_timer=startup_timer
             )
 
             # Exit if no agents started successfully
@@ -193,11 +199,18 @@ class ServeHandler:
                 ws_url=api_settings.ws_gql_url,
                 auth_manager=aion_services.AionAuthManagerService(
                     jwt_manager=aion_jwt_manager),
-            )
+            ),
+            on_state_change=self._report_platform_link_state,
         )
         await aion_services.AionWebSocketService(
             websocket_manager=self._websocket_manager).start_connection()
 
+    def _report_platform_link_state(self, state: dict) -> None:
+        """Pass the platform connection state to the proxy, which serves it as metrics."""
+        if self.process_manager is not None and self.proxy_started:
+            self.process_manager.send_to_process(
+                "proxy", {"type": PLATFORM_LINK_STATE_MESSAGE, "state": state})
+
     async def _stop_platform_link(self) -> None:
         """Close the platform connection, dropping a registration still in flight."""
         task, self._platform_link_task = self._platform_link_task, None
@@ -219,7 +232,8 @@ class ServeHandler:
             port_range_end: int = 9000,
             proxy_port_search_start: int = 8000,
             proxy_port_search_end: int = 8100,
-            startup_timeout: int = 30
+            startup_timeout: int = 30,
+            startup_timer: Optional[StartupTimer] = None
     ) -> tuple[list[str], list[str], bool]:
         """
         Start all configured agents and proxy server with dynamic port allocation.
@@ -232,15 +246,19 @@ class ServeHandler:
             proxy_port_search_start: Starting port for proxy search if auto-finding
             proxy_port_search_end: Ending port for proxy search if auto-finding
             startup_timeout: Timeout in seconds for startup confirmation (0 to skip)
+            startup_timer: Timer to record the startup phases in; the report is
+                logged once the agents and proxy are up
 
         Returns:
             tuple: (successful_agents, failed_agents, proxy_started)
         """
         # Store config for later use
         self.config = config
+        timer = startup_timer or StartupTimer()
 
         # Prepare environment BEFORE starting agents
-        self.env_context = env_context = await ServeEnvironmentPreparerService().execute()
+        with timer.phase("environment"):
+            self.env_context = env_context = await ServeEnvironmentPreparerService().execute()
         # The API host belongs on this line: the same credentials fail against one
         # environment and succeed against another, and nothing else in the startup
         # log says which one was targeted.
@@ -296,13 +314,15 @@ class ServeHandler:
         # Initialize process manager
         self.process_manager = ProcessManager()
 
-        # Start all configured agents with reserved ports
-        self.successful_agents, self.failed_agents = await ServeAgentStartupService().execute(
-            config=config,
-            process_manager=self.process_manager,
-            port_manager=self.port_manager,
-            startup_timeout=startup_timeout
-        )
+        # Start all configured agents with reserved ports. Each agent imports
+        # its module in its own process, so the imports run in parallel.
+        with timer.phase("agents"):
+            self.successful_agents, self.failed_agents = await ServeAgentStartupService().execute(
+                config=config,
+                process_manager=self.process_manager,
+                port_manager=self.port_manager,
+                startup_timeout=startup_timeout
+            )
 
         # Report agent startup results
         if self.failed_agents:
@@ -323,16 +343,19 @@ class ServeHandler:
                     agent_url = f"http://0.0.0.0:{agent_port}"
                     agents[agent_id] = agent_url
 
-            self.proxy_started = await ServeProxyStartupService().execute(
-                port=proxy_port,
-                agents=agents,
-                process_manager=self.process_manager,
-                port_manager=self.port_manager,
-                startup_timeout=startup_timeout
-            )
+            with timer.phase("proxy"):
+                self.proxy_started = await ServeProxyStartupService().execute(
+                    port=proxy_port,
+                    agents=agents,
+                    process_manager=self.process_manager,
+                    port_manager=self.port_manager,
+                    startup_timeout=startup_timeout
+                )
             if not self.proxy_started:
                 logger.error("Failed to start proxy server")
 
+        logger.info("Startup of %d agents: %s", len(self.successful_agents), timer.report())
+
         # Print welcome message after successful startup
         try:
             print(generate_welcome_message(port_manager=self.port_manager))
@@ -172,8 +172,9 @@ class ServeAgentStartupService(BaseExecuteService):
             signal.signal(signal.SIGINT, signal.SIG_DFL)
             signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
-            # Create new event loop for this process
-            loop = asyncio.new_event_loop()
+            # Create new event loop for this process, as SERVER_LOOP selects
+            from aion.server.utils.serving import new_event_loop
+            loop = new_event_loop()
             asyncio.set_event_loop(loop)
 
             try:
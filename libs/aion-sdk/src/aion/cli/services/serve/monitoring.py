@@ -1,7 +1,9 @@
 """Service for monitoring and restarting AION processes"""
 import asyncio
+from typing import Dict, Optional
 
 from aion.core.config import AionConfig
+from aion.proxy.constants import AGENT_RESTARTED_MESSAGE
 from aion.server.services import BaseExecuteService
 from aion.server.utils.processes import ProcessManager
 
@@ -11,7 +13,9 @@ class ServeMonitoringService(BaseExecuteService):
     Service for monitoring running AION serve processes and handling restarts.
 
     This service continuously monitors agent and proxy processes,
-    cleaning up dead processes and restarting the proxy if needed.
+    cleaning up dead processes and restarting the proxy if needed. It also
+    tells the proxy whenever an agent process stops or is replaced, so the
+    proxy drops the agent documents it has cached.
     """
 
     async def execute(
@@ -31,6 +35,10 @@ class ServeMonitoringService(BaseExecuteService):
             process_manager: ProcessManager instance
         """
         proxy_alive = proxy_started
+        agent_pids = {
+            agent_id: self._agent_pid(process_manager, agent_id)
+            for agent_id in successful_agents
+        }
 
         try:
             while True:
@@ -40,6 +48,9 @@ class ServeMonitoringService(BaseExecuteService):
                 # Clean up any dead processes
                 process_manager.cleanup_dead_processes()
 
+                if proxy_alive:
+                    self._notify_agent_restarts(agent_pids, process_manager)
+
                 # Check if all agents are still alive
                 alive_count = sum(
                     1
@@ -71,6 +82,42 @@ class ServeMonitoringService(BaseExecuteService):
         except KeyboardInterrupt:
             self.logger.debug("Received shutdown signal...")
 
+    @staticmethod
+    def _agent_pid(process_manager: ProcessManager, agent_id: str) -> Optional[int]:
+        """Return the pid of a live agent process, or None when it is gone."""
+        process_info = process_manager.get_process_info(agent_id)
+        if process_info is None or not process_info.process.is_alive():
+            return None
+        return process_info.pid
+
+    def _notify_agent_restarts(
+        self,
+        agent_pids: Dict[str, Optional[int]],
+        process_manager: ProcessManager,
+    ) -> None:
+        """
+        Tell the proxy about every agent whose process changed since last check.
+
+        An agent that stopped or came back under a new pid may serve a
+        different card or schema, so the proxy must not keep answering with
+        the documents the previous process served.
+
+        Args:
+            agent_pids: Last seen pid per agent, updated in place
+            process_manager: ProcessManager instance
+        """
+        for agent_id, last_pid in agent_pids.items():
+            pid = self._agent_pid(process_manager, agent_id)
+            if pid == last_pid:
+                continue
+
+            agent_pids[agent_id] = pid
+            self.logger.debug(f"Agent '{agent_id}' process changed ({last_pid} -> {pid})")
+            process_manager.send_to_process(
+                "proxy",
+                {"type": AGENT_RESTARTED_MESSAGE, "agent_id": agent_id},
+            )
+
     @staticmethod
     async def _restart_proxy(config: AionConfig, process_manager: ProcessManager) -> bool:
         """
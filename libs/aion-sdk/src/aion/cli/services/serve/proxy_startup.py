@@ -130,14 +130,16 @@ class ServeProxyStartupService(BaseExecuteService):
             signal.signal(signal.SIGINT, signal.SIG_DFL)
             signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
-            # Create new event loop for this process
-            loop = asyncio.new_event_loop()
+            # Create new event loop for this process, as SERVER_LOOP selects
+            from aion.server.utils.serving import new_event_loop
+            loop = new_event_loop()
             asyncio.set_event_loop(loop)
 
             # Create proxy server with startup callback
             proxy_server = AionAgentProxyServer(
                 agents=agents,
-                startup_callback=lambda: ServeProxyStartupService._send_startup_event(conn)
+                startup_callback=lambda: ServeProxyStartupService._send_startup_event(conn),
+                control_conn=conn,
             )
 
             try:
@@ -17,7 +17,7 @@ def platform(monkeypatch):
             return record["registered"]
 
     class FakeManager:
-        def __init__(self, ws_transport_factory):
+        def __init__(self, ws_transport_factory, on_state_change=None):
             record["managers"] += 1
 
     class FakeWebSocketService:
@@ -113,3 +113,23 @@ async def test_shutdown_drops_a_registration_still_retrying(platform):
 
     assert handler._platform_link_task is None
     assert platform["started"] == []
+
+
+def test_connection_state_is_passed_to_the_proxy():
+    """The proxy serves the deployment's metrics, the platform link among them."""
+    sent = []
+
+    class FakeProcessManager:
+        def send_to_process(self, key, message):
+            sent.append((key, message))
+
+    handler = serve.ServeHandler()
+    handler._report_platform_link_state({"status": "connected", "reconnects": 0, "lastError": None})
+    handler.process_manager = FakeProcessManager()
+    handler.proxy_started = True
+    handler._report_platform_link_state({"status": "connected", "reconnects": 1, "lastError": None})
+
+    assert sent == [("proxy", {
+        "type": serve.PLATFORM_LINK_STATE_MESSAGE,
+        "state": {"status": "connected", "reconnects": 1, "lastError": None},
+    })]
@@ -0,0 +1,64 @@
+"""Tests for how ``aion serve`` tells the proxy that an agent was replaced.
+
+The proxy caches documents an agent serves for as long as that agent's process
+lives. The supervisor is the only party that sees processes come and go, so a
+missed notification leaves the proxy serving a previous process's card.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("aion.proxy")
+
+from aion.cli.services.serve.monitoring import ServeMonitoringService
+from aion.proxy.constants import AGENT_RESTARTED_MESSAGE
+
+
+def _process(pid: int, alive: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(pid=pid, process=MagicMock(is_alive=MagicMock(return_value=alive)))
+
+
+@pytest.fixture
+def process_manager():
+    manager = MagicMock()
+    manager.processes = {"a": _process(100), "b": _process(200)}
+    manager.get_process_info.side_effect = lambda key: manager.processes.get(key)
+    return manager
+
+
+def test_unchanged_agents_send_nothing(process_manager):
+    pids = {"a": 100, "b": 200}
+
+    ServeMonitoringService()._notify_agent_restarts(pids, process_manager)
+
+    process_manager.send_to_process.assert_not_called()
+
+
+def test_a_new_pid_is_reported_once(process_manager):
+    pids = {"a": 100, "b": 200}
+    process_manager.processes["a"] = _process(101)
+    service = ServeMonitoringService()
+
+    service._notify_agent_restarts(pids, process_manager)
+    service._notify_agent_restarts(pids, process_manager)
+
+    process_manager.send_to_process.assert_called_once_with(
+        "proxy", {"type": AGENT_RESTARTED_MESSAGE, "agent_id": "a"}
+    )
+    assert pids["a"] == 101
+
+
+def test_a_stopped_agent_is_reported(process_manager):
+    pids = {"a": 100, "b": 200}
+    del process_manager.processes["b"]
+
+    ServeMonitoringService()._notify_agent_restarts(pids, process_manager)
+
+    process_manager.send_to_process.assert_called_once_with(
+        "proxy", {"type": AGENT_RESTARTED_MESSAGE, "agent_id": "b"}
+    )
+    assert pids["b"] is None
@@ -17,13 +17,14 @@ from aion.core.config.models import AgentConfig
 from google.adk.artifacts import BaseArtifactService
 from google.adk.events import Event
 from google.adk.sessions import Session, BaseSessionService
+from google.adk.sessions.base_session_service import GetSessionConfig
 
 from aion.adk.server.invocation import AionInvocationContextFactory
 from aion.adk.server.artifacts import ArtifactServiceFactory
 from aion.adk.server.constants import DEFAULT_USER_ID
 from aion.server.files.storage import FileUploadManager
 from aion.adk.server.session import SessionServiceFactory
-from aion.adk.server.state.converter import StateConverter
+from aion.adk.server.state import SessionMessageCache, SessionMessages, StateConverter
 from aion.adk.server.transformers.a2a_to_adk import ADKTransformer
 from aion.server.a2a.utils import empty_input_warning, extract_input_preview
 from .event_converter import ADKToA2AEventConverter
@@ -49,6 +50,7 @@ class ADKExecutor(ExecutorAdapter):
             artifact_service: Optional[BaseArtifactService] = None,
             result_handler: Optional[ADKExecutionResultHandler] = None,
             file_uploader: Optional[FileUploadManager] = None,
+            message_cache: Optional[SessionMessageCache] = None,
     ):
         self.agent = agent
         self.config = config
@@ -57,6 +59,7 @@ class ADKExecutor(ExecutorAdapter):
         self._result_handler = result_handler or ADKExecutionResultHandler()
         self._file_uploader = file_uploader
         self._state_converter = StateConverter()
+        self._message_cache = message_cache if message_cache is not None else SessionMessageCache()
         self._invocation_context_factory = AionInvocationContextFactory(
             agent=agent,
             session_service=self._session_service,
@@ -147,8 +150,14 @@ class ADKExecutor(ExecutorAdapter):
     async def get_state(self, config: ExecutionConfig) -> ExecutionSnapshot:
         """Retrieve the current execution state snapshot from ADK session.
 
+        Messages converted by earlier reads are cached per session, so a read
+        fetches and converts only the events appended since the previous one.
+        With ``config.message_limit`` set, only the newest messages are
+        returned, and a session not yet cached is read from its newest events
+        instead of in full.
+
         Args:
-            config: Execution configuration with context_id
+            config: Execution configuration with context_id and optional message_limit
 
         Returns:
             ExecutionSnapshot: Unified execution snapshot with state and messages
@@ -163,18 +172,14 @@ class ADKExecutor(ExecutorAdapter):
         try:
             logger.debug(f"Getting ADK state for context: {config.context_id}")
 
-            session = await self._session_service.get_session(
-                app_name=self._get_app_name(),
-                user_id=self._get_user_id(),
-                session_id=config.context_id,
-            )
+            session, messages = await self._read_session(config.context_id, config.message_limit)
 
             if not session:
                 raise StateRetrievalError(
                     f"Session not found: {config.context_id}"
                 )
 
-            execution_state = self._state_converter.from_adk_session(session)
+            execution_state = self._state_converter.from_adk_session(session, messages=messages)
             logger.debug(
                 f"State retrieved: {len(execution_state.messages)} messages, "
                 f"{len(execution_state.state)} state keys"
@@ -185,6 +190,62 @@ class ADKExecutor(ExecutorAdapter):
             logger.error(f"Failed to get ADK state: {e}")
             raise StateRetrievalError(f"Failed to retrieve state: {e}") from e
 
+    async def _read_session(
+            self,
+            session_id: str,
+            message_limit: Optional[int],
+    ) -> tuple[Optional[Session], list]:
+        """Fetch a session and its messages, converting only uncached events.
+
+        A cached session is fetched with only the events from its newest
+        cached one onwards. When that event is gone (the session was rewritten
+        or recreated) or the cache holds too few messages for the read, the
+        session is read again: in full, or for a windowed read, from its newest
+        ``message_limit`` events, doubling until enough messages are found.
+
+        Returns:
+            The session (None when it does not exist) and its messages.
+        """
+        convert = self._state_converter.convert_event
+        entry = self._message_cache.get(session_id)
+        if entry is not None and entry.last_timestamp is not None:
+            session = await self._fetch_session(
+                session_id, GetSessionConfig(after_timestamp=entry.last_timestamp))
+            if session is None:
+                self._message_cache.discard(session_id)
+                return None, []
+            if entry.extend(session.events, convert) and entry.covers(message_limit):
+                return session, entry.messages(message_limit)
+            logger.debug(f"Cached messages of session {session_id} are stale or too few, reading again")
+
+        num_events = max(message_limit, 1) if message_limit is not None else None
+        while True:
+            session = await self._fetch_session(
+                session_id, GetSessionConfig(num_recent_events=num_events) if num_events else None)
+            if session is None:
+                self._message_cache.discard(session_id)
+                return None, []
+            entry = SessionMessages(complete=num_events is None or len(session.events) < num_events)
+            entry.extend(session.events, convert)
+            if entry.covers(message_limit):
+                break
+            num_events *= 2
+
+        self._message_cache.put(session_id, entry)
+        return session, entry.messages(message_limit)
+
+    async def _fetch_session(
+            self,
+            session_id: str,
+            config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        return await self._session_service.get_session(
+            app_name=self._get_app_name(),
+            user_id=self._get_user_id(),
+            session_id=session_id,
+            config=config,
+        )
+
     async def resume(
             self,
             context: "RequestContext",
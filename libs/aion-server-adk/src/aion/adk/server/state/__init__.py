@@ -4,6 +4,7 @@ This module handles state extraction and conversion from ADK sessions
 to the unified ExecutionSnapshot format.
 """
 
+from .cache import SessionMessageCache, SessionMessages
 from .converter import StateConverter
 
-__all__ = ["StateConverter"]
+__all__ = ["SessionMessageCache", "SessionMessages", "StateConverter"]
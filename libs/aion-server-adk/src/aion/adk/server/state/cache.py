@@ -0,0 +1,146 @@
+"""Per-session cache of messages converted from ADK session events.
+
+Converting a session's events to messages is proportional to the length of
+the conversation. The cache keeps the converted messages of each session
+together with the id of the last event they cover, so a later state read
+fetches and converts only the events appended since.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from a2a.types import Message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 256
+
+
+@dataclass
+class _ConvertedEvent:
+    event_id: str
+    timestamp: float
+    messages: List[Message]
+
+
+class SessionMessages:
+    """Messages converted from a contiguous run of a session's newest events.
+
+    The run ends at the newest event converted so far. ``complete`` is True
+    when it also starts at the first event of the session, i.e. when it holds
+    the whole conversation rather than only a recent window of it.
+    """
+
+    def __init__(self, complete: bool):
+        self.complete = complete
+        self._events: List[_ConvertedEvent] = []
+        self._message_count = 0
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """Id of the newest converted event, or None before any."""
+        return self._events[-1].event_id if self._events else None
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest converted event, or None before any."""
+        return self._events[-1].timestamp if self._events else None
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages held."""
+        return self._message_count
+
+    def extend(self, events: Sequence[Any], convert: Callable[[Any], List[Message]]) -> bool:
+        """Convert and append the events newer than the newest one held.
+
+        ``events`` must contain the newest held event, followed by whatever
+        was appended after it; anything before it is skipped.
+
+        Args:
+            events: Session events, oldest first.
+            convert: Converts one event to its messages.
+
+        Returns:
+            False, leaving the entry unchanged, when the newest held event is
+            not among ``events`` - the session was rewritten or recreated and
+            the entry no longer describes it.
+        """
+        start = 0
+        if self._events:
+            last_event_id = self.last_event_id
+            for index, event in enumerate(events):
+                if event.id == last_event_id:
+                    start = index + 1
+                    break
+            else:
+                return False
+
+        for event in events[start:]:
+            messages = convert(event)
+            self._events.append(_ConvertedEvent(event.id, event.timestamp, messages))
+            self._message_count += len(messages)
+        return True
+
+    def covers(self, message_limit: Optional[int]) -> bool:
+        """Whether the entry can answer a read of ``message_limit`` newest messages (None: all)."""
+        return self.complete or (message_limit is not None and self._message_count >= message_limit)
+
+    def messages(self, message_limit: Optional[int] = None) -> List[Message]:
+        """Return the held messages, oldest first, or only the newest ``message_limit``."""
+        if message_limit is None:
+            return [message for event in self._events for message in event.messages]
+        if message_limit <= 0:
+            return []
+
+        window: List[Message] = []
+        for event in reversed(self._events):
+            if len(window) >= message_limit:
+                break
+            window.extend(reversed(event.messages))
+        window.reverse()
+        return window[-message_limit:]
+
+
+class SessionMessageCache:
+    """Least-recently-read :class:`SessionMessages` per session id, bounded by count."""
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        """Create a cache.
+
+        Args:
+            max_sessions: Sessions kept; the least recently read is dropped
+                first. 0 disables caching.
+        """
+        self.max_sessions = max_sessions
+        self._entries: OrderedDict[str, SessionMessages] = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[SessionMessages]:
+        """Return the entry of a session, marking it recently used."""
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            self._entries.move_to_end(session_id)
+        return entry
+
+    def put(self, session_id: str, entry: SessionMessages) -> None:
+        """Store the entry of a session, dropping the least recently read over the bound."""
+        if self.max_sessions <= 0:
+            return
+        self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_sessions:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"Evicted cached messages of session {evicted}")
+
+    def discard(self, session_id: str) -> None:
+        """Forget a session."""
+        self._entries.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["SessionMessageCache", "SessionMessages"]
@@ -5,7 +5,9 @@ state information from ADK sessions into the unified ExecutionSnapshot format.
 """
 
 import logging
-from typing import Any
+from typing import Any, List, Optional
+
+from a2a.types import Message
 
 from aion.server.agent.adapters import ExecutionSnapshot, ExecutionStatus
 
@@ -29,18 +31,26 @@ class StateConverter:
         self._values_extractor = StateValuesExtractor()
         self._messages_extractor = MessagesExtractor()
 
-    def from_adk_session(self, session: Any) -> ExecutionSnapshot:
+    def from_adk_session(
+            self,
+            session: Any,
+            messages: Optional[List[Message]] = None,
+    ) -> ExecutionSnapshot:
         """Convert ADK session to unified ExecutionSnapshot.
 
         Args:
             session: ADK Session object
+            messages: Messages already converted from the session's events, e.g.
+                from a cache. When omitted, every event in ``session.events`` is
+                converted.
 
         Returns:
             ExecutionSnapshot: Unified execution snapshot with state values and messages
                               (status is always COMPLETE, next_steps is always empty)
         """
         execution_state = self._values_extractor.extract(session)
-        messages = self._messages_extractor.extract(session)
+        if messages is None:
+            messages = self._messages_extractor.extract(session)
 
         logger.debug(
             f"Converted ADK session to ExecutionSnapshot: "
@@ -54,5 +64,9 @@ class StateConverter:
             metadata={},
         )
 
+    def convert_event(self, adk_event: Any) -> List[Message]:
+        """Convert one ADK event to the messages it contributes to a snapshot."""
+        return self._messages_extractor.convert_event(adk_event)
+
 
 __all__ = ["StateConverter"]
@@ -51,8 +51,7 @@ class MessagesExtractor(StateExtractor):
 
         # Convert each ADK event to unified Message format
         for event in events:
-            converted_messages = self._convert_event_to_messages(event)
-            messages.extend(converted_messages)
+            messages.extend(self.convert_event(event))
 
         logger.debug(f"Converted {len(events)} events to {len(messages)} messages")
         return messages
@@ -74,7 +73,7 @@ class MessagesExtractor(StateExtractor):
             and len(session.events) > 0
         )
 
-    def _convert_event_to_messages(self, adk_event: Any) -> List[Message]:
+    def convert_event(self, adk_event: Any) -> List[Message]:
         """Convert a single ADK event to one or more unified Messages.
 
         NOTE: Tool calls and tool results are filtered out during content extraction.
@@ -0,0 +1,151 @@
+"""Tests for incremental ADK state snapshots: message cache and message windows."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from aion.core.config.models import AgentConfig
+from aion.adk.server.constants import DEFAULT_USER_ID
+from aion.adk.server.execution.adk_executor import ADKExecutor
+from aion.adk.server.state import SessionMessageCache, SessionMessages
+from aion.server.agent.adapters import ExecutionConfig
+
+APP_NAME = "snapshot-agent"
+SESSION_ID = "ctx-1"
+
+
+def make_text_event(text: str, author: str = "user") -> Event:
+    return Event(
+        author=author,
+        content=types.Content(parts=[types.Part(text=text)], role="user" if author == "user" else "model"),
+        partial=False,
+        timestamp=time.time(),
+    )
+
+
+def make_tool_event() -> Event:
+    return Event(
+        author="agent",
+        content=types.Content(
+            parts=[types.Part(function_call=types.FunctionCall(name="lookup", args={}))],
+            role="model",
+        ),
+        timestamp=time.time(),
+    )
+
+
+def texts(messages) -> list[str]:
+    return [message.parts[0].text for message in messages]
+
+
+@pytest.fixture
+async def service():
+    service = InMemorySessionService()
+    await service.create_session(app_name=APP_NAME, user_id=DEFAULT_USER_ID, session_id=SESSION_ID)
+    return service
+
+
+async def append(service, *events):
+    session = await service.get_session(app_name=APP_NAME, user_id=DEFAULT_USER_ID, session_id=SESSION_ID)
+    for event in events:
+        await service.append_event(session, event)
+
+
+def make_executor(service, **kwargs) -> ADKExecutor:
+    return ADKExecutor(
+        agent=MagicMock(),
+        config=AgentConfig(path="agent.py", name=APP_NAME),
+        session_service=service,
+        artifact_service=MagicMock(),
+        **kwargs,
+    )
+
+
+class TestSessionMessages:
+    def test_extend_skips_held_events_and_rejects_rewritten_history(self):
+        """Only events after the newest held one are converted; a missing anchor is refused."""
+        first, second, third = (make_text_event(text) for text in ("a", "b", "c"))
+        entry = SessionMessages(complete=True)
+        convert = MagicMock(side_effect=lambda event: [event.content.parts[0].text])
+
+        assert entry.extend([first, second], convert)
+        assert entry.extend([second, third], convert)
+        assert not entry.extend([make_text_event("x")], convert)
+
+        assert convert.call_count == 3
+        assert entry.messages() == ["a", "b", "c"]
+        assert entry.messages(2) == ["b", "c"]
+        assert entry.messages(0) == []
+
+    def test_cache_evicts_least_recently_read_session(self):
+        cache = SessionMessageCache(max_sessions=2)
+        cache.put("a", SessionMessages(complete=True))
+        cache.put("b", SessionMessages(complete=True))
+        cache.get("a")
+        cache.put("c", SessionMessages(complete=True))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+
+class TestADKExecutorGetState:
+    async def test_later_reads_convert_only_new_events(self, service):
+        """The second read converts the appended events, not the whole conversation."""
+        await append(service, make_text_event("hi"), make_text_event("hello", author="agent"))
+        executor = make_executor(service)
+        config = ExecutionConfig(context_id=SESSION_ID)
+
+        first = await executor.get_state(config)
+        await append(service, make_tool_event(), make_text_event("again"))
+        with patch.object(
+                executor._state_converter, "convert_event",
+                wraps=executor._state_converter.convert_event) as convert:
+            second = await executor.get_state(config)
+
+        assert texts(first.messages) == ["hi", "hello"]
+        assert texts(second.messages) == ["hi", "hello", "again"]
+        assert convert.call_count == 2
+
+    async def test_message_window_reads_only_recent_events(self, service):
+        """A windowed read of a cold session fetches the newest events, widening past tool events."""
+        await append(
+            service,
+            make_text_event("one"), make_text_event("two"), make_tool_event(),
+            make_tool_event(), make_text_event("three"),
+        )
+        executor = make_executor(service)
+
+        with patch.object(service, "get_session", wraps=service.get_session) as get_session:
+            snapshot = await executor.get_state(ExecutionConfig(context_id=SESSION_ID, message_limit=2))
+
+        assert texts(snapshot.messages) == ["two", "three"]
+        windows = [call.kwargs["config"].num_recent_events for call in get_session.call_args_list]
+        assert windows == [2, 4]
+
+    async def test_full_read_after_window_reads_whole_session(self, service):
+        """A cached window cannot answer a read of the whole conversation."""
+        await append(service, make_text_event("one"), make_text_event("two"), make_text_event("three"))
+        executor = make_executor(service)
+
+        await executor.get_state(ExecutionConfig(context_id=SESSION_ID, message_limit=1))
+        snapshot = await executor.get_state(ExecutionConfig(context_id=SESSION_ID))
+
+        assert texts(snapshot.messages) == ["one", "two", "three"]
+
+    async def test_recreated_session_is_read_again(self, service):
+        """When the newest cached event is gone, the cache is rebuilt from the session."""
+        await append(service, make_text_event("old"))
+        executor = make_executor(service)
+        await executor.get_state(ExecutionConfig(context_id=SESSION_ID))
+
+        await service.delete_session(app_name=APP_NAME, user_id=DEFAULT_USER_ID, session_id=SESSION_ID)
+        await service.create_session(app_name=APP_NAME, user_id=DEFAULT_USER_ID, session_id=SESSION_ID)
+        await append(service, make_text_event("new"))
+        snapshot = await executor.get_state(ExecutionConfig(context_id=SESSION_ID))
+
+        assert texts(snapshot.messages) == ["new"]
@@ -1,6 +1,16 @@
 from .adapter import LangGraphAdapter
-from .checkpoint import CheckpointerBackend, CheckpointerFactory, MemoryBackend, PostgresBackend
+from .checkpoint import (
+    BoundedInMemorySaver,
+    CheckpointerBackend,
+    CheckpointerFactory,
+    CheckpointMemoryUsage,
+    CompactionResult,
+    MemoryBackend,
+    PostgresBackend,
+    PostgresCheckpointCompactor,
+)
 from .execution import ExecutionResultHandler, LangGraphExecutor, StreamResult
+from .files import PostgresFileContentStore
 from .plugin import LangGraphPlugin
 from .state import LangGraphStateAdapter
 
@@ -9,10 +19,15 @@ __all__ = [
     "CheckpointerFactory",
     "CheckpointerBackend",
     "MemoryBackend",
+    "BoundedInMemorySaver",
+    "CheckpointMemoryUsage",
     "PostgresBackend",
+    "PostgresCheckpointCompactor",
+    "CompactionResult",
     "LangGraphExecutor",
     "LangGraphPlugin",
     "LangGraphStateAdapter",
+    "PostgresFileContentStore",
     "ExecutionResultHandler",
     "StreamResult",
 ]
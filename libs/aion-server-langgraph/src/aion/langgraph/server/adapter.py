@@ -9,12 +9,16 @@ from aion.server.agent.adapters import AgentAdapter, ExecutorAdapter
 from aion.server.agent.exceptions import ConfigurationError
 from aion.core.config.models import AgentConfig
 from aion.core.db import DbManagerProtocol
+from aion.langgraph.authoring.files import FileContentStore, set_file_content_store
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 from langgraph.pregel import Pregel
 
-from .checkpoint import CheckpointerFactory
+from .checkpoint import AionAsyncPostgresSaver, CheckpointerFactory, PostgresCheckpointCompactor
+from .constants import FILE_CONTENT_GRACE_SECONDS
 from .execution import LangGraphExecutor
+from .files import create_file_content_store
+from .settings import langgraph_settings
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,8 @@ class LangGraphAdapter(AgentAdapter):
         """
         self.base_path = base_path or Path.cwd()
         self._db_manager = db_manager
+        self._file_store: Optional[FileContentStore] = None
+        self._compactor: Optional[PostgresCheckpointCompactor] = None
 
     @staticmethod
     def framework_name() -> str:
@@ -107,7 +113,22 @@ class LangGraphAdapter(AgentAdapter):
                 f"Agent must be a compiled LangGraph graph, got {type(agent).__name__}"
             )
 
-        return LangGraphExecutor(agent, config)
+        min_bytes = langgraph_settings.file_reference_min_bytes
+        if not min_bytes:
+            return LangGraphExecutor(agent, config)
+
+        return LangGraphExecutor(
+            agent,
+            config,
+            file_store=await self._get_file_store(),
+            file_reference_min_bytes=min_bytes,
+        )
+
+    async def close(self) -> None:
+        """Stop background jobs started for the agents' checkpointers."""
+        if self._compactor is not None:
+            await self._compactor.close()
+            self._compactor = None
 
     def validate_config(self, config: AgentConfig) -> None:
         """Raise ConfigurationError if required LangGraph config fields are absent."""
@@ -155,9 +176,43 @@ class LangGraphAdapter(AgentAdapter):
             Checkpointer instance or None if creation fails
         """
         try:
-            return await CheckpointerFactory.create(db_manager=self._db_manager)
+            checkpointer = await CheckpointerFactory.create(db_manager=self._db_manager)
         except Exception as ex:
             logger.warning(f"Failed to create checkpointer: {ex}")
+            return None
+
+        if isinstance(checkpointer, AionAsyncPostgresSaver):
+            self._start_compaction(checkpointer)
+        return checkpointer
+
+    def _start_compaction(self, checkpointer: AionAsyncPostgresSaver) -> None:
+        """Start the checkpoint compaction job once, if a retention policy is set."""
+        if self._compactor is not None:
+            return
+        if not (langgraph_settings.checkpoint_keep_last or langgraph_settings.checkpoint_max_age_seconds):
+            return
+
+        self._compactor = PostgresCheckpointCompactor(
+            checkpointer.conn,
+            keep_last=langgraph_settings.checkpoint_keep_last,
+            max_age=langgraph_settings.checkpoint_max_age_seconds,
+            batch_size=langgraph_settings.checkpoint_compaction_batch_size,
+            interval=langgraph_settings.checkpoint_compaction_interval_seconds,
+            file_grace=FILE_CONTENT_GRACE_SECONDS if langgraph_settings.file_reference_min_bytes else None,
+        )
+        self._compactor.start()
+        logger.info("LangGraph checkpoint compaction scheduled")
+
+    async def _get_file_store(self) -> FileContentStore:
+        """Create the file content store once and make it the process-wide one.
+
+        Graphs resolve file references through the process-wide store, so it
+        must be the one the executor writes to.
+        """
+        if self._file_store is None:
+            self._file_store = await create_file_content_store(self._db_manager)
+            set_file_content_store(self._file_store)
+        return self._file_store
 
     @staticmethod
     def _is_graph_instance(obj: Any) -> bool:
@@ -4,12 +4,25 @@ This module handles checkpointer creation and lifecycle management
 with support for multiple storage backends (memory, PostgreSQL).
 """
 
-from .backends import CheckpointerBackend, MemoryBackend, PostgresBackend
+from .backends import (
+    AionAsyncPostgresSaver,
+    BoundedInMemorySaver,
+    CheckpointerBackend,
+    CheckpointMemoryUsage,
+    MemoryBackend,
+    PostgresBackend,
+)
+from .compaction import CompactionResult, PostgresCheckpointCompactor
 from .factory import CheckpointerFactory
 
 __all__ = [
     "CheckpointerBackend",
     "MemoryBackend",
+    "BoundedInMemorySaver",
+    "CheckpointMemoryUsage",
     "PostgresBackend",
     "CheckpointerFactory",
+    "AionAsyncPostgresSaver",
+    "CompactionResult",
+    "PostgresCheckpointCompactor",
 ]
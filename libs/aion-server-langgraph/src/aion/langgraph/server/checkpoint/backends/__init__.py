@@ -1,19 +1,21 @@
 """Checkpointer backends for LangGraph plugin.
 
 This module provides different storage backends for LangGraph checkpoints:
-- MemoryBackend: In-memory storage (non-persistent)
+- MemoryBackend: In-memory storage (non-persistent, bounded)
 - PostgresBackend: PostgreSQL-backed storage (persistent)
 
 New backends can be added by implementing the CheckpointerBackend interface.
 """
 
 from .base import CheckpointerBackend
-from .memory import MemoryBackend
+from .memory import BoundedInMemorySaver, CheckpointMemoryUsage, MemoryBackend
 from .postgres import AionAsyncPostgresSaver, PostgresBackend
 
 __all__ = [
     "CheckpointerBackend",
     "MemoryBackend",
+    "BoundedInMemorySaver",
+    "CheckpointMemoryUsage",
     "PostgresBackend",
     "AionAsyncPostgresSaver",
 ]
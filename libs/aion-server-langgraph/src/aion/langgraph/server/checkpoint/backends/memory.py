@@ -1,22 +1,264 @@
 """In-memory checkpointer backend."""
 
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
 from langgraph.checkpoint.memory import InMemorySaver
 
+from aion.langgraph.authoring.files import FileContentStore, get_file_content_store
+from aion.langgraph.server.settings import langgraph_settings
 from .base import CheckpointerBackend
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CheckpointMemoryUsage:
+    """Snapshot of what a :class:`BoundedInMemorySaver` holds.
+
+    Attributes:
+        threads: Threads with at least one checkpoint.
+        checkpoints: Checkpoints across all threads and namespaces.
+        bytes: Approximate size of the stored checkpoints, channel values and
+            pending writes, counted as their serialized length.
+        evicted_threads: Threads evicted to stay within budget since creation.
+    """
+
+    threads: int
+    checkpoints: int
+    bytes: int
+    evicted_threads: int
+
+
+class BoundedInMemorySaver(InMemorySaver):
+    """InMemorySaver that keeps its memory use within configured limits.
+
+    Only the latest ``max_checkpoints_per_thread`` checkpoints of each thread
+    and namespace are kept; older ones are dropped with their pending writes
+    and the channel values no kept checkpoint references. When the number of
+    threads or the stored bytes exceed their budget, the least recently used
+    threads are deleted whole. The thread being written is never evicted, so
+    a single thread larger than ``max_bytes`` is kept until another thread is
+    written.
+
+    A limit of ``None`` or ``0`` disables it.
+
+    Deleting a thread, by eviction or otherwise, releases the file contents
+    it stored in ``file_store``, which defaults to the process-wide store.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_checkpoints_per_thread: Optional[int] = None,
+            max_threads: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            file_store: Optional[FileContentStore] = None,
+            serde: Any = None,
+    ):
+        super().__init__(serde=serde)
+        self.file_store = file_store
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread or None
+        self.max_threads = max_threads or None
+        self.max_bytes = max_bytes or None
+        # thread_id -> stored bytes, least recently used first
+        self._threads: OrderedDict[str, int] = OrderedDict()
+        # (thread_id, checkpoint_ns, checkpoint_id) -> channel versions the checkpoint references
+        self._channel_versions: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._total_bytes = 0
+        self._evicted_threads = 0
+
+    def memory_usage(self) -> CheckpointMemoryUsage:
+        """Report what the saver currently holds."""
+        return CheckpointMemoryUsage(
+            threads=len(self._threads),
+            checkpoints=len(self._channel_versions),
+            bytes=self._total_bytes,
+            evicted_threads=self._evicted_threads,
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        # The base class would leave an empty entry behind for an unknown thread.
+        if thread_id not in self.storage:
+            return None
+        self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def list(
+            self,
+            config: Optional[RunnableConfig],
+            *,
+            filter: Optional[dict[str, Any]] = None,
+            before: Optional[RunnableConfig] = None,
+            limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config is not None:
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id not in self.storage:
+                return iter(())
+            self._touch(thread_id)
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+            self,
+            config: RunnableConfig,
+            checkpoint: Checkpoint,
+            metadata: CheckpointMetadata,
+            new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint_id = checkpoint["id"]
+
+        blob_keys = [(thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items()]
+        replaced = sum(self._typed_size(self.blobs.get(key)) for key in blob_keys)
+        if thread_id in self.storage:
+            replaced += self._entry_size(self.storage[thread_id][checkpoint_ns].get(checkpoint_id))
+
+        result = super().put(config, checkpoint, metadata, new_versions)
+
+        added = sum(self._typed_size(self.blobs[key]) for key in blob_keys)
+        added += self._entry_size(self.storage[thread_id][checkpoint_ns][checkpoint_id])
+        self._channel_versions[(thread_id, checkpoint_ns, checkpoint_id)] = dict(checkpoint["channel_versions"])
+        self._account(thread_id, added - replaced)
+        self._prune(thread_id, checkpoint_ns)
+        self._evict(keep=thread_id)
+        return result
+
+    def put_writes(
+            self,
+            config: RunnableConfig,
+            writes: Sequence[tuple[str, Any]],
+            task_id: str,
+            task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        before = self._writes_size(self.writes.get(outer_key))
+        super().put_writes(config, writes, task_id, task_path)
+        self._account(thread_id, self._writes_size(self.writes.get(outer_key)) - before)
+        self._evict(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        # Walks only the thread's own keys; the base class scans every write and blob.
+        for checkpoint_ns, checkpoints in self.storage.pop(thread_id, {}).items():
+            for checkpoint_id in checkpoints:
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                versions = self._channel_versions.pop((thread_id, checkpoint_ns, checkpoint_id), {})
+                for channel, version in versions.items():
+                    self.blobs.pop((thread_id, checkpoint_ns, channel, version), None)
+        self._total_bytes -= self._threads.pop(thread_id, 0)
+        (self.file_store or get_file_content_store()).release_thread(thread_id)
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Drop the oldest checkpoints of a namespace beyond the per-thread limit."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if not self.max_checkpoints_per_thread or len(checkpoints) <= self.max_checkpoints_per_thread:
+            return
+
+        # Checkpoint ids are time-ordered, the same order ``list`` relies on.
+        checkpoint_ids = sorted(checkpoints)
+        stale = checkpoint_ids[:-self.max_checkpoints_per_thread]
+        live = set()
+        for checkpoint_id in checkpoint_ids[-self.max_checkpoints_per_thread:]:
+            live.update(self._channel_versions.get((thread_id, checkpoint_ns, checkpoint_id), {}).items())
+
+        freed = 0
+        for checkpoint_id in stale:
+            freed += self._entry_size(checkpoints.pop(checkpoint_id))
+            freed += self._writes_size(self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None))
+            versions = self._channel_versions.pop((thread_id, checkpoint_ns, checkpoint_id), {})
+            for channel_version in versions.items():
+                if channel_version not in live:
+                    freed += self._typed_size(self.blobs.pop((thread_id, checkpoint_ns, *channel_version), None))
+        self._account(thread_id, -freed)
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used threads, other than ``keep``, until within budget."""
+        while self._over_budget():
+            thread_id = next(iter(self._threads))
+            if thread_id == keep:
+                break
+            self.delete_thread(thread_id)
+            self._evicted_threads += 1
+            logger.debug(
+                "Evicted LangGraph thread %s from memory (%d threads, %d bytes held)",
+                thread_id, len(self._threads), self._total_bytes,
+            )
+
+    def _over_budget(self) -> bool:
+        return bool(
+            (self.max_threads and len(self._threads) > self.max_threads)
+            or (self.max_bytes and self._total_bytes > self.max_bytes)
+        )
+
+    def _account(self, thread_id: str, delta: int) -> None:
+        self._threads[thread_id] = self._threads.get(thread_id, 0) + delta
+        self._threads.move_to_end(thread_id)
+        self._total_bytes += delta
+
+    def _touch(self, thread_id: str) -> None:
+        if thread_id in self._threads:
+            self._threads.move_to_end(thread_id)
+
+    @staticmethod
+    def _typed_size(typed: Optional[tuple[str, bytes]]) -> int:
+        return len(typed[1]) if typed else 0
+
+    @classmethod
+    def _entry_size(cls, entry: Optional[tuple]) -> int:
+        if entry is None:
+            return 0
+        return cls._typed_size(entry[0]) + cls._typed_size(entry[1])
+
+    @classmethod
+    def _writes_size(cls, writes: Optional[dict]) -> int:
+        if not writes:
+            return 0
+        return sum(cls._typed_size(write[2]) for write in writes.values())
+
 
 class MemoryBackend(CheckpointerBackend):
     """In-memory checkpointer backend.
 
     Always available. Checkpoints are lost on restart.
     Use for development, testing, or when a database is unavailable.
+    Retention and memory budget come from the ``LANGGRAPH_MEMORY_*``
+    settings unless given explicitly.
     """
 
+    def __init__(
+            self,
+            *,
+            max_checkpoints_per_thread: Optional[int] = None,
+            max_threads: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+    ):
+        self._max_checkpoints_per_thread = (
+            langgraph_settings.memory_checkpoints_per_thread
+            if max_checkpoints_per_thread is None else max_checkpoints_per_thread
+        )
+        self._max_threads = langgraph_settings.memory_max_threads if max_threads is None else max_threads
+        self._max_bytes = langgraph_settings.memory_max_bytes if max_bytes is None else max_bytes
+
     def is_available(self) -> bool:
         return True
 
-    async def create(self) -> InMemorySaver:
-        return InMemorySaver()
+    async def create(self) -> BoundedInMemorySaver:
+        return BoundedInMemorySaver(
+            max_checkpoints_per_thread=self._max_checkpoints_per_thread,
+            max_threads=self._max_threads,
+            max_bytes=self._max_bytes,
+        )
 
 
-__all__ = ["MemoryBackend"]
+__all__ = ["BoundedInMemorySaver", "CheckpointMemoryUsage", "MemoryBackend"]
@@ -0,0 +1,322 @@
+"""Retention and compaction of PostgreSQL LangGraph checkpoints."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from aion.langgraph.server.constants import (
+    AION_LANGGRAPH_SCHEMA,
+    FILE_CONTENT_THREADS_TABLE,
+    FILE_CONTENTS_TABLE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """What one compaction pass removed.
+
+    Attributes:
+        threads: Threads examined.
+        checkpoints: Checkpoint rows deleted.
+        writes: Pending-write rows deleted with their checkpoints.
+        blobs: Channel value rows deleted because no kept checkpoint references them.
+        files: File contents deleted because no thread that stored them has
+            checkpoints left.
+        bytes: Approximate stored size of the deleted rows.
+        duration: Wall time of the pass, in seconds.
+    """
+
+    threads: int = 0
+    checkpoints: int = 0
+    writes: int = 0
+    blobs: int = 0
+    files: int = 0
+    bytes: int = 0
+    duration: float = 0.0
+
+    def __add__(self, other: "CompactionResult") -> "CompactionResult":
+        return CompactionResult(
+            threads=self.threads + other.threads,
+            checkpoints=self.checkpoints + other.checkpoints,
+            writes=self.writes + other.writes,
+            blobs=self.blobs + other.blobs,
+            files=self.files + other.files,
+            bytes=self.bytes + other.bytes,
+            duration=self.duration + other.duration,
+        )
+
+
+class PostgresCheckpointCompactor:
+    """Deletes checkpoint history beyond a retention policy, in batches of threads.
+
+    A checkpoint is deleted when it is not the newest of its thread and
+    namespace and either more than ``keep_last`` newer checkpoints exist or
+    it was taken more than ``max_age`` seconds ago. The newest checkpoint is
+    always kept: it is the thread's current state, and for an interrupted run
+    it carries the pending writes needed to resume. Pending writes of deleted
+    checkpoints go with them, and channel values no remaining checkpoint
+    references are deleted afterwards.
+
+    Each batch of threads is compacted in its own transaction, so a pass over
+    a large table never holds locks on more than ``batch_size`` threads.
+    Totals across passes are kept in :attr:`totals`.
+
+    With ``file_grace`` set, a pass also deletes the file contents stored by
+    :class:`~aion.langgraph.server.files.PostgresFileContentStore` once none
+    of the threads that stored them has checkpoints left.
+    """
+
+    def __init__(
+            self,
+            pool: AsyncConnectionPool,
+            *,
+            keep_last: Optional[int] = None,
+            max_age: Optional[float] = None,
+            batch_size: int = 100,
+            interval: float = 3600.0,
+            file_grace: Optional[float] = None,
+            schema: str = AION_LANGGRAPH_SCHEMA,
+    ):
+        """Create a compactor.
+
+        Args:
+            pool: Connection pool of the database holding the checkpoints.
+            keep_last: Checkpoints to keep per thread and namespace. None or 0
+                disables count-based retention.
+            max_age: Age in seconds past which checkpoints are dropped. None or
+                0 disables age-based retention.
+            batch_size: Threads compacted per transaction.
+            interval: Seconds between passes of the background job.
+            file_grace: Seconds a thread's claim on a file content outlives
+                the thread's checkpoints, covering a run that stored a file
+                but has not written its first checkpoint yet. None leaves
+                file contents alone.
+            schema: Schema of the LangGraph checkpoint tables.
+
+        Raises:
+            ValueError: If neither retention rule is enabled.
+        """
+        if not keep_last and not max_age:
+            raise ValueError("A checkpoint retention policy needs keep_last or max_age")
+        self._pool = pool
+        self.keep_last = keep_last or None
+        self.max_age = max_age or None
+        self.batch_size = batch_size
+        self.interval = interval
+        self.file_grace = file_grace
+        self._schema = schema
+        self._task: Optional[asyncio.Task] = None
+        self.totals = CompactionResult()
+
+    def start(self) -> None:
+        """Start the background job; a no-op when it is already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background job."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def compact(self) -> CompactionResult:
+        """Run one pass over every thread and return what it removed."""
+        started = time.monotonic()
+        result = CompactionResult()
+        after = ""
+        while True:
+            thread_ids = await self._next_threads(after)
+            if not thread_ids:
+                break
+            result += await self._compact_threads(thread_ids)
+            if len(thread_ids) < self.batch_size:
+                break
+            after = thread_ids[-1]
+        if self.file_grace is not None:
+            result += await self._collect_files()
+
+        result = replace(result, duration=time.monotonic() - started)
+        self.totals += result
+        logger.info(
+            "LangGraph checkpoint compaction: threads=%d checkpoints=%d writes=%d blobs=%d "
+            "files=%d bytes=%d duration=%.3fs",
+            result.threads, result.checkpoints, result.writes, result.blobs,
+            result.files, result.bytes, result.duration,
+        )
+        return result
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.compact()
+            except Exception:
+                logger.exception("LangGraph checkpoint compaction failed")
+
+    async def _next_threads(self, after: str) -> list[str]:
+        query = sql.SQL(
+            "SELECT DISTINCT thread_id FROM {} WHERE thread_id > %s ORDER BY thread_id LIMIT %s"
+        ).format(self._table("checkpoints"))
+        async with self._pool.connection() as conn:
+            cursor = await conn.execute(query, (after, self.batch_size))
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def _compact_threads(self, thread_ids: list[str]) -> CompactionResult:
+        """Apply the policy to a batch of threads in one transaction."""
+        async with self._pool.connection() as conn, conn.transaction():
+            cursor = await conn.execute(self._delete_checkpoints_query(), self._policy_params(thread_ids))
+            checkpoints, checkpoint_bytes, writes, write_bytes = await cursor.fetchone()
+            blobs, blob_bytes = 0, 0
+            if checkpoints:
+                cursor = await conn.execute(self._delete_orphaned_blobs_query(), {"threads": thread_ids})
+                blobs, blob_bytes = await cursor.fetchone()
+
+        return CompactionResult(
+            threads=len(thread_ids),
+            checkpoints=checkpoints,
+            writes=writes,
+            blobs=blobs,
+            bytes=checkpoint_bytes + write_bytes + blob_bytes,
+        )
+
+    async def _collect_files(self) -> CompactionResult:
+        """Delete file contents whose threads all lost their checkpoints, in one transaction."""
+        async with self._pool.connection() as conn, conn.transaction():
+            cursor = await conn.execute(self._release_file_threads_query(), {"grace": self.file_grace})
+            digests = [row[0] for row in await cursor.fetchall()]
+            if not digests:
+                return CompactionResult()
+            # Waits for a concurrent put of the same content, whose thread the
+            # next statement then sees; later puts wait for this transaction.
+            await conn.execute(self._lock_file_contents_query(), {"digests": digests})
+            cursor = await conn.execute(self._delete_unreferenced_files_query(), {"digests": digests})
+            files, file_bytes = await cursor.fetchone()
+        return CompactionResult(files=files, bytes=file_bytes)
+
+    def _policy_params(self, thread_ids: list[str]) -> dict[str, Any]:
+        params: dict[str, Any] = {"threads": thread_ids}
+        if self.keep_last:
+            params["keep_last"] = self.keep_last
+        if self.max_age:
+            params["max_age"] = self.max_age
+        return params
+
+    def _delete_checkpoints_query(self) -> sql.Composed:
+        rules = []
+        if self.keep_last:
+            rules.append(sql.SQL("position > %(keep_last)s"))
+        if self.max_age:
+            rules.append(sql.SQL("taken_at < now() - make_interval(secs => %(max_age)s)"))
+
+        return sql.SQL(
+            """
+            WITH ranked AS (
+                SELECT thread_id, checkpoint_ns, checkpoint_id,
+                       row_number() OVER (
+                           PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+                       ) AS position,
+                       (checkpoint ->> 'ts')::timestamptz AS taken_at
+                FROM {checkpoints}
+                WHERE thread_id = ANY(%(threads)s)
+            ), doomed AS (
+                SELECT thread_id, checkpoint_ns, checkpoint_id
+                FROM ranked
+                WHERE position > 1 AND ({rules})
+            ), deleted_writes AS (
+                DELETE FROM {writes} w USING doomed d
+                WHERE w.thread_id = d.thread_id
+                  AND w.checkpoint_ns = d.checkpoint_ns
+                  AND w.checkpoint_id = d.checkpoint_id
+                RETURNING octet_length(w.blob) AS size
+            ), deleted AS (
+                DELETE FROM {checkpoints} c USING doomed d
+                WHERE c.thread_id = d.thread_id
+                  AND c.checkpoint_ns = d.checkpoint_ns
+                  AND c.checkpoint_id = d.checkpoint_id
+                RETURNING pg_column_size(c.checkpoint) + pg_column_size(c.metadata) AS size
+            )
+            SELECT (SELECT count(*) FROM deleted),
+                   (SELECT coalesce(sum(size), 0)::bigint FROM deleted),
+                   (SELECT count(*) FROM deleted_writes),
+                   (SELECT coalesce(sum(size), 0)::bigint FROM deleted_writes)
+            """
+        ).format(
+            checkpoints=self._table("checkpoints"),
+            writes=self._table("checkpoint_writes"),
+            rules=sql.SQL(" OR ").join(rules),
+        )
+
+    def _delete_orphaned_blobs_query(self) -> sql.Composed:
+        # A checkpoint references a channel value through the version recorded
+        # for that channel in its channel_versions. The saver writes a new
+        # value before the checkpoint that references it, so only versions
+        # older than the newest referenced one are considered orphaned.
+        return sql.SQL(
+            """
+            WITH deleted AS (
+                DELETE FROM {blobs} b
+                WHERE b.thread_id = ANY(%(threads)s)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM {checkpoints} c
+                      WHERE c.thread_id = b.thread_id
+                        AND c.checkpoint_ns = b.checkpoint_ns
+                        AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+                  )
+                  AND b.version < (
+                      SELECT max(c.checkpoint -> 'channel_versions' ->> b.channel)
+                      FROM {checkpoints} c
+                      WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns
+                  )
+                RETURNING coalesce(octet_length(b.blob), 0) AS size
+            )
+            SELECT count(*), coalesce(sum(size), 0)::bigint FROM deleted
+            """
+        ).format(blobs=self._table("checkpoint_blobs"), checkpoints=self._table("checkpoints"))
+
+    def _release_file_threads_query(self) -> sql.Composed:
+        return sql.SQL(
+            """
+            WITH released AS (
+                DELETE FROM {threads} t
+                WHERE t.created_at < now() - make_interval(secs => %(grace)s)
+                  AND NOT EXISTS (SELECT 1 FROM {checkpoints} c WHERE c.thread_id = t.thread_id)
+                RETURNING t.digest
+            )
+            SELECT DISTINCT digest FROM released
+            """
+        ).format(threads=self._table(FILE_CONTENT_THREADS_TABLE), checkpoints=self._table("checkpoints"))
+
+    def _lock_file_contents_query(self) -> sql.Composed:
+        return sql.SQL("SELECT digest FROM {contents} WHERE digest = ANY(%(digests)s) FOR UPDATE").format(
+            contents=self._table(FILE_CONTENTS_TABLE),
+        )
+
+    def _delete_unreferenced_files_query(self) -> sql.Composed:
+        return sql.SQL(
+            """
+            WITH deleted AS (
+                DELETE FROM {contents} f
+                WHERE f.digest = ANY(%(digests)s)
+                  AND NOT EXISTS (SELECT 1 FROM {threads} t WHERE t.digest = f.digest)
+                RETURNING octet_length(f.data) AS size
+            )
+            SELECT count(*), coalesce(sum(size), 0)::bigint FROM deleted
+            """
+        ).format(contents=self._table(FILE_CONTENTS_TABLE), threads=self._table(FILE_CONTENT_THREADS_TABLE))
+
+    def _table(self, name: str) -> sql.Identifier:
+        return sql.Identifier(self._schema, name)
+
+
+__all__ = ["CompactionResult", "PostgresCheckpointCompactor"]
@@ -25,7 +25,7 @@ class CheckpointerFactory:
         Args:
             db_manager: Optional database manager. If provided and initialized,
                         AionAsyncPostgresSaver is used; otherwise falls back to
-                        InMemorySaver.
+                        BoundedInMemorySaver.
 
         Returns:
             A checkpointer instance ready for use.
@@ -1,3 +1,8 @@
 """Internal constants for aion-server-langgraph."""
 
 AION_LANGGRAPH_SCHEMA = "aion_langgraph"
+FILE_CONTENTS_TABLE = "file_contents"
+FILE_CONTENT_THREADS_TABLE = "file_content_threads"
+# How long a thread's claim on a stored file outlives its checkpoints, so a run
+# that stored a file but has not written its first checkpoint keeps the file.
+FILE_CONTENT_GRACE_SECONDS = 3600.0
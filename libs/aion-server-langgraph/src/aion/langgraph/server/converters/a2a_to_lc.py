@@ -5,8 +5,10 @@ from __future__ import annotations
 import base64
 import json
 import mimetypes
+from typing import Optional
 
 from a2a.types import Part
+from aion.langgraph.authoring.files import FileContentStore, file_reference_block
 from google.protobuf import json_format
 from langchain_core.messages.content import (
     FileContentBlock,
@@ -19,7 +21,8 @@ from langchain_core.messages.content import (
 class A2AToLcConverter:
     """Converts A2A Part objects to LangChain content blocks.
 
-    Not meant to be instantiated — use from_parts() or from_part() directly.
+    Not meant to be instantiated — use from_parts() or from_part() directly,
+    or afrom_parts() to keep large files out of graph state.
     """
 
     @classmethod
@@ -32,6 +35,36 @@ class A2AToLcConverter:
                 blocks.append(block)
         return blocks
 
+    @classmethod
+    async def afrom_parts(
+            cls,
+            parts: list[Part],
+            *,
+            file_store: Optional[FileContentStore] = None,
+            reference_min_bytes: int = 1,
+            thread_id: Optional[str] = None,
+    ) -> list[TextContentBlock | FileContentBlock]:
+        """Convert Parts like from_parts(), storing large raw files by reference.
+
+        Raw parts of at least ``reference_min_bytes`` are written to
+        ``file_store`` on behalf of ``thread_id`` and become file blocks
+        referring to the stored content, so checkpoints hold the digest rather
+        than the base64 payload.
+        """
+        if file_store is None:
+            return cls.from_parts(parts)
+
+        blocks = []
+        for part in parts:
+            if part.raw and len(part.raw) >= reference_min_bytes:
+                digest = await file_store.put(part.raw, thread_id)
+                blocks.append(file_reference_block(digest, cls._detect_mime_type(part)))
+                continue
+            block = cls.from_part(part)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
     @classmethod
     def from_part(cls, part: Part) -> TextContentBlock | FileContentBlock | None:
         """Convert a single A2A Part to a LangChain content block.
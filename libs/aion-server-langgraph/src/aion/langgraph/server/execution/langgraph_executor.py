@@ -15,6 +15,7 @@ from aion.server.agent.adapters import (
 )
 from aion.server.agent.exceptions import ExecutionError, StateRetrievalError
 from aion.core.runtime.context.registry import AionRuntimeContextRegistry
+from aion.langgraph.authoring.files import FileContentStore
 from aion.server.a2a.utils import empty_input_warning, extract_input_preview
 from .event_converter import LangGraphA2AConverter
 from .event_preprocessor import LangGraphEventPreprocessor
@@ -40,6 +41,8 @@ class LangGraphExecutor(ExecutorAdapter):
             compiled_graph: Any,
             config: AgentConfig,
             result_handler: Optional[ExecutionResultHandler] = None,
+            file_store: Optional[FileContentStore] = None,
+            file_reference_min_bytes: int = 1,
     ):
         """
         Args:
@@ -47,9 +50,14 @@ class LangGraphExecutor(ExecutorAdapter):
             config: Agent-level configuration (model params, tools, etc.).
             result_handler: Optional handler for post-stream result processing.
                 Defaults to a plain ExecutionResultHandler.
+            file_store: Store inbound files are written to so that state holds
+                references instead of base64. None keeps files inline.
+            file_reference_min_bytes: Smallest file stored by reference.
         """
         self.compiled_graph = compiled_graph
         self.config = config
+        self._file_store = file_store
+        self._file_reference_min_bytes = file_reference_min_bytes
         self._state_adapter = LangGraphStateAdapter()
         self._result_handler = result_handler or ExecutionResultHandler()
         self._preprocessor = LangGraphEventPreprocessor()
@@ -76,7 +84,7 @@ class LangGraphExecutor(ExecutorAdapter):
             )
             logger.debug(f"Input preview: {extract_input_preview(context.message)!r}")
 
-            lg_inputs = LangGraphTransformer.generate_langgraph_inputs(context)
+            lg_inputs = await self._generate_inputs(context)
             lg_config = LangGraphTransformer.generate_langgraph_config(config)
 
             runtime_context = await AionRuntimeContextRegistry.aget_current_context()
@@ -129,7 +137,7 @@ class LangGraphExecutor(ExecutorAdapter):
                 task_id=context.task_id,
                 context_id=context.context_id,
             )
-            lg_inputs = LangGraphTransformer.generate_langgraph_inputs(context)
+            lg_inputs = await self._generate_inputs(context)
             resume_command = self._state_adapter.create_resume_input(lg_inputs, state)
             lg_config = LangGraphTransformer.generate_langgraph_config(config)
 
@@ -165,6 +173,13 @@ class LangGraphExecutor(ExecutorAdapter):
             logger.error(f"Failed to get state: {e}")
             raise StateRetrievalError(f"Failed to retrieve state: {e}") from e
 
+    async def _generate_inputs(self, context: "RequestContext") -> dict[str, Any]:
+        return await LangGraphTransformer.agenerate_langgraph_inputs(
+            context,
+            file_store=self._file_store,
+            reference_min_bytes=self._file_reference_min_bytes,
+        )
+
     async def _finalize(
             self,
             stream_result: StreamResult,
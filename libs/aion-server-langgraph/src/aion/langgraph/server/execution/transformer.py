@@ -2,6 +2,7 @@
 
 from typing import Any, Optional, TYPE_CHECKING
 
+from aion.langgraph.authoring.files import FileContentStore
 from aion.server.agent.adapters import ExecutionConfig
 from langchain_core.messages import HumanMessage
 
@@ -45,3 +46,31 @@ class LangGraphTransformer:
                 messages = [HumanMessage(content=content_blocks)]
 
         return {"messages": messages}
+
+    @staticmethod
+    async def agenerate_langgraph_inputs(
+            context: "RequestContext",
+            file_store: Optional[FileContentStore] = None,
+            reference_min_bytes: int = 1,
+    ) -> dict[str, Any]:
+        """Generate LangGraph inputs like generate_langgraph_inputs().
+
+        With a ``file_store``, inbound files of at least ``reference_min_bytes``
+        are stored there for the context's thread and enter the state as
+        references.
+        """
+        if file_store is None:
+            return LangGraphTransformer.generate_langgraph_inputs(context)
+
+        messages: list = []
+        if context.message:
+            content_blocks = await A2AToLcConverter.afrom_parts(
+                context.message.parts,
+                file_store=file_store,
+                reference_min_bytes=reference_min_bytes,
+                thread_id=context.context_id,
+            )
+            if content_blocks:
+                messages = [HumanMessage(content=content_blocks)]
+
+        return {"messages": messages}
@@ -0,0 +1,108 @@
+"""File content stores backing file references in LangGraph message state."""
+
+import hashlib
+import logging
+from typing import Optional
+
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from aion.core.db import DbManagerProtocol
+from aion.langgraph.authoring.files import FileContentStore, InMemoryFileContentStore
+
+from .constants import AION_LANGGRAPH_SCHEMA, FILE_CONTENT_THREADS_TABLE, FILE_CONTENTS_TABLE
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresFileContentStore(FileContentStore):
+    """Content-addressed file table next to the LangGraph checkpoint tables.
+
+    Rows are keyed by the SHA-256 digest of their bytes, so a file re-sent in
+    any thread is stored once. Uses the application's shared connection pool.
+
+    The threads that stored each content are recorded next to it; the
+    checkpoint compactor deletes contents once none of those threads has
+    checkpoints left, so :meth:`release_thread` has nothing to do here.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool, schema: str = AION_LANGGRAPH_SCHEMA):
+        self._pool = pool
+        self._table = sql.Identifier(schema, FILE_CONTENTS_TABLE)
+        self._threads_table = sql.Identifier(schema, FILE_CONTENT_THREADS_TABLE)
+        self._schema = sql.Identifier(schema)
+
+    async def setup(self) -> None:
+        """Create the schema and tables if they do not exist."""
+        async with self._pool.connection() as conn:
+            await conn.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(self._schema))
+            await conn.execute(
+                sql.SQL(
+                    "CREATE TABLE IF NOT EXISTS {} ("
+                    "digest TEXT PRIMARY KEY, "
+                    "data BYTEA NOT NULL, "
+                    "created_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+                ).format(self._table)
+            )
+            await conn.execute(
+                sql.SQL(
+                    "CREATE TABLE IF NOT EXISTS {} ("
+                    "digest TEXT NOT NULL, "
+                    "thread_id TEXT NOT NULL, "
+                    "created_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+                    "PRIMARY KEY (digest, thread_id))"
+                ).format(self._threads_table)
+            )
+
+    async def put(self, data: bytes, thread_id: Optional[str] = None) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        async with self._pool.connection() as conn, conn.transaction():
+            # The thread is recorded before the content, the order in which the
+            # checkpoint compactor locks them, and the content row stays locked
+            # until both are committed: the compactor either deletes the
+            # content before this transaction writes it, or sees the thread.
+            if thread_id is not None:
+                await conn.execute(
+                    sql.SQL(
+                        "INSERT INTO {} (digest, thread_id) VALUES (%s, %s) "
+                        "ON CONFLICT (digest, thread_id) DO UPDATE SET created_at = now()"
+                    ).format(self._threads_table),
+                    (digest, thread_id),
+                )
+            await conn.execute(
+                sql.SQL(
+                    "INSERT INTO {} (digest, data) VALUES (%s, %s) "
+                    "ON CONFLICT (digest) DO UPDATE SET created_at = now()"
+                ).format(self._table),
+                (digest, data),
+            )
+        return digest
+
+    async def get(self, digest: str) -> Optional[bytes]:
+        async with self._pool.connection() as conn:
+            cursor = await conn.execute(
+                sql.SQL("SELECT data FROM {} WHERE digest = %s").format(self._table),
+                (digest,),
+            )
+            row = await cursor.fetchone()
+        return bytes(row[0]) if row else None
+
+
+async def create_file_content_store(db_manager: Optional[DbManagerProtocol] = None) -> FileContentStore:
+    """Create the file content store matching the checkpointer's persistence.
+
+    References written into Postgres checkpoints must outlive the process, so
+    the table is used whenever the database is; otherwise contents live in
+    memory, as the checkpoints do.
+    """
+    pool = db_manager.get_pool() if db_manager and db_manager.is_initialized else None
+    if pool is None:
+        return InMemoryFileContentStore()
+
+    store = PostgresFileContentStore(pool)
+    await store.setup()
+    logger.info("LangGraph file content table setup completed")
+    return store
+
+
+__all__ = ["PostgresFileContentStore", "create_file_content_store"]
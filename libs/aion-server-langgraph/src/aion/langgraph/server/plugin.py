@@ -41,11 +41,9 @@ class LangGraphPlugin(AgentPluginProtocol):
 
     @override
     async def teardown(self) -> None:
-        """Cleanup plugin resources.
-
-        Currently no cleanup is needed as the adapter doesn't hold
-        resources that need explicit cleanup.
-        """
+        """Cleanup plugin resources, stopping the adapter's background jobs."""
+        if self._adapter:
+            await self._adapter.close()
         self._adapter = None
         self._db_manager = None
 
@@ -0,0 +1,97 @@
+"""Environment-based settings for the LangGraph server plugin."""
+
+from pydantic import Field
+
+from aion.core.settings import BaseEnvSettings
+
+__all__ = ["LangGraphSettings", "langgraph_settings"]
+
+
+class LangGraphSettings(BaseEnvSettings):
+    """Settings for LangGraph agents' checkpoints and message state."""
+
+    memory_checkpoints_per_thread: int = Field(
+        default=20,
+        ge=0,
+        alias="LANGGRAPH_MEMORY_CHECKPOINTS_PER_THREAD",
+        description=(
+            "Checkpoints the in-memory checkpointer keeps per thread and namespace; "
+            "older ones are dropped together with their pending writes and the "
+            "channel values only they reference. 0 keeps every checkpoint."
+        )
+    )
+
+    memory_max_threads: int = Field(
+        default=0,
+        ge=0,
+        alias="LANGGRAPH_MEMORY_MAX_THREADS",
+        description=(
+            "Threads the in-memory checkpointer holds before evicting the least "
+            "recently used one. 0 means no limit."
+        )
+    )
+
+    memory_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        alias="LANGGRAPH_MEMORY_MAX_BYTES",
+        description=(
+            "Approximate size, in serialized bytes, of everything the in-memory "
+            "checkpointer holds before evicting the least recently used threads. "
+            "0 means no limit."
+        )
+    )
+
+    checkpoint_keep_last: int = Field(
+        default=0,
+        ge=0,
+        alias="LANGGRAPH_CHECKPOINT_KEEP_LAST",
+        description=(
+            "Checkpoints kept per thread in PostgreSQL by the background "
+            "compaction job. 0 disables count-based retention."
+        )
+    )
+
+    checkpoint_max_age_seconds: float = Field(
+        default=0,
+        ge=0,
+        alias="LANGGRAPH_CHECKPOINT_MAX_AGE_SECONDS",
+        description=(
+            "Age past which PostgreSQL checkpoints are deleted by the background "
+            "compaction job. The newest checkpoint of a thread is always kept. "
+            "0 disables age-based retention."
+        )
+    )
+
+    checkpoint_compaction_interval_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        alias="LANGGRAPH_CHECKPOINT_COMPACTION_INTERVAL_SECONDS",
+        description="Seconds between checkpoint compaction passes."
+    )
+
+    checkpoint_compaction_batch_size: int = Field(
+        default=100,
+        ge=1,
+        alias="LANGGRAPH_CHECKPOINT_COMPACTION_BATCH_SIZE",
+        description="Threads compacted per transaction."
+    )
+
+    file_reference_min_bytes: int = Field(
+        default=0,
+        ge=0,
+        alias="LANGGRAPH_FILE_REFERENCE_MIN_BYTES",
+        description=(
+            "Inbound files of at least this many bytes are stored once in a "
+            "content-addressed store and enter graph state as references instead "
+            "of inline base64. Graphs resolve them with resolve_file_references "
+            "before calling a model. 0 keeps every file inline."
+        )
+    )
+
+
+try:
+    langgraph_settings = LangGraphSettings()
+except Exception as ex:
+    print(f"Error loading LangGraph configuration: {ex}")
+    raise
@@ -0,0 +1,131 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from aion.langgraph.server.checkpoint.compaction import CompactionResult, PostgresCheckpointCompactor
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetchall(self):
+        return self._rows
+
+    async def fetchone(self):
+        return self._rows[0]
+
+
+class FakePool:
+    """Answers queries from a list of queued row sets and records what ran."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = []
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def execute(self, query, params=None):
+        self.queries.append((query.as_string(None), params))
+        return FakeCursor(self.results.pop(0))
+
+
+class TestPostgresCheckpointCompactor:
+    """Batching, policy rendering and accounting of the checkpoint compactor."""
+
+    def test_requires_a_retention_rule(self):
+        """A compactor with nothing to enforce is a configuration error."""
+        with pytest.raises(ValueError):
+            PostgresCheckpointCompactor(FakePool(), keep_last=0, max_age=0)
+
+    async def test_compacts_threads_in_batches_and_sums_results(self):
+        """Threads are paged by id; each batch runs in its own transaction."""
+        pool = FakePool(
+            [("a",), ("b",)],
+            [(3, 300, 2, 20)],
+            [(4, 400)],
+            [("c",)],
+            [(1, 100, 0, 0)],
+            [(1, 50)],
+        )
+        compactor = PostgresCheckpointCompactor(pool, keep_last=2, batch_size=2)
+
+        result = await compactor.compact()
+
+        assert (result.threads, result.checkpoints, result.writes, result.blobs) == (3, 4, 2, 5)
+        assert result.bytes == 300 + 20 + 400 + 100 + 50
+        assert pool.transactions == 2
+        assert pool.queries[3][1] == ("b", 2)
+        assert compactor.totals == result
+
+    async def test_skips_blob_cleanup_when_nothing_was_deleted(self):
+        """Without deleted checkpoints no channel value can have become orphaned."""
+        pool = FakePool([("a",)], [(0, 0, 0, 0)])
+        compactor = PostgresCheckpointCompactor(pool, max_age=60, batch_size=10)
+
+        result = await compactor.compact()
+
+        assert result.checkpoints == 0
+        assert len(pool.queries) == 2
+
+    async def test_only_enabled_rules_are_rendered(self):
+        """Each rule appears in the query only when configured; the newest checkpoint is exempt."""
+        pool = FakePool([("a",)], [(0, 0, 0, 0)])
+        await PostgresCheckpointCompactor(pool, keep_last=5, batch_size=10).compact()
+
+        query, params = pool.queries[1]
+        assert "position > 1 AND (position > %(keep_last)s)" in query
+        assert "max_age" not in query
+        assert params == {"threads": ["a"], "keep_last": 5}
+
+    async def test_collects_files_whose_threads_lost_their_checkpoints(self):
+        """Released digests are locked, then deleted only if no thread still holds them."""
+        pool = FakePool([("a",)], [(0, 0, 0, 0)], [("d1",), ("d2",)], [], [(1, 2048)])
+        compactor = PostgresCheckpointCompactor(pool, keep_last=5, batch_size=10, file_grace=60)
+
+        result = await compactor.compact()
+
+        assert (result.files, result.bytes) == (1, 2048)
+        assert pool.transactions == 2
+        release, lock, delete = pool.queries[2:]
+        assert "file_content_threads" in release[0] and release[1] == {"grace": 60}
+        assert lock[0].rstrip().endswith("FOR UPDATE") and lock[1] == {"digests": ["d1", "d2"]}
+        assert '"file_contents"' in delete[0] and delete[1] == {"digests": ["d1", "d2"]}
+
+    async def test_file_collection_stops_when_no_thread_was_released(self):
+        """Nothing is locked or deleted when every stored file still has a live thread."""
+        pool = FakePool([], [])
+        result = await PostgresCheckpointCompactor(pool, max_age=60, file_grace=60).compact()
+
+        assert result.files == 0
+        assert len(pool.queries) == 2
+
+    async def test_background_job_runs_until_closed(self):
+        """The job compacts every interval, survives failures and stops on close()."""
+        compactor = PostgresCheckpointCompactor(FakePool(), keep_last=1, interval=0.01)
+        calls = []
+
+        async def compact():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return CompactionResult()
+
+        compactor.compact = compact
+        compactor.start()
+        await asyncio.sleep(0.05)
+        await compactor.close()
+        seen = len(calls)
+        await asyncio.sleep(0.03)
+
+        assert seen >= 2
+        assert len(calls) == seen
@@ -0,0 +1,160 @@
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.graph import END, START, StateGraph
+
+from aion.langgraph.authoring.files import InMemoryFileContentStore
+from aion.langgraph.server.checkpoint.backends.memory import BoundedInMemorySaver, MemoryBackend
+
+
+def _put(saver, thread_id, step, value="x", parent=None):
+    """Store one checkpoint whose only channel changed to ``value``."""
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": value}
+    checkpoint["channel_versions"] = {"messages": step}
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": parent}}
+    return saver.put(config, checkpoint, {"step": step}, {"messages": step})
+
+
+class _State(TypedDict):
+    items: Annotated[list[int], operator.add]
+
+
+def _counting_graph(checkpointer):
+    builder = StateGraph(_State)
+    builder.add_node("first", lambda state: {"items": [1]})
+    builder.add_node("second", lambda state: {"items": [2]})
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+class TestBoundedInMemorySaver:
+    """Retention, LRU eviction and accounting of the bounded in-memory saver."""
+
+    def test_keeps_only_latest_checkpoints_per_thread(self):
+        """Older checkpoints, their writes and unreferenced blobs are dropped."""
+        saver = BoundedInMemorySaver(max_checkpoints_per_thread=2)
+        parent = None
+        for step in range(1, 6):
+            config = _put(saver, "t1", step, value=f"v{step}", parent=parent)
+            saver.put_writes(config, [("messages", f"pending {step}")], task_id="task")
+            parent = config["configurable"]["checkpoint_id"]
+
+        assert len(saver.storage["t1"][""]) == 2
+        assert sorted(key[3] for key in saver.blobs) == [4, 5]
+        assert len(saver.writes) == 2
+        latest = saver.get_tuple({"configurable": {"thread_id": "t1", "checkpoint_ns": ""}})
+        assert latest.checkpoint["channel_values"] == {"messages": "v5"}
+        assert latest.pending_writes == [("task", "messages", "pending 5")]
+
+    def test_blob_shared_with_kept_checkpoint_survives_pruning(self):
+        """A channel value a kept checkpoint still references is not deleted."""
+        saver = BoundedInMemorySaver(max_checkpoints_per_thread=1)
+        first = empty_checkpoint()
+        first["channel_values"] = {"a": 1, "b": 1}
+        first["channel_versions"] = {"a": 1, "b": 1}
+        config = saver.put(
+            {"configurable": {"thread_id": "t", "checkpoint_ns": ""}}, first, {}, {"a": 1, "b": 1}
+        )
+        second = empty_checkpoint()
+        second["channel_values"] = {"a": 1, "b": 2}
+        second["channel_versions"] = {"a": 1, "b": 2}
+        saver.put(config, second, {}, {"b": 2})
+
+        latest = saver.get_tuple({"configurable": {"thread_id": "t", "checkpoint_ns": ""}})
+        assert latest.checkpoint["channel_values"] == {"a": 1, "b": 2}
+        assert set(saver.blobs) == {("t", "", "a", 1), ("t", "", "b", 2)}
+
+    def test_evicts_least_recently_used_thread_over_thread_budget(self):
+        """Reading a thread makes it recent; the idle one is evicted."""
+        saver = BoundedInMemorySaver(max_threads=2)
+        _put(saver, "a", 1)
+        _put(saver, "b", 1)
+        saver.get_tuple({"configurable": {"thread_id": "a", "checkpoint_ns": ""}})
+        _put(saver, "c", 1)
+
+        assert set(saver.storage) == {"a", "c"}
+        assert saver.memory_usage().evicted_threads == 1
+        assert all(key[0] != "b" for key in saver.blobs)
+
+    def test_evicts_threads_over_byte_budget_but_never_the_one_written(self):
+        """The byte budget evicts other threads, not the thread being written."""
+        saver = BoundedInMemorySaver(max_bytes=1)
+        _put(saver, "a", 1, value="a" * 100)
+        assert set(saver.storage) == {"a"}
+
+        _put(saver, "b", 1, value="b" * 100)
+        assert set(saver.storage) == {"b"}
+
+    def test_memory_usage_tracks_stored_bytes(self):
+        """Accounting returns to zero once every thread is deleted."""
+        saver = BoundedInMemorySaver(max_checkpoints_per_thread=1)
+        parent = None
+        for step in range(1, 4):
+            config = _put(saver, "t", step, value="v" * 50, parent=parent)
+            saver.put_writes(config, [("messages", "w")], task_id="task")
+            parent = config["configurable"]["checkpoint_id"]
+
+        usage = saver.memory_usage()
+        assert (usage.threads, usage.checkpoints) == (1, 1)
+        stored = sum(len(blob[1]) for blob in saver.blobs.values())
+        stored += sum(len(entry[0][1]) + len(entry[1][1]) for entry in saver.storage["t"][""].values())
+        stored += sum(len(write[2][1]) for writes in saver.writes.values() for write in writes.values())
+        assert usage.bytes == stored
+
+        saver.delete_thread("t")
+        assert saver.memory_usage().bytes == 0
+        assert not saver.blobs and not saver.writes
+
+    async def test_evicting_a_thread_drops_the_files_only_it_stored(self):
+        """File contents live as long as a thread that stored them is held."""
+        store = InMemoryFileContentStore()
+        saver = BoundedInMemorySaver(max_threads=1, file_store=store)
+        own = await store.put(b"only t1", "t1")
+        shared = await store.put(b"shared", "t1")
+        await store.put(b"shared", "t2")
+        _put(saver, "t1", 1)
+
+        _put(saver, "t2", 1)
+
+        assert "t1" not in saver.storage
+        assert await store.get(own) is None
+        assert await store.get(shared) == b"shared"
+
+        saver.delete_thread("t2")
+        assert len(store) == 0
+
+    def test_unknown_thread_reads_leave_nothing_behind(self):
+        """Looking up a thread that was never written does not create it."""
+        saver = BoundedInMemorySaver()
+        config = {"configurable": {"thread_id": "missing", "checkpoint_ns": ""}}
+        assert saver.get_tuple(config) is None
+        assert list(saver.list(config)) == []
+        assert "missing" not in saver.storage
+
+    async def test_graph_runs_and_resumes_with_one_checkpoint_kept(self):
+        """A compiled graph keeps working when only the latest checkpoint is retained."""
+        saver = BoundedInMemorySaver(max_checkpoints_per_thread=1)
+        graph = _counting_graph(saver)
+        config = {"configurable": {"thread_id": "run"}}
+
+        await graph.ainvoke({"items": []}, config)
+        await graph.ainvoke({"items": []}, config)
+
+        state = await graph.aget_state(config)
+        assert state.values["items"] == [1, 2, 1, 2]
+        assert len([c async for c in saver.alist(config)]) == 1
+
+
+class TestMemoryBackendLimits:
+    """MemoryBackend passes its limits on to the saver."""
+
+    async def test_explicit_limits_reach_the_saver(self):
+        """Limits given to the backend override the settings."""
+        saver = await MemoryBackend(max_checkpoints_per_thread=3, max_threads=0, max_bytes=1024).create()
+        assert saver.max_checkpoints_per_thread == 3
+        assert saver.max_threads is None
+        assert saver.max_bytes == 1024
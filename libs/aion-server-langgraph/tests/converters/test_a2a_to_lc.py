@@ -6,6 +6,7 @@ import pytest
 from a2a.types import Part
 from google.protobuf import json_format, struct_pb2
 
+from aion.langgraph.authoring.files import InMemoryFileContentStore, file_reference_digest
 from aion.langgraph.server.converters.a2a_to_lc import A2AToLcConverter
 
 
@@ -23,6 +24,45 @@ class TestFromParts:
         assert A2AToLcConverter.from_parts([]) == []
 
 
+def _without_ids(blocks):
+    return [{key: value for key, value in block.items() if key != "id"} for block in blocks]
+
+
+class TestAfromParts:
+    """afrom_parts stores large raw parts and leaves references in their place."""
+
+    async def test_large_raw_part_becomes_reference(self):
+        """Raw bytes at the threshold are stored once and referenced by digest."""
+        store = InMemoryFileContentStore()
+        raw = b"x" * 1024
+        result = await A2AToLcConverter.afrom_parts(
+            [Part(raw=raw, media_type="application/pdf"), Part(raw=raw, media_type="application/pdf")],
+            file_store=store,
+            reference_min_bytes=1024,
+        )
+
+        digest = file_reference_digest(result[0])
+        assert digest is not None
+        assert "base64" not in result[0]
+        assert result[0]["mime_type"] == "application/pdf"
+        assert await store.get(digest) == raw
+        assert len(store) == 1
+
+    async def test_small_raw_and_text_parts_stay_inline(self):
+        """Parts below the threshold convert exactly as from_parts does."""
+        parts = [Part(text="Hello"), Part(raw=b"tiny", media_type="image/png")]
+        result = await A2AToLcConverter.afrom_parts(
+            parts, file_store=InMemoryFileContentStore(), reference_min_bytes=1024
+        )
+        assert _without_ids(result) == _without_ids(A2AToLcConverter.from_parts(parts))
+
+    async def test_without_store_matches_from_parts(self):
+        """No store means inline base64, as before."""
+        parts = [Part(raw=b"x" * 2048, media_type="image/png")]
+        result = await A2AToLcConverter.afrom_parts(parts)
+        assert _without_ids(result) == _without_ids(A2AToLcConverter.from_parts(parts))
+
+
 class TestFromPart:
     """from_part dispatches to the correct block type by Part field presence."""
 
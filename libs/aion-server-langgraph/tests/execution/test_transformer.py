@@ -1,9 +1,11 @@
+import base64
 from unittest.mock import Mock, patch
 
 import pytest
 from a2a.types import Part
 from langchain_core.messages import HumanMessage
 
+from aion.langgraph.authoring.files import InMemoryFileContentStore, resolve_file_references
 from aion.langgraph.server.execution.transformer import LangGraphTransformer
 
 from ..helpers import make_execution_config, make_mock_request_context
@@ -61,3 +63,31 @@ class TestGenerateLangGraphInputs:
         with patch(A2A_CONVERTER_PATH, return_value=[]):
             result = LangGraphTransformer.generate_langgraph_inputs(ctx)
         assert result == {"messages": []}
+
+
+class TestAgenerateLangGraphInputs:
+    """agenerate_langgraph_inputs keeps large files out of the state when given a store."""
+
+    async def test_large_file_enters_state_as_reference(self):
+        """The HumanMessage holds a reference that resolves to the original bytes."""
+        store = InMemoryFileContentStore()
+        raw = b"%PDF" * 1024
+        a2a_msg = Mock()
+        a2a_msg.parts = [Part(text="Summarize this"), Part(raw=raw, media_type="application/pdf")]
+        ctx = make_mock_request_context(message=a2a_msg)
+
+        result = await LangGraphTransformer.agenerate_langgraph_inputs(ctx, file_store=store, reference_min_bytes=1024)
+
+        message = result["messages"][0]
+        assert "base64" not in message.content[1]
+        resolved = await resolve_file_references([message], store)
+        assert base64.b64decode(resolved[0].content[1]["base64"]) == raw
+        assert message.content[1]["url"].startswith("aion-file://")
+
+        store.release_thread("ctx-1")
+        assert len(store) == 0
+
+    async def test_without_store_delegates_to_sync_conversion(self):
+        """No store produces the same inputs as generate_langgraph_inputs."""
+        ctx = make_mock_request_context(message=None)
+        assert await LangGraphTransformer.agenerate_langgraph_inputs(ctx) == {"messages": []}
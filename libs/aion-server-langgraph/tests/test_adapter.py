@@ -6,7 +6,9 @@ from aion.server.agent.exceptions import ConfigurationError
 from langgraph.graph import StateGraph
 from langgraph.pregel import Pregel
 
+from aion.langgraph.authoring.files import InMemoryFileContentStore
 from aion.langgraph.server.adapter import LangGraphAdapter
+from aion.langgraph.server.checkpoint import AionAsyncPostgresSaver, PostgresCheckpointCompactor
 from aion.langgraph.server.execution import LangGraphExecutor
 
 
@@ -181,6 +183,25 @@ class TestCreateExecutor:
             with pytest.raises(TypeError):
                 await self.adapter.create_executor(object(), self.config)
 
+    async def test_file_references_disabled_by_default(self):
+        """Without a reference threshold the executor keeps files inline."""
+        with patch.object(LangGraphAdapter, "_is_graph_instance", return_value=True):
+            executor = await self.adapter.create_executor(Mock(spec=Pregel), self.config)
+        assert executor._file_store is None
+
+    async def test_file_reference_threshold_installs_process_store(self):
+        """A threshold gives executors one store, also used to resolve references."""
+        with patch.object(LangGraphAdapter, "_is_graph_instance", return_value=True), \
+             patch("aion.langgraph.server.adapter.langgraph_settings.file_reference_min_bytes", 1024), \
+             patch("aion.langgraph.server.adapter.set_file_content_store") as set_store:
+            first = await self.adapter.create_executor(Mock(spec=Pregel), self.config)
+            second = await self.adapter.create_executor(Mock(spec=Pregel), self.config)
+
+        assert isinstance(first._file_store, InMemoryFileContentStore)
+        assert second._file_store is first._file_store
+        assert first._file_reference_min_bytes == 1024
+        set_store.assert_called_once_with(first._file_store)
+
 
 class TestGetCheckpointer:
     """_get_checkpointer falls back to None when factory raises."""
@@ -216,3 +237,36 @@ class TestValidateConfig:
         config = Mock()
         config.path = "/some/path"
         self.adapter.validate_config(config)
+
+
+class TestCheckpointCompaction:
+    """Compaction starts with a Postgres checkpointer and a retention policy only."""
+
+    def setup_method(self):
+        self.adapter = LangGraphAdapter()
+
+    async def test_no_policy_starts_nothing(self):
+        saver = Mock(spec=AionAsyncPostgresSaver)
+        with patch("aion.langgraph.server.adapter.CheckpointerFactory.create", new=AsyncMock(return_value=saver)):
+            assert await self.adapter._get_checkpointer() is saver
+        assert self.adapter._compactor is None
+
+    async def test_policy_starts_one_compactor_and_close_stops_it(self):
+        saver = Mock(spec=AionAsyncPostgresSaver)
+        saver.conn = Mock()
+        with patch("aion.langgraph.server.adapter.CheckpointerFactory.create", new=AsyncMock(return_value=saver)), \
+             patch("aion.langgraph.server.adapter.langgraph_settings.checkpoint_keep_last", 10), \
+             patch.object(PostgresCheckpointCompactor, "start") as start:
+            await self.adapter._get_checkpointer()
+            await self.adapter._get_checkpointer()
+
+        start.assert_called_once()
+        compactor = self.adapter._compactor
+        assert compactor.keep_last == 10
+        assert compactor.max_age is None
+        assert compactor.file_grace is None
+
+        with patch.object(PostgresCheckpointCompactor, "close", new=AsyncMock()) as close:
+            await self.adapter.close()
+        close.assert_awaited_once()
+        assert self.adapter._compactor is None
@@ -0,0 +1,85 @@
+"""In-process cache for the static-per-deployment documents an agent serves.
+
+An agent's card, its OpenAPI schema and its Swagger UI page only change when
+the agent process is replaced, yet clients and the platform poll them
+constantly. Each poll used to cost a round trip to the agent and, for the
+schema and docs, a full decode-rewrite-encode pass in the proxy. The cache
+keeps the bytes the proxy actually answered with - after any rewriting - so a
+hit is served without touching the agent or re-running the rewrite.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from aion.server.utils.documents import CachedDocument
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CachedDocument",
+    "ProxyDocumentCache",
+]
+
+
+class ProxyDocumentCache:
+    """Agent documents keyed by agent id and the path they were served under.
+
+    Entries live until the agent they came from is invalidated - which the
+    ``aion serve`` supervisor requests whenever it sees an agent process stop
+    or come back under a new pid - or the proxy process ends.
+    """
+
+    def __init__(self):
+        self._documents: Dict[Tuple[str, str], CachedDocument] = {}
+
+    def get(self, agent_id: str, path: str) -> Optional[CachedDocument]:
+        """Return the cached document for an agent path, if any."""
+        return self._documents.get((agent_id, path))
+
+    def put(
+            self,
+            agent_id: str,
+            path: str,
+            body: bytes,
+            media_type: Optional[str] = None,
+    ) -> CachedDocument:
+        """Store the bytes served for an agent path.
+
+        Args:
+            agent_id: Agent the document belongs to.
+            path: Agent-relative path the document was served under.
+            body: Exact response body, after any proxy-side rewriting.
+            media_type: Content type to serve the body with.
+
+        Returns:
+            The stored document, with its entity tag computed.
+        """
+        document = CachedDocument.from_body(body, media_type)
+        self._documents[(agent_id, path)] = document
+        logger.debug(f"Cached '{path}' for agent '{agent_id}' ({len(body)} bytes)")
+        return document
+
+    def invalidate(self, agent_id: Optional[str] = None) -> int:
+        """Drop the documents of one agent, or of every agent.
+
+        Args:
+            agent_id: Agent whose documents to drop; None drops everything.
+
+        Returns:
+            Number of documents dropped.
+        """
+        if agent_id is None:
+            dropped = len(self._documents)
+            self._documents.clear()
+        else:
+            keys = [key for key in self._documents if key[0] == agent_id]
+            for key in keys:
+                del self._documents[key]
+            dropped = len(keys)
+
+        if dropped:
+            logger.debug(f"Invalidated {dropped} cached documents for agent '{agent_id or '*'}'")
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self._documents)
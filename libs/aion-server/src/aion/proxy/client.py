@@ -4,51 +4,79 @@ HTTP client management for AION Agent Proxy Server
 """
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 import httpx
+from aion.server.settings import app_settings
 
 logger = logging.getLogger(__name__)
 
 class ProxyHttpClient:
-    """Manages HTTP client lifecycle for proxy server"""
+    """Manages HTTP client lifecycle for proxy server
+
+    Every agent gets a client - and so a connection pool - of its own. A
+    single shared pool let one agent holding long SSE streams take every
+    connection, stalling requests to agents that had nothing to do with it.
+    """
 
     def __init__(self):
-        self.client: Optional[httpx.AsyncClient] = None
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        """Per-agent pool limits from the application settings."""
+        return httpx.Limits(
+            max_connections=app_settings.proxy_max_connections_per_agent,
+            max_keepalive_connections=app_settings.proxy_max_keepalive_connections_per_agent,
+            keepalive_expiry=app_settings.proxy_keepalive_expiry_seconds,
+        )
 
     @asynccontextmanager
-    async def lifespan(self):
+    async def lifespan(self, agent_ids: Iterable[str]):
         """
         Context manager for HTTP client lifecycle
 
+        Args:
+            agent_ids: Agents to create a connection pool for
+
         Yields:
-            httpx.AsyncClient: The initialized HTTP client
+            Dict[str, httpx.AsyncClient]: The initialized HTTP client of each agent
         """
         # Startup
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            follow_redirects=True
-        )
-        logger.debug("HTTP client initialized")
+        limits = self._limits()
+        self.clients = {
+            agent_id: httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=limits,
+                follow_redirects=True
+            )
+            for agent_id in agent_ids
+        }
+        logger.debug(f"HTTP clients initialized for {len(self.clients)} agents")
 
         try:
-            yield self.client
+            yield self.clients
         finally:
             # Shutdown
-            if self.client:
-                await self.client.aclose()
-                logger.debug("HTTP client closed")
+            for client in self.clients.values():
+                await client.aclose()
+            self.clients = {}
+            logger.debug("HTTP clients closed")
 
-    def get_client(self) -> httpx.AsyncClient:
+    def get_client(self, agent_id: str) -> httpx.AsyncClient:
         """
-        Get the current HTTP client instance
+        Get the HTTP client serving an agent
+
+        Args:
+            agent_id: Agent identifier
 
         Returns:
             httpx.AsyncClient: The HTTP client
 
         Raises:
-            RuntimeError: If client is not initialized
+            RuntimeError: If clients are not initialized or the agent is unknown
         """
-        if self.client is None:
-            raise RuntimeError("HTTP client not initialized")
-        return self.client
+        client: Optional[httpx.AsyncClient] = self.clients.get(agent_id)
+        if client is None:
+            raise RuntimeError(f"HTTP client for agent '{agent_id}' not initialized")
+        return client
@@ -2,8 +2,11 @@
 
 import re
 
+from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
+
 HEALTH_CHECK_URL = "/health/"
 SYSTEM_HEALTH_CHECK_URL = "/health/system/"
+METRICS_URL = "/metrics"
 MANIFEST_URL = "/.well-known/manifest.json"
 
 # The one place the shape of an agent's address is written down. Everything below
@@ -17,6 +20,22 @@ AGENT_PROXY_URL = f"{AGENT_PROXY_PREFIX}/{{path:path}}"
 # Group 2 is None for a bare root - use ``or ''``.
 AGENT_PATH_PATTERN = re.compile(r'^/agents/([^/]+)(?:/(.*))?$')
 
+# Agent-relative paths whose documents only change when the agent process is
+# replaced, and which the proxy therefore answers from its document cache.
+CACHEABLE_AGENT_PATHS = frozenset({
+    AGENT_CARD_WELL_KNOWN_PATH.lstrip("/"),
+    "openapi.json",
+    "docs",
+})
+
+# Control message the ``aion serve`` supervisor sends down the proxy's pipe when
+# an agent process stopped or was replaced, so documents it served are dropped.
+AGENT_RESTARTED_MESSAGE = "agent_restarted"
+
+# Control message carrying the supervisor's platform connection state, sent
+# whenever it changes, so the proxy's metrics can report it.
+PLATFORM_LINK_STATE_MESSAGE = "platform_link_state"
+
 
 def build_agent_path(agent_id: str, path: str = "") -> str:
     """Build a full agent proxy path from agent_id and path.
@@ -1,10 +1,13 @@
 """Request handlers for the AION Agent Proxy Server."""
 
+import asyncio
 import logging
-from typing import Any, AsyncIterator, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Mapping, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
+from aion.server.metrics import Histogram
+from aion.server.settings import app_settings
 from fastapi import Request, Response
 from starlette.responses import StreamingResponse
 from starlette.types import Receive, Scope, Send
@@ -16,6 +19,7 @@ from .exceptions import (
     AgentProxyException
 )
 from .types import AgentHealthInfo
+from .upstream import AgentUpstream, CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +74,7 @@ class UpstreamStreamingResponse(StreamingResponse):
         upstream_response: httpx.Response,
         headers: Dict[str, str],
         agent_id: str,
+        on_close: Optional[Callable[[], None]] = None,
     ) -> None:
         """Initialize a response backed by the upstream raw byte stream.
 
@@ -77,9 +82,11 @@ class UpstreamStreamingResponse(StreamingResponse):
             upstream_response: Open HTTPX response to forward.
             headers: End-to-end response headers safe to forward downstream.
             agent_id: Target agent identifier, used when logging stream errors.
+            on_close: Called once the upstream response has been released.
         """
         self._upstream_response = upstream_response
         self._agent_id = agent_id
+        self._on_close = on_close
         super().__init__(
             content=self._relay_upstream(),
             status_code=upstream_response.status_code,
@@ -116,22 +123,48 @@ class UpstreamStreamingResponse(StreamingResponse):
         try:
             await super().__call__(scope, receive, send)
         finally:
-            await self._upstream_response.aclose()
+            try:
+                await self._upstream_response.aclose()
+            finally:
+                if self._on_close is not None:
+                    self._on_close()
 
 
 class RequestHandler:
     """Handles request forwarding to agent servers"""
 
-    def __init__(self, agent_urls: Dict[str, str], http_client: httpx.AsyncClient):
+    def __init__(
+        self,
+        agent_urls: Dict[str, str],
+        http_client: Union[httpx.AsyncClient, Mapping[str, httpx.AsyncClient]],
+    ):
         """
         Initialize request handler
 
         Args:
             agent_urls: Mapping of agent_id to agent base URLs
-            http_client: HTTP client for making requests
+            http_client: HTTP client for making requests - either one client
+                per agent, or a single client shared by all of them
         """
         self.agent_urls = agent_urls
-        self.http_client = http_client
+        self.upstream_latency = Histogram(
+            "aion_proxy_upstream_latency_seconds",
+            "Time from forwarding a request to the agent's response headers.",
+            labelnames=("agent_id",),
+        )
+        self.upstreams: Dict[str, AgentUpstream] = {
+            agent_id: AgentUpstream(
+                agent_id=agent_id,
+                url=agent_url,
+                client=http_client[agent_id] if isinstance(http_client, Mapping) else http_client,
+                breaker=CircuitBreaker(
+                    failure_threshold=app_settings.proxy_circuit_failure_threshold,
+                    reset_timeout=app_settings.proxy_circuit_reset_timeout_seconds,
+                ),
+                latency=self.upstream_latency,
+            )
+            for agent_id, agent_url in agent_urls.items()
+        }
 
     async def check_agents_health(self) -> Dict[str, Any]:
         """
@@ -142,35 +175,40 @@ class RequestHandler:
         """
         results = {}
 
-        for agent_id, agent_url in self.agent_urls.items():
+        for agent_id, upstream in self.upstreams.items():
+            agent_url = upstream.url
             try:
                 # Try to connect to agent's health endpoint or root
-                response = await self.http_client.get(
+                response = await upstream.client.get(
                     f"{agent_url}/health/",
                     timeout=5.0
                 )
                 results[agent_id] = AgentHealthInfo(
                     status="healthy" if response.status_code == 200 else "unhealthy",
                     url=agent_url,
-                    status_code=response.status_code
+                    status_code=response.status_code,
+                    upstream=upstream.metrics()
                 )
             except httpx.ConnectError:
                 results[agent_id] = AgentHealthInfo(
                     status="unavailable",
                     url=agent_url,
-                    error="connection_refused"
+                    error="connection_refused",
+                    upstream=upstream.metrics()
                 )
             except httpx.TimeoutException:
                 results[agent_id] = AgentHealthInfo(
                     status="timeout",
                     url=agent_url,
-                    error="timeout"
+                    error="timeout",
+                    upstream=upstream.metrics()
                 )
             except Exception as e:
                 results[agent_id] = AgentHealthInfo(
                     status="error",
                     url=agent_url,
-                    error=str(e)
+                    error=str(e),
+                    upstream=upstream.metrics()
                 )
 
         # Overall status
@@ -202,23 +240,31 @@ class RequestHandler:
 
         Raises:
             AgentNotFoundException: When agent_id is not found
-            AgentUnavailableException: When agent server is unreachable
+            AgentUnavailableException: When agent server is unreachable, or its
+                circuit is open after repeated connect failures or timeouts
             AgentTimeoutException: When agent server times out
             AgentProxyException: When there's an error forwarding the request
         """
         # Check if agent exists
-        if agent_id not in self.agent_urls:
+        upstream = self.upstreams.get(agent_id)
+        if upstream is None:
             available_agents = list(self.agent_urls.keys())
             raise AgentNotFoundException(agent_id, available_agents)
 
+        # Fail fast while the agent's circuit is open
+        if not upstream.allow_request():
+            logger.warning(f"Circuit open for agent '{agent_id}', refusing request")
+            raise AgentUnavailableException(agent_id)
+
         # Build target URL
-        agent_base_url = self.agent_urls[agent_id]
+        agent_base_url = upstream.url
         target_url = urljoin(f"{agent_base_url}/", path)
 
         # Add query parameters if present
         if request.url.query:
             target_url = f"{target_url}?{request.url.query}"
 
+        started_at: Optional[float] = None
         try:
             # Prepare headers: everything the client sent except what described
             # its own hop to us (see _REQUEST_HEADERS_MANAGED_BY_PROXY). httpx
@@ -234,36 +280,77 @@ class RequestHandler:
 
             # Keep the upstream response open so streaming responses can flow
             # through the proxy without first being buffered in memory.
-            upstream_request = self.http_client.build_request(
+            upstream_request = upstream.client.build_request(
                 method=request.method,
                 url=target_url,
                 headers=headers,
                 content=body,
                 timeout=_FORWARD_TIMEOUT,
             )
-            response = await self.http_client.send(
+            started_at = upstream.request_started()
+            response = await upstream.client.send(
                 upstream_request,
                 stream=True,
             )
+            upstream.request_answered(started_at)
 
             return UpstreamStreamingResponse(
                 response,
                 self._forwarded_response_headers(response),
                 agent_id,
+                on_close=upstream.request_finished,
             )
 
         except httpx.ConnectError:
             logger.error(f"Failed to connect to agent '{agent_id}' at {agent_base_url}")
+            self._record_failure(upstream, started_at, counts_against_circuit=True)
             raise AgentUnavailableException(agent_id)
 
+        except httpx.PoolTimeout:
+            # No free connection in the proxy's own pool: local saturation,
+            # which says nothing about whether the agent is reachable.
+            logger.error(f"Timeout waiting for a connection to agent '{agent_id}' from the proxy's pool")
+            self._record_failure(upstream, started_at, counts_against_circuit=False)
+            raise AgentTimeoutException(agent_id)
+
         except httpx.TimeoutException:
             logger.error(f"Timeout when connecting to agent '{agent_id}'")
+            self._record_failure(upstream, started_at, counts_against_circuit=True)
             raise AgentTimeoutException(agent_id)
 
         except Exception as e:
             logger.error(f"Error forwarding request to agent '{agent_id}': {str(e)}")
+            self._record_failure(upstream, started_at, counts_against_circuit=False)
             raise AgentProxyException(agent_id, str(e))
 
+        except asyncio.CancelledError:
+            # The caller went away mid-request, which says nothing about the agent.
+            self._record_failure(upstream, started_at, counts_against_circuit=False)
+            raise
+
+    @staticmethod
+    def _record_failure(
+        upstream: AgentUpstream,
+        started_at: Optional[float],
+        counts_against_circuit: bool,
+    ) -> None:
+        """Record a forward that got no answer from the agent.
+
+        Args:
+            upstream: Upstream state of the target agent
+            started_at: When the request was sent, or None if it never was -
+                reading the client's body can fail first, which says nothing
+                about the agent and never took an in-flight slot
+            counts_against_circuit: Whether the failure means the agent is
+                unreachable (connect failures and timeouts)
+        """
+        if started_at is None:
+            upstream.request_abandoned()
+            return
+
+        upstream.request_failed(counts_against_circuit)
+        upstream.request_finished()
+
     @staticmethod
     def _forwarded_response_headers(
         response: httpx.Response,
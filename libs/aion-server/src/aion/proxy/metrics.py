@@ -0,0 +1,209 @@
+"""Metrics the proxy serves: its own per-agent forwarding state, plus every agent's metrics."""
+
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Callable, Optional
+
+import httpx
+from aion.server.constants import METRICS_URL
+from aion.server.metrics import Histogram, MetricFamily, Sample, escape_label_value, render_metrics
+
+from .upstream import AgentUpstream, CircuitState
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ProxyMetricsCollector",
+    "relabel_agent_metrics",
+    "render_proxy_metrics",
+]
+
+AGENT_LABEL = "agent_id"
+
+
+class ProxyMetricsCollector:
+    """Reports the forwarding state the proxy keeps per agent, and the platform link.
+
+    Everything but the latency histogram is read from ``AgentUpstream`` and
+    the latest platform link state at scrape time, so forwarding a request
+    updates nothing it did not update before.
+    """
+
+    def __init__(
+            self,
+            upstreams: Mapping[str, AgentUpstream],
+            latency: Optional[Histogram] = None,
+            platform_link_state: Optional[Callable[[], Optional[Mapping[str, Any]]]] = None,
+    ):
+        """
+        Args:
+            upstreams: Upstream state by agent id.
+            latency: Histogram of upstream latency the upstreams observe into.
+            platform_link_state: Returns the last platform connection state the
+                ``aion serve`` supervisor reported, or None if it reported none.
+        """
+        self._upstreams = upstreams
+        self._latency = latency
+        self._platform_link_state = platform_link_state
+
+    def collect(self) -> Iterator[MetricFamily]:
+        def per_agent(read) -> list[Sample]:
+            return [
+                Sample("", ((AGENT_LABEL, agent_id),), read(upstream))
+                for agent_id, upstream in self._upstreams.items()
+            ]
+
+        yield MetricFamily(
+            "aion_proxy_in_flight_requests", "gauge",
+            "Requests forwarded to the agent whose responses are still being relayed.",
+            per_agent(lambda upstream: upstream.in_flight),
+        )
+        yield MetricFamily(
+            "aion_proxy_requests_total", "counter",
+            "Requests forwarded to the agent.",
+            per_agent(lambda upstream: upstream.requests_total),
+        )
+        yield MetricFamily(
+            "aion_proxy_failures_total", "counter",
+            "Forwarded requests the agent did not answer: connect errors and timeouts.",
+            per_agent(lambda upstream: upstream.failures_total),
+        )
+        yield MetricFamily(
+            "aion_proxy_rejected_total", "counter",
+            "Requests refused without forwarding because the agent's circuit was open.",
+            per_agent(lambda upstream: upstream.rejected_total),
+        )
+        yield MetricFamily(
+            "aion_proxy_circuit_state", "gauge",
+            "1 for the state the agent's circuit breaker is in, 0 for the others.",
+            [
+                Sample("", ((AGENT_LABEL, agent_id), ("state", state.value)), int(upstream.circuit_state is state))
+                for agent_id, upstream in self._upstreams.items()
+                for state in CircuitState
+            ],
+        )
+        if self._latency is not None:
+            yield from self._latency.collect()
+
+        state = self._platform_link_state() if self._platform_link_state is not None else None
+        if state is not None:
+            yield MetricFamily(
+                "aion_platform_connected", "gauge",
+                "1 while the deployment's connection to the Aion platform is up.",
+                [Sample("", (), int(state.get("status") == "connected"))],
+            )
+            yield MetricFamily(
+                "aion_platform_reconnects_total", "counter",
+                "Times the connection to the Aion platform was re-established after dropping.",
+                [Sample("", (), state.get("reconnects", 0))],
+            )
+
+
+def relabel_agent_metrics(bodies: Mapping[str, str]) -> list[str]:
+    """Merge the metrics of several agents into one exposition, labelled by agent.
+
+    Every sample gets an ``agent_id`` label, and the samples of a metric are
+    grouped under one ``HELP`` and ``TYPE`` pair whichever agents reported it:
+    the format does not allow a metric to appear twice.
+
+    Args:
+        bodies: Each agent's ``/metrics`` response body, by agent id.
+
+    Returns:
+        Exposition lines, metrics in the order they were first seen.
+    """
+    families: dict[str, dict[str, Any]] = {}
+
+    def family(name: str) -> dict[str, Any]:
+        found = families.get(name)
+        if found is None:
+            found = families[name] = {"help": None, "type": None, "samples": []}
+        return found
+
+    for agent_id, body in bodies.items():
+        label = f'{AGENT_LABEL}="{escape_label_value(agent_id)}"'
+        current: Optional[str] = None
+        for line in body.splitlines():
+            if not line:
+                continue
+            if line.startswith("#"):
+                parts = line.split(None, 3)
+                if len(parts) >= 3 and parts[1] in ("HELP", "TYPE"):
+                    current = parts[2]
+                    entry = family(current)
+                    key = parts[1].lower()
+                    entry[key] = entry[key] or line
+                continue
+
+            end = _name_end(line)
+            name = line[:end]
+            # Histogram and summary samples carry a suffix on their family's name.
+            owner = current if current is not None and name.startswith(current) else name
+            if line.startswith("{}", end):
+                relabelled = f"{name}{{{label}}}{line[end + 2:]}"
+            elif line.startswith("{", end):
+                relabelled = f"{name}{{{label},{line[end + 1:]}"
+            else:
+                relabelled = f"{name}{{{label}}}{line[end:]}"
+            family(owner)["samples"].append(relabelled)
+
+    lines: list[str] = []
+    for entry in families.values():
+        if not entry["samples"]:
+            continue
+        lines.extend(line for line in (entry["help"], entry["type"]) if line is not None)
+        lines.extend(entry["samples"])
+    return lines
+
+
+async def render_proxy_metrics(
+        collectors: Iterable,
+        upstreams: Mapping[str, AgentUpstream],
+        timeout: float,
+) -> bytes:
+    """Render the proxy's own metrics followed by every agent's, scraped concurrently.
+
+    An agent that does not answer within ``timeout``, or answers with an error,
+    contributes nothing but ``aion_proxy_agent_scrape_up 0``.
+
+    Args:
+        collectors: The proxy's own collectors.
+        upstreams: Upstream state by agent id, whose clients scrape the agents.
+        timeout: Seconds each agent scrape may take.
+
+    Returns:
+        The response body for the proxy's ``/metrics``.
+    """
+    agent_ids = list(upstreams)
+    results = await asyncio.gather(*(
+        _scrape(upstreams[agent_id], timeout) for agent_id in agent_ids
+    ))
+    bodies = {agent_id: body for agent_id, body in zip(agent_ids, results) if body is not None}
+
+    scrape_up = MetricFamily(
+        "aion_proxy_agent_scrape_up", "gauge",
+        "1 if the agent's metrics were read in this scrape, 0 if it did not answer.",
+        [Sample("", ((AGENT_LABEL, agent_id),), int(agent_id in bodies)) for agent_id in agent_ids],
+    )
+    families = [family for collector in collectors for family in collector.collect()]
+    return render_metrics([*families, scrape_up], extra=relabel_agent_metrics(bodies))
+
+
+async def _scrape(upstream: AgentUpstream, timeout: float) -> Optional[str]:
+    try:
+        response = await upstream.client.get(f"{upstream.url}{METRICS_URL}", timeout=timeout)
+    except httpx.HTTPError as exc:
+        logger.debug("Could not scrape metrics of agent '%s': %s", upstream.agent_id, exc)
+        return None
+    if response.status_code != 200:
+        logger.debug("Agent '%s' answered its metrics scrape with HTTP %s", upstream.agent_id, response.status_code)
+        return None
+    return response.text
+
+
+def _name_end(line: str) -> int:
+    for index, char in enumerate(line):
+        if char in "{ \t":
+            return index
+    return len(line)
@@ -1,7 +1,9 @@
+from .cache import ProxyDocumentCacheMiddleware
 from .logging import ProxyLoggingMiddleware
 from .swagger import ProxySwaggerUIFixMiddleware
 
 __all__ = [
+    "ProxyDocumentCacheMiddleware",
     "ProxyLoggingMiddleware",
     "ProxySwaggerUIFixMiddleware",
-]
\ No newline at end of file
+]
@@ -0,0 +1,72 @@
+"""Middleware answering agent cards, schemas and docs pages from the proxy cache."""
+
+import logging
+from typing import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..cache import ProxyDocumentCache
+from ..constants import AGENT_PATH_PATTERN, CACHEABLE_AGENT_PATHS
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ProxyDocumentCacheMiddleware"]
+
+
+class ProxyDocumentCacheMiddleware(BaseHTTPMiddleware):
+    """Serve static-per-deployment agent documents from memory.
+
+    Registered outside :class:`ProxySwaggerUIFixMiddleware`, so what it stores
+    is the already rewritten schema and docs page: a hit skips both the upstream
+    request and the rewrite. Every cached answer carries an ``ETag``, and a
+    client presenting it in ``If-None-Match`` is answered with a bodiless 304.
+
+    Only plain ``GET``/``HEAD`` requests without a query string are answered
+    from the cache, and only successful, uncompressed ``GET`` answers are
+    stored - anything else passes through untouched.
+
+    Args:
+        app: The ASGI application
+        cache: Document cache shared with the proxy server
+    """
+
+    def __init__(self, app, cache: ProxyDocumentCache):
+        super().__init__(app)
+        self.cache = cache
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Answer from the cache, or fill it from the upstream answer."""
+        if request.method not in ("GET", "HEAD") or request.url.query:
+            return await call_next(request)
+
+        match = AGENT_PATH_PATTERN.match(request.url.path)
+        if not match:
+            return await call_next(request)
+
+        agent_id = match.group(1)
+        agent_path = (match.group(2) or '').rstrip('/')
+        if agent_path not in CACHEABLE_AGENT_PATHS:
+            return await call_next(request)
+
+        document = self.cache.get(agent_id, agent_path)
+        if document is None:
+            response = await call_next(request)
+            # A HEAD answer has no body to store, only a GET may fill the cache.
+            if (
+                request.method != "GET"
+                or response.status_code != 200
+                or 'content-encoding' in response.headers
+            ):
+                return response
+
+            body = b''.join([chunk async for chunk in response.body_iterator])
+            document = self.cache.put(
+                agent_id,
+                agent_path,
+                body,
+                media_type=response.headers.get('content-type'),
+            )
+
+        return document.to_response(request.headers.get('if-none-match'))
@@ -67,10 +67,7 @@ class ProxySwaggerUIFixMiddleware(BaseHTTPMiddleware):
     @staticmethod
     async def _read_response_body(response: Response) -> bytes:
         """Read full response body from iterator."""
-        body = b''
-        async for chunk in response.body_iterator:
-            body += chunk
-        return body
+        return b''.join([chunk async for chunk in response.body_iterator])
 
     @staticmethod
     def _create_error_response(body: bytes, response: Response) -> Response:
@@ -3,16 +3,22 @@ Route definitions for AION Agent Proxy Server
 """
 from aion.core.http import HealthResponse
 from aion.core.a2a import A2AManifest
+from aion.server.metrics import CONTENT_TYPE
+from aion.server.settings import app_settings
 from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 
+from .cache import CachedDocument
 from .constants import (
     HEALTH_CHECK_URL,
     SYSTEM_HEALTH_CHECK_URL,
+    METRICS_URL,
     MANIFEST_URL,
     AGENT_PROXY_URL,
     AGENT_PROXY_PREFIX,
 )
 from .handlers import RequestHandler
+from .metrics import ProxyMetricsCollector, render_proxy_metrics
 from .types import SystemHealthResponse
 from .utils import generate_a2a_manifest
 
@@ -40,6 +46,8 @@ class ProxyRouter:
         """Register all routes with the FastAPI application"""
         self._register_health_check()
         self._register_system_health_check()
+        if app_settings.metrics_enabled:
+            self._register_metrics()
         self._register_manifest()
         self._register_proxy()
 
@@ -80,23 +88,57 @@ class ProxyRouter:
             result = await self.request_handler.check_agents_health()
             return SystemHealthResponse(**result)
 
+    def _register_metrics(self) -> None:
+        """Register the metrics endpoint, aggregating the proxy's and every agent's metrics"""
+
+        @self.app.get(METRICS_URL, include_in_schema=False)
+        async def metrics() -> Response:
+            """
+            Prometheus metrics of the proxy and of all configured agents
+
+            Returns:
+                The proxy's per-agent forwarding metrics and the platform link,
+                followed by each agent's own metrics labelled with its agent_id
+            """
+            upstreams = self.request_handler.upstreams
+            collector = ProxyMetricsCollector(
+                upstreams,
+                latency=self.request_handler.upstream_latency,
+                platform_link_state=lambda: self.ap_server.platform_link_state,
+            )
+            body = await render_proxy_metrics(
+                [collector],
+                upstreams,
+                timeout=app_settings.proxy_metrics_scrape_timeout_seconds,
+            )
+            return Response(body, media_type=CONTENT_TYPE)
+
     def _register_manifest(self) -> None:
         """Register manifest endpoint"""
 
+        # The agent set is fixed for the life of the proxy, so the manifest is
+        # rendered once and every request is answered with the same bytes.
+        manifest = generate_a2a_manifest(agent_ids=list(self.ap_server.agent_urls.keys()))
+        document = CachedDocument.from_body(
+            JSONResponse(content=manifest.model_dump(mode="json")).body,
+            media_type="application/json",
+        )
+
         @self.app.get(
             MANIFEST_URL,
             response_model=A2AManifest,
             summary="Manifest",
             description="Get a manifest from the deployment"
         )
-        async def get_manifest() -> A2AManifest:
+        async def get_manifest(request: Request) -> Response:
             """
             Get deployment manifest with service information and agent endpoints
 
             Returns:
-                RootManifest containing API version, service name, and agent endpoints
+                RootManifest containing API version, service name, and agent endpoints,
+                or a bodiless 304 when the client's copy is current
             """
-            return generate_a2a_manifest(agent_ids=list(self.ap_server.agent_urls.keys()))
+            return document.to_response(request.headers.get("if-none-match"))
 
     def _register_proxy(self) -> None:
         """Register proxy endpoint for forwarding requests to agents"""
@@ -3,16 +3,25 @@ AION Agent Proxy Server
 Simple proxy server that routes requests to different AION agents based on agent_id
 """
 import aion.core.logging.base  # noqa: F401
+import asyncio
 import logging
 import uvicorn
 from aion.server.settings import app_settings
-from contextlib import asynccontextmanager
+from aion.server.utils.serving import uvicorn_config_options
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from typing import Dict, Optional, Callable
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, Callable
 
+from .cache import ProxyDocumentCache
 from .client import ProxyHttpClient
+from .constants import AGENT_RESTARTED_MESSAGE, PLATFORM_LINK_STATE_MESSAGE
 from .handlers import RequestHandler
-from .middlewares import ProxySwaggerUIFixMiddleware, ProxyLoggingMiddleware
+from .middlewares import (
+    ProxyDocumentCacheMiddleware,
+    ProxySwaggerUIFixMiddleware,
+    ProxyLoggingMiddleware,
+)
 from .routes import ProxyRouter
 
 logger = logging.getLogger(__name__)
@@ -24,18 +33,29 @@ class AionAgentProxyServer:
     based on agent_id in the URL path
     """
 
-    def __init__(self, agents: Dict[str, str], startup_callback: Optional[Callable] = None):
+    def __init__(
+            self,
+            agents: Dict[str, str],
+            startup_callback: Optional[Callable] = None,
+            control_conn: Optional[Connection] = None,
+    ):
         """
         Initialize proxy server with agent mappings
 
         Args:
             agents: Dictionary mapping agent_id to agent_url (e.g., {"my-agent": "http://0.0.0.0:8001"})
             startup_callback: Optional callback to call after server lifespan startup completes
+            control_conn: Optional pipe to the supervising process, read for
+                control messages such as agent restarts
         """
         self.agent_urls = agents
         self.http_client_manager = ProxyHttpClient()
         self.request_handler: Optional[RequestHandler] = None
         self.startup_callback = startup_callback
+        self.control_conn = control_conn
+        self.document_cache = ProxyDocumentCache()
+        # Last platform connection state the supervisor reported, for metrics.
+        self.platform_link_state: Optional[Dict[str, Any]] = None
 
         # Log agent mappings
         for agent_id, agent_url in self.agent_urls.items():
@@ -51,6 +71,9 @@ class AionAgentProxyServer:
     def add_middlewares(self):
         """Add middlewares to app"""
         self.app.add_middleware(ProxySwaggerUIFixMiddleware)
+        # Added after - and so wrapping - the Swagger fix, so the cache holds
+        # the rewritten documents rather than the agent's originals.
+        self.app.add_middleware(ProxyDocumentCacheMiddleware, cache=self.document_cache)
         self.app.add_middleware(ProxyLoggingMiddleware)
 
     @asynccontextmanager
@@ -60,21 +83,70 @@ class AionAgentProxyServer:
         Initializes HTTP client, request handler, routes, and calls startup callback.
         """
         # Startup
-        async with self.http_client_manager.lifespan() as http_client:
-            # Initialize request handler with HTTP client
-            self.request_handler = RequestHandler(self.agent_urls, http_client)
+        async with self.http_client_manager.lifespan(self.agent_urls) as http_clients:
+            # Initialize request handler with one HTTP client per agent
+            self.request_handler = RequestHandler(self.agent_urls, http_clients)
 
             # Setup routes
             ProxyRouter(agent_proxy_server=self, request_handler=self.request_handler).register_routes()
 
+            control_listener = None
+            if self.control_conn is not None:
+                control_listener = asyncio.create_task(self._listen_for_control_messages())
+
             # Call startup callback if provided - server is now ready
             if self.startup_callback is not None:
                 self.startup_callback()
 
-            yield
+            try:
+                yield
+            finally:
+                if control_listener is not None:
+                    control_listener.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await control_listener
 
         # Shutdown handled by context manager
 
+    async def _listen_for_control_messages(self) -> None:
+        """
+        Apply control messages the supervising process sends down the pipe.
+
+        The pipe is polled from a worker thread with a short timeout, so the
+        event loop never blocks on it and cancellation takes effect within one
+        poll. The listener ends quietly once the supervisor's end is closed.
+        """
+        while True:
+            try:
+                if not await asyncio.to_thread(self.control_conn.poll, 1.0):
+                    continue
+                message = self.control_conn.recv()
+            except (EOFError, OSError):
+                logger.debug("Control pipe closed, no longer listening for control messages")
+                return
+
+            self.handle_control_message(message)
+
+    def handle_control_message(self, message: Dict) -> None:
+        """
+        Apply one control message from the supervising process.
+
+        Args:
+            message: Message dictionary with a ``type`` key
+        """
+        if not isinstance(message, dict):
+            logger.warning(f"Ignoring malformed control message: {message!r}")
+            return
+
+        if message.get("type") == AGENT_RESTARTED_MESSAGE:
+            agent_id = message.get("agent_id")
+            self.document_cache.invalidate(agent_id)
+            logger.debug(f"Agent '{agent_id}' restarted, cached documents dropped")
+        elif message.get("type") == PLATFORM_LINK_STATE_MESSAGE:
+            self.platform_link_state = message.get("state")
+        else:
+            logger.warning(f"Ignoring unknown control message type: {message.get('type')!r}")
+
     async def start(self, port: int, host: str = "0.0.0.0", serialized_socket=None):
         """
         Start the proxy server
@@ -98,7 +170,8 @@ class AionAgentProxyServer:
             port=port if sockets is None else None,
             log_level=app_settings.log_level.lower(),
             log_config=None,
-            access_log=False
+            access_log=False,
+            **uvicorn_config_options()
         )
 
         server = uvicorn.Server(config)
@@ -5,6 +5,33 @@ from typing import Literal, Optional, Dict
 from pydantic import BaseModel, Field
 
 
+class AgentUpstreamMetrics(BaseModel):
+    """Forwarding metrics the proxy keeps for one agent"""
+    circuit_state: Literal["closed", "open", "half_open"] = Field(
+        description="State of the agent's circuit breaker"
+    )
+    in_flight: int = Field(
+        description="Requests forwarded to the agent whose responses are still being relayed"
+    )
+    requests_total: int = Field(
+        description="Requests forwarded to the agent since the proxy started"
+    )
+    failures_total: int = Field(
+        description="Forwarded requests the agent did not answer (connect errors, timeouts)"
+    )
+    rejected_total: int = Field(
+        description="Requests refused without forwarding because the circuit was open"
+    )
+    latency_avg_ms: Optional[float] = Field(
+        default=None,
+        description="Average time to the agent's response headers, in milliseconds"
+    )
+    latency_max_ms: Optional[float] = Field(
+        default=None,
+        description="Slowest time to the agent's response headers, in milliseconds"
+    )
+
+
 class AgentHealthInfo(BaseModel):
     """Health status of a single agent"""
     status: Literal["healthy", "unhealthy", "unavailable", "timeout", "error"] = Field(
@@ -21,6 +48,10 @@ class AgentHealthInfo(BaseModel):
         default=None,
         description="Error message (if any)"
     )
+    upstream: Optional[AgentUpstreamMetrics] = Field(
+        default=None,
+        description="Forwarding metrics the proxy keeps for the agent"
+    )
 
 
 class SystemHealthResponse(BaseModel):
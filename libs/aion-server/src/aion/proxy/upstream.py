@@ -0,0 +1,186 @@
+"""Per-agent upstream state for the proxy: connection pool, circuit breaker, metrics."""
+
+import logging
+import time
+from enum import Enum
+from typing import Optional
+
+import httpx
+from aion.server.metrics import Histogram
+
+from .types import AgentUpstreamMetrics
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "AgentUpstream",
+    "CircuitBreaker",
+    "CircuitState",
+]
+
+
+class CircuitState(str, Enum):
+    """State of an agent's circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop forwarding to an agent that keeps failing to answer.
+
+    Only connect failures and timeouts count: an agent answering with an error
+    status is reachable, and the error is its answer to forward. After
+    ``failure_threshold`` consecutive failures the circuit opens and requests
+    are refused without touching the network. Once ``reset_timeout`` has passed
+    a single trial request is let through - its outcome closes the circuit or
+    opens it for another period.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Report whether a request may be sent upstream now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = CircuitState.HALF_OPEN
+
+        # Half-open: exactly one trial request at a time.
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after an upstream answer."""
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+
+    def release_trial(self) -> None:
+        """End a trial request whose outcome says nothing about reachability."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a connect failure or timeout, opening the circuit at the threshold."""
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+
+class AgentUpstream:
+    """Everything the proxy keeps about one agent it forwards to.
+
+    Latency is measured to the upstream response headers: for a streamed
+    answer the body may legitimately stay open for minutes, which says nothing
+    about how quickly the agent responded. A request stays in flight until its
+    response - streamed or not - has been fully relayed and released.
+    """
+
+    def __init__(
+            self,
+            agent_id: str,
+            url: str,
+            client: httpx.AsyncClient,
+            breaker: Optional[CircuitBreaker] = None,
+            latency: Optional[Histogram] = None,
+    ):
+        """
+        Args:
+            agent_id: Agent identifier
+            url: Agent base URL
+            client: HTTP client whose connection pool serves this agent
+            breaker: Circuit breaker guarding the agent, if any
+            latency: Histogram, labelled by agent id, that answered requests
+                are observed into
+        """
+        self.agent_id = agent_id
+        self.url = url
+        self.client = client
+        self.breaker = breaker
+        self._latency = latency.labels(agent_id) if latency is not None else None
+        self.in_flight = 0
+        self.requests_total = 0
+        self.failures_total = 0
+        self.rejected_total = 0
+        self._answered = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def allow_request(self) -> bool:
+        """Report whether a request may be forwarded, counting refusals."""
+        if self.breaker is None or self.breaker.allow_request():
+            return True
+        self.rejected_total += 1
+        return False
+
+    def request_started(self) -> float:
+        """Mark a request in flight and return its start time."""
+        self.in_flight += 1
+        self.requests_total += 1
+        return time.perf_counter()
+
+    def request_answered(self, started_at: float) -> None:
+        """Record that the agent answered a request started at ``started_at``."""
+        latency = time.perf_counter() - started_at
+        self._answered += 1
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+        if self._latency is not None:
+            self._latency.observe(latency)
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def request_failed(self, counts_against_circuit: bool) -> None:
+        """Record a request that got no answer from the agent."""
+        self.failures_total += 1
+        if self.breaker is None:
+            return
+        if counts_against_circuit:
+            self.breaker.record_failure()
+        else:
+            self.breaker.release_trial()
+
+    def request_abandoned(self) -> None:
+        """Record a request that was admitted but never sent upstream."""
+        if self.breaker is not None:
+            self.breaker.release_trial()
+
+    def request_finished(self) -> None:
+        """Release a request's in-flight slot."""
+        self.in_flight = max(0, self.in_flight - 1)
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """State of the agent's circuit breaker; closed when it has none."""
+        return self.breaker.state if self.breaker is not None else CircuitState.CLOSED
+
+    def metrics(self) -> AgentUpstreamMetrics:
+        """Return a snapshot of this agent's forwarding metrics."""
+        answered = self._answered
+        return AgentUpstreamMetrics(
+            circuit_state=self.circuit_state.value,
+            in_flight=self.in_flight,
+            requests_total=self.requests_total,
+            failures_total=self.failures_total,
+            rejected_total=self.rejected_total,
+            latency_avg_ms=(self._latency_total / answered * 1000) if answered > 0 else None,
+            latency_max_ms=self._latency_max * 1000 if answered > 0 else None,
+        )
@@ -1,6 +1,6 @@
 """Builder utilities for assembling A2A Conversation objects from task history."""
 
-from typing import List
+from typing import Iterable, List, Optional
 
 from a2a.types import Task, TaskState, Artifact, Message
 
@@ -50,8 +50,69 @@ class ConversationBuilder:
             status=ConversationTaskStatus(state=conversation_status.state)
         )
 
+    @classmethod
+    def build_from_window(
+            cls,
+            context_id: str,
+            messages: List[Message],
+            artifacts: Iterable[List[Artifact]],
+            state: TaskState,
+            next_cursor: Optional[str] = None,
+    ) -> Conversation:
+        """
+        Build a Conversation object from a window of messages.
+
+        Args:
+           context_id: The context identifier for the conversation
+           messages: Conversation messages of the window, newest first
+           artifacts: Artifact lists of the tasks the window spans, newest task first
+           state: State of the context's most recent task
+           next_cursor: Cursor continuing the window, if the conversation goes on
+
+        Returns:
+           Conversation object holding only the window
+        """
+        return Conversation(
+            context_id=context_id,
+            history=messages,
+            artifacts=cls.dedupe_artifacts(artifacts),
+            status=ConversationTaskStatus(state=state),
+            next_cursor=next_cursor,
+        )
+
     @staticmethod
-    def extract_messages_from_tasks(tasks: List[Task], reverse: bool = False) -> List[Message]:
+    def is_conversation_message(message: Message) -> bool:
+        """
+        Tell whether a history message belongs in the conversation.
+
+        Messages without a type, or typed as plain messages, do; events and
+        other typed messages do not. ``PostgresTaskStore`` applies the same
+        rule in SQL when it windows messages, and must be kept in step.
+        """
+        if not message.HasField('metadata'):
+            return True
+
+        key = A2AMetadataKey.MESSAGE_TYPE.value
+        message_type = message.metadata[key] if key in message.metadata else None
+        return message_type is None or message_type == MessageType.MESSAGE.value
+
+    @classmethod
+    def task_messages(cls, task: Task) -> List[Message]:
+        """
+        Conversation messages of one task, oldest first, including the status message.
+
+        A task with no history contributes nothing, status message included.
+        """
+        if not task.history:
+            return []
+
+        messages = [message for message in task.history if cls.is_conversation_message(message)]
+        if task.status.HasField('message'):
+            messages.append(task.status.message)
+        return messages
+
+    @classmethod
+    def extract_messages_from_tasks(cls, tasks: List[Task], reverse: bool = False) -> List[Message]:
         """
         Extract and filter messages from a collection of tasks.
 
@@ -67,31 +128,14 @@ class ConversationBuilder:
         """
         all_messages = []
         for task in tasks:
-            if not task.history:
-                continue
-
-            task_messages = []
-            for message in task.history:
-                if not message.HasField('metadata'):
-                    task_messages.append(message)
-                    continue
-
-                key = A2AMetadataKey.MESSAGE_TYPE.value
-                message_type = message.metadata[key] if key in message.metadata else None
-                if message_type is None or message_type == MessageType.MESSAGE.value:
-                    task_messages.append(message)
-                    continue
-
-            if task.status.HasField('message'):
-                task_messages.append(task.status.message)
-
+            task_messages = cls.task_messages(task)
             if task_messages:
                 all_messages.extend(reversed(task_messages) if reverse else task_messages)
 
         return all_messages
 
-    @staticmethod
-    def extract_artifacts_from_tasks(tasks: List[Task], reverse: bool = False) -> List[Artifact]:
+    @classmethod
+    def extract_artifacts_from_tasks(cls, tasks: List[Task], reverse: bool = False) -> List[Artifact]:
         """
         Extract and deduplicate artifacts from a collection of tasks.
 
@@ -102,17 +146,33 @@ class ConversationBuilder:
            tasks: List of Task objects to extract artifacts from
            reverse: Whether to reverse the final order of artifacts
 
+        Returns:
+           List of deduplicated Artifact objects
+        """
+        all_artifacts = cls.dedupe_artifacts(task.artifacts for task in tasks)
+        return reversed(all_artifacts) if reverse else all_artifacts
+
+    @staticmethod
+    def dedupe_artifacts(artifact_lists: Iterable[List[Artifact]]) -> List[Artifact]:
+        """
+        Flatten artifact lists, dropping MESSAGE_RESULT artifacts and repeated IDs.
+
+        Artifacts without IDs are always included.
+
+        Args:
+           artifact_lists: Artifact lists in the order they should appear
+
         Returns:
            List of deduplicated Artifact objects
         """
         all_artifacts = []
         artifact_ids_seen = set()
 
-        for task in tasks:
-            if not task.artifacts:
+        for artifacts in artifact_lists:
+            if not artifacts:
                 continue
 
-            for artifact in task.artifacts:
+            for artifact in artifacts:
                 if artifact.name == ArtifactName.MESSAGE_RESULT.value:
                     continue
 
@@ -124,4 +184,4 @@ class ConversationBuilder:
                 elif not artifact_id:
                     all_artifacts.append(artifact)
 
-        return reversed(all_artifacts) if reverse else all_artifacts
+        return all_artifacts
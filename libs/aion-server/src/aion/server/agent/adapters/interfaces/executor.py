@@ -29,6 +29,8 @@ class ExecutionConfig:
         context_id: Context identifier for multi-turn conversations (A2A Task.context_id)
         timeout: Maximum execution time in seconds
         metadata: Additional execution metadata
+        message_limit: For state reads, the number of newest messages the
+            snapshot needs; None for the whole conversation
     """
     def __init__(
         self,
@@ -36,6 +38,7 @@ class ExecutionConfig:
         context_id: Optional[str] = None,
         timeout: Optional[float] = None,
         metadata: Optional[dict[str, Any]] = None,
+        message_limit: Optional[int] = None,
     ):
         """Initialize execution configuration.
 
@@ -44,11 +47,15 @@ class ExecutionConfig:
             context_id: Context identifier for multi-turn conversations (A2A Task.context_id)
             timeout: Maximum execution time in seconds
             metadata: Additional execution metadata
+            message_limit: For state reads, the number of newest messages the
+                snapshot needs. Executors that can read a window return only
+                those; others may return the whole conversation.
         """
         self.task_id = task_id
         self.context_id = context_id
         self.timeout = timeout
         self.metadata = metadata or {}
+        self.message_limit = message_limit
 
 
 class ExecutorAdapter(ABC):
@@ -6,6 +6,7 @@ configuration, and execution capabilities while delegating framework-specific
 operations to adapters.
 """
 from __future__ import annotations
+import asyncio
 import logging
 
 import time
@@ -20,6 +21,7 @@ from aion.server.agent.card import AionAgentCard
 from aion.core.config.models import AgentConfig
 from aion.core.logging.base import AionLogger
 from collections.abc import AsyncIterator
+from types import ModuleType
 from typing import Any, Optional, TYPE_CHECKING
 
 from .models import AgentMetadata
@@ -94,6 +96,8 @@ class AionAgent:
         self._metadata = metadata
         self._card: Optional[Any] = None
         self._logger: Optional[AionLogger] = logger
+        self._module_import: Optional[asyncio.Future[tuple[ModuleType, Optional[str]]]] = None
+        self.module_import_seconds: Optional[float] = None
 
     @property
     def logger(self) -> AionLogger:
@@ -216,12 +220,15 @@ class AionAgent:
             self,
             context_id: str,
             task_id: Optional[str] = None,
+            message_limit: Optional[int] = None,
     ) -> ExecutionSnapshot:
         """Get the current execution state snapshot for a context.
 
         Args:
             context_id: Context identifier (A2A context_id)
             task_id: Optional task identifier (A2A task.id)
+            message_limit: Optional number of newest messages the snapshot
+                needs; see :class:`ExecutionConfig`
 
         Returns:
             ExecutionSnapshot: Current execution snapshot including state, messages, status, and metadata
@@ -235,7 +242,7 @@ class AionAgent:
                 f"Agent '{self._id}' is not built yet. Call build() before accessing state."
             )
 
-        config = ExecutionConfig(task_id=task_id, context_id=context_id)
+        config = ExecutionConfig(task_id=task_id, context_id=context_id, message_limit=message_limit)
 
         self.logger.debug(
             f"Getting state for agent '{self.id}', task_id={task_id}, context_id={context_id}"
@@ -368,6 +375,51 @@ class AionAgent:
 
         return agent
 
+    def start_module_import(self, base_path: Optional[Any] = None) -> None:
+        """Start importing the agent module in a worker thread.
+
+        Importing a graph module can take seconds (model clients, tool
+        registries, compiled graphs). Started early, the import overlaps with
+        the rest of server startup - database connections, plugin setup -
+        instead of following it; :meth:`build` then picks up the result. A
+        no-op when the import has already been started.
+
+        The module is imported off the event loop thread and before plugins
+        are set up, so only start it for a module that neither touches the
+        event loop nor depends on plugin or database state at import time.
+
+        Args:
+            base_path: Optional base path for resolving relative module paths
+        """
+        if self._module_import is None and self._config.path:
+            self._module_import = asyncio.ensure_future(
+                asyncio.to_thread(self._import_module, base_path))
+
+    def _import_module(self, base_path: Optional[Any]) -> tuple[ModuleType, Optional[str]]:
+        from .module_loader import ModuleLoader
+
+        started = time.perf_counter()
+        try:
+            return ModuleLoader(base_path=base_path).load_from_config_path(self._config.path)
+        finally:
+            self.module_import_seconds = time.perf_counter() - started
+
+    async def cancel_module_import(self) -> None:
+        """Abandon a module import started by :meth:`start_module_import`.
+
+        Called when startup fails before :meth:`build` collects the import,
+        so its outcome is not left unretrieved. The worker thread cannot be
+        interrupted and finishes the import in the background.
+        """
+        if self._module_import is None:
+            return
+        module_import, self._module_import = self._module_import, None
+        module_import.cancel()
+        try:
+            await module_import
+        except (asyncio.CancelledError, Exception):
+            pass
+
     async def build(self, base_path: Optional[Any] = None) -> "AionAgent":
         """Build the agent by discovering a framework and creating an executor.
 
@@ -377,6 +429,8 @@ class AionAgent:
         3. Creating the executor for agent execution
 
         This allows plugins to be registered before the framework is discovered.
+        The module import started by :meth:`start_module_import` is reused;
+        otherwise the module is imported here, on the event loop thread.
 
         Args:
             base_path: Optional base path for resolving relative module paths
@@ -400,10 +454,13 @@ class AionAgent:
 
         self.logger.debug(f"Building AionAgent '{self._id}' from config (path='{self._config.path}')")
 
-        # Load the module using ModuleLoader
+        # Collect the preloaded module, or load it now
         module_loader = ModuleLoader(base_path=base_path)
         try:
-            module, item_name = module_loader.load_from_config_path(self._config.path)
+            if self._module_import is not None:
+                module, item_name = await self._module_import
+            else:
+                module, item_name = self._import_module(base_path)
         except Exception as ex:
             raise FileNotFoundError(
                 f"Failed to load module for agent '{self._id}' from path '{self._config.path}': {ex}"
@@ -1,7 +1,8 @@
 """Registry that creates ActiveTask instances wired with AionTaskManager."""
 
+import asyncio
 import logging
-from typing import Any, override
+from typing import Any, Optional, override
 
 from a2a.server.agent_execution.active_task import ActiveTask
 from a2a.server.agent_execution.active_task_registry import ActiveTaskRegistry
@@ -10,8 +11,17 @@ from a2a.types import TaskState
 from a2a.types.a2a_pb2 import Message
 
 from aion.core.a2a.enums import TaskSettlementReason
-from aion.server.tasks import AionTaskManager, TerminalTaskPushSender, settled_task
+from aion.server.settings import app_settings
+from aion.server.tasks import (
+    AionTaskManager,
+    BaseTaskStore,
+    SettlementReport,
+    TerminalTaskPushSender,
+    settled_task,
+    task_lease_owner,
+)
 from aion.server.agent.execution.scope import set_task_manager
+from aion.server.metrics.instruments import TASKS_STARTED
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +35,71 @@ class AionActiveTaskRegistry(ActiveTaskRegistry):
     subscriber cannot make that call — it may have merely disconnected while
     the execution carried on — which is why ``TerminalTaskProjection`` only
     reads.
+
+    With a store that supports task leases, the registry also leases every
+    task it starts to this process and renews the leases from a background
+    heartbeat, so that replicas sharing the store can tell a task running here
+    from one a killed process left behind (see ``aion.server.tasks.leases``).
+    A lease is released once its task is finished, or settled by shutdown; a
+    task shutdown could not settle keeps its lease until it expires.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        settlement_timeout: Optional[float] = None,
+        settlement_concurrency: Optional[int] = None,
+        lease_heartbeat: Optional[float] = None,
+        lease_owner: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create the registry.
+
+        Args:
+            settlement_timeout: Seconds ``aclose`` may take to drain and settle.
+                Defaults to ``SHUTDOWN_SETTLEMENT_TIMEOUT_SECONDS``.
+            settlement_concurrency: Tasks settled at once. Defaults to
+                ``SHUTDOWN_SETTLEMENT_CONCURRENCY``.
+            lease_heartbeat: Seconds between task lease renewals. Defaults to
+                ``TASK_LEASE_HEARTBEAT_SECONDS``.
+            lease_owner: Identity task leases are held under. Defaults to
+                this process's lease owner.
+            *args: Passed to ``ActiveTaskRegistry``.
+            **kwargs: Passed to ``ActiveTaskRegistry``.
+        """
         super().__init__(*args, **kwargs)
+        self._settlement_timeout = (
+            settlement_timeout if settlement_timeout is not None
+            else app_settings.shutdown_settlement_timeout_seconds
+        )
+        self._settlement_concurrency = (
+            settlement_concurrency or app_settings.shutdown_settlement_concurrency
+        )
         # Managers are kept here rather than read off ActiveTask so shutdown
         # can reach the store through the same call context the task ran with:
         # a store may resolve ownership from it, and no request context exists
         # at shutdown.
         self._task_managers: dict[str, AionTaskManager] = {}
+        self._leases_enabled = (
+            isinstance(self._task_store, BaseTaskStore) and self._task_store.supports_task_leases
+        )
+        self._lease_heartbeat = (
+            lease_heartbeat if lease_heartbeat is not None
+            else app_settings.task_lease_heartbeat_seconds
+        )
+        self._lease_owner = lease_owner or task_lease_owner()
+        # Tasks leased to this process, and those among them whose execution
+        # has finished; the latter are released with the next heartbeat. Both
+        # map a task to the token of the acquisition it holds, so a release
+        # never takes a lease the task was given again in the meantime.
+        self._leased: dict[str, str] = {}
+        self._finished_leases: dict[str, str] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    @property
+    def active_task_count(self) -> int:
+        """Number of tasks registered and not yet cleaned up."""
+        return len(self._active_tasks)
 
     @override
     async def get_or_create(
@@ -70,38 +136,49 @@ class AionActiveTaskRegistry(ActiveTaskRegistry):
             RuntimeError: If the registry has already been closed via
                 ``aclose()``.
         """
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError('ActiveTaskRegistry is closed')
-            if task_id in self._active_tasks:
-                return self._active_tasks[task_id]
-
-            task_manager = AionTaskManager(
-                task_id=task_id,
-                context_id=context_id,
-                task_store=self._task_store,
-                initial_message=initial_message,
-                context=call_context,
-            )
+        # Insert-if-absent without the registry lock. Nothing between the
+        # closed check and the insert awaits, so on one event loop the two are
+        # atomic, and two requests for one task still get one ActiveTask. The
+        # base class takes ``_lock`` here, which never excluded anything - its
+        # section had no await either - and only cost every creation an
+        # acquire and release; the store round trips (the lease and ``start``)
+        # always ran outside it.
+        if self._closed:
+            raise RuntimeError('ActiveTaskRegistry is closed')
+        active_task = self._active_tasks.get(task_id)
+        if active_task is not None:
+            return active_task
 
-            set_task_manager(task_manager)
-
-            # Push dispatch runs in the background consumer with no request
-            # context, so the outbound projection is bound per task, to the
-            # manager that carries the task's call context.
-            push_sender = self._push_sender
-            if push_sender is not None:
-                push_sender = TerminalTaskPushSender(inner=push_sender, task_manager=task_manager)
-
-            active_task = ActiveTask(
-                agent_executor=self._agent_executor,
-                task_id=task_id,
-                task_manager=task_manager,
-                push_sender=push_sender,
-                on_cleanup=self._on_active_task_cleanup,
-            )
-            self._active_tasks[task_id] = active_task
-            self._task_managers[task_id] = task_manager
+        task_manager = AionTaskManager(
+            task_id=task_id,
+            context_id=context_id,
+            task_store=self._task_store,
+            initial_message=initial_message,
+            context=call_context,
+        )
+
+        set_task_manager(task_manager)
+
+        # Push dispatch runs in the background consumer with no request
+        # context, so the outbound projection is bound per task, to the
+        # manager that carries the task's call context.
+        push_sender = self._push_sender
+        if push_sender is not None:
+            push_sender = TerminalTaskPushSender(inner=push_sender, task_manager=task_manager)
+
+        active_task = ActiveTask(
+            agent_executor=self._agent_executor,
+            task_id=task_id,
+            task_manager=task_manager,
+            push_sender=push_sender,
+            on_cleanup=self._on_active_task_cleanup,
+        )
+        self._active_tasks[task_id] = active_task
+        self._task_managers[task_id] = task_manager
+        TASKS_STARTED.inc()
+
+        if self._leases_enabled:
+            await self._acquire_lease(task_id)
 
         await active_task.start(
             call_context=call_context,
@@ -113,8 +190,79 @@ class AionActiveTaskRegistry(ActiveTaskRegistry):
     async def _remove_task(self, task_id: str) -> None:
         """Drop the task manager alongside the base registry's own entry."""
         await super()._remove_task(task_id)
-        async with self._lock:
-            self._task_managers.pop(task_id, None)
+        self._task_managers.pop(task_id, None)
+        token = self._leased.get(task_id)
+        if token is not None:
+            self._finished_leases[task_id] = token
+
+    async def _acquire_lease(self, task_id: str) -> None:
+        """Lease a task to this process and make sure the heartbeat is running.
+
+        A lease the store refuses does not fail the task: the lease only
+        matters if this process dies, and the request would be lost over it
+        now for certain.
+        """
+        try:
+            token = await self._task_store.acquire_task_lease(task_id, self._lease_owner)
+        except Exception as exc:
+            logger.error(
+                "Failed to lease task %s; it will not be settled if this process dies",
+                task_id,
+                exc_info=exc,
+            )
+            return
+
+        self._leased[task_id] = token
+        # The previous acquisition is no longer finished business: its row was
+        # replaced by this one, which a release of the old token spares.
+        self._finished_leases.pop(task_id, None)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.get_running_loop().create_task(self._run_heartbeat())
+
+    async def _run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self._lease_heartbeat)
+            try:
+                await self._renew_leases()
+            except Exception:
+                logger.exception("Failed to renew task leases")
+
+    async def _renew_leases(self) -> None:
+        """Release the leases of finished tasks, then renew the rest in one write.
+
+        A finished task may be resumed, and its lease acquired again, while the
+        release is in flight. The release names the acquisitions it ends by
+        token, so the new lease survives it, and only tasks still holding the
+        released token are forgotten afterwards.
+        """
+        finished = self._finished_leases
+        if finished:
+            self._finished_leases = {}
+            try:
+                await self._task_store.release_task_leases(
+                    self._lease_owner, list(finished), list(finished.values())
+                )
+            except Exception:
+                for task_id, token in finished.items():
+                    if self._leased.get(task_id) == token:
+                        self._finished_leases.setdefault(task_id, token)
+                raise
+            for task_id, token in finished.items():
+                if self._leased.get(task_id) == token:
+                    del self._leased[task_id]
+
+        if not self._leased:
+            return
+
+        expected = set(self._leased)
+        held = set(await self._task_store.renew_task_leases(self._lease_owner))
+        for task_id in expected - held:
+            # Only a sweeper takes a lease over, and only once it expired.
+            logger.warning(
+                "Lease of task %s expired and was claimed by another process, which settles it",
+                task_id,
+            )
+            self._leased.pop(task_id, None)
 
     @override
     async def aclose(self) -> None:
@@ -129,35 +277,125 @@ class AionActiveTaskRegistry(ActiveTaskRegistry):
         Such a task is settled as ``FAILED``, marked in metadata with
         ``SERVER_SHUTDOWN``. See ``aion.server.tasks.settlement`` for why the
         state is terminal rather than resumable.
+
+        Tasks are settled concurrently, at most ``settlement_concurrency`` at
+        a time, and only until ``settlement_timeout`` seconds after the drain
+        began: a shutdown that overruns the container's grace period is killed
+        and settles nothing at all. Tasks not reached by then stay active in
+        the store, and keep their lease, for a sibling replica or the next
+        process to settle once it expires.
         """
-        async with self._lock:
-            task_managers = list(self._task_managers.values())
+        deadline = asyncio.get_running_loop().time() + self._settlement_timeout
+        # Closed before the snapshot, in the same step, so a task created
+        # while the base class drains cannot escape settlement.
+        self._closed = True
+        task_managers = list(self._task_managers.values())
 
         await super().aclose()
 
-        for task_manager in task_managers:
+        outcomes = await self._settle_interrupted_tasks(task_managers, deadline)
+        results = list(outcomes.values())
+        report = SettlementReport(
+            settled=results.count("settled"),
+            unchanged=results.count("unchanged"),
+            failed=results.count("failed"),
+            unsettled=len(task_managers) - len(results),
+        )
+        if report.total:
+            log = logger.warning if report.failed or report.unsettled else logger.info
+            log(
+                "Shutdown settlement: %d settled, %d unchanged, %d failed, %d unsettled",
+                report.settled, report.unchanged, report.failed, report.unsettled,
+            )
+
+        if self._leases_enabled:
+            interrupted = {task_manager.task_id for task_manager in task_managers}
+            resolved = {
+                task_id for task_id, outcome in outcomes.items() if outcome != "failed"
+            }
+            await self._close_leases(interrupted - resolved)
+
+        self._task_managers.clear()
+
+    async def _close_leases(self, kept: set[str]) -> None:
+        """Stop the heartbeat and release every lease except ``kept``.
+
+        The kept leases belong to tasks shutdown left active; they expire and
+        are settled by a sibling replica or the next process.
+        """
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
             try:
-                await self._settle_interrupted_task(task_manager)
-            except Exception as exc:
-                logger.error(
-                    "Failed to settle task %s after shutdown",
-                    task_manager.task_id,
-                    exc_info=exc,
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        released = {task_id: token for task_id, token in self._leased.items() if task_id not in kept}
+        if released:
+            try:
+                await self._task_store.release_task_leases(
+                    self._lease_owner, list(released), list(released.values())
                 )
+            except Exception as exc:
+                logger.error("Failed to release task leases on shutdown", exc_info=exc)
+        self._leased.clear()
+        self._finished_leases.clear()
+
+    async def _settle_interrupted_tasks(
+        self,
+        task_managers: list[AionTaskManager],
+        deadline: float,
+    ) -> dict[str, str]:
+        """Settle tasks concurrently under the semaphore until the deadline.
 
-        async with self._lock:
-            self._task_managers.clear()
+        Returns:
+            Outcome by task id - ``settled``, ``unchanged`` or ``failed`` -
+            for every task reached before the deadline.
+        """
+        semaphore = asyncio.Semaphore(self._settlement_concurrency)
+        outcomes: dict[str, str] = {}
+
+        async def settle(task_manager: AionTaskManager) -> None:
+            async with semaphore:
+                try:
+                    settled = await self._settle_interrupted_task(task_manager)
+                    outcomes[task_manager.task_id] = "settled" if settled else "unchanged"
+                except Exception as exc:
+                    outcomes[task_manager.task_id] = "failed"
+                    logger.error(
+                        "Failed to settle task %s after shutdown",
+                        task_manager.task_id,
+                        exc_info=exc,
+                    )
+
+        try:
+            async with asyncio.timeout_at(deadline):
+                await asyncio.gather(*(settle(task_manager) for task_manager in task_managers))
+        except TimeoutError:
+            logger.error(
+                "Shutdown settlement deadline of %.1fs passed with %d of %d task(s) not settled",
+                self._settlement_timeout,
+                len(task_managers) - len(outcomes),
+                len(task_managers),
+            )
+
+        return outcomes
 
     @staticmethod
-    async def _settle_interrupted_task(task_manager: AionTaskManager) -> None:
-        """Mark a single task as interrupted by shutdown, if it is still active."""
+    async def _settle_interrupted_task(task_manager: AionTaskManager) -> bool:
+        """Mark a single task as interrupted by shutdown, if it is still active.
+
+        Returns:
+            True if the task was written as settled.
+        """
         task = await task_manager.get_task()
         if task is None:
-            return
+            return False
 
         settled = settled_task(task, TaskSettlementReason.SERVER_SHUTDOWN)
         if settled is None:
-            return
+            return False
 
         logger.info(
             "Settling task %s left in %s by shutdown",
@@ -165,3 +403,4 @@ class AionActiveTaskRegistry(ActiveTaskRegistry):
             TaskState.Name(task.status.state),
         )
         await task_manager.save_task_event(settled)
+        return True
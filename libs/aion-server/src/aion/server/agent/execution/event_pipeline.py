@@ -2,12 +2,14 @@
 
 import logging
 import copy
+import time
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import Message, Task, TaskArtifactUpdateEvent, TaskState, TaskStatusUpdateEvent
 
 from aion.server.agent.execution.scope import get_task_manager as exec_scope_get_task_manager
 from aion.server.files.a2a import A2AFileTransformer
+from aion.server.metrics.instruments import EVENT_PROCESSING_SECONDS, EVENTS_PROCESSED
 from aion.server.tasks import A2ATaskDeduplicator
 from aion.server.a2a.constants import TERMINAL_TASK_STATES
 from aion.server.a2a.utils import (
@@ -74,28 +76,33 @@ class AionEventPipeline:
         return self._terminal_seen
 
     async def process(self, event) -> None:
-        await self._ensure_task_started()
-        event = await self._prepare_event(event)
-        event = await self._deduplicate_event(event)
-        if event is None:
-            return
-
-        # Task and Message events are persisted silently (not streamed to client)
-        if isinstance(event, (Task, Message)):
-            if isinstance(event, Task):
-                await self._flush_pending_status_message(event)
-            await self._save_silently(event)
-        else:
-            # All other events are streamed to client
-            await self._emit_to_client(event)
-
-        self._note_terminal_state(event)
-
-        # An ephemeral event never reaches the task record, so folding it into
-        # the deduplicator's cache would leave that cache describing a history
-        # the database does not have.
-        if self._deduplicator is not None and not is_ephemeral_status_event(event):
-            self._deduplicator.apply_processed_item(event)
+        EVENTS_PROCESSED.labels(type(event).__name__).inc()
+        started_at = time.perf_counter()
+        try:
+            await self._ensure_task_started()
+            event = await self._prepare_event(event)
+            event = await self._deduplicate_event(event)
+            if event is None:
+                return
+
+            # Task and Message events are persisted silently (not streamed to client)
+            if isinstance(event, (Task, Message)):
+                if isinstance(event, Task):
+                    await self._flush_pending_status_message(event)
+                await self._save_silently(event)
+            else:
+                # All other events are streamed to client
+                await self._emit_to_client(event)
+
+            self._note_terminal_state(event)
+
+            # An ephemeral event never reaches the task record, so folding it into
+            # the deduplicator's cache would leave that cache describing a history
+            # the database does not have.
+            if self._deduplicator is not None and not is_ephemeral_status_event(event):
+                self._deduplicator.apply_processed_item(event)
+        finally:
+            EVENT_PROCESSING_SECONDS.observe(time.perf_counter() - started_at)
 
     def _note_terminal_state(self, event) -> None:
         """Record that this event closed the task, whatever shape it arrived in."""
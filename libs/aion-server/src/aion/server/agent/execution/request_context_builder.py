@@ -5,8 +5,8 @@ from a2a.server.context import ServerCallContext
 from a2a.server.id_generator import IDGenerator
 from a2a.types.a2a_pb2 import SendMessageRequest, Task
 
+from aion.server.opentelemetry.stages import TASK_ID_ATTRIBUTE, stage_span
 from aion.server.tasks.stores.base_task_store import BaseTaskStore
-from aion.server.a2a.utils import is_task_interrupted
 
 
 class AionRequestContextBuilder(RequestContextBuilder):
@@ -55,32 +55,30 @@ class AionRequestContextBuilder(RequestContextBuilder):
             An instance of RequestContext populated with the provided information
             and potentially a list of related tasks.
         """
-        if not task_id and self._auto_discover_interrupted_task and context_id:
-            discovered = await self._find_interrupted_task(context_id)
-            if discovered:
-                task_id = discovered.id
-                task = discovered
+        with stage_span("aion.request_context.build", task_id=task_id, context_id=context_id) as span:
+            if not task_id and self._auto_discover_interrupted_task and context_id:
+                with stage_span("aion.task.discover_interrupted", context_id=context_id):
+                    discovered = await self._find_interrupted_task(context_id)
+                if discovered:
+                    task_id = discovered.id
+                    task = discovered
+                    if span.is_recording():
+                        span.set_attribute(TASK_ID_ATTRIBUTE, task_id)
 
-        return RequestContext(
-            call_context=context,
-            request=params,
-            task_id=task_id,
-            context_id=context_id,
-            task=task,
-            related_tasks=[],
-            task_id_generator=self._task_id_generator,
-            context_id_generator=self._context_id_generator,
-        )
+            return RequestContext(
+                call_context=context,
+                request=params,
+                task_id=task_id,
+                context_id=context_id,
+                task=task,
+                related_tasks=[],
+                task_id_generator=self._task_id_generator,
+                context_id_generator=self._context_id_generator,
+            )
 
     async def _find_interrupted_task(self, context_id: str) -> Task | None:
         """Returns the last interrupted task for the given context, or None."""
         if not self._task_store:
             return None
 
-        last_task = await self._task_store.get_context_last_task(context_id=context_id)
-        if last_task is None:
-            return None
-
-        if not is_task_interrupted(last_task):
-            return None
-        return last_task
+        return await self._task_store.get_context_interrupted_task(context_id=context_id)
@@ -23,6 +23,7 @@ from aion.server.a2a.constants import TERMINAL_TASK_STATES
 from aion.server.agent.aion_agent import AionAgent
 from aion.server.agent.execution.scope import set_task_id
 from aion.server.files.a2a import A2AFileTransformer
+from aion.server.opentelemetry.stages import stage_span, traced_stream
 from collections.abc import Callable, Iterable
 from typing import Literal, Optional, Tuple
 
@@ -117,7 +118,8 @@ class AionAgentRequestExecutor(AgentExecutor):
         task_updater = TaskUpdater(event_queue, task.id, task.context_id)
 
         try:
-            await self._setup_runtime_context(context)
+            with stage_span("aion.extensions.collect", task_id=task.id, context_id=task.context_id):
+                await self._setup_runtime_context(context)
         except ExtensionActivationError as ex:
             raise InvalidParamsError(message=str(ex)) from ex
 
@@ -141,7 +143,14 @@ class AionAgentRequestExecutor(AgentExecutor):
             task_started=not is_new_task,
         )
         try:
-            async for agent_event in produce_events(context=context):
+            events = traced_stream(
+                "aion.agent.stream",
+                produce_events(context=context),
+                task_id=task.id,
+                context_id=task.context_id,
+                attributes={"aion.agent.operation": operation},
+            )
+            async for agent_event in events:
                 await pipeline.process(agent_event)
 
         except Exception as ex:
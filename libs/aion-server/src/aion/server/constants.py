@@ -1,5 +1,7 @@
 """Server-wide URL path constants and default protocol version."""
 
 HEALTH_CHECK_URL = "/health/"
+METRICS_URL = "/metrics"
+FILES_URL = "/files"
 CONFIGURATION_FILE_URL = "/.well-known/configuration.json"
 A2A_VERSION_DEFAULT = "1.0"
@@ -1,3 +1,3 @@
-from .routes import AionExtraHTTPRoutes
+from .routes import AionExtraHTTPRoutes, create_agent_card_routes, create_file_routes
 
-__all__ = ["AionExtraHTTPRoutes"]
+__all__ = ["AionExtraHTTPRoutes", "create_agent_card_routes", "create_file_routes"]
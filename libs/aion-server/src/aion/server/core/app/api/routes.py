@@ -1,24 +1,102 @@
-"""Additional HTTP routes (health check and configuration) registered on the FastAPI app."""
+"""Additional HTTP routes (health check, metrics, configuration and stored files) registered on the FastAPI app."""
 
+from collections.abc import Sequence
+from itertools import chain
+
+from a2a.server.request_handlers.response_helpers import agent_card_to_dict
+from a2a.types import AgentCard
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 from aion.server.agent.aion_agent import AionAgent
 from aion.core.config import AgentConfigurationCollector
 from aion.core.http import HealthResponse
+from aion.server.files.storage import FilesystemFileStorageBackend
+from aion.server.metrics import CONTENT_TYPE, MetricsCollector, metrics_registry, render_metrics
+from aion.server.settings import app_settings
 from aion.server.utils.deployment import get_protocol_version
+from aion.server.utils.documents import CachedDocument
 from fastapi import FastAPI
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse, Response
+from starlette.routing import Route
 
-from aion.server.constants import CONFIGURATION_FILE_URL, HEALTH_CHECK_URL
+from aion.server.constants import CONFIGURATION_FILE_URL, FILES_URL, HEALTH_CHECK_URL, METRICS_URL
 from aion.server.types import ConfigurationFileResponse
 
+__all__ = ["AionExtraHTTPRoutes", "create_agent_card_routes", "create_file_routes"]
+
+
+def create_agent_card_routes(agent_card: AgentCard) -> list[Route]:
+    """Create the agent card route, serving the card rendered once.
+
+    Replaces the A2A SDK's route of the same path, which serializes the card
+    again on every request. The card is fixed for the life of the process.
+
+    Args:
+        agent_card: The card to serve.
+
+    Returns:
+        Routes to pass to ``add_a2a_routes_to_fastapi``.
+    """
+    document = CachedDocument.from_body(
+        JSONResponse(agent_card_to_dict(agent_card)).body,
+        media_type="application/json",
+    )
+
+    async def get_agent_card(request: Request) -> Response:
+        """Returns the public AgentCard describing this agent's capabilities, supported transports, and skills."""
+        return document.to_response(request.headers.get("if-none-match"))
+
+    return [Route(path=AGENT_CARD_WELL_KNOWN_PATH, endpoint=get_agent_card, methods=["GET"])]
+
+
+def create_file_routes(backend: FilesystemFileStorageBackend) -> list[Route]:
+    """Create the route serving files stored by the filesystem storage backend.
+
+    A file URL names one upload, whose bytes never change, so responses may be
+    cached indefinitely. ``FileResponse`` answers ``Range`` and ``If-Range``
+    requests, so clients can resume downloads and seek in media.
+
+    Args:
+        backend: The backend whose files are served.
+
+    Returns:
+        Routes to add to the agent app.
+    """
+
+    async def get_file(request: Request) -> Response:
+        """Returns a file stored by the agent, in full or the requested byte range."""
+        path = backend.resolve(request.path_params["path"])
+        if path is None:
+            return Response(status_code=404)
+        return FileResponse(path, headers={"cache-control": "public, max-age=31536000, immutable"})
+
+    return [Route(path=f"{FILES_URL}/{{path:path}}", endpoint=get_file, methods=["GET", "HEAD"])]
+
 
 class AionExtraHTTPRoutes:
-    """Registers Aion-specific HTTP endpoints (health and configuration) on a FastAPI app."""
+    """Registers Aion-specific HTTP endpoints (health, metrics and configuration) on a FastAPI app."""
 
-    def __init__(self, agent: AionAgent):
+    def __init__(self, agent: AionAgent, metrics_collectors: Sequence[MetricsCollector] = ()):
+        """
+        Args:
+            agent: The agent the routes describe.
+            metrics_collectors: Collectors a metrics scrape renders besides the
+                process's ``metrics_registry``.
+        """
         self.agent = agent
+        self.metrics_collectors = list(metrics_collectors)
+        self._configuration_document: CachedDocument | None = None
 
     def register(self, app: FastAPI):
-        """Attach health-check and configuration routes to the given FastAPI application."""
+        """Attach health-check, metrics and configuration routes to the given FastAPI application.
+
+        The metrics route is left out when ``METRICS_ENABLED`` is off.
+
+        The configuration document is rendered here, once: the agent's
+        configuration and protocol version do not change while it runs.
+        """
+        self._configuration_document = self._render_configuration()
+
         app.add_api_route(
             HEALTH_CHECK_URL,
             self._handle_health_check,
@@ -26,6 +104,15 @@ class AionExtraHTTPRoutes:
             response_class=JSONResponse,
         )
 
+        if app_settings.metrics_enabled:
+            app.add_api_route(
+                METRICS_URL,
+                self._handle_metrics,
+                methods=["GET"],
+                response_class=Response,
+                include_in_schema=False,
+            )
+
         app.add_api_route(
             CONFIGURATION_FILE_URL,
             self._handle_get_configuration_info,
@@ -44,12 +131,33 @@ class AionExtraHTTPRoutes:
         """
         return JSONResponse(HealthResponse().model_dump())
 
-    async def _handle_get_configuration_info(self) -> JSONResponse:
-        """Return agent protocol version and collected configuration as JSON."""
+    async def _handle_metrics(self) -> Response:
+        """Render this process's metrics in the Prometheus text format.
+
+        Gauges of state the server already keeps - active tasks, database
+        pools - are read here, so they cost nothing between scrapes.
+        """
+        families = chain(
+            metrics_registry.collect(),
+            chain.from_iterable(collector.collect() for collector in self.metrics_collectors),
+        )
+        return Response(render_metrics(families), media_type=CONTENT_TYPE)
+
+    async def _handle_get_configuration_info(self, request: Request) -> Response:
+        """Return agent protocol version and collected configuration as JSON.
+
+        Answers 304 when the client's ``If-None-Match`` names the current document.
+        """
+        return self._configuration_document.to_response(request.headers.get("if-none-match"))
+
+    def _render_configuration(self) -> CachedDocument:
         response = ConfigurationFileResponse(
             protocolVersion=get_protocol_version(),
             configuration=AgentConfigurationCollector(
                 self.agent.config.configuration
             ).collect(),
         )
-        return JSONResponse(response.model_dump(exclude_none=True))
+        return CachedDocument.from_body(
+            JSONResponse(response.model_dump(exclude_none=True)).body,
+            media_type="application/json",
+        )
@@ -5,24 +5,27 @@ database, plugins, agent, and FastAPI application using dependency injection.
 """
 import logging
 
-from a2a.server.routes import add_a2a_routes_to_fastapi, create_agent_card_routes
+from a2a.server.routes import add_a2a_routes_to_fastapi
 from a2a.utils.constants import DEFAULT_RPC_URL
 from aion.db.postgres import DbFactory
 from aion.server.agent.aion_agent import AionAgent
 from aion.server.files.a2a import A2AFileTransformer
-from aion.server.files.storage.manager import FileUploadManager
+from aion.server.files.storage import FilesystemFileStorageBackend, FileUploadManager
 from fastapi import FastAPI
 from starlette.routing import Route
 from typing import Optional
 
 from aion.server.agent.execution import AionAgentRequestExecutor, AionRequestContextBuilder
 from aion.server.agent.factory import AgentFactory
-from aion.server.core.app.api import AionExtraHTTPRoutes
+from aion.server.core.app.api import AionExtraHTTPRoutes, create_agent_card_routes, create_file_routes
 from aion.server.core.app.handlers import AionJsonRpcDispatcher, AionRequestHandler
 from aion.server.core.app.handlers.request_preprocessors import A2ARequestPreprocessor, FilePartPreprocessor
 from aion.server.core.middlewares import TracingMiddleware, AionContextMiddleware
+from aion.server.metrics import ActiveTasksCollector, DbPoolCollector
 from aion.server.plugins import PluginFactory
+from aion.server.settings import app_settings
 from aion.server.tasks import StoreManager, PushNotificationFactory
+from aion.server.utils.timing import StartupTimer
 from .lifespan import AppLifespan
 from .registry import app_registry
 
@@ -88,33 +91,57 @@ class AppFactory:
             return self
         except Exception as exc:
             logger.error("Failed to initialize application factory", exc_info=exc)
+            await self.aion_agent.cancel_module_import()
             await self.shutdown()
             return None
 
     async def _initialize(self) -> None:
-        """Initialize all application components in sequence."""
+        """Initialize all application components in sequence.
+
+        With ``AGENT_MODULE_PRELOAD`` enabled, the agent module is imported in
+        a worker thread from the start, so a slow graph import overlaps with
+        database and plugin setup rather than following them. The wall time of
+        each step is logged once startup completes.
+        """
         logger.debug("Initializing application for agent '%s'", self.aion_agent.id)
+        timer = StartupTimer()
+
+        if app_settings.agent_module_preload:
+            self.aion_agent.start_module_import()
 
         # 1. Initialize database
-        await self.db_factory.initialize()
+        with timer.phase("database"):
+            await self.db_factory.initialize()
 
-        # 2. Build FastAPI application
-        await self._build_app()
+        # 2. Prepare file storage
+        if self.upload_manager is not None:
+            with timer.phase("storage"):
+                await self.upload_manager.start()
 
-        # 3. Initialize plugins - Phase 1: infrastructure setup
-        await self.plugin_factory.initialize(file_upload_manager=self.upload_manager)
+        # 3. Build FastAPI application
+        with timer.phase("app"):
+            await self._build_app()
 
-        # 4. Build agent
-        await self.agent_factory.build()
+        # 4. Initialize plugins - Phase 1: infrastructure setup
+        with timer.phase("plugins"):
+            await self.plugin_factory.initialize(file_upload_manager=self.upload_manager)
 
-        # 5. Configure app - Phase 2: integrate plugins with built app and agent
-        await self.plugin_factory.configure_app(self.fastapi_app, self.aion_agent)
+        # 5. Build agent
+        with timer.phase("agent"):
+            await self.agent_factory.build()
+        if self.aion_agent.module_import_seconds is not None:
+            timer.record("import", self.aion_agent.module_import_seconds)
 
-        # 6. Apply custom app extensions from AppRegistry
+        # 6. Configure app - Phase 2: integrate plugins with built app and agent
+        with timer.phase("configure"):
+            await self.plugin_factory.configure_app(self.fastapi_app, self.aion_agent)
+
+        # 7. Apply custom app extensions from AppRegistry
         app_registry.apply_to_app(self.fastapi_app)
 
         logger.info("Agent '%s' initialized at http://%s:%s",
                     self.aion_agent.id, self.aion_agent.host, self.aion_agent.port)
+        logger.info("Agent '%s' startup: %s", self.aion_agent.id, timer.report())
 
     async def _build_app(self) -> None:
         """Build FastAPI application with all necessary configuration."""
@@ -142,7 +169,15 @@ class AppFactory:
                 Route(DEFAULT_RPC_URL, endpoint=jsonrpc_dispatcher.handle_requests, methods=['POST']),
             ],
         )
-        AionExtraHTTPRoutes(self.aion_agent).register(self.fastapi_app)
+        AionExtraHTTPRoutes(
+            self.aion_agent,
+            metrics_collectors=[
+                ActiveTasksCollector(request_handler.active_task_registry),
+                DbPoolCollector(self.db_factory.db_manager),
+            ],
+        ).register(self.fastapi_app)
+        if self.upload_manager is not None and isinstance(self.upload_manager.backend, FilesystemFileStorageBackend):
+            self.fastapi_app.router.routes.extend(create_file_routes(self.upload_manager.backend))
         self._add_extra_middlewares()
 
     async def _create_request_handler(self) -> AionRequestHandler:
@@ -198,6 +233,12 @@ class AppFactory:
             except Exception as exc:
                 logger.error("Error draining uploads", exc_info=exc)
 
+        if self.upload_manager is not None:
+            try:
+                await self.upload_manager.aclose()
+            except Exception as exc:
+                logger.error("Error closing file storage", exc_info=exc)
+
         if self.plugin_factory.is_initialized():
             try:
                 await self.plugin_factory.teardown_all()
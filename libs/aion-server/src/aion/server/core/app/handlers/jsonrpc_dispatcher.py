@@ -12,8 +12,9 @@ from a2a.server.jsonrpc_models import (
 )
 from a2a.server.request_handlers import prepare_response_object
 from a2a.server.routes.jsonrpc_dispatcher import JsonRpcDispatcher
-from a2a.utils.errors import UnsupportedOperationError
+from a2a.utils.errors import A2AError, UnsupportedOperationError
 from aion.core.a2a import GetContextParams, GetContextsListParams
+from aion.server.utils.requests import read_json_body
 from jsonrpc.jsonrpc2 import JSONRPC20Request
 from pydantic import ValidationError
 from sse_starlette.sse import EventSourceResponse
@@ -33,6 +34,10 @@ class AionJsonRpcDispatcher(JsonRpcDispatcher):
     Intercepts GetContext and GetContexts before the standard protobuf-based
     routing and handles them via Pydantic models. All standard A2A methods
     are delegated to the parent dispatcher unchanged.
+
+    The body is decoded once per request: the decoded object is shared with
+    ``AionContextMiddleware`` upstream and reaches the parent dispatcher
+    through the request's ``json()`` cache.
     """
     request_handler: AionRequestHandler
 
@@ -44,7 +49,7 @@ class AionJsonRpcDispatcher(JsonRpcDispatcher):
     @override
     async def handle_requests(self, request: Request) -> Response:
         try:
-            body = await request.json()
+            body = await read_json_body(request)
         except Exception as e:
             return self._generate_error_response(None, JSONParseError(message=str(e)))
 
@@ -136,6 +141,8 @@ class AionJsonRpcDispatcher(JsonRpcDispatcher):
                         request_id,
                         UnsupportedOperationError(message=f'Method {method} is unknown.'),
                     )
+        except A2AError as e:
+            return self._generate_error_response(request_id, e)
         except Exception:
             logger.error('Unhandled exception in Aion handler', exc_info=True)
             from a2a.server.jsonrpc_models import InternalError
@@ -6,10 +6,10 @@ from a2a.server.agent_execution.active_task import ActiveTask
 from a2a.server.context import ServerCallContext
 from a2a.server.events import Event
 from a2a.server.request_handlers import DefaultRequestHandlerV2
-from a2a.types import SendMessageRequest, SubscribeToTaskRequest, Task
+from a2a.types import SendMessageRequest, SubscribeToTaskRequest, Task, TaskState
 from a2a.utils.errors import InternalError, InvalidParamsError
 from a2a.utils.task import apply_history_length
-from aion.core.a2a import ContextsList, Conversation, GetContextParams, GetContextsListParams
+from aion.core.a2a import ContextsList, ContextsPage, Conversation, GetContextParams, GetContextsListParams
 from aion.core.runtime import ExtensionActivationError, aion_a2a_extension_registry
 from aion.core.runtime.context.extensions import AionRuntimeExtensions
 from collections.abc import AsyncGenerator
@@ -26,6 +26,12 @@ from .terminal_task_projection import TerminalTaskProjection
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONTEXTS_PAGE_SIZE = 50
+"""Page size of a cursor-paged GetContexts request that names only a cursor."""
+
+DEFAULT_CONTEXT_MESSAGE_LIMIT = 50
+"""Window size of a windowed GetContext request that names only a cursor."""
+
 
 def _with_preprocessors(method):
     """Decorator that runs all registered preprocessors before a handler method.
@@ -58,6 +64,11 @@ class AionRequestHandler(DefaultRequestHandlerV2):
         )
         self._preprocessors = preprocessors or []
 
+    @property
+    def active_task_registry(self) -> AionActiveTaskRegistry:
+        """The registry of tasks this handler is executing."""
+        return self._active_task_registry
+
     @override
     @_with_preprocessors
     async def _setup_active_task(
@@ -116,6 +127,10 @@ class AionRequestHandler(DefaultRequestHandlerV2):
     ) -> Conversation:
         """Get conversation context by ID.
 
+        A request carrying ``message_limit``, ``before`` or ``after`` is
+        answered with a window of messages and a cursor continuing it;
+        otherwise with the messages of a page of whole tasks.
+
         Args:
             params: Parameters containing context ID
             context: Optional server call context
@@ -123,6 +138,9 @@ class AionRequestHandler(DefaultRequestHandlerV2):
         Returns:
             Conversation object with context data
         """
+        if params.is_windowed:
+            return await AionRequestHandler._get_context_window(params)
+
         task_store = store_manager.get_store()
         tasks = await task_store.get_context_tasks(
             context_id=params.context_id,
@@ -131,21 +149,64 @@ class AionRequestHandler(DefaultRequestHandlerV2):
 
         return ConversationBuilder.build_from_tasks(context_id=params.context_id, tasks=tasks)
 
+    @staticmethod
+    async def _get_context_window(params: GetContextParams) -> Conversation:
+        """Assemble a conversation from a window of messages rather than whole tasks.
+
+        Messages are pulled from the store one at a time until the window is
+        full, plus one more to tell whether the conversation goes on; only the
+        artifacts of the tasks the window spans are read.
+        """
+        task_store = store_manager.get_store()
+        limit = params.message_limit or DEFAULT_CONTEXT_MESSAGE_LIMIT
+
+        window = []
+        async for item in task_store.iter_context_messages(
+                params.context_id, before=params.before, after=params.after, limit=limit + 1):
+            window.append(item)
+
+        has_more = len(window) > limit
+        window = window[:limit]
+        next_cursor = window[-1].cursor if has_more else None
+        if params.after is not None:
+            # Read oldest first to stay next to the cursor; answered newest first.
+            window.reverse()
+
+        task_ids = list(dict.fromkeys(item.task_id for item in window))
+        artifacts = await task_store.get_task_artifacts(task_ids)
+        head = await task_store.get_context_head(params.context_id)
+
+        return ConversationBuilder.build_from_window(
+            context_id=params.context_id,
+            messages=[item.message for item in window],
+            artifacts=(artifacts.get(task_id, []) for task_id in task_ids),
+            state=head.state if head is not None else TaskState.TASK_STATE_UNSPECIFIED,
+            next_cursor=next_cursor)
+
     @staticmethod
     async def on_get_contexts_list(
             params: GetContextsListParams,
             context: ServerCallContext | None = None
-    ) -> ContextsList:
-        """Get list of available context IDs.
+    ) -> ContextsList | ContextsPage:
+        """Get list of available contexts.
+
+        A request carrying ``page_size`` or ``cursor`` is answered with a page
+        of context summaries read from the store's per-context records;
+        otherwise with the offset-paged list of context ids.
 
         Args:
             params: Parameters for contexts list request
             context: Optional server call context
 
         Returns:
-            List of available context IDs
+            Page of context summaries, or list of available context IDs
         """
         task_store = store_manager.get_store()
+        if params.is_paged:
+            return await task_store.get_context_summaries(
+                page_size=params.page_size or DEFAULT_CONTEXTS_PAGE_SIZE,
+                cursor=params.cursor)
+
         context_ids = await task_store.get_context_ids(
             limit=params.history_length,
             offset=params.history_offset)
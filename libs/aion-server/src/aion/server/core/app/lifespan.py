@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from aion.core.runtime.context.registry import AionRuntimeContextRegistry
 from aion.server.agent.execution.context import RequestScopeRuntimeContextProvider
 from aion.server.opentelemetry import init_tracing
+from aion.server.settings import app_settings
+from aion.server.tasks import OrphanedTaskSweeper
 from fastapi import FastAPI
+from opentelemetry.sdk.trace import TracerProvider
 
 if TYPE_CHECKING:
     from aion.server.core.app import AppFactory
@@ -27,6 +31,8 @@ class AppLifespan:
     def __init__(self, app_factory: AppFactory):
         """Initialize the lifespan manager with an app factory."""
         self.app_factory: AppFactory = app_factory
+        self._orphaned_task_sweeper: Optional[OrphanedTaskSweeper] = None
+        self._tracer_provider: Optional[TracerProvider] = None
 
     @asynccontextmanager
     async def executor(self, app: FastAPI) -> AsyncGenerator[None, None]:
@@ -49,35 +55,33 @@ class AppLifespan:
         AionRuntimeContextRegistry.set_provider(RequestScopeRuntimeContextProvider())
 
         # SETUP OPEN-TELEMETRY
-        init_tracing()
-
-        # Startup settlement is intentionally disabled. The durable task store
-        # is shared by multiple agent processes, so this process cannot safely
-        # distinguish its predecessor's orphaned work from work another agent
-        # is still executing.
-        await self._settle_orphaned_tasks()
-
-    async def _settle_orphaned_tasks(self):
-        """Close out tasks a killed predecessor left running in the store.
-
-        Runs here, in startup, because it must happen before the process serves
-        anything: while such a task is still active, a client polling it cannot
-        tell a dead run from a live one, and this process may hand it back as
-        the resumable task of its context.
-
-        A store that cannot answer only costs the reap. Failing the startup
-        instead would take the agent down over tasks that are already stale,
-        and the same store is about to report its condition on the first
-        request anyway.
+        self._tracer_provider = init_tracing()
+
+        self._start_orphaned_task_sweeper()
+
+    def _start_orphaned_task_sweeper(self):
+        """Settle tasks that processes killed outright left running in the store.
+
+        The task store may be shared by several replicas, so a task merely
+        active in it may be running next door. Only tasks whose lease was not
+        renewed within its TTL are settled, from a background sweep whose first
+        pass runs now. A store without leases keeps nothing across processes,
+        so it has nothing to sweep.
         """
-        # try:
-        #     await settle_orphaned_tasks(self.app_factory.store_manager.get_store())
-        # except Exception as exc:
-        #     logger.error(
-        #         "Failed to settle tasks left by a previous process", exc_info=exc
-        #     )
-        pass
+        store = self.app_factory.store_manager.get_store()
+        if not store.supports_task_leases or not app_settings.orphaned_task_sweep_interval_seconds:
+            return
+
+        self._orphaned_task_sweeper = OrphanedTaskSweeper(store)
+        self._orphaned_task_sweeper.start()
 
     async def shutdown(self):
         """Handle application shutdown events."""
+        if self._orphaned_task_sweeper is not None:
+            await self._orphaned_task_sweeper.close()
+            self._orphaned_task_sweeper = None
         await self.app_factory.shutdown()
+        if self._tracer_provider is not None:
+            # Exports the spans still queued; bounded by the export timeout.
+            await asyncio.to_thread(self._tracer_provider.shutdown)
+            self._tracer_provider = None
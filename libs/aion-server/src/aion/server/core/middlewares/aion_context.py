@@ -18,6 +18,7 @@ from aion.server.agent.execution.scope import (
 )
 from aion.core.a2a.extensions.distribution import DistributionExtensionV1
 from aion.core.a2a.extensions.traceability import TraceabilityExtensionV1
+from aion.server.utils.requests import read_json_body
 from fastapi import Request, Response
 from pydantic import ValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -88,14 +89,15 @@ class AionContextMiddleware(BaseHTTPMiddleware):
         """Extract JSON-RPC method name and params.metadata from the raw body.
 
         Does not perform full A2A schema validation — only accesses the fields
-        this middleware actually needs.
+        this middleware actually needs. The decoded body is kept for the
+        JSON-RPC dispatcher, which does not decode it again.
 
         Returns:
             (method, metadata) tuple; both None if the body is not a valid
             JSON-RPC dict or has no metadata.
         """
         try:
-            body = await request.json()
+            body = await read_json_body(request)
             if not isinstance(body, dict):
                 return None, None, None
 
@@ -55,7 +55,8 @@ class TracingMiddleware(BaseHTTPMiddleware):
         # Generate trace context and attach it globally
         trace_context = generate_request_span_context(
             trace_id=scope.inbound.trace.trace_id if scope else None,
-            span_id=scope.inbound.trace.span_id if scope else None
+            span_id=scope.inbound.trace.span_id if scope else None,
+            trace_flags=scope.inbound.trace.trace_flags if scope else None,
         )
         if trace_context:
             token = context.attach(trace_context)
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import random
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from urllib.parse import urlsplit
 
 from aion.server.interfaces import IWebsocketTransportFactory, IWebSocketManager
@@ -49,6 +49,7 @@ class AionWebSocketManager(IWebSocketManager):
             connect_timeout: float = 30.0,
             startup_timeout: float = 30.0,
             stop_timeout: float = 5.0,
+            on_state_change: Optional[Callable[[dict], None]] = None,
     ):
         """
         Initialize WebSocket manager with injected dependencies.
@@ -61,6 +62,8 @@ class AionWebSocketManager(IWebSocketManager):
             connect_timeout: Deadline for a single connection attempt (seconds)
             startup_timeout: How long start() waits for the first attempt (seconds)
             stop_timeout: How long stop() waits before cancelling the loop (seconds)
+            on_state_change: Called with ``connection_state`` whenever the
+                connection comes up or goes down
         """
         self._ws_transport_factory = ws_transport_factory
         self.reconnect_delay = reconnect_delay
@@ -68,6 +71,8 @@ class AionWebSocketManager(IWebSocketManager):
         self.connect_timeout = connect_timeout
         self.startup_timeout = startup_timeout
         self.stop_timeout = stop_timeout
+        self._on_state_change = on_state_change
+        self._published_state: Optional[dict] = None
 
         self._websocket_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
@@ -134,6 +139,7 @@ class AionWebSocketManager(IWebSocketManager):
                     raise
 
         self._connected.clear()
+        self._publish_state()
         logger.info("Connection to Aion platform closed")
 
     async def _run(self) -> None:
@@ -190,6 +196,7 @@ class AionWebSocketManager(IWebSocketManager):
 
             reason = await self._wait_until_closed()
             self._connected.clear()
+            self._publish_state()
             await self._close_transport()
 
             if self._shutdown_event.is_set():
@@ -225,6 +232,20 @@ class AionWebSocketManager(IWebSocketManager):
 
         self._ever_connected = True
         self._startup_settled.set()
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        """Hand a changed connection state to ``on_state_change``, which must not break the loop."""
+        if self._on_state_change is None:
+            return
+        state = self.connection_state
+        if state == self._published_state:
+            return
+        self._published_state = state
+        try:
+            self._on_state_change(state)
+        except Exception:
+            logger.exception("Platform connection state callback failed")
 
     async def _open_transport(self) -> None:
         """Build a fresh transport and connect it, within connect_timeout."""
@@ -6,7 +6,8 @@ The actual upload is scheduled in the background via FileUploadManager.
 
 If no upload_manager is provided or resolved, all transform methods are no-ops.
 
-Parts that match skip rules (e.g., JSX Cards) are never uploaded to storage.
+Parts that match skip rules (e.g., JSX Cards) are never uploaded to storage,
+and parts the storage budget has no room for are left inline.
 """
 import logging
 
@@ -19,6 +20,7 @@ from a2a.types import (
     TaskArtifactUpdateEvent,
     TaskStatusUpdateEvent,
 )
+from aion.server.files.storage.backends.base import FileStorageLimitError
 from aion.server.files.storage.manager import FileUploadManager
 from .rules import PartSkipRule, create_default_skip_rules
 
@@ -189,8 +191,9 @@ class A2AFileTransformer:
     ) -> tuple[Part, str | None]:
         """Transform a single Part if it contains inline bytes; returns the part and upload URL.
 
-        If a part matches any skip rule, it is returned unchanged (not uploaded).
-        Otherwise, prepares a URL for the inline bytes and schedules background upload.
+        If a part matches any skip rule, or does not fit the storage budget, it
+        is returned unchanged (not uploaded). Otherwise, prepares a URL for the
+        inline bytes and schedules background upload.
         """
         if not part.raw:
             return part, None
@@ -207,10 +210,14 @@ class A2AFileTransformer:
             mime_type = guessed
         mime_type = mime_type or "application/octet-stream"
 
-        url = self._upload_manager.schedule(
-            data=data,
-            mime_type=mime_type,
-            context_id=context_id,
-        )
+        try:
+            url = self._upload_manager.schedule(
+                data=data,
+                mime_type=mime_type,
+                context_id=context_id,
+            )
+        except FileStorageLimitError as exc:
+            logger.warning("File part %r left inline: %s", part.filename or mime_type, exc)
+            return part, None
 
         return Part(url=url, media_type=mime_type, filename=part.filename), url
@@ -1,8 +1,15 @@
-from .backends import FileStorageBackend, StubFileStorageBackend
+from .backends import (
+    FileStorageBackend,
+    FileStorageLimitError,
+    FilesystemFileStorageBackend,
+    StubFileStorageBackend,
+)
 from .manager import FileUploadManager
 
 __all__ = [
     "FileStorageBackend",
+    "FileStorageLimitError",
+    "FilesystemFileStorageBackend",
     "StubFileStorageBackend",
     "FileUploadManager",
 ]
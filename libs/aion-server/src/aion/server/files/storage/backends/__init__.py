@@ -1,2 +1,3 @@
-from .base import FileStorageBackend
+from .base import FileStorageBackend, FileStorageLimitError
+from .filesystem import FilesystemFileStorageBackend
 from .stub import StubFileStorageBackend
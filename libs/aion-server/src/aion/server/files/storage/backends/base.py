@@ -7,6 +7,10 @@ a stable URL before the upload completes, enabling the presigned-URL pattern.
 from abc import ABC, abstractmethod
 
 
+class FileStorageLimitError(Exception):
+    """A file does not fit the backend's per-file or total size budget."""
+
+
 class FileStorageBackend(ABC):
     """Abstract file storage service.
 
@@ -18,6 +22,29 @@ class FileStorageBackend(ABC):
     immediately while the upload happens in the background.
     """
 
+    def admits(self, size: int) -> bool:
+        """Whether a file of ``size`` bytes fits the backend's size budget.
+
+        Checked before a URI is handed out for the file. An admitted file
+        holds its share of the budget until release() is called for it, so
+        files admitted together cannot overrun the budget once they land.
+        Backends without a budget admit everything.
+
+        Args:
+            size: Size of the file in bytes.
+        """
+        return True
+
+    def release(self, size: int) -> None:
+        """Give back the share of the budget admits() reserved for a file.
+
+        Called once per admitted file when its upload has ended, whether it
+        stored the bytes, found them already stored, failed or was cancelled.
+
+        Args:
+            size: Size of the file in bytes, as passed to admits().
+        """
+
     @abstractmethod
     def generate_uri(
         self,
@@ -73,3 +100,17 @@ class FileStorageBackend(ABC):
             file_id: The file_id returned by generate_uri().
             context_id: Session/conversation identifier.
         """
+
+    async def start(self) -> None:
+        """Prepare the backend before its first use, such as loading credentials.
+
+        Called once, on startup, before any URI is generated. Backends with
+        nothing to prepare need not override it.
+        """
+
+    async def aclose(self) -> None:
+        """Release the backend's resources, such as connection pools.
+
+        Called once, on shutdown, after in-flight uploads have drained.
+        Backends holding nothing open need not override it.
+        """
@@ -0,0 +1,268 @@
+"""Content-addressed file storage on the local filesystem.
+
+Each distinct content is stored once, named by its SHA-256, and each upload is
+a hard link to its content named by the upload's file id::
+
+    {root}/objects/ab/ab12...ef             one file per distinct content
+    {root}/files/{context_id}/{file_id}.ext  one link per upload
+
+A URI is handed out before the bytes are seen (see ``FileStorageBackend``), so
+it names the upload rather than the content. The link makes serving it a plain
+file read, while identical uploads share one copy on disk and count once
+against the total budget. The agent app serves the files under ``FILES_URL``.
+"""
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import Optional
+from uuid import uuid4
+
+from aion.server.constants import FILES_URL
+from aion.server.files.storage.backends.base import FileStorageBackend, FileStorageLimitError
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed and written per step, so a large upload never needs a second
+# copy of itself in memory.
+_CHUNK_SIZE = 1024 * 1024
+
+# A path segment that is safe both in a URL and on disk. Leading dots are
+# excluded, which rules out "." and "..".
+_SAFE_SEGMENT = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,127}")
+
+
+class FilesystemFileStorageBackend(FileStorageBackend):
+    """Stores files under a local directory and hands out URLs the agent app serves.
+
+    Bytes are hashed and written in a worker thread, a chunk at a time, to a
+    temporary file that is moved into place once complete, so a reader never
+    sees a partial file and the event loop is not blocked by a large upload.
+
+    Two budgets apply: ``max_file_bytes`` per file and ``max_total_bytes``
+    across the distinct contents stored. Both are checked before a URI is
+    handed out (``admits``), which also reserves the file's size against the
+    total until its upload ends (``release``): a URI handed out must not turn
+    into a 404 because uploads admitted alongside it filled the budget first.
+    The total is checked again when the bytes land, for uploads made without
+    an admission.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        base_url: str,
+        max_file_bytes: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+    ) -> None:
+        """Open, or create, the storage directory.
+
+        Args:
+            root: Directory the files are stored under.
+            base_url: URL the agent app is reached at by clients; file URLs are
+                built on it.
+            max_file_bytes: Largest file accepted. None for no limit.
+            max_total_bytes: Most bytes stored in total, counting identical
+                contents once. None for no limit.
+        """
+        self._root = Path(root).resolve()
+        self._objects = self._root / "objects"
+        self._files = self._root / "files"
+        self._staging = self._root / "tmp"
+        for directory in (self._objects, self._files, self._staging):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self._base_url = f"{base_url.rstrip('/')}{FILES_URL}"
+        self._max_file_bytes = max_file_bytes
+        self._max_total_bytes = max_total_bytes
+        # Linking, unlinking and the byte count change together under this
+        # lock, so a content is never collected while an upload links to it.
+        self._lock = asyncio.Lock()
+        # Sizes admitted against the total whose uploads have not ended yet.
+        self._reserved_bytes = 0
+
+        self._clear_staging()
+        self._used_bytes = self._measure_objects()
+
+    @property
+    def used_bytes(self) -> int:
+        """Bytes stored, counting identical contents once."""
+        return self._used_bytes
+
+    def admits(self, size: int) -> bool:
+        """Whether a file of ``size`` bytes fits both budgets; if so, reserve it against the total."""
+        if self._max_file_bytes is not None and size > self._max_file_bytes:
+            return False
+        if self._max_total_bytes is not None:
+            if self._used_bytes + self._reserved_bytes + size > self._max_total_bytes:
+                return False
+            self._reserved_bytes += size
+        return True
+
+    def release(self, size: int) -> None:
+        """Give back the reservation admits() made for a file whose upload ended."""
+        if self._max_total_bytes is not None:
+            self._reserved_bytes = max(0, self._reserved_bytes - size)
+
+    def generate_uri(
+        self,
+        mime_type: str | None = None,
+        context_id: str | None = None,
+    ) -> tuple[str, str]:
+        """Allocate a file id and the URL its upload will be served at.
+
+        Args:
+            mime_type: Content type (used to pick the file extension).
+            context_id: Conversation the file belongs to (used as a directory).
+
+        Returns:
+            Tuple of (file_id, uri).
+        """
+        file_id = str(uuid4())
+        return file_id, f"{self._base_url}/{self._relative_path(file_id, mime_type, context_id)}"
+
+    async def upload(
+        self,
+        file_id: str,
+        data: bytes,
+        mime_type: str,
+        context_id: str | None = None,
+    ) -> None:
+        """Store ``data`` once by content and link the upload's path to it.
+
+        Args:
+            file_id: The file_id returned by generate_uri().
+            data: Raw file bytes.
+            mime_type: MIME type of the content.
+            context_id: Session/conversation identifier.
+
+        Raises:
+            FileStorageLimitError: If the file exceeds a budget.
+        """
+        size = len(data)
+        if self._max_file_bytes is not None and size > self._max_file_bytes:
+            raise FileStorageLimitError(
+                f"File of {size} bytes exceeds the {self._max_file_bytes} byte limit per file"
+            )
+
+        link = self._files / self._relative_path(file_id, mime_type, context_id)
+        staged, digest = await asyncio.to_thread(self._stage, data)
+        try:
+            async with self._lock:
+                await asyncio.to_thread(self._commit, staged, digest, size, link)
+        finally:
+            staged.unlink(missing_ok=True)
+
+    async def delete(
+        self,
+        file_id: str,
+        context_id: str | None = None,
+    ) -> None:
+        """Remove an upload's link, and its content once nothing else links to it."""
+        directory = self._files / context_id if self._is_safe(context_id) else self._files
+        async with self._lock:
+            await asyncio.to_thread(self._remove_links, directory, file_id)
+
+    def resolve(self, path: str) -> Optional[Path]:
+        """Map the path of a file URL below ``FILES_URL`` to the stored file.
+
+        Returns:
+            The file, or None if the path is malformed or nothing is stored there.
+        """
+        segments = path.split("/")
+        if not 1 <= len(segments) <= 2 or not all(self._is_safe(segment) for segment in segments):
+            return None
+        candidate = self._files.joinpath(*segments)
+        return candidate if candidate.is_file() else None
+
+    def _relative_path(self, file_id: str, mime_type: str | None, context_id: str | None) -> str:
+        # A context id that is unsafe as a path segment is client-supplied text;
+        # such files are stored without a context directory.
+        ext = mimetypes.guess_extension(mime_type) if mime_type else None
+        name = f"{file_id}{ext or ''}"
+        if self._is_safe(context_id):
+            return str(PurePosixPath(context_id, name))
+        return name
+
+    @staticmethod
+    def _is_safe(segment: str | None) -> bool:
+        return bool(segment) and _SAFE_SEGMENT.fullmatch(segment) is not None
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest
+
+    def _stage(self, data: bytes) -> tuple[Path, str]:
+        """Write ``data`` to a temporary file, hashing it on the way."""
+        digest = hashlib.sha256()
+        view = memoryview(data)
+        fd, name = tempfile.mkstemp(dir=self._staging)
+        with os.fdopen(fd, "wb") as file:
+            for start in range(0, len(view), _CHUNK_SIZE):
+                chunk = view[start:start + _CHUNK_SIZE]
+                digest.update(chunk)
+                file.write(chunk)
+        return Path(name), digest.hexdigest()
+
+    def _commit(self, staged: Path, digest: str, size: int, link: Path) -> None:
+        """Move staged content into place unless already stored, then link to it."""
+        blob = self._object_path(digest)
+        if blob.exists():
+            logger.debug("Content of %s is already stored as %s", link.name, digest)
+        else:
+            if self._max_total_bytes is not None and self._used_bytes + size > self._max_total_bytes:
+                raise FileStorageLimitError(
+                    f"Storing {size} more bytes would exceed the {self._max_total_bytes} byte total limit"
+                )
+            blob.parent.mkdir(exist_ok=True)
+            os.replace(staged, blob)
+            self._used_bytes += size
+
+        link.parent.mkdir(exist_ok=True)
+        if link.exists():
+            if link.stat().st_ino == blob.stat().st_ino:
+                # Already linked to this content; unlinking first could
+                # collect it before it is linked again.
+                return
+            self._unlink(link)
+        os.link(blob, link)
+
+    def _remove_links(self, directory: Path, file_id: str) -> None:
+        # The extension was derived from a MIME type delete() is not given.
+        for link in directory.glob(f"{file_id}*"):
+            if link.name == file_id or link.name.startswith(f"{file_id}."):
+                self._unlink(link)
+
+    def _unlink(self, link: Path) -> None:
+        """Remove one link, collecting its content if this was the last one."""
+        links = link.stat().st_nlink
+        if links > 2:
+            link.unlink()
+            return
+
+        # Only the content and this link remain; name the content by hashing it.
+        blob = self._object_path(self._hash_file(link))
+        link.unlink()
+        if blob.exists() and blob.stat().st_nlink == 1:
+            self._used_bytes -= blob.stat().st_size
+            blob.unlink()
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _clear_staging(self) -> None:
+        """Remove partial writes a previous process left behind."""
+        for partial in self._staging.iterdir():
+            partial.unlink(missing_ok=True)
+
+    def _measure_objects(self) -> int:
+        return sum(blob.stat().st_size for blob in self._objects.glob("*/*"))
@@ -0,0 +1,313 @@
+"""S3-compatible object storage backend.
+
+Works against AWS S3 and any service speaking its API (MinIO, Ceph, R2, ...).
+Requires the ``s3`` extra of aion-server. Credentials are resolved the way
+the AWS SDKs resolve them - environment, shared config, instance role.
+
+Files are stored under ``{prefix}{context_id}/{file_id}{ext}``. The URI handed
+out is a pre-signed GET URL for that key, valid for ``url_expires_seconds``,
+or a plain URL below ``public_url`` when the bucket is served publicly (e.g.
+through a CDN), which never expires.
+"""
+
+import asyncio
+import logging
+import mimetypes
+from contextlib import AsyncExitStack
+from typing import Any, Optional
+from urllib.parse import quote
+from uuid import uuid4
+
+import botocore.session
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from botocore.config import Config
+from botocore.credentials import CredentialProvider, CredentialResolver, Credentials, RefreshableCredentials
+
+from aion.server.files.storage.backends.base import FileStorageBackend
+
+logger = logging.getLogger(__name__)
+
+# S3 refuses multipart parts smaller than this, the last part excepted.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class _SigningCredentials(Credentials):
+    """Credentials the URL signer reads without blocking the event loop.
+
+    Signing uses a frozen snapshot. Temporary credentials are refreshed in a
+    worker thread once botocore would start refreshing them, and signing goes
+    on with the current snapshot until the refresh lands.
+    """
+
+    def __init__(self, source: Credentials) -> None:
+        self._source = source
+        self._frozen = source.get_frozen_credentials()
+        self._refresh: Optional[asyncio.Future] = None
+        self.method = source.method
+
+    @property
+    def access_key(self) -> str:
+        return self._frozen.access_key
+
+    @property
+    def secret_key(self) -> str:
+        return self._frozen.secret_key
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._frozen.token
+
+    def get_frozen_credentials(self) -> Any:
+        return self._frozen
+
+    def refresh_if_needed(self) -> None:
+        if not isinstance(self._source, RefreshableCredentials) or not self._source.refresh_needed():
+            return
+        if self._refresh is not None and not self._refresh.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._reload()
+            return
+        self._refresh = loop.run_in_executor(None, self._reload)
+
+    def _reload(self) -> None:
+        try:
+            self._frozen = self._source.get_frozen_credentials()
+        except Exception:
+            logger.warning("Failed to refresh the credentials S3 URLs are signed with", exc_info=True)
+
+
+class _ResolvedCredentialProvider(CredentialProvider):
+    """Hands a botocore session credentials that were resolved beforehand."""
+
+    METHOD = "aion-resolved"
+
+    def __init__(self, credentials: Optional[Credentials]) -> None:
+        super().__init__()
+        self._credentials = credentials
+
+    def load(self) -> Optional[Credentials]:
+        return self._credentials
+
+
+class S3FileStorageBackend(FileStorageBackend):
+    """Uploads files to an S3-compatible bucket and hands out pre-signed URLs.
+
+    A file below ``multipart_threshold`` bytes is stored with one PUT. A larger
+    one is streamed as a multipart upload of ``part_size`` byte parts, up to
+    ``part_concurrency`` of them in flight at once; each part is sliced from
+    the file without copying the rest, and a failed upload is aborted so no
+    orphaned parts are billed.
+
+    URLs are signed locally, with no request to the service, which is what
+    lets ``generate_uri`` answer before the upload starts. Resolving the
+    signing credentials may call out (instance metadata, STS, SSO), so
+    ``start`` does it in a worker thread, and temporary credentials are
+    refreshed there too. A backend that was not started resolves them on its
+    first ``generate_uri``, blocking the caller once. A pre-signed URL stops
+    working when the temporary credentials it was signed with expire, however
+    long ``url_expires_seconds`` is.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        region_name: Optional[str] = None,
+        public_url: Optional[str] = None,
+        url_expires_seconds: int = 7 * 24 * 3600,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        part_concurrency: int = 4,
+        max_connections: int = 10,
+    ) -> None:
+        """Configure the backend. No connection is opened until the first upload.
+
+        Args:
+            bucket: Bucket files are stored in.
+            prefix: Prefix of every key, e.g. ``"agent-files/"``.
+            endpoint_url: Endpoint of an S3-compatible service. None for AWS.
+            region_name: Region of the bucket. None for the SDK's default.
+            public_url: Base URL the bucket's objects are publicly served at.
+                When set, URIs are built on it instead of being pre-signed.
+            url_expires_seconds: Lifetime of a pre-signed URL. SigV4 allows at
+                most 7 days.
+            multipart_threshold: Smallest file uploaded in parts.
+            part_size: Size of each part of a multipart upload.
+            part_concurrency: Parts of one file uploaded at once.
+            max_connections: Connections kept to the service, shared by all
+                uploads.
+
+        Raises:
+            ValueError: If ``part_size`` is below what S3 accepts.
+        """
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes, got {part_size}")
+
+        self._bucket = bucket
+        self._prefix = prefix
+        self._public_url = public_url.rstrip("/") if public_url else None
+        self._url_expires_seconds = url_expires_seconds
+        self._multipart_threshold = max(multipart_threshold, part_size)
+        self._part_size = part_size
+        self._part_concurrency = part_concurrency
+        self._client_kwargs: dict[str, Any] = {"endpoint_url": endpoint_url, "region_name": region_name}
+        self._config = AioConfig(max_pool_connections=max_connections, signature_version="s3v4")
+
+        self._session = get_session()
+        # Signing needs no connection, so a synchronous client does it and
+        # generate_uri stays synchronous. It is created by start().
+        self._signer: Any = None
+        self._signing_credentials: Optional[_SigningCredentials] = None
+        self._client: Any = None
+        self._exit_stack = AsyncExitStack()
+        self._client_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Resolve the signing credentials and create the signer off the loop."""
+        if self._public_url is None and self._signer is None:
+            self._signer, self._signing_credentials = await asyncio.to_thread(self._create_signer)
+
+    def generate_uri(
+        self,
+        mime_type: str | None = None,
+        context_id: str | None = None,
+    ) -> tuple[str, str]:
+        """Allocate a file id and sign the URL its object will be served at.
+
+        Args:
+            mime_type: Content type (used to pick the key's extension).
+            context_id: Conversation the file belongs to (used in the key).
+
+        Returns:
+            Tuple of (file_id, uri).
+        """
+        file_id = str(uuid4())
+        key = self._key(file_id, mime_type, context_id)
+        if self._public_url is not None:
+            return file_id, f"{self._public_url}/{quote(key)}"
+
+        if self._signer is None:
+            self._signer, self._signing_credentials = self._create_signer()
+        elif self._signing_credentials is not None:
+            self._signing_credentials.refresh_if_needed()
+        uri = self._signer.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self._bucket, "Key": key},
+            ExpiresIn=self._url_expires_seconds,
+        )
+        return file_id, uri
+
+    async def upload(
+        self,
+        file_id: str,
+        data: bytes,
+        mime_type: str,
+        context_id: str | None = None,
+    ) -> None:
+        """Store ``data`` at the key its URI was signed for.
+
+        Args:
+            file_id: The file_id returned by generate_uri().
+            data: Raw file bytes.
+            mime_type: MIME type of the content.
+            context_id: Session/conversation identifier.
+        """
+        client = await self._get_client()
+        key = self._key(file_id, mime_type, context_id)
+        if len(data) < self._multipart_threshold:
+            await client.put_object(Bucket=self._bucket, Key=key, Body=data, ContentType=mime_type)
+            return
+        await self._upload_multipart(client, key, data, mime_type)
+
+    async def delete(
+        self,
+        file_id: str,
+        context_id: str | None = None,
+    ) -> None:
+        """Delete the object stored for ``file_id``.
+
+        The key's extension was derived from a MIME type delete() is not
+        given, so the object is found by listing its file id as a prefix.
+        """
+        client = await self._get_client()
+        listing = await client.list_objects_v2(
+            Bucket=self._bucket, Prefix=self._key(file_id, None, context_id)
+        )
+        for entry in listing.get("Contents", []):
+            await client.delete_object(Bucket=self._bucket, Key=entry["Key"])
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._exit_stack.aclose()
+        self._client = None
+
+    async def _upload_multipart(self, client: Any, key: str, data: bytes, mime_type: str) -> None:
+        upload = await client.create_multipart_upload(Bucket=self._bucket, Key=key, ContentType=mime_type)
+        upload_id = upload["UploadId"]
+        view = memoryview(data)
+        semaphore = asyncio.Semaphore(self._part_concurrency)
+
+        async def upload_part(number: int, start: int) -> dict[str, Any]:
+            async with semaphore:
+                response = await client.upload_part(
+                    Bucket=self._bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=view[start:start + self._part_size].tobytes(),
+                )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        uploads = [
+            asyncio.ensure_future(upload_part(number, start))
+            for number, start in enumerate(range(0, len(view), self._part_size), start=1)
+        ]
+        try:
+            parts = await asyncio.gather(*uploads)
+            await client.complete_multipart_upload(
+                Bucket=self._bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            # Parts still in flight when the upload is aborted may be stored
+            # after it, and are billed until removed, so they are stopped first.
+            for part in uploads:
+                part.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            try:
+                await client.abort_multipart_upload(Bucket=self._bucket, Key=key, UploadId=upload_id)
+            except Exception:
+                logger.warning("Failed to abort multipart upload of %s", key, exc_info=True)
+            raise
+
+    def _create_signer(self) -> tuple[Any, Optional[_SigningCredentials]]:
+        """Create the signing client; blocks on credential resolution."""
+        source = botocore.session.get_session().get_credentials()
+        credentials = _SigningCredentials(source) if source is not None else None
+        session = botocore.session.get_session()
+        session.register_component(
+            "credential_provider", CredentialResolver([_ResolvedCredentialProvider(credentials)])
+        )
+        signer = session.create_client("s3", config=Config(signature_version="s3v4"), **self._client_kwargs)
+        return signer, credentials
+
+    async def _get_client(self) -> Any:
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = await self._exit_stack.enter_async_context(
+                        self._session.create_client("s3", config=self._config, **self._client_kwargs)
+                    )
+        return self._client
+
+    def _key(self, file_id: str, mime_type: str | None, context_id: str | None) -> str:
+        ext = mimetypes.guess_extension(mime_type) if mime_type else None
+        name = f"{file_id}{ext or ''}"
+        if context_id:
+            return f"{self._prefix}{context_id}/{name}"
+        return f"{self._prefix}{name}"
@@ -7,8 +7,9 @@ waiting for specific URIs — without coupling callers to asyncio internals.
 import logging
 
 import asyncio
+from contextlib import nullcontext
 
-from .backends.base import FileStorageBackend
+from .backends.base import FileStorageBackend, FileStorageLimitError
 
 logger = logging.getLogger(__name__)
 
@@ -23,24 +24,37 @@ class FileUploadManager:
     wait only for their own uploads, without blocking on unrelated ones.
 
     drain() is intended for graceful shutdown — it waits for all pending uploads.
+
+    At most ``upload_concurrency`` uploads run at once; the rest wait their
+    turn, so a burst of attachments cannot open an unbounded number of
+    connections to the backend. Waiting uploads still hold their file's bytes
+    until they run.
     """
 
-    def __init__(self, backend: FileStorageBackend) -> None:
+    def __init__(self, backend: FileStorageBackend, upload_concurrency: int | None = None) -> None:
         """Initialize the upload manager with a storage backend.
 
         Args:
             backend: The file storage backend to use for uploads.
+            upload_concurrency: Uploads run at once. None for no limit.
         """
         self._backend = backend
         self._pending: dict[str, asyncio.Task] = {}  # uri -> task
         self._uri_to_file_id: dict[str, str] = {}  # uri -> file_id
+        self._upload_slots = asyncio.Semaphore(upload_concurrency) if upload_concurrency else None
+
+    @property
+    def backend(self) -> FileStorageBackend:
+        """The storage backend uploads go to."""
+        return self._backend
 
     @classmethod
     def from_settings(cls) -> "FileUploadManager | None":
         """Create a FileUploadManager from the current application settings.
 
         Returns None if file storage is not configured. Raises ValueError
-        if the configured backend type is unknown.
+        if the configured backend type is unknown, or if the filesystem
+        backend has no FILE_STORAGE_PUBLIC_URL to build its file URLs on.
 
         Returns:
             FileUploadManager instance or None if storage is disabled.
@@ -54,13 +68,46 @@ class FileUploadManager:
             case "stub":
                 from .backends.stub import StubFileStorageBackend
                 backend = StubFileStorageBackend()
+            case "filesystem":
+                from .backends.filesystem import FilesystemFileStorageBackend
+                # The agent binds to 0.0.0.0, which is no address a client
+                # can fetch from, so there is no usable default.
+                if not app_settings.file_storage_public_url:
+                    raise ValueError(
+                        "The 'filesystem' storage backend needs FILE_STORAGE_PUBLIC_URL "
+                        "to build the URLs it serves files at."
+                    )
+                backend = FilesystemFileStorageBackend(
+                    root=app_settings.file_storage_path,
+                    base_url=app_settings.file_storage_public_url,
+                    max_file_bytes=app_settings.file_storage_max_file_bytes,
+                    max_total_bytes=app_settings.file_storage_max_total_bytes,
+                )
+            case "s3":
+                from .backends.s3 import S3FileStorageBackend
+                backend = S3FileStorageBackend(
+                    bucket=app_settings.file_storage_s3_bucket,
+                    prefix=app_settings.file_storage_s3_prefix,
+                    endpoint_url=app_settings.file_storage_s3_endpoint_url,
+                    region_name=app_settings.file_storage_s3_region,
+                    public_url=app_settings.file_storage_s3_public_url,
+                    url_expires_seconds=app_settings.file_storage_s3_url_expires_seconds,
+                    multipart_threshold=app_settings.file_storage_s3_multipart_threshold_bytes,
+                    part_size=app_settings.file_storage_s3_part_size_bytes,
+                    part_concurrency=app_settings.file_storage_s3_part_concurrency,
+                    # Enough connections for every part of every upload allowed at once.
+                    max_connections=(
+                        app_settings.file_storage_upload_concurrency
+                        * app_settings.file_storage_s3_part_concurrency
+                    ),
+                )
             case other:
                 raise ValueError(
                     f"Unknown storage backend type: '{other}'. "
-                    f"Available: 'stub'."
+                    f"Available: 'stub', 'filesystem', 's3'."
                 )
 
-        return cls(backend)
+        return cls(backend, upload_concurrency=app_settings.file_storage_upload_concurrency)
 
     def schedule(
             self,
@@ -80,12 +127,28 @@ class FileUploadManager:
 
         Returns:
             The file URI for the scheduled upload.
+
+        Raises:
+            FileStorageLimitError: If the backend's size budget has no room
+                for the file.
         """
-        file_id, uri = self._backend.generate_uri(mime_type=mime_type, context_id=context_id)
+        size = len(data)
+        if not self._backend.admits(size):
+            raise FileStorageLimitError(
+                f"File of {size} bytes does not fit the storage budget"
+            )
+        try:
+            file_id, uri = self._backend.generate_uri(mime_type=mime_type, context_id=context_id)
+        except BaseException:
+            self._backend.release(size)
+            raise
         self._uri_to_file_id[uri] = file_id
         task = asyncio.create_task(self._upload_safe(file_id, data, mime_type, context_id))
         self._pending[uri] = task
         task.add_done_callback(lambda _: self._pending.pop(uri, None))
+        # A done callback rather than a finally in the upload: a task
+        # cancelled before it first runs never enters its coroutine.
+        task.add_done_callback(lambda _: self._backend.release(size))
         return uri
 
     async def delete(self, uri: str, context_id: str | None = None) -> None:
@@ -131,6 +194,18 @@ class FileUploadManager:
         await asyncio.gather(*self._pending.values(), return_exceptions=True)
         logger.info("All uploads drained")
 
+    async def start(self) -> None:
+        """Prepare the backend; call once on startup, before scheduling uploads."""
+        await self._backend.start()
+
+    async def aclose(self) -> None:
+        """Drain pending uploads, then release the backend's resources.
+
+        Intended for shutdown; no upload may be scheduled afterwards.
+        """
+        await self.drain()
+        await self._backend.aclose()
+
     @property
     def pending_count(self) -> int:
         """Number of uploads currently in flight.
@@ -159,11 +234,12 @@ class FileUploadManager:
             context_id: Optional context identifier for the upload.
         """
         try:
-            await self._backend.upload(
-                file_id=file_id,
-                data=data,
-                mime_type=mime_type,
-                context_id=context_id,
-            )
+            async with self._upload_slots or nullcontext():
+                await self._backend.upload(
+                    file_id=file_id,
+                    data=data,
+                    mime_type=mime_type,
+                    context_id=context_id,
+                )
         except Exception:
             logger.exception("Background upload failed for file_id=%s", file_id)
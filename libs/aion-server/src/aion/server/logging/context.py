@@ -0,0 +1,142 @@
+"""Tracing and execution-scope context captured for a log record, resolved on demand.
+
+Enriching a record used to mean reading the active span and the execution
+scope and copying about fifteen values onto it, baggage dicts included, for
+every record - even when the only handler was a console formatter that prints
+just the task id. A :class:`LogContext` instead holds two references taken
+when the record passes the context filter: the active span and the execution
+scope. A field is resolved from them the first time a formatter reads it.
+
+The scope is mutable, so a field holds what the scope held when the field was
+resolved. Handlers here format within ``handle()``, while the code that logged
+still waits on the logging call, so that is what an eager copy would have held.
+"""
+
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+from opentelemetry import trace
+
+_TRACE_FIELDS = frozenset({"trace_id", "trace_span_id", "trace_span_name", "trace_parent_span_id"})
+
+_scope_module: Optional[ModuleType] = None
+
+
+def _current_scope() -> Any:
+    """Return the current execution scope, or None.
+
+    The scope package is imported on first use: logging is configured before
+    the agent execution modules can be imported.
+    """
+    global _scope_module
+    if _scope_module is None:
+        from aion.server.agent.execution import scope as _scope_module
+    return _scope_module.get_execution_scope()
+
+
+class LogContext:
+    """The span and execution scope a log record was emitted under.
+
+    A field is resolved on its first read and cached; the four trace fields
+    are resolved together, from one ``SpanInfo``. Resolution never raises: a
+    field that cannot be resolved reads as None.
+    """
+
+    __slots__ = ("_span", "_scope", "_fields", "_trace_resolved", "_scope_resolved")
+
+    def __init__(self, span: Any, scope: Any):
+        self._span = span
+        self._scope = scope
+        self._fields: dict[str, Any] = {}
+        self._trace_resolved = False
+        self._scope_resolved = False
+
+    @classmethod
+    def capture(cls) -> "LogContext":
+        """Capture the active span and execution scope of the caller."""
+        try:
+            span = trace.get_current_span()
+        except Exception:
+            span = None
+        try:
+            scope = _current_scope()
+        except Exception:
+            scope = None
+        return cls(span, scope)
+
+    def get(self, name: str) -> Any:
+        """Return the value of a context field, or None if it has none."""
+        fields = self._fields
+        if name in fields:
+            return fields[name]
+        if name in _TRACE_FIELDS:
+            if not self._trace_resolved:
+                self._trace_resolved = True
+                self._resolve_trace(fields)
+            return fields.get(name)
+
+        value = None
+        resolve = _SCOPE_FIELDS.get(name)
+        if resolve is not None and self._scope is not None:
+            try:
+                value = resolve(self._scope)
+            except Exception:
+                pass
+        fields[name] = value
+        return value
+
+    def resolve(self) -> dict[str, Any]:
+        """Resolve every field at once and return them by name; a missing one has no value."""
+        fields = self._fields
+        if not self._trace_resolved:
+            self._trace_resolved = True
+            self._resolve_trace(fields)
+        scope = self._scope
+        if scope is not None:
+            for name, resolve in _SCOPE_FIELDS.items():
+                if name not in fields:
+                    try:
+                        fields[name] = resolve(scope)
+                    except Exception:
+                        fields[name] = None
+        return dict(fields)
+
+    def _resolve_trace(self, fields: dict[str, Any]) -> None:
+        """Populate trace_id, span_id, span_name, and parent_span_id from the span."""
+        if self._span is None:
+            return
+        try:
+            from aion.server.opentelemetry.tracing import get_span_info
+
+            trace_span_info = get_span_info(self._span)
+            fields["trace_id"] = getattr(trace_span_info, "trace_id_hex", None)
+            fields["trace_span_id"] = getattr(trace_span_info, "span_id_hex", None)
+            fields["trace_span_name"] = getattr(trace_span_info, "span_name", None)
+            fields["trace_parent_span_id"] = getattr(trace_span_info, "parent_span_id_hex", None)
+        except Exception:
+            pass
+
+
+def _get_app_version_id() -> str:
+    """Return the running agent's version_id from app settings as a fallback."""
+    from aion.server.settings import app_settings
+    return app_settings.version_id
+
+
+# Aion deployment, task, and request fields, each read from the execution scope alone.
+_SCOPE_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "trace_baggage": lambda scope: scope.inbound.trace.baggage.copy(),
+    "agent_trace_baggage": lambda scope: scope.framework.agent_framework.trace.baggage.copy(),
+    "transaction_id": lambda scope: scope.inbound.trace.transaction_id,
+    "transaction_name": lambda scope: scope.inbound.transaction_name,
+    "aion_distribution_id": lambda scope: scope.inbound.aion.distribution_id,
+    "aion_version_id": lambda scope: scope.inbound.aion.version_id or _get_app_version_id(),
+    "aion_agent_environment_id": lambda scope: scope.inbound.aion.environment_id,
+    "http_request_method": lambda scope: scope.inbound.request.method,
+    "http_request_target": lambda scope: scope.inbound.request.path,
+    "task_id": lambda scope: scope.inbound.a2a.task_id,
+    "a2a_rpc_method": lambda scope: scope.inbound.request.jrpc_method,
+    "a2a_task_status": lambda scope: scope.inbound.a2a.task_status,
+}
+
+__all__ = ["LogContext"]
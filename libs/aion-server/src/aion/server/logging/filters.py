@@ -2,6 +2,10 @@
 
 import logging
 
+from aion.core.logging.base import attach_context
+
+from .context import LogContext
+
 # Rules for stream handler: namespace -> minimum log level, None = exclude entirely
 BASE_RULES: dict[str, int | None] = {
     "httpcore": logging.WARNING,
@@ -84,66 +88,15 @@ class ShieldedWebsocketCloseFilter(logging.Filter):
 
 class ServerAionContextFilter(logging.Filter):
     """
-    Enriches logging.LogRecord with OpenTelemetry tracing and server execution context.
+    Attaches OpenTelemetry tracing and server execution context to logging.LogRecord.
 
-    Attach to a handler so all records receive enriched fields before filtering or formatting.
+    Attach to a handler so all records carry the context before filtering or formatting.
+    The record gets one :class:`LogContext` reference as ``aion_context``; its fields
+    (``trace_id``, ``task_id``, ...) are resolved from it only when a formatter reads them.
+    A record passed to several handlers is captured once.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if not getattr(record, '_aion_enriched', False):
-            self._enrich_otel(record)
-            self._enrich_server_context(record)
-            record._aion_enriched = True
+        if record.__dict__.get("aion_context") is None:
+            attach_context(record, LogContext.capture())
         return True
-
-    @staticmethod
-    def _enrich_otel(record: logging.LogRecord) -> None:
-        """Populate trace_id, span_id, span_name, and parent_span_id from the active OTel span."""
-        try:
-            from aion.server.opentelemetry.tracing import get_span_info
-
-            trace_span_info = get_span_info()
-            record.trace_id = getattr(trace_span_info, "trace_id_hex", None)
-            record.trace_span_id = getattr(trace_span_info, "span_id_hex", None)
-            record.trace_span_name = getattr(trace_span_info, "span_name", None)
-            record.trace_parent_span_id = getattr(trace_span_info, "parent_span_id_hex", None)
-        except Exception:
-            pass
-
-    @classmethod
-    def _enrich_server_context(cls, record: logging.LogRecord) -> None:
-        """Populate Aion deployment, task, and request fields from the current execution scope."""
-        try:
-            from aion.server.agent.execution.scope import get_execution_scope
-
-            scope = get_execution_scope()
-            if not scope:
-                return
-
-            ec_inbound = scope.inbound
-            ec_framework = scope.framework
-
-            record.trace_baggage = ec_inbound.trace.baggage.copy()
-            record.agent_trace_baggage = ec_framework.agent_framework.trace.baggage.copy()
-
-            record.transaction_id = ec_inbound.trace.transaction_id
-            record.transaction_name = ec_inbound.transaction_name
-
-            record.aion_distribution_id = ec_inbound.aion.distribution_id
-            record.aion_version_id = ec_inbound.aion.version_id or cls._get_app_version_id()
-            record.aion_agent_environment_id = ec_inbound.aion.environment_id
-
-            record.http_request_method = ec_inbound.request.method
-            record.http_request_target = ec_inbound.request.path
-
-            record.task_id = ec_inbound.a2a.task_id
-            record.a2a_rpc_method = ec_inbound.request.jrpc_method
-            record.a2a_task_status = ec_inbound.a2a.task_status
-        except Exception:
-            pass
-
-    @staticmethod
-    def _get_app_version_id() -> str:
-        """Return the running agent's version_id from app settings as a fallback."""
-        from aion.server.settings import app_settings
-        return app_settings.version_id
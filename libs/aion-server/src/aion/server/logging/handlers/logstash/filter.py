@@ -2,7 +2,7 @@
 
 import logging
 
-from aion.core.logging.base import AionLogRecord
+from aion.core.logging.base import AionLogRecord, get_context_field
 
 __all__ = ["AionLogstashFilter"]
 
@@ -33,10 +33,10 @@ class AionLogstashFilter(logging.Filter):
     @staticmethod
     def _validate_deployment(record: AionLogRecord):
         return bool(
-            getattr(record, 'aion_distribution_id', None) or
-            getattr(record, 'aion_version_id', None)
+            get_context_field(record, 'aion_distribution_id') or
+            get_context_field(record, 'aion_version_id')
         )
 
     @staticmethod
     def _validate_tracing(record: AionLogRecord):
-        return bool(getattr(record, 'trace_id', None))
+        return bool(get_context_field(record, 'trace_id'))
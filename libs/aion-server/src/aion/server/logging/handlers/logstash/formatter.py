@@ -6,7 +6,7 @@ import os
 import traceback
 
 from a2a.types import TaskState
-from aion.core.logging.base import AionLogRecord
+from aion.core.logging.base import AionLogRecord, get_context_fields, get_message
 from logstash_async.formatter import LogstashFormatter
 
 from aion.server.utils.deployment import get_service_name
@@ -62,8 +62,12 @@ class AionLogstashFormatter(LogstashFormatter):
                 - error.type: Exception type name (only if exception present)
                 - error.stack_trace: Full stack trace (only if exception present)
         """
-        trace_baggage = record.trace_baggage if isinstance(record.trace_baggage, dict) else {}
-        agent_framework_baggage = record.agent_trace_baggage if isinstance(record.agent_trace_baggage, dict) else {}
+        field = get_context_fields(record).get
+        trace_baggage = field("trace_baggage")
+        trace_baggage = trace_baggage if isinstance(trace_baggage, dict) else {}
+        agent_framework_baggage = field("agent_trace_baggage")
+        agent_framework_baggage = agent_framework_baggage if isinstance(agent_framework_baggage, dict) else {}
+        a2a_task_status = field("a2a_task_status")
         user_id = trace_baggage.get("aion.sender.id", None)
 
         message = {
@@ -73,7 +77,7 @@ class AionLogstashFormatter(LogstashFormatter):
             ).strftime('%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}Z',
             'clientId': self._client_id,
             'logLevel': _LOG_LEVEL_MAP.get(record.levelname, record.levelname),
-            'message': record.getMessage(),
+            'message': get_message(record),
             'logger': record.name,
             'user.id': user_id,
 
@@ -83,21 +87,21 @@ class AionLogstashFormatter(LogstashFormatter):
 
             # Application & trace context
             'service.name': get_service_name(),
-            "trace.id": record.trace_id,
-            "transaction.id": record.transaction_id,
-            "transaction.name": record.transaction_name,
-            "span.id": record.trace_span_id,
-            "span.name": record.trace_span_name,
-            "parent.span.id": record.trace_parent_span_id,
+            "trace.id": field("trace_id"),
+            "transaction.id": field("transaction_id"),
+            "transaction.name": field("transaction_name"),
+            "span.id": field("trace_span_id"),
+            "span.name": field("trace_span_name"),
+            "parent.span.id": field("trace_parent_span_id"),
 
             "_tags": trace_baggage | agent_framework_baggage | {
-                "aion.distribution.id": record.aion_distribution_id,
-                "aion.version.id": record.aion_version_id,
-                "aion.agentEnvironment.id": record.aion_agent_environment_id,
-                "http.method": record.http_request_method,
-                "http.target": record.http_request_target,
-                "a2a.rpc.method": record.a2a_rpc_method,
-                "a2a.taskStatus.state": TaskState.Name(record.a2a_task_status) if record.a2a_task_status is not None else None,
+                "aion.distribution.id": field("aion_distribution_id"),
+                "aion.version.id": field("aion_version_id"),
+                "aion.agentEnvironment.id": field("aion_agent_environment_id"),
+                "http.method": field("http_request_method"),
+                "http.target": field("http_request_target"),
+                "a2a.rpc.method": field("a2a_rpc_method"),
+                "a2a.taskStatus.state": TaskState.Name(a2a_task_status) if a2a_task_status is not None else None,
             },
         }
         # Add exception information if present
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from aion.core.logging.base import AionLogRecord
+from aion.core.logging.base import AionLogRecord, get_context_field, get_message
 from aion.core.logging.process import get_process_role
 from aion.core.utils.text import colorize_text
 
@@ -37,15 +37,17 @@ class LogStreamFormatter(logging.Formatter):
             # from nowhere in particular.
             context_parts.append(role)
 
-        if hasattr(record, 'task_id') and record.task_id:
-            context_parts.append(f"Task [{record.task_id}]")
+        if task_id := get_context_field(record, "task_id"):
+            context_parts.append(f"Task [{task_id}]")
 
-        # Build the formatted message manually
+        # Build the formatted message manually. Only the task id is printed, so
+        # the rest of the context is left unresolved.
+        message = get_message(record)
         context_str = " - ".join(context_parts)
         if context_str:
-            formatted_message = f"{timestamp} - {record.levelname} - {record.name} - {context_str} - {record.getMessage()}"
+            formatted_message = f"{timestamp} - {record.levelname} - {record.name} - {context_str} - {message}"
         else:
-            formatted_message = f"{timestamp} - {record.levelname} - {record.name} - {record.getMessage()}"
+            formatted_message = f"{timestamp} - {record.levelname} - {record.name} - {message}"
 
         # Add exception info if present
         if record.exc_info:
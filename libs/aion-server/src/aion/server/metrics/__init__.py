@@ -0,0 +1,15 @@
+from .registry import (
+    CONTENT_TYPE,
+    DEFAULT_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricFamily,
+    MetricsCollector,
+    MetricsRegistry,
+    Sample,
+    escape_label_value,
+    metrics_registry,
+    render_metrics,
+)
+from .collectors import ActiveTasksCollector, DbPoolCollector
@@ -0,0 +1,93 @@
+"""Collectors that read state the server already keeps, when a scrape asks for it."""
+
+import logging
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from aion.core.db import DbManagerProtocol
+
+from .registry import MetricFamily, Sample
+
+if TYPE_CHECKING:
+    from aion.server.agent.execution import AionActiveTaskRegistry
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ActiveTasksCollector", "DbPoolCollector"]
+
+
+class ActiveTasksCollector:
+    """Reports the tasks an ``AionActiveTaskRegistry`` is executing."""
+
+    def __init__(self, registry: "AionActiveTaskRegistry"):
+        self._registry = registry
+
+    def collect(self) -> Iterator[MetricFamily]:
+        yield MetricFamily(
+            "aion_active_tasks",
+            "gauge",
+            "Tasks executing in this process.",
+            [Sample("", (), self._registry.active_task_count)],
+        )
+
+
+class DbPoolCollector:
+    """Reports how saturated the database manager's connection pools are.
+
+    The manager holds two pools: the psycopg pool, and the SQLAlchemy engine's
+    own, which the task store's sessions draw from. Nothing is reported while
+    the manager is not initialized, as when the server runs without Postgres.
+    """
+
+    def __init__(self, db_manager: DbManagerProtocol):
+        self._db_manager = db_manager
+
+    def collect(self) -> Iterator[MetricFamily]:
+        if not self._db_manager.is_initialized:
+            return
+
+        connections: list[Sample] = []
+        limits: list[Sample] = []
+        waiting: list[Sample] = []
+        try:
+            stats = self._db_manager.get_pool().get_stats()
+            pool = (("pool", "psycopg"),)
+            size, available = stats.get("pool_size", 0), stats.get("pool_available", 0)
+            connections += [
+                Sample("", (*pool, ("state", "in_use")), size - available),
+                Sample("", (*pool, ("state", "idle")), available),
+            ]
+            limits.append(Sample("", pool, stats.get("pool_max", 0)))
+            waiting.append(Sample("", pool, stats.get("requests_waiting", 0)))
+
+            engine_pool = self._db_manager.get_engine().pool
+            pool = (("pool", "sqlalchemy"),)
+            connections += [
+                Sample("", (*pool, ("state", "in_use")), engine_pool.checkedout()),
+                Sample("", (*pool, ("state", "idle")), engine_pool.checkedin()),
+            ]
+            max_overflow = getattr(engine_pool, "_max_overflow", 0)
+            if max_overflow >= 0:
+                limits.append(Sample("", pool, engine_pool.size() + max_overflow))
+        except Exception as exc:
+            # A scrape racing shutdown finds the pools gone; it reports what it read.
+            logger.debug("Could not read database pool statistics: %s", exc)
+
+        yield MetricFamily(
+            "aion_db_pool_connections",
+            "gauge",
+            "Database connections open in each pool, in use or idle.",
+            connections,
+        )
+        yield MetricFamily(
+            "aion_db_pool_max_connections",
+            "gauge",
+            "Connections each pool opens at most.",
+            limits,
+        )
+        yield MetricFamily(
+            "aion_db_pool_waiting_requests",
+            "gauge",
+            "Requests waiting for a connection from the pool.",
+            waiting,
+        )
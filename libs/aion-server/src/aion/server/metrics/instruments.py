@@ -0,0 +1,43 @@
+"""The agent server's own instruments, registered with ``metrics_registry``."""
+
+from .registry import metrics_registry
+
+__all__ = [
+    "EVENT_PROCESSING_SECONDS",
+    "EVENTS_PROCESSED",
+    "PUSH_DELIVERIES",
+    "PUSH_DELIVERY_SECONDS",
+    "TASKS_STARTED",
+]
+
+# An event is routed in well under a millisecond unless it waits on the task
+# store, so the buckets start far below the request-latency defaults.
+_EVENT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+TASKS_STARTED = metrics_registry.counter(
+    "aion_tasks_started_total",
+    "Tasks this process started executing.",
+)
+
+EVENTS_PROCESSED = metrics_registry.counter(
+    "aion_events_processed_total",
+    "Agent events that entered the event pipeline, by event type.",
+    labelnames=("event",),
+)
+
+EVENT_PROCESSING_SECONDS = metrics_registry.histogram(
+    "aion_event_processing_seconds",
+    "Time the event pipeline spent on one agent event, including persisting it.",
+    buckets=_EVENT_BUCKETS,
+)
+
+PUSH_DELIVERIES = metrics_registry.counter(
+    "aion_push_deliveries_total",
+    "Push notification deliveries, by outcome: delivered, rejected, timeout or error.",
+    labelnames=("outcome",),
+)
+
+PUSH_DELIVERY_SECONDS = metrics_registry.histogram(
+    "aion_push_delivery_seconds",
+    "Time a push notification delivery took, whatever its outcome.",
+)
@@ -0,0 +1,325 @@
+"""Counters, gauges and histograms, rendered in the Prometheus text format.
+
+An instrument is a few attributes updated in place: incrementing a counter or
+observing a histogram costs about as much as the attribute arithmetic itself,
+and nothing else happens until something scrapes. Values that the server
+already keeps - active tasks, pool usage, in-flight requests - are not
+mirrored into instruments at all; a collector reads them when a scrape asks.
+
+Instruments are updated from the event loop thread, without locks.
+"""
+
+import math
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from typing import NamedTuple, Optional, Protocol, runtime_checkable
+
+__all__ = [
+    "CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricFamily",
+    "MetricsCollector",
+    "MetricsRegistry",
+    "Sample",
+    "escape_label_value",
+    "metrics_registry",
+    "render_metrics",
+]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Sample(NamedTuple):
+    """One exposed value: the family name plus ``suffix``, under ``labels``."""
+    suffix: str
+    labels: tuple[tuple[str, str], ...]
+    value: float
+
+
+class MetricFamily(NamedTuple):
+    """Every sample of one metric, as a scrape renders it."""
+    name: str
+    kind: str
+    documentation: str
+    samples: list[Sample]
+
+
+@runtime_checkable
+class MetricsCollector(Protocol):
+    """Anything that yields metric families when a scrape asks for them."""
+
+    def collect(self) -> Iterable[MetricFamily]:
+        ...
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount``, which must not be negative."""
+        self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramValue:
+    __slots__ = ("_bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        # One count per bucket, the last one for values above every bound.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+
+
+class _Instrument:
+    """A metric and its values, one per distinct set of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], object] = {}
+        self._unlabelled = None if self.labelnames else self.labels()
+
+    def labels(self, *values: str):
+        """Return the value kept for these label values, in ``labelnames`` order.
+
+        Callers on a hot path with fixed label values should keep the result
+        rather than look it up each time.
+
+        Raises:
+            ValueError: If the number of values does not match ``labelnames``.
+        """
+        value = self._values.get(values)
+        if value is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric {self.name} takes labels {self.labelnames}, got {len(values)} value(s)"
+                )
+            value = self._values[values] = self._new_value()
+        return value
+
+    def _new_value(self):
+        raise NotImplementedError
+
+    def _require_unlabelled(self):
+        if self._unlabelled is None:
+            raise ValueError(f"Metric {self.name} has labels {self.labelnames}; call labels() first")
+        return self._unlabelled
+
+    def _label_pairs(self, values: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, values))
+
+    def collect(self) -> Iterator[MetricFamily]:
+        yield MetricFamily(self.name, self.kind, self.documentation, list(self._samples()))
+
+    def _samples(self) -> Iterator[Sample]:
+        for values, value in self._values.items():
+            yield Sample("", self._label_pairs(values), value.value)
+
+
+class Counter(_Instrument):
+    """A total that only goes up. Name it ``..._total``."""
+
+    kind = "counter"
+
+    def _new_value(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().inc(amount)
+
+
+class Gauge(_Instrument):
+    """A value that goes up and down."""
+
+    kind = "gauge"
+
+    def _new_value(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self._require_unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().dec(amount)
+
+
+class Histogram(_Instrument):
+    """Observations counted into cumulative buckets, with their count and sum."""
+
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            name: Metric name.
+            documentation: Help text of the metric.
+            labelnames: Names of the labels values are kept per.
+            buckets: Upper bounds of the buckets, ascending; ``+Inf`` is implied.
+
+        Raises:
+            ValueError: If the buckets are empty or not strictly ascending.
+        """
+        bounds = tuple(float(bound) for bound in buckets if bound != math.inf)
+        if not bounds or any(low >= high for low, high in zip(bounds, bounds[1:])):
+            raise ValueError(f"Histogram {name} needs strictly ascending buckets, got {tuple(buckets)}")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._require_unlabelled().observe(value)
+
+    def _samples(self) -> Iterator[Sample]:
+        bounds = [*(_format_value(bound) for bound in self.buckets), "+Inf"]
+        for values, value in self._values.items():
+            labels = self._label_pairs(values)
+            cumulative = 0
+            for bound, count in zip(bounds, value.counts):
+                cumulative += count
+                yield Sample("_bucket", (*labels, ("le", bound)), cumulative)
+            yield Sample("_count", labels, cumulative)
+            yield Sample("_sum", labels, value.sum)
+
+
+class MetricsRegistry:
+    """The instruments and collectors one scrape renders."""
+
+    def __init__(self):
+        self._collectors: list[MetricsCollector] = []
+        self._names: set[str] = set()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register(self, collector):
+        """Add an instrument or collector to what a scrape renders, and return it.
+
+        Raises:
+            ValueError: If an instrument of the same name is registered already.
+        """
+        name = getattr(collector, "name", None)
+        if isinstance(collector, _Instrument):
+            if name in self._names:
+                raise ValueError(f"Metric {name} is already registered")
+            self._names.add(name)
+        self._collectors.append(collector)
+        return collector
+
+    def unregister(self, collector: MetricsCollector) -> None:
+        """Remove an instrument or collector added by ``register``."""
+        self._collectors.remove(collector)
+        if isinstance(collector, _Instrument):
+            self._names.discard(collector.name)
+
+    def collect(self) -> Iterator[MetricFamily]:
+        for collector in self._collectors:
+            yield from collector.collect()
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def escape_label_value(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_documentation(documentation: str) -> str:
+    return documentation.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def render_metrics(families: Iterable[MetricFamily], extra: Optional[Iterable[str]] = None) -> bytes:
+    """Render metric families in the Prometheus text exposition format.
+
+    Args:
+        families: Families to render; a family with no samples is skipped.
+        extra: Lines already in the exposition format, appended as they are.
+
+    Returns:
+        The response body for a scrape, served as ``CONTENT_TYPE``.
+    """
+    lines: list[str] = []
+    for family in families:
+        if not family.samples:
+            continue
+        lines.append(f"# HELP {family.name} {_escape_documentation(family.documentation)}")
+        lines.append(f"# TYPE {family.name} {family.kind}")
+        for suffix, labels, value in family.samples:
+            if labels:
+                rendered = ",".join(f'{key}="{escape_label_value(str(label))}"' for key, label in labels)
+                lines.append(f"{family.name}{suffix}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{family.name}{suffix} {_format_value(value)}")
+    if extra is not None:
+        lines.extend(extra)
+    return ("\n".join(lines) + "\n").encode() if lines else b""
+
+
+metrics_registry = MetricsRegistry()
+"""The process's registry, holding the instruments of ``aion.server.metrics.instruments``."""
@@ -1 +1,2 @@
 from .tracing import init_tracing, generate_request_span_context, get_span_info, SpanInfo
+from .stages import stage_span, traced_stream
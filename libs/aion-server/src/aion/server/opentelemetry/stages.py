@@ -0,0 +1,225 @@
+"""Child spans around the stages of a request, so their latencies can be told apart.
+
+A ``message/send`` spends its time building the request context, persisting
+task events, streaming from the agent framework and delivering push
+notifications; the request span alone cannot say which. Each stage opens a
+span named ``aion.<stage>`` carrying the task and context ids it works on.
+
+When the trace is not sampled, or no tracer provider is installed, a stage
+starts no span, or a non-recording one, and does no attribute work.
+"""
+
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Awaitable, Generator, Mapping
+from typing import Any, ContextManager, Optional, TypeVar
+
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+__all__ = ["stage_span", "traced_stream", "TASK_ID_ATTRIBUTE", "CONTEXT_ID_ATTRIBUTE"]
+
+TASK_ID_ATTRIBUTE = "a2a.task.id"
+CONTEXT_ID_ATTRIBUTE = "a2a.context.id"
+
+_tracer = trace.get_tracer("aion.server")
+
+T = TypeVar("T")
+
+
+def _in_unsampled_trace() -> bool:
+    """Whether the current trace was already decided against sampling.
+
+    The parent-based sampler ``init_tracing`` installs would drop any child of
+    such a trace, so the span is not even started: creating one costs more
+    than everything a stage does with it.
+    """
+    span_context = trace.get_current_span().get_span_context()
+    return span_context.is_valid and not span_context.trace_flags.sampled
+
+
+def _set_attributes(
+        span: Span,
+        task_id: Optional[str],
+        context_id: Optional[str],
+        attributes: Optional[Mapping[str, Any]],
+) -> None:
+    if task_id:
+        span.set_attribute(TASK_ID_ATTRIBUTE, task_id)
+    if context_id:
+        span.set_attribute(CONTEXT_ID_ATTRIBUTE, context_id)
+    for key, value in (attributes or {}).items():
+        if value is not None:
+            span.set_attribute(key, value)
+
+
+def stage_span(
+        name: str,
+        *,
+        task_id: Optional[str] = None,
+        context_id: Optional[str] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Mapping[str, Any]] = None,
+) -> ContextManager[Span]:
+    """Run the enclosed block in a child span of the current one.
+
+    An exception escaping the block is recorded on the span, which is marked
+    as failed, and propagates unchanged.
+
+    Args:
+        name: Span name, ``aion.<stage>``.
+        task_id: Task the stage works on, if known.
+        context_id: Context the task belongs to, if known.
+        kind: Span kind; ``CLIENT`` for a call to another service.
+        attributes: Further span attributes; None values are skipped.
+
+    Returns:
+        A context manager yielding the span, for attributes only known once
+        the stage ran.
+    """
+    return _StageSpan(name, kind, task_id, context_id, attributes)
+
+
+class _StageSpan:
+    """Context manager behind :func:`stage_span`.
+
+    A class rather than a generator-based context manager: stages run per
+    event, and with tracing off the context manager is all they cost.
+    """
+
+    __slots__ = ("_name", "_kind", "_task_id", "_context_id", "_attributes", "_scope")
+
+    def __init__(self, name, kind, task_id, context_id, attributes):
+        self._name = name
+        self._kind = kind
+        self._task_id = task_id
+        self._context_id = context_id
+        self._attributes = attributes
+        self._scope: Optional[ContextManager[Span]] = None
+
+    def __enter__(self) -> Span:
+        if _in_unsampled_trace():
+            return trace.INVALID_SPAN
+
+        span = _tracer.start_span(self._name, kind=self._kind)
+        if not span.is_recording():
+            # Nothing to record, and the current span already carries the trace
+            # context its children need, so the span is not made current.
+            return span
+
+        _set_attributes(span, self._task_id, self._context_id, self._attributes)
+        self._scope = trace.use_span(span, end_on_exit=True, record_exception=True, set_status_on_exception=True)
+        return self._scope.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        if self._scope is None:
+            return None
+        scope, self._scope = self._scope, None
+        return scope.__exit__(exc_type, exc_value, traceback)
+
+
+def traced_stream(
+        name: str,
+        stream: AsyncIterator[T],
+        *,
+        task_id: Optional[str] = None,
+        context_id: Optional[str] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+) -> AsyncIterator[T]:
+    """Time an event stream in one span, from this call until it is exhausted or closed.
+
+    The stream runs in a copy of the caller's context in which the span is
+    current, so work the stream does - model calls, tool calls - nests under
+    it, while what the consumer does with each item does not. Context
+    variables the stream sets stay in its own context. The span records how many items
+    the stream produced and when the first arrived.
+
+    Args:
+        name: Span name, ``aion.<stage>``.
+        stream: The stream to time.
+        task_id: Task the stream produces events for, if known.
+        context_id: Context the task belongs to, if known.
+        attributes: Further span attributes; None values are skipped.
+
+    Returns:
+        The stream itself when the trace is not sampled, otherwise a stream
+        yielding the same items.
+    """
+    if _in_unsampled_trace():
+        return stream
+    span = _tracer.start_span(name)
+    if not span.is_recording():
+        return stream
+    _set_attributes(span, task_id, context_id, attributes)
+    return _timed_stream(span, stream)
+
+
+class _InContext:
+    """Await ``awaitable`` with ``context`` current, in the awaiting task.
+
+    What ``asyncio.create_task(..., context=...)`` would do, without moving the
+    work to another task: libraries driven by the stream (anyio cancel scopes,
+    for one) must be entered and exited in the same task.
+    """
+
+    __slots__ = ("_context", "_awaitable")
+
+    def __init__(self, context: contextvars.Context, awaitable: Awaitable[T]):
+        self._context = context
+        self._awaitable = awaitable
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        context = self._context
+        step = self._awaitable.__await__()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                if error is None:
+                    yielded = context.run(step.send, value)
+                else:
+                    yielded = context.run(step.throw, error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                context.run(step.close)
+                raise
+            except BaseException as exc:
+                value, error = None, exc
+
+
+async def _timed_stream(span: Span, stream: AsyncIterator[T]) -> AsyncIterator[T]:
+    # The stream runs in a context of its own with the span attached once.
+    # Attaching it around every item instead would undo, at each detach, any
+    # span the stream itself keeps current across its yields (a framework's
+    # span around a whole invocation), and nest its later work under this one.
+    stream_context = contextvars.copy_context()
+    stream_context.run(otel_context.attach, trace.set_span_in_context(span))
+    iterator = aiter(stream)
+    items = 0
+    try:
+        while True:
+            try:
+                item = await _InContext(stream_context, anext(iterator))
+            except StopAsyncIteration:
+                break
+            if not items:
+                span.add_event("first_item")
+            items += 1
+            yield item
+    except BaseException as error:
+        # Closing or cancelling the stream ends it early, but it did not fail.
+        if not isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, f"{type(error).__name__}: {error}"))
+        raise
+    finally:
+        span.set_attribute("aion.stream.items", items)
+        span.end()
+        # Closing this stream early closes the one it wraps too, not leaving it to the GC.
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await _InContext(stream_context, aclose())
@@ -6,24 +6,64 @@ from typing import Optional, Union
 
 from opentelemetry import trace
 from opentelemetry.context import Context
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider, ReadableSpan
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace import SpanContext, TraceFlags, NonRecordingSpan, INVALID_SPAN_ID
 
+from aion.server.settings import AppSettings, app_settings
+from aion.server.utils.deployment import get_service_name
 
-def init_tracing():
+
+def init_tracing(settings: Optional[AppSettings] = None) -> TracerProvider:
     """
     Initialize global tracing provider.
 
-    Sets up the base tracer provider for the application.
+    Sets up the tracer provider for the application: traces started here are
+    sampled at ``TRACE_SAMPLE_RATIO``, traces continued from a caller follow
+    the caller's sampled flag, and sampled spans are exported in batches to
+    ``TRACE_EXPORT_ENDPOINT`` when it is set. Spans of unsampled traces are
+    not recorded at all, but still carry the trace context into logs.
     Call once at application startup. For multiprocessing, call in each process.
+
+    Args:
+        settings: Settings to configure tracing from. Defaults to app settings.
+
+    Returns:
+        The installed provider. Shut it down on exit, so queued spans are flushed.
     """
-    provider = TracerProvider()
+    settings = settings or app_settings
+    provider = TracerProvider(
+        sampler=ParentBased(TraceIdRatioBased(settings.trace_sample_ratio)),
+        resource=Resource.create({SERVICE_NAME: get_service_name()}),
+    )
+    if settings.trace_export_endpoint:
+        provider.add_span_processor(BatchSpanProcessor(
+            _build_span_exporter(settings),
+            max_queue_size=settings.trace_export_max_queue_size,
+            max_export_batch_size=settings.trace_export_max_batch_size,
+            schedule_delay_millis=settings.trace_export_schedule_delay_seconds * 1000,
+            export_timeout_millis=settings.trace_export_timeout_seconds * 1000,
+        ))
     trace.set_tracer_provider(provider)
+    return provider
+
+
+def _build_span_exporter(settings: AppSettings) -> SpanExporter:
+    """Create the OTLP/HTTP exporter; the package is an optional dependency."""
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(
+        endpoint=settings.trace_export_endpoint,
+        timeout=settings.trace_export_timeout_seconds,
+    )
 
 
 def generate_request_span_context(
         trace_id: Optional[Union[int, str]] = None,
-        span_id: Optional[Union[int, str]] = None
+        span_id: Optional[Union[int, str]] = None,
+        trace_flags: Optional[Union[int, str]] = None,
 ) -> Optional[Context]:
     """
     Generate a remote span context for continuing an existing trace.
@@ -32,6 +72,9 @@ def generate_request_span_context(
         trace_id: The trace ID as 128-bit (16 byte) integer or hex string to continue
         span_id: Optional parent span ID as 64-bit (8 byte) integer or hex string.
                  If None, INVALID_SPAN_ID will be used.
+        trace_flags: Optional W3C trace flags of the caller as integer or hex
+                 string; the sampler follows their sampled bit. If None or
+                 invalid, the trace is continued as sampled.
 
     Returns:
         Context object that can be passed to start_as_current_span
@@ -67,11 +110,25 @@ def generate_request_span_context(
                 )
                 span_id = INVALID_SPAN_ID
 
+        # Convert trace_flags from hex string to int if needed
+        if trace_flags is None:
+            trace_flags = TraceFlags.SAMPLED
+
+        elif isinstance(trace_flags, str):
+            try:
+                trace_flags = int(trace_flags, 16)
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    f"Failed to convert trace_flags '{trace_flags}' from hex to int: {e}. "
+                    f"Continuing the trace as sampled."
+                )
+                trace_flags = TraceFlags.SAMPLED
+
         span_context = SpanContext(
             trace_id=trace_id,
             span_id=span_id,
             is_remote=True,
-            trace_flags=TraceFlags(0x01)  # Sampled
+            trace_flags=TraceFlags(trace_flags)
         )
 
         parent = NonRecordingSpan(span_context)
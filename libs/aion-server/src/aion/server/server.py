@@ -13,6 +13,7 @@ from aion.server.core.app import AppFactory
 from aion.server.logging import setup_root_logger
 from aion.server.plugins import PluginFactory
 from aion.server.tasks import store_manager
+from aion.server.utils.serving import uvicorn_config_options
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,8 @@ async def async_serve(
             host=aion_agent.host if sockets is None else None,
             port=aion_agent.port if sockets is None else None,
             log_config=None,
-            access_log=False
+            access_log=False,
+            **uvicorn_config_options()
         )
         # If we have sockets, we need to manually set them on the server
         server = uvicorn.Server(config=uconfig)
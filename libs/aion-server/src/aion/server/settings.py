@@ -2,7 +2,7 @@
 
 from typing import Literal, Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from aion.core.settings import BaseEnvSettings
 
@@ -12,17 +12,144 @@ __all__ = ["AppSettings", "app_settings"]
 class AppSettings(BaseEnvSettings):
     """Application configuration settings."""
 
-    file_storage_backend: Optional[Literal["stub"]] = Field(
+    file_storage_backend: Optional[Literal["stub", "filesystem", "s3"]] = Field(
         default=None,
         alias="FILE_STORAGE_BACKEND",
         description=(
             "File storage backend for converting inline (base64) file parts to URLs. "
             "When set, outgoing A2A events with binary content are uploaded to storage "
             "and replaced with URL references, minimizing content stored in tables. "
-            "Options: 'stub' (development only). Default: None (disabled, base64 passthrough)."
+            "Options: 'stub' (development only), 'filesystem' (files stored under "
+            "FILE_STORAGE_PATH and served by the agent), 's3' (an S3-compatible "
+            "bucket; requires the 's3' extra). Default: None (disabled, base64 "
+            "passthrough)."
         )
     )
 
+    file_storage_path: str = Field(
+        default=".aion/files",
+        alias="FILE_STORAGE_PATH",
+        description=(
+            "Directory the 'filesystem' storage backend keeps files in. Identical "
+            "files are stored once. Relative paths are resolved against the "
+            "working directory."
+        )
+    )
+
+    file_storage_public_url: Optional[str] = Field(
+        default=None,
+        alias="FILE_STORAGE_PUBLIC_URL",
+        description=(
+            "Base URL clients reach the agent at, which URLs of files stored by the "
+            "'filesystem' backend are built on, e.g. 'https://host/agents/my-agent' "
+            "behind the proxy. Required by the 'filesystem' backend."
+        )
+    )
+
+    file_storage_max_file_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        ge=1,
+        alias="FILE_STORAGE_MAX_FILE_BYTES",
+        description=(
+            "Largest file the 'filesystem' backend stores, in bytes. A larger file "
+            "part is left inline. Default: 100 MiB."
+        )
+    )
+
+    file_storage_max_total_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        alias="FILE_STORAGE_MAX_TOTAL_BYTES",
+        description=(
+            "Most bytes the 'filesystem' backend stores in total, counting identical "
+            "files once. File parts that would exceed it are left inline. Default: "
+            "None (no limit)."
+        )
+    )
+
+    file_storage_upload_concurrency: int = Field(
+        default=8,
+        ge=1,
+        alias="FILE_STORAGE_UPLOAD_CONCURRENCY",
+        description=(
+            "Files uploaded to storage at once, by any backend. Further uploads "
+            "wait for a slot, and the requests carrying them wait with them."
+        )
+    )
+
+    file_storage_s3_bucket: Optional[str] = Field(
+        default=None,
+        alias="FILE_STORAGE_S3_BUCKET",
+        description="Bucket the 's3' backend stores files in. Required by that backend."
+    )
+
+    file_storage_s3_prefix: str = Field(
+        default="",
+        alias="FILE_STORAGE_S3_PREFIX",
+        description="Prefix of every object key the 's3' backend writes, e.g. 'agent-files/'."
+    )
+
+    file_storage_s3_endpoint_url: Optional[str] = Field(
+        default=None,
+        alias="FILE_STORAGE_S3_ENDPOINT_URL",
+        description=(
+            "Endpoint of an S3-compatible service such as MinIO, e.g. "
+            "'http://minio:9000'. Default: None (AWS S3)."
+        )
+    )
+
+    file_storage_s3_region: Optional[str] = Field(
+        default=None,
+        alias="FILE_STORAGE_S3_REGION",
+        description="Region of the bucket. Default: the AWS SDK's (AWS_REGION and shared config)."
+    )
+
+    file_storage_s3_public_url: Optional[str] = Field(
+        default=None,
+        alias="FILE_STORAGE_S3_PUBLIC_URL",
+        description=(
+            "Base URL the bucket's objects are publicly served at, e.g. through a "
+            "CDN. When set, file URLs are built on it and never expire; otherwise "
+            "they are pre-signed."
+        )
+    )
+
+    file_storage_s3_url_expires_seconds: int = Field(
+        default=7 * 24 * 3600,
+        ge=1,
+        le=7 * 24 * 3600,
+        alias="FILE_STORAGE_S3_URL_EXPIRES_SECONDS",
+        description=(
+            "Lifetime of a pre-signed file URL. The URL is stored in task history, "
+            "so a file is unreachable from there once it expires. Default and "
+            "maximum: 7 days."
+        )
+    )
+
+    file_storage_s3_multipart_threshold_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=1,
+        alias="FILE_STORAGE_S3_MULTIPART_THRESHOLD_BYTES",
+        description=(
+            "Smallest file the 's3' backend uploads in parts rather than with one "
+            "request. Never below FILE_STORAGE_S3_PART_SIZE_BYTES. Default: 8 MiB."
+        )
+    )
+
+    file_storage_s3_part_size_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        alias="FILE_STORAGE_S3_PART_SIZE_BYTES",
+        description="Size of each part of a multipart upload. S3's minimum is 5 MiB. Default: 8 MiB."
+    )
+
+    file_storage_s3_part_concurrency: int = Field(
+        default=4,
+        ge=1,
+        alias="FILE_STORAGE_S3_PART_CONCURRENCY",
+        description="Parts of one file the 's3' backend uploads at once."
+    )
+
     push_notification_timeout_seconds: float = Field(
         default=30.0,
         alias="PUSH_NOTIFICATION_TIMEOUT_SECONDS",
@@ -37,6 +164,245 @@ class AppSettings(BaseEnvSettings):
         )
     )
 
+    shutdown_settlement_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        alias="SHUTDOWN_SETTLEMENT_TIMEOUT_SECONDS",
+        description=(
+            "Seconds a graceful shutdown may spend draining in-flight tasks and "
+            "settling the ones it interrupted, counted from the start of the "
+            "drain. Keep it well inside the container's termination grace period: "
+            "tasks not settled by then are left for the next process to settle."
+        )
+    )
+
+    shutdown_settlement_concurrency: int = Field(
+        default=16,
+        ge=1,
+        alias="SHUTDOWN_SETTLEMENT_CONCURRENCY",
+        description="Interrupted tasks settled concurrently on shutdown, each a read and a write to the task store."
+    )
+
+    task_lease_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="TASK_LEASE_TTL_SECONDS",
+        description=(
+            "Seconds after its last heartbeat that a process's lease on a running "
+            "task expires, and the task is settled as failed by whichever replica "
+            "sweeps next. Bounds how long a task killed with its process stays "
+            "active. A process stalled for longer than this loses its tasks, so "
+            "keep it several heartbeats long."
+        )
+    )
+
+    task_lease_heartbeat_seconds: float = Field(
+        default=15.0,
+        gt=0,
+        alias="TASK_LEASE_HEARTBEAT_SECONDS",
+        description=(
+            "Seconds between renewals of the leases a process holds on the tasks "
+            "it runs. One write per process per interval, however many tasks. "
+            "Must be shorter than TASK_LEASE_TTL_SECONDS."
+        )
+    )
+
+    orphaned_task_sweep_interval_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        alias="ORPHANED_TASK_SWEEP_INTERVAL_SECONDS",
+        description=(
+            "Seconds between sweeps for tasks whose lease expired. Each sweep is "
+            "one indexed query while nothing has expired. 0 disables the sweep."
+        )
+    )
+
+    server_loop: Literal["asyncio", "uvloop", "auto"] = Field(
+        default="asyncio",
+        alias="SERVER_LOOP",
+        description=(
+            "Event loop the agent and proxy processes run on. 'uvloop' requires "
+            "the uvloop package; 'auto' uses it when installed and falls back to "
+            "the stock asyncio loop otherwise. Default: 'asyncio'."
+        )
+    )
+
+    server_http: Literal["h11", "httptools", "auto"] = Field(
+        default="auto",
+        alias="SERVER_HTTP",
+        description=(
+            "HTTP/1.1 parser uvicorn uses. 'httptools' requires the httptools "
+            "package; 'auto' uses it when installed and falls back to h11."
+        )
+    )
+
+    server_backlog: int = Field(
+        default=2048,
+        ge=1,
+        alias="SERVER_BACKLOG",
+        description="Maximum number of pending connections on the listening socket."
+    )
+
+    server_keep_alive_timeout: int = Field(
+        default=5,
+        ge=0,
+        alias="SERVER_KEEP_ALIVE_TIMEOUT",
+        description=(
+            "Seconds an idle keep-alive connection is held open. Keep it above "
+            "the idle timeout of any load balancer in front of the server, or "
+            "the balancer reuses connections the server already closed."
+        )
+    )
+
+    server_limit_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        alias="SERVER_LIMIT_CONCURRENCY",
+        description=(
+            "Maximum concurrent connections and tasks before new requests are "
+            "answered 503. Default: unlimited."
+        )
+    )
+
+    server_h11_max_incomplete_event_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        alias="SERVER_H11_MAX_INCOMPLETE_EVENT_SIZE",
+        description=(
+            "Largest request head, in bytes, the h11 parser buffers before "
+            "rejecting the request. Default: uvicorn's (16 KiB)."
+        )
+    )
+
+    agent_module_preload: bool = Field(
+        default=False,
+        alias="AGENT_MODULE_PRELOAD",
+        description=(
+            "Import the agent module in a worker thread as soon as the agent "
+            "process starts, overlapping the import with database and plugin "
+            "setup. Only enable it for an agent module whose import neither "
+            "uses the event loop nor depends on plugin or database state; "
+            "otherwise the module is imported after plugin setup."
+        )
+    )
+
+    trace_export_endpoint: Optional[str] = Field(
+        default=None,
+        alias="TRACE_EXPORT_ENDPOINT",
+        description=(
+            "OTLP/HTTP traces endpoint sampled spans are exported to, e.g. "
+            "'http://collector:4318/v1/traces'. Requires the 'otlp' extra of "
+            "aion-server. Default: None (spans are not exported)."
+        )
+    )
+
+    trace_sample_ratio: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        alias="TRACE_SAMPLE_RATIO",
+        description=(
+            "Fraction of traces started here that are sampled. A request that "
+            "carries a traceparent follows the sampled flag of its caller instead."
+        )
+    )
+
+    trace_export_max_queue_size: int = Field(
+        default=2048,
+        ge=1,
+        alias="TRACE_EXPORT_MAX_QUEUE_SIZE",
+        description=(
+            "Finished spans held for export. Spans ending while the queue is "
+            "full are dropped rather than slowing the request down."
+        )
+    )
+
+    trace_export_max_batch_size: int = Field(
+        default=512,
+        ge=1,
+        alias="TRACE_EXPORT_MAX_BATCH_SIZE",
+        description="Spans sent in one export request. At most TRACE_EXPORT_MAX_QUEUE_SIZE."
+    )
+
+    trace_export_schedule_delay_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="TRACE_EXPORT_SCHEDULE_DELAY_SECONDS",
+        description="Longest a finished span waits before its batch is exported."
+    )
+
+    trace_export_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        alias="TRACE_EXPORT_TIMEOUT_SECONDS",
+        description="Timeout of one export request, in seconds."
+    )
+
+    metrics_enabled: bool = Field(
+        default=True,
+        alias="METRICS_ENABLED",
+        description=(
+            "Serve Prometheus metrics at /metrics on every agent server, and "
+            "aggregated across agents on the proxy."
+        )
+    )
+
+    proxy_max_connections_per_agent: int = Field(
+        default=100,
+        ge=1,
+        alias="PROXY_MAX_CONNECTIONS_PER_AGENT",
+        description=(
+            "Upper bound on concurrent upstream connections the proxy opens to "
+            "one agent. Each agent has a pool of its own, so an agent holding "
+            "many long SSE streams exhausts only its own pool instead of "
+            "stalling traffic to every other agent."
+        )
+    )
+
+    proxy_max_keepalive_connections_per_agent: int = Field(
+        default=20,
+        ge=0,
+        alias="PROXY_MAX_KEEPALIVE_CONNECTIONS_PER_AGENT",
+        description="Idle upstream connections the proxy keeps open per agent for reuse."
+    )
+
+    proxy_keepalive_expiry_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="PROXY_KEEPALIVE_EXPIRY_SECONDS",
+        description="Seconds an idle upstream connection is kept before it is closed."
+    )
+
+    proxy_circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        alias="PROXY_CIRCUIT_FAILURE_THRESHOLD",
+        description=(
+            "Consecutive connect failures or timeouts after which the proxy stops "
+            "forwarding to an agent and answers 503 immediately."
+        )
+    )
+
+    proxy_circuit_reset_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        alias="PROXY_CIRCUIT_RESET_TIMEOUT_SECONDS",
+        description=(
+            "Seconds an open circuit stays open before one trial request is let "
+            "through; its success closes the circuit, its failure reopens it."
+        )
+    )
+
+    proxy_metrics_scrape_timeout_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        alias="PROXY_METRICS_SCRAPE_TIMEOUT_SECONDS",
+        description=(
+            "Seconds the proxy's /metrics waits for each agent's metrics. An "
+            "agent that does not answer in time is reported as down in that scrape."
+        )
+    )
+
     encryption_key: Optional[str] = Field(
         default=None,
         alias="ENCRYPTION_KEY",
@@ -133,6 +499,64 @@ class AppSettings(BaseEnvSettings):
 
         return value
 
+    @model_validator(mode="after")
+    def validate_task_lease_timing(self) -> "AppSettings":
+        """Rejects a heartbeat that would let a live process's leases expire.
+
+        Raises:
+            ValueError: If the heartbeat interval is not shorter than the TTL.
+        """
+        if self.task_lease_heartbeat_seconds >= self.task_lease_ttl_seconds:
+            raise ValueError(
+                "TASK_LEASE_HEARTBEAT_SECONDS must be shorter than TASK_LEASE_TTL_SECONDS, "
+                f"got {self.task_lease_heartbeat_seconds} and {self.task_lease_ttl_seconds}"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_s3_file_storage(self) -> "AppSettings":
+        """Rejects the 's3' file storage backend without a bucket or its client library.
+
+        Raises:
+            ValueError: If FILE_STORAGE_BACKEND is 's3' and no bucket is set,
+                or aiobotocore is not installed.
+        """
+        if self.file_storage_backend != "s3":
+            return self
+        if not self.file_storage_s3_bucket:
+            raise ValueError("FILE_STORAGE_BACKEND is 's3' but FILE_STORAGE_S3_BUCKET is not set")
+        try:
+            import aiobotocore  # noqa: F401
+        except ImportError as error:
+            raise ValueError(
+                "FILE_STORAGE_BACKEND is 's3' but aiobotocore is not installed. "
+                "Install aion-server with its 's3' extra."
+            ) from error
+        return self
+
+    @model_validator(mode="after")
+    def validate_trace_export(self) -> "AppSettings":
+        """Rejects a batch larger than the export queue, or an exporter that is not installed.
+
+        Raises:
+            ValueError: If the batch size exceeds the queue size, or if an
+                export endpoint is set without the OTLP exporter installed.
+        """
+        if self.trace_export_max_batch_size > self.trace_export_max_queue_size:
+            raise ValueError(
+                "TRACE_EXPORT_MAX_BATCH_SIZE must not exceed TRACE_EXPORT_MAX_QUEUE_SIZE, "
+                f"got {self.trace_export_max_batch_size} and {self.trace_export_max_queue_size}"
+            )
+        if self.trace_export_endpoint:
+            try:
+                import opentelemetry.exporter.otlp.proto.http.trace_exporter  # noqa: F401
+            except ImportError as error:
+                raise ValueError(
+                    "TRACE_EXPORT_ENDPOINT is set but the OTLP exporter is not "
+                    "installed. Install aion-server with its 'otlp' extra."
+                ) from error
+        return self
+
     @property
     def is_logstash_configured(self) -> bool:
         """Return True when both LOGSTASH_HOST and LOGSTASH_PORT are set."""
@@ -1,14 +1,17 @@
-from .stores import BaseTaskStore, PostgresTaskStore, InMemoryTaskStore
+from .stores import BaseTaskStore, ContextHead, ContextMessage, PostgresTaskStore, InMemoryTaskStore
 from .store_manager import store_manager, StoreManager
 from .task_manager import AionTaskManager
 from .push_notifications import PushNotificationFactory
 from .authenticated_push_sender import AuthenticatedPushNotificationSender
 from .terminal_push_sender import TerminalTaskPushSender
 from .deduplicator import A2ATaskDeduplicator
-from .settlement import settle_orphaned_tasks, settled_task
+from .settlement import SettlementReport, settle_orphaned_tasks, settled_task
+from .leases import OrphanedTaskSweeper, task_lease_owner
 
 __all__ = [
     "BaseTaskStore",
+    "ContextHead",
+    "ContextMessage",
     "InMemoryTaskStore",
     "PostgresTaskStore",
     # Manager
@@ -21,6 +24,9 @@ __all__ = [
     "TerminalTaskPushSender",
     "A2ATaskDeduplicator",
     # Settlement of tasks whose execution is gone
+    "SettlementReport",
     "settled_task",
     "settle_orphaned_tasks",
+    "OrphanedTaskSweeper",
+    "task_lease_owner",
 ]
@@ -3,19 +3,28 @@
 import asyncio
 import httpx
 import logging
+import time
 from a2a.server.tasks.base_push_notification_sender import BasePushNotificationSender
 from a2a.server.tasks.push_notification_sender import PushNotificationEvent
 from a2a.types import Task
 from a2a.types.a2a_pb2 import TaskPushNotificationConfig
 from a2a.utils.proto_utils import to_stream_response
 from aion.server.a2a.utils import NO_TEXT, describe_event, extract_event_preview
+from aion.server.metrics.instruments import PUSH_DELIVERIES, PUSH_DELIVERY_SECONDS
+from aion.server.opentelemetry.stages import stage_span
 from google.protobuf.json_format import MessageToDict
+from opentelemetry.trace import SpanKind
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_AUTH_SCHEME = 'Bearer'
 RESPONSE_SUMMARY_LIMIT = 200
 
+_DELIVERED = PUSH_DELIVERIES.labels('delivered')
+_REJECTED = PUSH_DELIVERIES.labels('rejected')
+_TIMED_OUT = PUSH_DELIVERIES.labels('timeout')
+_FAILED = PUSH_DELIVERIES.labels('error')
+
 # The event vocabulary is shared with the streaming path — see describe_event.
 # A rejection is also ranked by it: a refused intermediate status is cosmetic,
 # since the next update supersedes it, while a refused terminal Task leaves the
@@ -141,7 +150,8 @@ class AuthenticatedPushNotificationSender(BasePushNotificationSender):
             task_id: Identifier of the task the event belongs to.
             event: The event to deliver.
         """
-        push_configs = await self._config_store.get_info_for_dispatch(task_id)
+        with stage_span("aion.push.get_configs", task_id=task_id):
+            push_configs = await self._config_store.get_info_for_dispatch(task_id)
         if not push_configs:
             return
 
@@ -187,13 +197,22 @@ class AuthenticatedPushNotificationSender(BasePushNotificationSender):
             one unreachable webhook must not abort the fan-out to the others.
         """
         url = push_info.url
+        started_at = time.perf_counter()
         try:
-            response = await self._client.post(
-                url,
-                json=MessageToDict(to_stream_response(event)),
-                headers=self._build_headers(push_info) or None,
-            )
-            response.raise_for_status()
+            with stage_span(
+                    "aion.push.deliver",
+                    task_id=task_id,
+                    kind=SpanKind.CLIENT,
+                    attributes={"http.request.method": "POST", "url.full": url},
+            ) as span:
+                response = await self._client.post(
+                    url,
+                    json=MessageToDict(to_stream_response(event)),
+                    headers=self._build_headers(push_info) or None,
+                )
+                if span.is_recording():
+                    span.set_attribute("http.response.status_code", response.status_code)
+                response.raise_for_status()
             logger.info(
                 'Push-notification sent to URL: %s — %s (HTTP %s%s)',
                 url,
@@ -215,6 +234,7 @@ class AuthenticatedPushNotificationSender(BasePushNotificationSender):
                 error.response.status_code,
                 _summarize(error.response),
             )
+            _REJECTED.inc()
             return False
         except httpx.TimeoutException as error:
             # The request went out but the receiver did not answer in time.
@@ -229,6 +249,7 @@ class AuthenticatedPushNotificationSender(BasePushNotificationSender):
                 describe_event(event),
                 type(error).__name__,
             )
+            _TIMED_OUT.inc()
             return False
         except Exception:
             logger.exception(
@@ -236,7 +257,11 @@ class AuthenticatedPushNotificationSender(BasePushNotificationSender):
                 url,
                 describe_event(event),
             )
+            _FAILED.inc()
             return False
+        finally:
+            PUSH_DELIVERY_SECONDS.observe(time.perf_counter() - started_at)
+        _DELIVERED.inc()
         return True
 
     @staticmethod
@@ -0,0 +1,115 @@
+"""Owner leases on executing tasks, and the sweep that settles expired ones.
+
+Every replica of an agent shares one durable task store, so a task found
+active there may be running in a sibling process right now or may have died
+with a killed one; its state alone cannot tell. While a process executes a
+task it holds the task's lease and renews its heartbeat (see
+``AionActiveTaskRegistry``). A lease that has not been renewed for longer than
+its TTL belongs to a process that is gone, and only such tasks are settled.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+from aion.server.settings import app_settings
+from .settlement import SettlementReport, settle_orphaned_tasks
+from .stores import BaseTaskStore
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["OrphanedTaskSweeper", "task_lease_owner"]
+
+
+@lru_cache(maxsize=1)
+def task_lease_owner() -> str:
+    """Identity this process holds task leases under: ``host:pid:nonce``.
+
+    The nonce keeps a restarted process that reuses a pid, as the first process
+    of every container does, from mistaking its predecessor's leases for its own.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class OrphanedTaskSweeper:
+    """Periodically settles tasks whose lease expired.
+
+    The first sweep runs as soon as the sweeper starts, then one every
+    ``interval`` seconds. Claims are taken under an owner of their own, never
+    renewed, so a task whose settlement the store refuses is retried once its
+    claim expires in turn. Totals across sweeps are kept in :attr:`totals`.
+    """
+
+    def __init__(
+            self,
+            store: BaseTaskStore,
+            *,
+            lease_ttl: Optional[float] = None,
+            interval: Optional[float] = None,
+            owner: Optional[str] = None,
+    ):
+        """Create a sweeper.
+
+        Args:
+            store: Task store to sweep. Must support task leases.
+            lease_ttl: Seconds after its last heartbeat that a lease expires.
+                Defaults to ``TASK_LEASE_TTL_SECONDS``.
+            interval: Seconds between sweeps. Defaults to
+                ``ORPHANED_TASK_SWEEP_INTERVAL_SECONDS``.
+            owner: Lease owner claims are taken under. Defaults to this
+                process's lease owner with a ``:sweep`` suffix.
+
+        Raises:
+            ValueError: If the store does not support task leases.
+        """
+        if not store.supports_task_leases:
+            raise ValueError(f"{type(store).__name__} does not support task leases")
+        self._store = store
+        self.lease_ttl = lease_ttl if lease_ttl is not None else app_settings.task_lease_ttl_seconds
+        self.interval = interval if interval is not None else app_settings.orphaned_task_sweep_interval_seconds
+        self.owner = owner or f"{task_lease_owner()}:sweep"
+        self._task: Optional[asyncio.Task] = None
+        self.totals = SettlementReport()
+
+    def start(self) -> None:
+        """Start the background job; a no-op when it is already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background job."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def sweep(self) -> SettlementReport:
+        """Settle every task whose lease has expired, and return what became of them."""
+        report = await settle_orphaned_tasks(self._store, self.owner, self.lease_ttl)
+        if report.total:
+            log = logger.warning if report.failed else logger.info
+            log(
+                "Orphaned task sweep: %d settled, %d unchanged, %d failed",
+                report.settled, report.unchanged, report.failed,
+            )
+        self.totals = SettlementReport(
+            settled=self.totals.settled + report.settled,
+            unchanged=self.totals.unchanged + report.unchanged,
+            failed=self.totals.failed + report.failed,
+        )
+        return report
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Orphaned task sweep failed")
+            await asyncio.sleep(self.interval)
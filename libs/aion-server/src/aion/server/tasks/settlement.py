@@ -24,6 +24,7 @@ client can tell a state the server had to supply from one the agent declared.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 from a2a.types import Task, TaskState
@@ -36,7 +37,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["settled_task", "settle_orphaned_tasks"]
+ORPHAN_CLAIM_BATCH_SIZE = 100
+
+__all__ = ["SettlementReport", "settled_task", "settle_orphaned_tasks"]
+
+
+@dataclass(frozen=True)
+class SettlementReport:
+    """Outcome of settling a set of tasks.
+
+    Attributes:
+        settled: Tasks written as settled.
+        unchanged: Tasks that already held a state of their own, or that a
+            live process took over before they were settled.
+        failed: Tasks whose read or write the store refused.
+        unsettled: Tasks not reached before the deadline.
+    """
+
+    settled: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    unsettled: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of tasks the settlement was asked to handle."""
+        return self.settled + self.unchanged + self.failed + self.unsettled
 
 
 def settled_task(task: Task, reason: TaskSettlementReason) -> Optional[Task]:
@@ -65,44 +91,83 @@ def settled_task(task: Task, reason: TaskSettlementReason) -> Optional[Task]:
     return settled
 
 
-async def settle_orphaned_tasks(store: BaseTaskStore) -> None:
-    """Close out tasks a killed predecessor left running in the store.
+async def settle_orphaned_tasks(
+    store: BaseTaskStore,
+    owner: str,
+    lease_ttl: float,
+    batch_size: int = ORPHAN_CLAIM_BATCH_SIZE,
+) -> SettlementReport:
+    """Close out tasks whose executing process died without settling them.
 
     A graceful stop settles its own tasks as it drains them. This covers what
     no shutdown could: a process killed outright — SIGKILL, OOM, a lost
     machine — leaves its tasks active in the store with the execution already
-    gone. A durable store carries them into the next process, which is the only
-    thing left that can end them.
+    gone, and nothing but another process can end them.
 
-    Every task the store presents as running is one of those. This process has
-    just started and executes nothing yet, and a store whose contents die with
-    the process hands back nothing here at all.
+    A task still active in the store is not by itself one of those: the store
+    is shared by every replica, and a sibling may be running it right now.
+    What tells them apart is the lease the executing process renews while it
+    runs (see ``AionActiveTaskRegistry``). Only tasks whose lease outlived its
+    TTL are claimed, and the claim is atomic, so two replicas sweeping at once
+    never settle the same task.
 
     Each task is settled on its own, because one write the store refuses says
-    nothing about the rest, and a task left active is exactly the state this
-    exists to remove.
+    nothing about the rest. The lease of a task settled, or found settled
+    already, is released; the lease of a refused one is left to expire again,
+    so a later sweep retries it.
+
+    A live replica may resume a claimed task before it is settled, taking its
+    lease over. The settled copy is therefore only written while the claim
+    still holds the lease, so the resumed run is never overwritten with
+    ``FAILED``; such a task is left to its new owner.
 
     Args:
-        store: The task store to reap. Must outlive nothing else — this runs
-            before the process serves any request.
+        store: The task store to sweep. Must support task leases.
+        owner: Lease owner the claims are taken under. Must not be renewed by
+            anything, or a refused task's lease would never expire again.
+        lease_ttl: Seconds after its last heartbeat that a lease expires.
+        batch_size: Leases claimed per round trip.
+
+    Returns:
+        What became of the claimed tasks.
     """
-    tasks = await store.get_active_tasks()
-    if not tasks:
-        return
-
-    logger.info("Settling %d task(s) left running by a previous process", len(tasks))
-
-    for task in tasks:
-        settled = settled_task(task, TaskSettlementReason.SERVER_RESTART)
-        if settled is None:
-            continue
-
-        try:
-            await store.save(settled)
-        except Exception as exc:
-            logger.error(
-                "Failed to settle task %s left in %s by a previous process",
-                task.id,
-                TaskState.Name(task.status.state),
-                exc_info=exc,
-            )
+    settled_count = unchanged = failed = 0
+    while True:
+        tasks = await store.claim_orphaned_tasks(owner, lease_ttl, batch_size)
+        if not tasks:
+            break
+
+        logger.info("Settling %d task(s) left running by a process that died", len(tasks))
+        resolved = []
+        for task in tasks:
+            settled = settled_task(task, TaskSettlementReason.SERVER_RESTART)
+            if settled is None:
+                unchanged += 1
+                resolved.append(task.id)
+                continue
+
+            try:
+                saved = await store.save_if_leased(settled, owner)
+            except Exception as exc:
+                failed += 1
+                logger.error(
+                    "Failed to settle task %s left in %s by a process that died",
+                    task.id,
+                    TaskState.Name(task.status.state),
+                    exc_info=exc,
+                )
+                continue
+
+            if not saved:
+                logger.info("Task %s was resumed by a live process before it could be settled", task.id)
+                unchanged += 1
+                continue
+
+            settled_count += 1
+            resolved.append(task.id)
+
+        await store.release_task_leases(owner, resolved)
+        if len(tasks) < batch_size:
+            break
+
+    return SettlementReport(settled=settled_count, unchanged=unchanged, failed=failed)
@@ -1,9 +1,11 @@
-from .base_task_store import BaseTaskStore
+from .base_task_store import BaseTaskStore, ContextHead, ContextMessage
 from .in_memory_task_store import InMemoryTaskStore
 from .postgres_task_store import PostgresTaskStore
 
 __all__ = [
     "BaseTaskStore",
+    "ContextHead",
+    "ContextMessage",
     "InMemoryTaskStore",
     "PostgresTaskStore",
 ]
@@ -1,11 +1,36 @@
 """Abstract base class for A2A task persistence backends."""
 
 from abc import abstractmethod
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, List
 
 from a2a.server.tasks import TaskStore
-from a2a.types.a2a_pb2 import Task
+from a2a.types.a2a_pb2 import Artifact, Message, Task, TaskState
 
+from aion.core.a2a import ContextsPage
+from aion.server.a2a.constants import INTERRUPT_TASK_STATES
+
+
+@dataclass(frozen=True)
+class ContextHead:
+    """The most recent task of a context and its state, without the task itself."""
+
+    task_id: str
+    """ID of the most recently created task of the context."""
+    state: TaskState
+    """Current state of that task."""
+
+
+@dataclass(frozen=True)
+class ContextMessage:
+    """A conversation message of a context, with where it sits in the context."""
+
+    message: Message
+    """The message itself."""
+    task_id: str
+    """ID of the task whose history holds the message."""
+    cursor: str
+    """Opaque position of the message, usable as ``before``/``after`` of the store's iteration."""
 
 
 class BaseTaskStore(TaskStore):
@@ -16,6 +41,13 @@ class BaseTaskStore(TaskStore):
    associated with specific contexts, with optional pagination support.
    """
 
+    supports_task_leases: bool = False
+    """Whether the store keeps task leases, shared by every process using it.
+
+    A store whose contents die with the process has nothing to lease: a task it
+    holds in an active state belongs to an execution that is still running.
+    """
+
     @abstractmethod
     async def get_context_ids(
             self,
@@ -30,10 +62,36 @@ class BaseTaskStore(TaskStore):
            limit: Maximum number of records to return
 
        Returns:
-           List of context ID strings
+           List of context ID strings, newest first by each context's most
+           recently created task
        """
         pass
 
+    @abstractmethod
+    async def get_context_summaries(
+            self,
+            page_size: int,
+            cursor: Optional[str] = None
+    ) -> ContextsPage:
+        """
+        Retrieve a page of context summaries, most recently active first.
+
+        Summaries come from what the store maintains per context as tasks are
+        written, never from the tasks themselves. The cursor is opaque and
+        store-specific; a cursor stays valid while contexts keep changing.
+
+        Args:
+            page_size: Maximum number of summaries to return
+            cursor: The previous page's next_cursor, or None for the first page
+
+        Returns:
+            The page of summaries and the cursor of the next page, if any
+
+        Raises:
+            InvalidParamsError: If the cursor was not issued by this store
+        """
+        pass
+
     @abstractmethod
     async def get_context_tasks(
             self,
@@ -61,14 +119,112 @@ class BaseTaskStore(TaskStore):
 
         Deliberately owner-agnostic and unpaginated: this serves process-level
         maintenance, which asks about the store as a whole rather than on
-        behalf of a caller. Its one consumer today is the startup reap of tasks
-        an interrupted process left active.
+        behalf of a caller. It cannot tell orphaned tasks from tasks another
+        replica is running; :meth:`claim_orphaned_tasks` can.
 
         Returns:
             All tasks in an active state, in no particular order
         """
         pass
 
+    async def acquire_task_lease(self, task_id: str, owner: str) -> str:
+        """
+        Lease a task to the process about to execute it.
+
+        Takes the lease over from any previous holder: a task is only executed
+        by one process at a time, and the newest one is it.
+
+        Args:
+            task_id: The task about to be executed
+            owner: Identity of the executing process
+
+        Returns:
+            Token naming this acquisition; releasing with it spares a lease the
+            task was given again since
+
+        Raises:
+            NotImplementedError: If the store does not support task leases
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task leases")
+
+    async def renew_task_leases(self, owner: str) -> List[str]:
+        """
+        Refresh the heartbeat of every lease an owner holds.
+
+        Args:
+            owner: Identity of the renewing process
+
+        Returns:
+            IDs of the tasks still leased to the owner; a lease missing here
+            expired and was claimed by another process
+
+        Raises:
+            NotImplementedError: If the store does not support task leases
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task leases")
+
+    async def release_task_leases(
+            self,
+            owner: str,
+            task_ids: List[str],
+            tokens: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Release leases an owner holds; leases claimed by another process are kept.
+
+        Args:
+            owner: Identity of the releasing process
+            task_ids: Tasks whose leases are released
+            tokens: Tokens returned by :meth:`acquire_task_lease`, one per
+                task; a lease acquired again since then is kept. Omit to
+                release whatever lease the owner holds
+
+        Raises:
+            NotImplementedError: If the store does not support task leases
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task leases")
+
+    async def claim_orphaned_tasks(self, owner: str, lease_ttl: float, limit: int) -> List[Task]:
+        """
+        Claim tasks whose lease expired, and return them as stored.
+
+        The claim moves the lease to ``owner`` with a fresh heartbeat, so a task
+        is claimed by one process only. Leases of tasks the store no longer
+        holds are released rather than returned.
+
+        Args:
+            owner: Identity of the claiming process
+            lease_ttl: Seconds after its last heartbeat that a lease expires
+            limit: Maximum number of leases to claim
+
+        Returns:
+            The claimed tasks, in any state, in no particular order
+
+        Raises:
+            NotImplementedError: If the store does not support task leases
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task leases")
+
+    async def save_if_leased(self, task: Task, owner: str) -> bool:
+        """
+        Save a task only while an owner still holds its lease.
+
+        The check and the write are one step, so a process that takes the
+        lease over meanwhile, to execute the task again, never has its task
+        overwritten by the previous holder's last word.
+
+        Args:
+            task: The task to save
+            owner: Identity of the process expected to hold the lease
+
+        Returns:
+            Whether the task was saved; ``False`` when the lease changed hands
+
+        Raises:
+            NotImplementedError: If the store does not support task leases
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task leases")
+
     @abstractmethod
     async def get_context_last_task(self, context_id: str) -> Optional[Task]:
         """
@@ -81,3 +237,85 @@ class BaseTaskStore(TaskStore):
             The most recent Task object for the context, or None if no tasks exist
         """
         pass
+
+    @abstractmethod
+    async def get_context_head(self, context_id: str) -> Optional[ContextHead]:
+        """
+        Retrieve the id and state of the most recent task of a context.
+
+        Stores maintain this as tasks are saved and deleted, so answering it
+        costs one lookup and never loads a task's history or artifacts.
+
+        Args:
+            context_id: The context identifier to get the head for
+
+        Returns:
+            The context's head, or None if no tasks exist
+        """
+        pass
+
+    async def get_context_interrupted_task(self, context_id: str) -> Optional[Task]:
+        """
+        Retrieve the most recent task of a context if it is waiting to be resumed.
+
+        Consults the context head first: the common answer - no task, or a
+        task that is not interrupted - never loads a task.
+
+        Args:
+            context_id: The context identifier to look in
+
+        Returns:
+            The most recent task when it is in an interrupted state, otherwise None
+        """
+        head = await self.get_context_head(context_id)
+        if head is None or head.state not in INTERRUPT_TASK_STATES:
+            return None
+
+        task = await self.get_context_last_task(context_id)
+        # The head may have moved on between the two reads.
+        if task is None or task.status.state not in INTERRUPT_TASK_STATES:
+            return None
+        return task
+
+    @abstractmethod
+    def iter_context_messages(
+            self,
+            context_id: str,
+            before: Optional[str] = None,
+            after: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> AsyncIterator[ContextMessage]:
+        """
+        Iterate the conversation messages of a context without loading its tasks whole.
+
+        Only conversation messages are yielded (see
+        ConversationBuilder.is_conversation_message). Messages come newest
+        first, or oldest first when ``after`` is given, so that a limited
+        iteration always stays next to its cursor.
+
+        Args:
+            context_id: The context ID to read
+            before: Cursor of a message; only older messages are yielded
+            after: Cursor of a message; only newer messages are yielded
+            limit: Maximum number of messages to yield
+
+        Returns:
+            Async iterator of the messages with their task and cursor
+
+        Raises:
+            InvalidParamsError: If a cursor was not issued by this store
+        """
+        pass
+
+    @abstractmethod
+    async def get_task_artifacts(self, task_ids: List[str]) -> Dict[str, List[Artifact]]:
+        """
+        Retrieve the artifacts of the given tasks.
+
+        Args:
+            task_ids: IDs of the tasks whose artifacts are wanted
+
+        Returns:
+            Artifacts by task ID; unknown tasks and tasks without artifacts are omitted
+        """
+        pass
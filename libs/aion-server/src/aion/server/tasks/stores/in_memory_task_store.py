@@ -1,27 +1,67 @@
 """In-memory task store implementation for development and testing."""
 
+import json
 import logging
 import asyncio
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
 from a2a.server.context import ServerCallContext
 from a2a.server.owner_resolver import OwnerResolver, resolve_user_scope
 from a2a.types import a2a_pb2
-from a2a.types.a2a_pb2 import Task
+from a2a.types.a2a_pb2 import Artifact, Task
 from a2a.utils.constants import DEFAULT_LIST_TASKS_PAGE_SIZE
 from a2a.utils.errors import InvalidParamsError
 from a2a.utils.task import decode_page_token, encode_page_token
-from typing import Iterator, Optional, List
+from typing import AsyncIterator, Dict, Optional, List
 
+from aion.core.a2a import ContextsPage, ContextSummary
 from aion.server.a2a.constants import ACTIVE_TASK_STATES
-from .base_task_store import BaseTaskStore
+from aion.server.a2a.conversation import ConversationBuilder
+from .base_task_store import BaseTaskStore, ContextHead, ContextMessage
 
 logger = logging.getLogger(__name__)
 
+# (has status timestamp, status timestamp as ISO string, task id): the order
+# ``list`` returns tasks in, reversed. Unstamped tasks sort before stamped ones,
+# so they come last in the newest-first listing.
+_SortKey = tuple[bool, str, str]
+# (owner, task id): task ids are only unique within an owner.
+_TaskKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    """Where a stored task is filed in the secondary indexes.
+
+    Kept apart from the task because callers may mutate a saved task in place
+    before saving it again: the entry still says where to unfile it from.
+    """
+
+    context_id: str
+    state: int
+    sort_key: _SortKey
+    # Order of first save; a task saved again keeps it.
+    created: int
+
+
+def _sort_key(task: Task) -> _SortKey:
+    if task.HasField('status') and task.status.HasField('timestamp'):
+        return True, task.status.timestamp.ToJsonString(), task.id
+    return False, '', task.id
+
 
 class InMemoryTaskStore(BaseTaskStore):
     """In-memory implementation of TaskStore.
 
     Stores task objects in a nested dictionary keyed by owner then task_id.
-    Task data is lost when the server process stops.
+    Secondary indexes - tasks by context in creation order, tasks by state,
+    contexts by their newest task and by last activity, and each owner's tasks
+    by status timestamp - are
+    maintained on ``save`` and ``delete``, so lookups cost in proportion to
+    their result rather than to the size of the store. Task data is lost when
+    the server process stops.
     """
 
     def __init__(
@@ -32,14 +72,109 @@ class InMemoryTaskStore(BaseTaskStore):
         self.tasks: dict[str, dict[str, Task]] = {}
         self.lock = asyncio.Lock()
         self.owner_resolver = owner_resolver
+        self._entries: dict[_TaskKey, _IndexEntry] = {}
+        self._by_context: dict[str, dict[_TaskKey, Task]] = {}
+        self._by_state: dict[int, dict[_TaskKey, Task]] = {}
+        # Contexts by last activity, oldest first, as (activity sequence,
+        # context id); each context's current sequence and time are kept in
+        # _context_activity so its entry can be found by binary search.
+        self._activity_order: list[tuple[int, str]] = []
+        self._context_activity: dict[str, tuple[int, datetime]] = {}
+        self._activity_seq = 0
+        # Contexts by the creation order of their newest task, oldest first, as
+        # (creation sequence, context id), with each context's sequence in
+        # _context_created. Deleting the newest task moves its context back.
+        self._creation_order: list[tuple[int, str]] = []
+        self._context_created: dict[str, int] = {}
+        self._creation_seq = 0
+        # Each owner's task sort keys, ascending.
+        self._by_timestamp: dict[str, list[_SortKey]] = {}
 
     def _get_owner_tasks(self, owner: str) -> dict[str, Task]:
         return self.tasks.get(owner, {})
 
-    def _all_tasks(self) -> Iterator[Task]:
-        """Iterate over all tasks across all owners."""
-        for owner_tasks in self.tasks.values():
-            yield from owner_tasks.values()
+    def _index(self, owner: str, task: Task) -> None:
+        """File a saved task in the secondary indexes, replacing its previous filing."""
+        key = (owner, task.id)
+        previous = self._entries.get(key)
+        if previous is None:
+            self._creation_seq += 1
+        entry = _IndexEntry(
+            context_id=task.context_id,
+            state=task.status.state,
+            sort_key=_sort_key(task),
+            created=self._creation_seq if previous is None else previous.created,
+        )
+        self._entries[key] = entry
+
+        if previous is not None and previous.context_id != entry.context_id:
+            self._unindex_context(key, previous)
+        self._touch_context(entry.context_id)
+        # Reassigning an existing key keeps its creation-order position.
+        self._by_context.setdefault(entry.context_id, {})[key] = task
+        self._place_context(entry.context_id)
+
+        if previous is not None and previous.state != entry.state:
+            self._discard(self._by_state, previous.state, key)
+        self._by_state.setdefault(entry.state, {})[key] = task
+
+        if previous is None or previous.sort_key != entry.sort_key:
+            owner_keys = self._by_timestamp.setdefault(owner, [])
+            if previous is not None:
+                del owner_keys[bisect_left(owner_keys, previous.sort_key)]
+            insort(owner_keys, entry.sort_key)
+
+    def _unindex(self, owner: str, task_id: str) -> None:
+        """Remove a deleted task from the secondary indexes."""
+        key = (owner, task_id)
+        entry = self._entries.pop(key)
+        self._unindex_context(key, entry)
+        self._discard(self._by_state, entry.state, key)
+
+        owner_keys = self._by_timestamp[owner]
+        del owner_keys[bisect_left(owner_keys, entry.sort_key)]
+        if not owner_keys:
+            del self._by_timestamp[owner]
+
+    def _unindex_context(self, key: _TaskKey, entry: _IndexEntry) -> None:
+        self._discard(self._by_context, entry.context_id, key)
+        self._place_context(entry.context_id)
+        if entry.context_id in self._by_context:
+            return
+        self._remove_activity(entry.context_id)
+
+    def _place_context(self, context_id: str) -> None:
+        """File a context by the creation order of its newest task, or drop it once empty."""
+        context_tasks = self._by_context.get(context_id)
+        created = self._entries[next(reversed(context_tasks))].created if context_tasks else None
+        current = self._context_created.get(context_id)
+        if created == current:
+            return
+        if current is not None:
+            del self._creation_order[bisect_left(self._creation_order, (current, context_id))]
+            del self._context_created[context_id]
+        if created is not None:
+            insort(self._creation_order, (created, context_id))
+            self._context_created[context_id] = created
+
+    def _touch_context(self, context_id: str) -> None:
+        """Move a context to the most recently active end."""
+        self._remove_activity(context_id)
+        self._activity_seq += 1
+        self._activity_order.append((self._activity_seq, context_id))
+        self._context_activity[context_id] = (self._activity_seq, datetime.now(timezone.utc))
+
+    def _remove_activity(self, context_id: str) -> None:
+        activity = self._context_activity.pop(context_id, None)
+        if activity is not None:
+            del self._activity_order[bisect_left(self._activity_order, (activity[0], context_id))]
+
+    @staticmethod
+    def _discard(index: dict, bucket, key: _TaskKey) -> None:
+        tasks = index[bucket]
+        del tasks[key]
+        if not tasks:
+            del index[bucket]
 
     async def save(
             self, task: Task, context: ServerCallContext | None = None
@@ -51,6 +186,7 @@ class InMemoryTaskStore(BaseTaskStore):
 
         async with self.lock:
             self.tasks[owner][task.id] = task
+            self._index(owner, task)
             logger.debug(
                 'Task %s for owner %s saved successfully.', task.id, owner
             )
@@ -85,75 +221,52 @@ class InMemoryTaskStore(BaseTaskStore):
             params: a2a_pb2.ListTasksRequest,
             context: ServerCallContext | None = None,
     ) -> a2a_pb2.ListTasksResponse:
-        """Retrieves a list of tasks from the store, for the given owner."""
+        """Retrieves a list of tasks from the store, for the given owner.
+
+        Tasks are ordered newest status timestamp first, ties broken by id.
+        Without a context or status filter the owner's timestamp index already
+        holds that order, and a timestamp filter is a range of it; with one,
+        only the tasks the filter selects from its index are sorted. The page
+        token is located by binary search either way.
+        """
         owner = self.owner_resolver(context)
         logger.debug('Listing tasks for owner %s with params %s', owner, params)
 
         async with self.lock:
             owner_tasks = self._get_owner_tasks(owner)
-            tasks = list(owner_tasks.values())
+            ordered = self._ordered_keys(owner, params)
 
-        # Filter tasks
-        if params.context_id:
-            tasks = [
-                task for task in tasks if task.context_id == params.context_id
-            ]
-        if params.status:
-            tasks = [
-                task for task in tasks if task.status.state == params.status
-            ]
-        if params.HasField('status_timestamp_after'):
-            last_updated_after_iso = (
-                params.status_timestamp_after.ToJsonString()
-            )
-            tasks = [
-                task
-                for task in tasks
-                if (
-                        task.HasField('status')
-                        and task.status.HasField('timestamp')
-                        and task.status.timestamp.ToJsonString()
-                        >= last_updated_after_iso
+            lo = 0
+            if params.HasField('status_timestamp_after'):
+                last_updated_after_iso = (
+                    params.status_timestamp_after.ToJsonString()
                 )
-            ]
+                lo = bisect_left(ordered, (True, last_updated_after_iso))
 
-        # Order tasks by last update time. To ensure stable sorting, in cases where timestamps are null or not unique, do a second order comparison of IDs.
-        tasks.sort(
-            key=lambda task: (
-                task.status.HasField('timestamp')
-                if task.HasField('status')
-                else False,
-                task.status.timestamp.ToJsonString()
-                if task.HasField('status') and task.status.HasField('timestamp')
-                else '',
-                task.id,
-            ),
-            reverse=True,
-        )
+            # ``ordered`` is ascending: descending position i is ordered[-1 - i].
+            total_size = len(ordered) - lo
+            start_idx = 0
+            if params.page_token:
+                start_task_id = decode_page_token(params.page_token)
+                entry = self._entries.get((owner, start_task_id))
+                pos = bisect_left(ordered, entry.sort_key, lo) if entry else len(ordered)
+                if pos == len(ordered) or ordered[pos] != entry.sort_key:
+                    raise InvalidParamsError(
+                        f'Invalid page token: {params.page_token}'
+                    )
+                start_idx = len(ordered) - 1 - pos
 
-        # Paginate tasks
-        total_size = len(tasks)
-        start_idx = 0
-        if params.page_token:
-            start_task_id = decode_page_token(params.page_token)
-            valid_token = False
-            for i, task in enumerate(tasks):
-                if task.id == start_task_id:
-                    start_idx = i
-                    valid_token = True
-                    break
-            if not valid_token:
-                raise InvalidParamsError(
-                    f'Invalid page token: {params.page_token}'
-                )
-        page_size = params.page_size or DEFAULT_LIST_TASKS_PAGE_SIZE
-        end_idx = start_idx + page_size
-        next_page_token = (
-            encode_page_token(tasks[end_idx].id)
-            if end_idx < total_size
-            else None
-        )
-        tasks = tasks[start_idx:end_idx]
+            page_size = params.page_size or DEFAULT_LIST_TASKS_PAGE_SIZE
+            end_idx = min(start_idx + page_size, total_size)
+            tasks = [
+                owner_tasks[ordered[-1 - i][2]]
+                for i in range(start_idx, end_idx)
+            ]
+            next_page_token = (
+                encode_page_token(ordered[-1 - end_idx][2])
+                if end_idx < total_size
+                else None
+            )
 
         return a2a_pb2.ListTasksResponse(
             next_page_token=next_page_token,
@@ -162,6 +275,28 @@ class InMemoryTaskStore(BaseTaskStore):
             page_size=page_size,
         )
 
+    def _ordered_keys(
+            self, owner: str, params: a2a_pb2.ListTasksRequest
+    ) -> List[_SortKey]:
+        """Sort keys of the owner's tasks matching the context and status filters, ascending."""
+        if not params.context_id and not params.status:
+            return self._by_timestamp.get(owner, [])
+
+        if params.context_id:
+            candidates = self._by_context.get(params.context_id, {})
+        else:
+            candidates = self._by_state.get(params.status, {})
+
+        keys = []
+        for key in candidates:
+            if key[0] != owner:
+                continue
+            entry = self._entries[key]
+            if params.status and entry.state != params.status:
+                continue
+            keys.append(entry.sort_key)
+        return sorted(keys)
+
     async def delete(
             self, task_id: str, context: ServerCallContext | None = None
     ) -> None:
@@ -184,6 +319,7 @@ class InMemoryTaskStore(BaseTaskStore):
                 return
 
             del owner_tasks[task_id]
+            self._unindex(owner, task_id)
             logger.debug(
                 'Task %s deleted successfully for owner %s.', task_id, owner
             )
@@ -196,27 +332,51 @@ class InMemoryTaskStore(BaseTaskStore):
             offset: Optional[int] = None,
             limit: Optional[int] = None,
     ) -> List[str]:
-        """Retrieve unique context IDs with pagination support."""
+        """Retrieve unique context IDs with pagination support.
+
+        Contexts come newest first by their most recently created task, as
+        they always have; ``get_context_summaries`` orders by last activity.
+        """
         offset = offset or 0
-        context_ids = []
-        seen = set()
-        skipped = 0
+        stop = offset + limit if limit else None
+        return [
+            context_id
+            for _, context_id in islice(reversed(self._creation_order), offset, stop)
+        ]
 
-        for task in reversed(list(self._all_tasks())):
-            if not task.context_id:
-                continue
-            if task.context_id in seen:
-                continue
-            if skipped < offset:
-                seen.add(task.context_id)
-                skipped += 1
-                continue
-            context_ids.append(task.context_id)
-            seen.add(task.context_id)
-            if limit and len(context_ids) >= limit:
-                break
+    async def get_context_summaries(
+            self,
+            page_size: int,
+            cursor: Optional[str] = None,
+    ) -> ContextsPage:
+        """Retrieve a page of context summaries, most recently active first.
+
+        The cursor is the activity sequence number of the previous page's last
+        context, so a page starts at a binary search whatever its depth.
+        """
+        end = len(self._activity_order)
+        if cursor:
+            try:
+                after_seq = int(decode_page_token(cursor))
+            except ValueError:
+                raise InvalidParamsError(f'Invalid cursor: {cursor}')
+            end = bisect_left(self._activity_order, (after_seq,))
+
+        start = max(0, end - page_size)
+        page = self._activity_order[start:end][::-1]
+        summaries = []
+        for _, context_id in page:
+            context_tasks = self._by_context[context_id]
+            head = next(reversed(context_tasks.values()))
+            summaries.append(ContextSummary(
+                context_id=context_id,
+                last_activity=self._context_activity[context_id][1],
+                task_count=len(context_tasks),
+                state=head.status.state,
+            ))
 
-        return context_ids
+        next_cursor = encode_page_token(str(page[-1][0])) if start > 0 else None
+        return ContextsPage(contexts=summaries, next_cursor=next_cursor)
 
     async def get_context_tasks(
             self,
@@ -226,20 +386,9 @@ class InMemoryTaskStore(BaseTaskStore):
     ) -> List[Task]:
         """Retrieve tasks for a specific context with pagination support."""
         offset = offset or 0
-        matching_tasks = []
-        skipped = 0
-
-        for task in reversed(list(self._all_tasks())):
-            if task.context_id != context_id:
-                continue
-            if skipped < offset:
-                skipped += 1
-                continue
-            matching_tasks.append(task)
-            if limit and len(matching_tasks) >= limit:
-                break
-
-        return matching_tasks
+        stop = offset + limit if limit else None
+        context_tasks = self._by_context.get(context_id, {})
+        return list(islice(reversed(context_tasks.values()), offset, stop))
 
     async def get_active_tasks(self) -> List[Task]:
         """Retrieve every task in an active state, across all owners.
@@ -254,13 +403,88 @@ class InMemoryTaskStore(BaseTaskStore):
         async with self.lock:
             return [
                 task
-                for task in self._all_tasks()
-                if task.status.state in ACTIVE_TASK_STATES
+                for state in ACTIVE_TASK_STATES
+                for task in self._by_state.get(state, {}).values()
             ]
 
     async def get_context_last_task(self, context_id: str) -> Optional[Task]:
         """Retrieve the most recent task for a specific context."""
-        for task in reversed(list(self._all_tasks())):
-            if task.context_id == context_id:
-                return task
-        return None
+        context_tasks = self._by_context.get(context_id)
+        if not context_tasks:
+            return None
+        return next(reversed(context_tasks.values()))
+
+    async def get_context_head(self, context_id: str) -> Optional[ContextHead]:
+        """Retrieve the id and state of the most recent task of a context."""
+        task = await self.get_context_last_task(context_id)
+        if task is None:
+            return None
+        return ContextHead(task_id=task.id, state=task.status.state)
+
+    async def iter_context_messages(
+            self,
+            context_id: str,
+            before: Optional[str] = None,
+            after: Optional[str] = None,
+            limit: Optional[int] = None,
+    ) -> AsyncIterator[ContextMessage]:
+        """Iterate the conversation messages of a context, newest first by default.
+
+        The cursor is the message's task id and its index among that task's
+        conversation messages. Tasks are walked from the cursor's outward, so
+        only the tasks the window reaches have their messages extracted.
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        tasks = list(self._by_context.get(context_id, {}).values())
+        newest_first = after is None
+        if newest_first:
+            tasks.reverse()
+
+        start, bound = 0, None
+        cursor = after or before
+        if cursor:
+            task_id, bound = self._decode_message_cursor(cursor)
+            start = next((i for i, task in enumerate(tasks) if task.id == task_id), None)
+            if start is None:
+                raise InvalidParamsError(f'Invalid cursor: {cursor}')
+
+        yielded = 0
+        for position in range(start, len(tasks)):
+            task = tasks[position]
+            indexed = list(enumerate(ConversationBuilder.task_messages(task)))
+            if position == start and bound is not None:
+                indexed = [(i, m) for i, m in indexed if (i < bound if newest_first else i > bound)]
+            if newest_first:
+                indexed.reverse()
+
+            for index, message in indexed:
+                yield ContextMessage(
+                    message=message,
+                    task_id=task.id,
+                    cursor=encode_page_token(json.dumps([task.id, index])),
+                )
+                yielded += 1
+                if yielded == limit:
+                    return
+
+    @staticmethod
+    def _decode_message_cursor(cursor: str) -> tuple[str, int]:
+        try:
+            task_id, index = json.loads(decode_page_token(cursor))
+        except (TypeError, ValueError):
+            raise InvalidParamsError(f'Invalid cursor: {cursor}')
+        if not isinstance(task_id, str) or not isinstance(index, int):
+            raise InvalidParamsError(f'Invalid cursor: {cursor}')
+        return task_id, index
+
+    async def get_task_artifacts(self, task_ids: List[str]) -> Dict[str, List[Artifact]]:
+        """Retrieve the artifacts of the given tasks, across all owners."""
+        wanted = set(task_ids)
+        artifacts = {}
+        for owner_tasks in self.tasks.values():
+            for task_id in wanted.intersection(owner_tasks):
+                if owner_tasks[task_id].artifacts:
+                    artifacts[task_id] = list(owner_tasks[task_id].artifacts)
+        return artifacts
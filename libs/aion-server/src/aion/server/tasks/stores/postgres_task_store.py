@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
+import json
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import AsyncIterator, Dict, Optional, List
 
 from a2a.server.context import ServerCallContext
-from a2a.types import Task, TaskState
+from a2a.types import Artifact, Task, TaskState
 from a2a.types import a2a_pb2
 from a2a.utils.constants import DEFAULT_LIST_TASKS_PAGE_SIZE
 from a2a.utils.errors import InvalidParamsError
 from a2a.utils.task import decode_page_token, encode_page_token
 
+from aion.core.a2a import ContextsPage, ContextSummary
 from aion.db.postgres.manager import db_manager
 from aion.db.postgres.types import Pagination, Sorting, SortKey
-from aion.db.postgres.repositories import STATUS_TIMESTAMP_SORT_KEY, TasksRepository
+from aion.db.postgres.repositories import (
+    STATUS_TIMESTAMP_SORT_KEY,
+    ContextsRepository,
+    TaskLeasesRepository,
+    TasksRepository,
+)
 from aion.db.postgres.records import TaskRecord
 from aion.server.a2a.constants import ACTIVE_TASK_STATES
-from .base_task_store import BaseTaskStore
+from .base_task_store import BaseTaskStore, ContextHead, ContextMessage
 
 
 class PostgresTaskStore(BaseTaskStore):
     """Store tasks in a Postgres database using repository pattern."""
 
+    supports_task_leases = True
+
     @staticmethod
     def _require_task_uuid(task_id: str) -> uuid.UUID:
         """Parse a task identifier, refusing anything this store cannot address.
@@ -202,10 +211,63 @@ class PostgresTaskStore(BaseTaskStore):
             offset: Optional[int] = None,
             limit: Optional[int] = None
     ) -> List[str]:
-        """Retrieve unique context IDs with pagination support."""
+        """Retrieve unique context IDs with pagination support.
+
+        Contexts come newest first by their most recently created task, as
+        they did when this aggregated the tasks table; it now reads the
+        ``contexts`` table through each context's head task instead.
+        ``get_context_summaries`` orders by last activity.
+        """
         async with db_manager.get_session() as session:
-            repository = TasksRepository(session)
-            return await repository.find_unique_context_ids(pagination=Pagination(limit=limit, offset=offset))
+            repository = ContextsRepository(session)
+            return await repository.find_context_ids(pagination=Pagination(limit=limit, offset=offset))
+
+    async def get_context_summaries(
+            self,
+            page_size: int,
+            cursor: Optional[str] = None
+    ) -> ContextsPage:
+        """Retrieve a page of context summaries, most recently active first.
+
+        One indexed range read of the ``contexts`` table. The cursor encodes
+        the ``(last activity, context id)`` position of the previous page's
+        last context, so deep pages cost the same as the first.
+
+        Raises:
+            InvalidParamsError: If the cursor cannot be decoded.
+        """
+        after = self._decode_context_cursor(cursor) if cursor else None
+
+        async with db_manager.get_session() as session:
+            repository = ContextsRepository(session)
+            # One extra row tells whether a next page exists.
+            records = await repository.find_page(limit=page_size + 1, after=after)
+
+        page = records[:page_size]
+        summaries = [
+            ContextSummary(
+                context_id=record.context_id,
+                last_activity=record.last_activity_at,
+                task_count=record.task_count,
+                state=TaskState.Value(record.head_state),
+            )
+            for record in page
+        ]
+        next_cursor = None
+        if len(records) > page_size:
+            last = page[-1]
+            next_cursor = encode_page_token(
+                json.dumps([last.last_activity_at.isoformat(), last.context_id])
+            )
+        return ContextsPage(contexts=summaries, next_cursor=next_cursor)
+
+    @staticmethod
+    def _decode_context_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            activity, context_id = json.loads(decode_page_token(cursor))
+            return datetime.fromisoformat(activity), str(context_id)
+        except (ValueError, TypeError):
+            raise InvalidParamsError(f'Invalid cursor: {cursor}')
 
     async def get_context_tasks(
             self,
@@ -242,6 +304,91 @@ class PostgresTaskStore(BaseTaskStore):
 
         return [self._entity_to_task(str(r.id), r) for r in records]
 
+    async def acquire_task_lease(self, task_id: str, owner: str) -> str:
+        """Lease a task to ``owner``, taking it over from any previous holder.
+
+        Raises:
+            InvalidParamsError: If ``task_id`` is not a UUID.
+        """
+        task_uuid = self._require_task_uuid(task_id)
+
+        async with db_manager.get_session() as session:
+            token = await TaskLeasesRepository(session).acquire(task_uuid, owner)
+            await session.commit()
+        return token
+
+    async def renew_task_leases(self, owner: str) -> List[str]:
+        """Refresh every lease of ``owner`` in one statement; return the tasks still held."""
+        async with db_manager.get_session() as session:
+            task_ids = await TaskLeasesRepository(session).renew(owner)
+            await session.commit()
+        return [str(task_id) for task_id in task_ids]
+
+    async def release_task_leases(
+            self,
+            owner: str,
+            task_ids: List[str],
+            tokens: Optional[List[str]] = None,
+    ) -> None:
+        """Release leases of ``owner`` in one statement; with ``tokens``, reacquired leases are kept."""
+        uuids = []
+        kept_tokens: Optional[List[str]] = None if tokens is None else []
+        for index, task_id in enumerate(task_ids):
+            try:
+                uuids.append(uuid.UUID(task_id))
+            except ValueError:
+                continue
+            if kept_tokens is not None:
+                kept_tokens.append(tokens[index])
+        if not uuids:
+            return
+
+        async with db_manager.get_session() as session:
+            await TaskLeasesRepository(session).release(owner, uuids, kept_tokens)
+            await session.commit()
+
+    async def save_if_leased(self, task: Task, owner: str) -> bool:
+        """Save a task in the transaction that locks its lease held by ``owner``.
+
+        An acquisition by another process waits on the lease row's lock, so
+        it either lands first and the task is not saved, or lands after the
+        task was.
+
+        Raises:
+            InvalidParamsError: If ``task.id`` is not a UUID.
+        """
+        task_uuid = self._require_task_uuid(task.id)
+        entity = self._task_to_entity(task, task_uuid)
+
+        async with db_manager.get_session() as session:
+            if not await TaskLeasesRepository(session).lock_held(task_uuid, owner):
+                return False
+            await TasksRepository(session).save(entity)
+            await session.commit()
+        return True
+
+    async def claim_orphaned_tasks(self, owner: str, lease_ttl: float, limit: int) -> List[Task]:
+        """Claim tasks whose lease expired and load them.
+
+        The claim is a single update over the heartbeat index, committed before
+        the tasks are read, so a concurrent sweeper skips these leases from then
+        on. Leases left behind by tasks that were deleted are released here.
+        """
+        async with db_manager.get_session() as session:
+            leases = TaskLeasesRepository(session)
+            task_ids = await leases.claim_expired(owner, lease_ttl, limit)
+            await session.commit()
+            if not task_ids:
+                return []
+
+            records = await TasksRepository(session).find_by_ids(task_ids)
+            missing = set(task_ids) - {record.id for record in records}
+            if missing:
+                await leases.release(owner, list(missing))
+                await session.commit()
+
+        return [self._entity_to_task(str(r.id), r) for r in records]
+
     async def get_context_last_task(self, context_id: str) -> Optional[Task]:
         """Retrieve the most recent task for a specific context.
 
@@ -250,6 +397,9 @@ class PostgresTaskStore(BaseTaskStore):
         connection error reported as "no previous task" would silently start a
         fresh task over work that already exists.
 
+        The task is found through the context's head record and loaded by
+        primary key.
+
         Args:
             context_id: Context whose most recent task is wanted.
 
@@ -257,5 +407,87 @@ class PostgresTaskStore(BaseTaskStore):
             The most recently created task of the context, or ``None`` when the
             context holds no tasks.
         """
-        tasks = await self.get_context_tasks(context_id=context_id, limit=1)
-        return tasks[0] if tasks else None
+        async with db_manager.get_session() as session:
+            head = await ContextsRepository(session).find_by_context_id(context_id)
+            if head is None:
+                return None
+
+            entity = await TasksRepository(session).find_by_id(head.head_task_id)
+            if entity is None:
+                return None
+
+        return self._entity_to_task(str(entity.id), entity)
+
+    async def get_context_head(self, context_id: str) -> Optional[ContextHead]:
+        """Retrieve the id and state of the most recent task of a context.
+
+        A primary-key read of the ``contexts`` table, which the tasks
+        repository keeps current in the same transaction as every task write.
+        Database failures propagate, as for :meth:`get_context_last_task`.
+
+        Args:
+            context_id: Context whose head is wanted.
+
+        Returns:
+            The context's head, or ``None`` when the context holds no tasks.
+        """
+        async with db_manager.get_session() as session:
+            head = await ContextsRepository(session).find_by_context_id(context_id)
+
+        if head is None:
+            return None
+        return ContextHead(task_id=str(head.head_task_id), state=TaskState.Value(head.head_state))
+
+    async def iter_context_messages(
+            self,
+            context_id: str,
+            before: Optional[str] = None,
+            after: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> AsyncIterator[ContextMessage]:
+        """Stream the conversation messages of a context, newest first by default.
+
+        Histories are unnested and filtered in the database and rows are
+        streamed, so neither whole tasks nor events are loaded. The cursor
+        encodes the message's ``(task created at, task id, index)`` position.
+
+        Raises:
+            InvalidParamsError: If a cursor cannot be decoded.
+        """
+        before_position = self._decode_message_cursor(before) if before else None
+        after_position = self._decode_message_cursor(after) if after else None
+
+        async with db_manager.get_session() as session:
+            repository = TasksRepository(session)
+            async for (created_at, task_id, index), message in repository.stream_messages(
+                    context_id, before=before_position, after=after_position, limit=limit
+            ):
+                yield ContextMessage(
+                    message=message,
+                    task_id=str(task_id),
+                    cursor=encode_page_token(
+                        json.dumps([created_at.isoformat(), str(task_id), index])
+                    ),
+                )
+
+    @staticmethod
+    def _decode_message_cursor(cursor: str) -> tuple[datetime, uuid.UUID, int]:
+        try:
+            created_at, task_id, index = json.loads(decode_page_token(cursor))
+            return datetime.fromisoformat(created_at), uuid.UUID(task_id), int(index)
+        except (ValueError, TypeError, AttributeError):
+            raise InvalidParamsError(f'Invalid cursor: {cursor}')
+
+    async def get_task_artifacts(self, task_ids: List[str]) -> Dict[str, List[Artifact]]:
+        """Retrieve the artifacts of the given tasks, reading only the artifacts column."""
+        uuids = []
+        for task_id in task_ids:
+            try:
+                uuids.append(uuid.UUID(task_id))
+            except ValueError:
+                continue
+
+        async with db_manager.get_session() as session:
+            repository = TasksRepository(session)
+            artifacts = await repository.find_task_artifacts(uuids)
+        return {str(task_id): task_artifacts for task_id, task_artifacts in artifacts.items()}
@@ -5,8 +5,9 @@ from a2a.server.events import Event
 from a2a.server.tasks import TaskManager
 from a2a.types import Message, Task, TaskArtifactUpdateEvent, TaskState, TaskStatus, TaskStatusUpdateEvent
 from aion.server.a2a.constants import NON_ACTIVE_TASK_STATES, TRANSIENT_ARTIFACT_IDS
-from aion.server.a2a.utils import is_ephemeral_status_event, is_task_interrupted
+from aion.server.a2a.utils import is_ephemeral_status_event
 from aion.server.agent.execution.scope import set_task_status
+from aion.server.opentelemetry.stages import stage_span
 from typing import override
 
 from aion.server.tasks import store_manager
@@ -51,6 +52,17 @@ class AionTaskManager(TaskManager):
         self._track_task_status(event)
         return result
 
+    @override
+    async def save_task_event(self, event: Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent) -> Task | None:
+        """Applies an event to the task and persists it, in a stage span of its own."""
+        with stage_span(
+                "aion.task.save_event",
+                task_id=self.task_id,
+                context_id=self.context_id,
+                attributes={"aion.event.type": type(event).__name__},
+        ):
+            return await super().save_task_event(event)
+
     async def _carry_pending_message(self, event: Event) -> Event:
         """Keep the turn's closing message in status when the task stops.
 
@@ -143,13 +155,14 @@ class AionTaskManager(TaskManager):
             logger.warning("Task ID already assigned, ignoring")
             return None
 
-        last_task = await store_manager.get_store().get_context_last_task(context_id=self.context_id)
+        store = store_manager.get_store()
+        if interrupted:
+            last_task = await store.get_context_interrupted_task(context_id=self.context_id)
+        else:
+            last_task = await store.get_context_last_task(context_id=self.context_id)
         if last_task is None:
             return None
 
-        if interrupted and not is_task_interrupted(last_task):
-            return None
-
         self.task_id = last_task.id
         self._current_task = last_task
         return last_task
@@ -0,0 +1,52 @@
+"""Documents rendered once and served from memory with conditional-GET support.
+
+Used for responses whose bytes only change when the serving process is
+replaced - an agent's card and configuration document, the proxy's manifest
+and the agent documents the proxy caches.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from aion.core.http import compute_etag, etag_matches
+from starlette.responses import Response
+
+__all__ = ["CachedDocument"]
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """One document as it is served: exact body bytes and their entity tag."""
+
+    body: bytes
+    media_type: Optional[str]
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes, media_type: Optional[str] = None) -> "CachedDocument":
+        """Wrap served bytes, computing their entity tag."""
+        return cls(body=body, media_type=media_type, etag=compute_etag(body))
+
+    def to_response(self, if_none_match: Optional[str] = None) -> Response:
+        """Build the answer for this document, honouring ``If-None-Match``.
+
+        ``no-cache`` lets clients keep a copy but makes them revalidate it, so
+        a replaced agent is never hidden behind a client-side cache.
+
+        Args:
+            if_none_match: The client's ``If-None-Match`` header, if it sent one.
+
+        Returns:
+            A 304 when the client's copy is current, the full document otherwise.
+        """
+        headers = {'etag': self.etag, 'cache-control': 'no-cache'}
+
+        if etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=self.body,
+            status_code=200,
+            headers=headers,
+            media_type=self.media_type,
+        )
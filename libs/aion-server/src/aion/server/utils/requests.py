@@ -0,0 +1,41 @@
+"""Request body parsing shared by the middlewares and handlers of one request.
+
+Starlette caches ``request.json()`` on the ``Request`` object, but every
+``BaseHTTPMiddleware`` and route builds its own ``Request`` over the same ASGI
+scope, so each of them would decode the body again. For JSON-RPC bodies
+carrying inline file parts that is megabytes of JSON per pass.
+"""
+
+from typing import Any
+
+from starlette.requests import Request
+
+__all__ = ["read_json_body"]
+
+_JSON_BODY_SCOPE_KEY = "aion.json_body"
+
+
+async def read_json_body(request: Request) -> Any:
+    """Return the request body decoded as JSON, decoding it once per request.
+
+    The decoded body is kept in the ASGI scope, which every ``Request`` built
+    for this request shares, and is also primed as the ``request.json()``
+    cache of ``request``, so code that calls ``request.json()`` on it (such as
+    the a2a-sdk dispatcher) gets the same object without decoding again.
+
+    The returned object is shared: callers must not mutate it.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON. Failures are not
+            cached, so the next reader reports the same error.
+    """
+    scope = request.scope
+    if _JSON_BODY_SCOPE_KEY in scope:
+        body = scope[_JSON_BODY_SCOPE_KEY]
+        # Starlette's per-instance cache behind Request.json().
+        request._json = body  # noqa: SLF001
+        return body
+
+    body = await request.json()
+    scope[_JSON_BODY_SCOPE_KEY] = body
+    return body
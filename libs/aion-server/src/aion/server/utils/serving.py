@@ -0,0 +1,84 @@
+"""Event loop and uvicorn tuning shared by the agent and proxy servers.
+
+Both servers run ``uvicorn.Server.serve`` inside an event loop their process
+created itself, so uvicorn's own ``loop`` option never takes effect: the loop
+has to be chosen when the process creates it, which is what
+:func:`new_event_loop` is for. Everything uvicorn does decide for itself comes
+from :func:`uvicorn_config_options`.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict
+
+from aion.server.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "new_event_loop",
+    "uvicorn_config_options",
+]
+
+
+def _is_installed(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the event loop a server process runs on, as ``SERVER_LOOP`` says.
+
+    Asking for ``uvloop`` without the package installed is not fatal: the
+    process logs a warning and runs on the stock loop rather than refusing to
+    serve over a performance setting.
+
+    Returns:
+        A new, not yet running event loop.
+    """
+    if app_settings.server_loop != "asyncio" and _is_installed("uvloop"):
+        import uvloop
+
+        return uvloop.new_event_loop()
+
+    if app_settings.server_loop == "uvloop":
+        logger.warning("SERVER_LOOP is 'uvloop' but uvloop is not installed, using asyncio")
+
+    return asyncio.new_event_loop()
+
+
+def _resolve_http() -> str:
+    """Pick the uvicorn HTTP implementation, falling back to h11 when needed."""
+    if app_settings.server_http == "h11":
+        return "h11"
+
+    if _is_installed("httptools"):
+        return "httptools"
+
+    if app_settings.server_http == "httptools":
+        logger.warning("SERVER_HTTP is 'httptools' but httptools is not installed, using h11")
+    return "h11"
+
+
+def uvicorn_config_options() -> Dict[str, Any]:
+    """Return the tuned ``uvicorn.Config`` keyword arguments from the settings.
+
+    Options left unset in the settings are omitted, so uvicorn's own defaults
+    apply to them.
+
+    Returns:
+        Keyword arguments to merge into a ``uvicorn.Config`` call.
+    """
+    options: Dict[str, Any] = {
+        "http": _resolve_http(),
+        "backlog": app_settings.server_backlog,
+        "timeout_keep_alive": app_settings.server_keep_alive_timeout,
+    }
+
+    if app_settings.server_limit_concurrency is not None:
+        options["limit_concurrency"] = app_settings.server_limit_concurrency
+
+    if app_settings.server_h11_max_incomplete_event_size is not None:
+        options["h11_max_incomplete_event_size"] = app_settings.server_h11_max_incomplete_event_size
+
+    return options
@@ -0,0 +1,44 @@
+"""Per-phase wall-time accounting for process startup."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+__all__ = ["StartupTimer"]
+
+
+class StartupTimer:
+    """Wall time of named startup phases, reported as one log line.
+
+    Phases are recorded in the order they finish; timing the same name twice
+    adds up. ``total`` is the time since the timer was created, so it also
+    covers whatever ran between the timed phases.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``, including when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add a phase measured elsewhere, e.g. in a worker thread."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._started
+
+    def report(self) -> str:
+        """Render the phases as ``name=1.234s ... total=2.345s``."""
+        parts = [f"{name}={seconds:.3f}s" for name, seconds in self.phases.items()]
+        parts.append(f"total={self.total:.3f}s")
+        return " ".join(parts)
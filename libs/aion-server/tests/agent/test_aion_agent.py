@@ -8,8 +8,10 @@ Focus areas:
   - build() factory: already-built guard, missing path, no adapter, adapter discovery
   - AgentManager: create_agent, set_agent_config, get_agent, clear, Singleton guard
 """
+import asyncio
 import logging
 
+import threading
 import time
 from collections.abc import AsyncIterator
 from typing import Any
@@ -308,6 +310,67 @@ class TestAionAgentBuild:
 
         assert result is agent
 
+    async def test_build_reuses_a_started_module_import(self):
+        """A module import started early is awaited by build, not repeated."""
+        cfg = _make_config(path="aion.core.config.models")
+        agent = AionAgent(agent_id="a", config=cfg)
+        adapter = _make_mock_adapter()
+
+        with patch("aion.server.agent.adapters.registry.adapter_registry") as mock_reg:
+            mock_reg.list_adapters.return_value = [adapter]
+            with patch("aion.server.agent.aion_agent.module_loader.ModuleLoader") as MockLoader:
+                loader_instance = MagicMock()
+                loader_instance.load_from_config_path.return_value = (MagicMock(), None)
+                loader_instance.discover_object.return_value = object()
+                MockLoader.return_value = loader_instance
+
+                agent.start_module_import()
+                agent.start_module_import()
+                await agent.build()
+
+        loader_instance.load_from_config_path.assert_called_once_with("aion.core.config.models")
+        assert agent.module_import_seconds is not None
+
+    async def test_build_without_a_started_import_imports_on_the_loop_thread(self):
+        """Without a preload the module is imported in build, on the loop's thread."""
+        cfg = _make_config(path="aion.core.config.models")
+        agent = AionAgent(agent_id="a", config=cfg)
+        adapter = _make_mock_adapter()
+        import_threads = []
+
+        def load(path):
+            import_threads.append(threading.get_ident())
+            return MagicMock(), None
+
+        with patch("aion.server.agent.adapters.registry.adapter_registry") as mock_reg:
+            mock_reg.list_adapters.return_value = [adapter]
+            with patch("aion.server.agent.aion_agent.module_loader.ModuleLoader") as MockLoader:
+                loader_instance = MagicMock()
+                loader_instance.load_from_config_path.side_effect = load
+                loader_instance.discover_object.return_value = object()
+                MockLoader.return_value = loader_instance
+
+                await agent.build()
+
+        assert import_threads == [threading.get_ident()]
+
+    async def test_cancel_module_import_collects_a_failed_import(self):
+        """An abandoned import is awaited, so its error is not left unretrieved."""
+        cfg = _make_config(path="aion.core.config.models")
+        agent = AionAgent(agent_id="a", config=cfg)
+
+        with patch("aion.server.agent.aion_agent.module_loader.ModuleLoader") as MockLoader:
+            MockLoader.return_value.load_from_config_path.side_effect = ImportError("no module")
+            agent.start_module_import()
+            module_import = agent._module_import
+            await asyncio.wait([module_import])
+            await agent.cancel_module_import()
+
+        assert module_import.done()
+        assert agent._module_import is None
+        await agent.cancel_module_import()
+
+
 class TestAionAgentExecution:
     def _built_agent(self) -> AionAgent:
         executor = _make_mock_executor()
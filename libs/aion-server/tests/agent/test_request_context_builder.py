@@ -1,37 +1,37 @@
 """Tests for AionRequestContextBuilder._find_interrupted_task."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from a2a.server.context import ServerCallContext
 from a2a.types import Task, TaskState, TaskStatus
 
 from aion.server.agent.execution.request_context_builder import AionRequestContextBuilder
-from aion.server.tasks.stores.base_task_store import BaseTaskStore
+from aion.server.tasks.stores import InMemoryTaskStore
 
+CALL_CONTEXT = ServerCallContext()
 
-def _make_task(state: TaskState) -> Task:
-    return Task(id="task-1", context_id="ctx-1", status=TaskStatus(state=state))
 
+def _make_task(state: TaskState, task_id: str = "task-1") -> Task:
+    return Task(id=task_id, context_id="ctx-1", status=TaskStatus(state=state))
 
-def _make_store(last_task: Task | None) -> BaseTaskStore:
-    store = MagicMock(spec=BaseTaskStore)
-    store.get_context_last_task = AsyncMock(return_value=last_task)
+
+async def _make_store(*tasks: Task) -> InMemoryTaskStore:
+    store = InMemoryTaskStore()
+    for task in tasks:
+        await store.save(task, CALL_CONTEXT)
     return store
 
 
 class TestFindInterruptedTask:
-    @pytest.fixture
-    def builder(self):
-        return AionRequestContextBuilder(task_store=_make_store(None))
 
     async def test_returns_none_when_no_task_exists(self):
         """No prior task for the context — should return None, not raise TypeError."""
-        builder = AionRequestContextBuilder(task_store=_make_store(None))
+        builder = AionRequestContextBuilder(task_store=await _make_store())
         result = await builder._find_interrupted_task("ctx-new")
         assert result is None
 
     async def test_returns_none_when_task_not_interrupted(self):
         """Task exists but is completed — should return None."""
-        store = _make_store(_make_task(TaskState.TASK_STATE_COMPLETED))
+        store = await _make_store(_make_task(TaskState.TASK_STATE_COMPLETED))
         builder = AionRequestContextBuilder(task_store=store)
         result = await builder._find_interrupted_task("ctx-1")
         assert result is None
@@ -39,11 +39,21 @@ class TestFindInterruptedTask:
     async def test_returns_task_when_interrupted(self):
         """Task exists and is interrupted — should return it."""
         task = _make_task(TaskState.TASK_STATE_INPUT_REQUIRED)
-        store = _make_store(task)
+        store = await _make_store(task)
         builder = AionRequestContextBuilder(task_store=store)
         result = await builder._find_interrupted_task("ctx-1")
         assert result is task
 
+    async def test_only_the_latest_task_is_considered(self):
+        """An older interrupted task is not resumed once a newer task exists."""
+        store = await _make_store(
+            _make_task(TaskState.TASK_STATE_INPUT_REQUIRED, task_id="task-1"),
+            _make_task(TaskState.TASK_STATE_COMPLETED, task_id="task-2"),
+        )
+        builder = AionRequestContextBuilder(task_store=store)
+        result = await builder._find_interrupted_task("ctx-1")
+        assert result is None
+
     async def test_returns_none_when_no_task_store(self):
         """No task store configured — should return None."""
         builder = AionRequestContextBuilder(task_store=None)
@@ -1,12 +1,18 @@
 """Tests for the public agent configuration discovery route."""
 
 from types import SimpleNamespace
+from unittest.mock import patch
 
+from a2a.server.request_handlers.response_helpers import agent_card_to_dict
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from aion.core.config import AgentConfigurationCollector
+from aion.core.config.models import AgentConfig
+from aion.server.agent.card import AionAgentCard
 from aion.server.constants import CONFIGURATION_FILE_URL
-from aion.server.core.app.api.routes import AionExtraHTTPRoutes
+from aion.server.core.app.api.routes import AionExtraHTTPRoutes, create_agent_card_routes
 
 
 def test_configuration_route_omits_null_secret_metadata():
@@ -34,3 +40,53 @@ def test_configuration_route_omits_null_secret_metadata():
         "nullable": True,
         "type": "secret",
     }
+
+
+def _configuration_app(configuration):
+    agent = SimpleNamespace(config=SimpleNamespace(configuration=configuration))
+    app = FastAPI()
+    AionExtraHTTPRoutes(agent).register(app)
+    return app
+
+
+def test_configuration_is_rendered_once_and_served_with_etag():
+    """Repeat requests get the same bytes without collecting the configuration again."""
+    with patch(
+        "aion.server.core.app.api.routes.AgentConfigurationCollector",
+        wraps=AgentConfigurationCollector,
+    ) as collector:
+        client = TestClient(_configuration_app({"region": {"type": "string"}}))
+        first = client.get(CONFIGURATION_FILE_URL)
+        second = client.get(CONFIGURATION_FILE_URL)
+
+    assert collector.call_count == 1
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["content-type"] == "application/json"
+
+
+def test_configuration_answers_304_for_current_etag():
+    """A client holding the current document gets a bodiless 304."""
+    client = TestClient(_configuration_app({}))
+    etag = client.get(CONFIGURATION_FILE_URL).headers["etag"]
+
+    response = client.get(CONFIGURATION_FILE_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_agent_card_route_serves_precomputed_card():
+    """The card route answers the SDK's JSON rendering of the card, with conditional GET."""
+    card = AionAgentCard.from_config(AgentConfig(path="my.module:agent"), "http://localhost:8000")
+    app = FastAPI()
+    app.router.routes.extend(create_agent_card_routes(card))
+    client = TestClient(app)
+
+    response = client.get(AGENT_CARD_WELL_KNOWN_PATH)
+
+    assert response.status_code == 200
+    assert response.json() == agent_card_to_dict(card)
+    conditional = client.get(AGENT_CARD_WELL_KNOWN_PATH, headers={"If-None-Match": response.headers["etag"]})
+    assert conditional.status_code == 304
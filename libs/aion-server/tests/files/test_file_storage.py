@@ -14,6 +14,8 @@ Focus areas:
     - delete() cancels pending / calls backend delete
     - pending_count tracks correctly
     - _upload_safe absorbs exceptions
+    - upload_concurrency bounds the uploads in flight
+    - aclose drains, then closes the backend
 
   A2AFileTransformer:
     - is_active reflects upload_manager presence
@@ -207,6 +209,40 @@ class TestFileUploadManager:
         uri = mgr.schedule(data=b"x", mime_type="text/plain")
         await mgr.wait([uri])
 
+    async def test_upload_concurrency_bounds_uploads_in_flight(self):
+        """Uploads beyond upload_concurrency wait for a slot instead of starting."""
+        backend = self._backend()
+        in_flight = []
+        peak = 0
+
+        async def _upload(**kw):
+            nonlocal peak
+            in_flight.append(kw["file_id"])
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(kw["file_id"])
+
+        backend.upload = _upload
+        mgr = FileUploadManager(backend, upload_concurrency=2)
+        for i in range(6):
+            backend.generate_uri.return_value = (f"id{i}", f"https://stub/{i}")
+            mgr.schedule(data=b"x", mime_type="text/plain")
+
+        await mgr.drain()
+        assert peak == 2
+
+    async def test_aclose_drains_then_closes_backend(self):
+        backend = self._backend()
+        backend.aclose = AsyncMock()
+        mgr = self._manager(backend)
+        mgr.schedule(data=b"x", mime_type="text/plain")
+
+        await mgr.aclose()
+
+        assert mgr.pending_count == 0
+        backend.upload.assert_awaited_once()
+        backend.aclose.assert_awaited_once()
+
 def _make_part_raw(data: bytes = b"hello", media_type: str = "text/plain") -> Part:
     return Part(raw=data, media_type=media_type)
 
@@ -426,13 +462,14 @@ class TestFileUploadManagerFromSettings:
         """from_settings returns a FileUploadManager when backend is 'stub'."""
         with patch("aion.server.settings.app_settings") as mock:
             mock.file_storage_backend = "stub"
+            mock.file_storage_upload_concurrency = 8
             result = FileUploadManager.from_settings()
             assert isinstance(result, FileUploadManager)
 
     def test_raises_for_unknown_backend(self):
         """from_settings raises ValueError for unknown storage backend names."""
         with patch("aion.server.settings.app_settings") as mock:
-            mock.file_storage_backend = "s3"
+            mock.file_storage_backend = "gcs"
             with pytest.raises(ValueError, match="Unknown storage backend"):
                 FileUploadManager.from_settings()
 
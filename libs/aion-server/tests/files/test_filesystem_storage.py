@@ -0,0 +1,236 @@
+"""Tests for FilesystemFileStorageBackend and the route serving its files.
+
+Focus areas:
+  Storage:
+    - An upload is served from the path of its URL
+    - Identical contents are stored once; the last link removed collects them
+    - Uploading a file id again replaces its content
+    - Context ids unsafe as a path segment are stored without a directory
+    - Paths outside the storage directory do not resolve
+    - A reopened backend counts what is stored and drops partial writes
+
+  Budgets:
+    - Files over the per-file limit are refused before a URI is handed out
+    - Files admitted together reserve their share of the total until they land
+    - The total limit is enforced again when bytes land
+    - The transformer leaves parts the budget refuses inline
+
+  Route:
+    - Files are served in full and by byte range
+    - Unknown paths answer 404
+"""
+
+from unittest.mock import patch
+
+import pytest
+from a2a.types import Message, Part, Role
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aion.server.core.app.api import create_file_routes
+from aion.server.files.a2a import A2AFileTransformer
+from aion.server.files.storage import (
+    FilesystemFileStorageBackend,
+    FileStorageLimitError,
+    FileUploadManager,
+)
+
+BASE_URL = "http://agent:8001"
+
+
+def _path(uri: str) -> str:
+    return uri.removeprefix(f"{BASE_URL}/files/")
+
+
+async def _store(backend, data: bytes, context_id="ctx-1", mime_type="image/png") -> str:
+    file_id, uri = backend.generate_uri(mime_type=mime_type, context_id=context_id)
+    await backend.upload(file_id, data, mime_type, context_id=context_id)
+    return uri
+
+
+def _objects(tmp_path) -> list:
+    return sorted((tmp_path / "objects").glob("*/*"))
+
+
+class TestStorage:
+    async def test_upload_is_served_from_its_url_path(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+
+        uri = await _store(backend, b"png bytes")
+
+        assert uri.startswith(f"{BASE_URL}/files/ctx-1/") and uri.endswith(".png")
+        assert backend.resolve(_path(uri)).read_bytes() == b"png bytes"
+
+    async def test_identical_contents_are_stored_once(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+
+        first = await _store(backend, b"same")
+        second = await _store(backend, b"same", context_id="ctx-2")
+
+        assert first != second
+        assert len(_objects(tmp_path)) == 1
+        assert backend.used_bytes == 4
+
+    async def test_content_is_collected_with_its_last_link(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+        uploads = []
+        for context_id in ("ctx-1", "ctx-2"):
+            file_id, uri = backend.generate_uri(mime_type="text/plain", context_id=context_id)
+            await backend.upload(file_id, b"same", "text/plain", context_id=context_id)
+            uploads.append((file_id, context_id, uri))
+        (first_id, first_context, first_uri), (second_id, second_context, second_uri) = uploads
+
+        await backend.delete(first_id, context_id=first_context)
+
+        assert backend.resolve(_path(first_uri)) is None
+        assert backend.resolve(_path(second_uri)).read_bytes() == b"same"
+        assert backend.used_bytes == 4
+
+        await backend.delete(second_id, context_id=second_context)
+
+        assert _objects(tmp_path) == []
+        assert backend.used_bytes == 0
+
+    async def test_repeated_upload_of_a_file_id_replaces_its_content(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+        file_id, uri = backend.generate_uri(mime_type="text/plain", context_id="ctx-1")
+
+        for data in (b"same", b"same", b"other"):
+            await backend.upload(file_id, data, "text/plain", context_id="ctx-1")
+            assert backend.resolve(_path(uri)).read_bytes() == data
+
+        assert len(_objects(tmp_path)) == 1
+        assert backend.used_bytes == 5
+
+    async def test_unsafe_context_id_is_not_a_directory(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+
+        uri = await _store(backend, b"data", context_id="../../etc")
+
+        assert "/" not in _path(uri)
+        assert backend.resolve(_path(uri)) is not None
+
+    @pytest.mark.parametrize("path", ["../objects", "ctx/../../x", ".hidden", "a/b/c", ""])
+    def test_paths_outside_storage_do_not_resolve(self, tmp_path, path):
+        assert FilesystemFileStorageBackend(tmp_path, BASE_URL).resolve(path) is None
+
+    async def test_reopened_backend_counts_stored_bytes(self, tmp_path):
+        await _store(FilesystemFileStorageBackend(tmp_path, BASE_URL), b"12345")
+        (tmp_path / "tmp" / "partial").write_bytes(b"interrupted")
+
+        reopened = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+
+        assert reopened.used_bytes == 5
+        assert list((tmp_path / "tmp").iterdir()) == []
+
+
+class TestBudgets:
+    def test_oversized_file_is_refused_before_a_uri_exists(self, tmp_path):
+        manager = FileUploadManager(FilesystemFileStorageBackend(tmp_path, BASE_URL, max_file_bytes=4))
+
+        with pytest.raises(FileStorageLimitError):
+            manager.schedule(b"12345", "text/plain")
+        assert manager.pending_count == 0
+
+    async def test_files_admitted_together_reserve_their_share(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL, max_total_bytes=150)
+        manager = FileUploadManager(backend)
+        message = Message(
+            message_id="m1", role=Role.ROLE_USER, context_id="ctx-1",
+            parts=[Part(raw=b"a" * 100, media_type="text/plain"), Part(raw=b"b" * 100, media_type="text/plain")],
+        )
+
+        result = await A2AFileTransformer(manager).transform_message(message, wait_upload=True)
+
+        # Each fits on its own; the second is refused up front, not once it lands.
+        stored, refused = result.parts
+        assert backend.resolve(_path(stored.url)).read_bytes() == b"a" * 100
+        assert refused.raw == b"b" * 100
+
+    async def test_reservation_is_released_when_the_upload_ends(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL, max_total_bytes=150)
+        manager = FileUploadManager(backend)
+
+        await manager.wait([manager.schedule(b"a" * 100, "text/plain")])
+        with patch.object(backend, "_stage", side_effect=OSError("disk full")):
+            await manager.wait([manager.schedule(b"b" * 50, "text/plain")])
+
+        assert backend.used_bytes == 100
+        assert backend.admits(50)
+
+    async def test_total_limit_is_enforced_when_bytes_land(self, tmp_path):
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL, max_total_bytes=8)
+        await _store(backend, b"12345")
+
+        with pytest.raises(FileStorageLimitError):
+            await _store(backend, b"67890")
+        # A duplicate costs nothing and still fits.
+        await _store(backend, b"12345")
+        assert backend.used_bytes == 5
+
+    async def test_refused_part_is_left_inline(self, tmp_path):
+        manager = FileUploadManager(FilesystemFileStorageBackend(tmp_path, BASE_URL, max_file_bytes=4))
+        message = Message(
+            message_id="m1", role=Role.ROLE_USER, context_id="ctx-1",
+            parts=[Part(raw=b"too large", media_type="text/plain")],
+        )
+
+        result = await A2AFileTransformer(manager).transform_message(message, wait_upload=True)
+
+        assert result.parts[0].raw == b"too large"
+
+    def test_from_settings_builds_urls_on_the_public_url(self, tmp_path):
+        with patch.multiple(
+            "aion.server.settings.app_settings",
+            file_storage_backend="filesystem",
+            file_storage_path=str(tmp_path),
+            file_storage_public_url=BASE_URL,
+        ):
+            manager = FileUploadManager.from_settings()
+
+        _, uri = manager.backend.generate_uri()
+        assert uri.startswith(f"{BASE_URL}/files/")
+
+    def test_from_settings_requires_a_public_url(self, tmp_path):
+        with patch.multiple(
+            "aion.server.settings.app_settings",
+            file_storage_backend="filesystem",
+            file_storage_path=str(tmp_path),
+            file_storage_public_url=None,
+        ):
+            with pytest.raises(ValueError, match="FILE_STORAGE_PUBLIC_URL"):
+                FileUploadManager.from_settings()
+
+
+class TestRoute:
+    async def _client(self, tmp_path, data: bytes) -> tuple[TestClient, str]:
+        backend = FilesystemFileStorageBackend(tmp_path, BASE_URL)
+        uri = await _store(backend, data)
+        app = FastAPI()
+        app.router.routes.extend(create_file_routes(backend))
+        return TestClient(app), f"/files/{_path(uri)}"
+
+    async def test_serves_the_whole_file(self, tmp_path):
+        client, path = await self._client(tmp_path, b"0123456789")
+
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["accept-ranges"] == "bytes"
+
+    async def test_serves_a_byte_range(self, tmp_path):
+        client, path = await self._client(tmp_path, b"0123456789")
+
+        response = client.get(path, headers={"range": "bytes=2-5"})
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+
+    async def test_unknown_file_is_not_found(self, tmp_path):
+        client, _ = await self._client(tmp_path, b"data")
+
+        assert client.get("/files/ctx-1/missing.png").status_code == 404
+        assert client.get("/files/../objects").status_code == 404
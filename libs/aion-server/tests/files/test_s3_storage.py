@@ -0,0 +1,190 @@
+"""Tests for S3FileStorageBackend against an in-process S3 server.
+
+Skipped unless the 's3' extra and moto's server are installed.
+
+Focus areas:
+    - A small file is stored with one request and served by its pre-signed URL
+    - A large file is uploaded in parts and arrives intact
+    - A failed multipart upload is aborted, leaving no parts behind
+    - delete removes the object stored for a file id
+    - A public URL replaces signing
+    - A part size S3 would refuse is rejected up front
+    - Signing credentials are resolved and refreshed off the event loop
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import httpx
+import pytest
+
+pytest.importorskip("aiobotocore")
+moto_server = pytest.importorskip("moto.server")
+
+from botocore.credentials import RefreshableCredentials  # noqa: E402
+from botocore.session import Session  # noqa: E402
+
+from aion.server.files.storage.backends.s3 import (  # noqa: E402
+    MIN_PART_SIZE,
+    S3FileStorageBackend,
+    _SigningCredentials,
+)
+
+
+@pytest.fixture(scope="module")
+def endpoint_url():
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture
+async def backend(endpoint_url):
+    """A backend on a bucket of its own, with the smallest parts S3 allows."""
+    backend = S3FileStorageBackend(
+        f"bucket-{uuid4().hex[:12]}",
+        endpoint_url=endpoint_url,
+        multipart_threshold=MIN_PART_SIZE,
+        part_size=MIN_PART_SIZE,
+        part_concurrency=2,
+    )
+    await backend.start()
+    client = await backend._get_client()
+    await client.create_bucket(Bucket=backend._bucket)
+    yield backend
+    await backend.aclose()
+
+
+async def _store(backend, data: bytes, mime_type="image/png", context_id="ctx-1") -> tuple[str, str]:
+    file_id, uri = backend.generate_uri(mime_type=mime_type, context_id=context_id)
+    await backend.upload(file_id, data, mime_type, context_id=context_id)
+    return file_id, uri
+
+
+async def _objects(backend) -> list[dict]:
+    client = await backend._get_client()
+    return (await client.list_objects_v2(Bucket=backend._bucket)).get("Contents", [])
+
+
+async def test_small_file_is_served_by_its_presigned_url(backend):
+    _, uri = await _store(backend, b"png bytes")
+
+    async with httpx.AsyncClient() as http:
+        response = await http.get(uri)
+
+    assert "X-Amz-Signature=" in uri
+    assert response.status_code == 200
+    assert response.content == b"png bytes"
+    assert response.headers["content-type"] == "image/png"
+
+
+async def test_large_file_is_uploaded_in_parts(backend):
+    data = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256) + b"tail"
+
+    await _store(backend, data)
+
+    [stored] = await _objects(backend)
+    client = await backend._get_client()
+    response = await client.get_object(Bucket=backend._bucket, Key=stored["Key"])
+    async with response["Body"] as body:
+        assert await body.read() == data
+    # A multipart object's ETag carries its part count.
+    assert stored["ETag"].strip('"').endswith("-3")
+
+
+async def test_failed_multipart_upload_is_aborted(backend, monkeypatch):
+    client = await backend._get_client()
+    upload_part = client.upload_part
+
+    async def fail_second_part(**kwargs):
+        if kwargs["PartNumber"] == 2:
+            raise ConnectionError("reset")
+        return await upload_part(**kwargs)
+
+    monkeypatch.setattr(client, "upload_part", fail_second_part)
+
+    with pytest.raises(ConnectionError):
+        await _store(backend, b"x" * (MIN_PART_SIZE * 2))
+
+    uploads = await client.list_multipart_uploads(Bucket=backend._bucket)
+    assert uploads.get("Uploads", []) == []
+    assert await _objects(backend) == []
+
+
+async def test_delete_removes_the_object(backend):
+    file_id, _ = await _store(backend, b"data")
+
+    await backend.delete(file_id, context_id="ctx-1")
+
+    assert await _objects(backend) == []
+
+
+def test_public_url_replaces_signing(endpoint_url):
+    backend = S3FileStorageBackend(
+        "bucket", prefix="files/", endpoint_url=endpoint_url, public_url="https://cdn.example.com/",
+    )
+
+    file_id, uri = backend.generate_uri(mime_type="image/png", context_id="ctx 1")
+
+    assert uri == f"https://cdn.example.com/files/ctx%201/{file_id}.png"
+
+
+def test_part_size_below_the_s3_minimum_is_rejected():
+    with pytest.raises(ValueError):
+        S3FileStorageBackend("bucket", part_size=MIN_PART_SIZE - 1)
+
+
+async def test_start_resolves_signing_credentials_off_the_loop(endpoint_url, monkeypatch):
+    resolved_on = []
+    get_credentials = Session.get_credentials
+
+    def record_thread(session):
+        resolved_on.append(threading.get_ident())
+        return get_credentials(session)
+
+    monkeypatch.setattr(Session, "get_credentials", record_thread)
+    backend = S3FileStorageBackend("bucket", endpoint_url=endpoint_url)
+
+    await backend.start()
+    _, uri = backend.generate_uri(mime_type="image/png")
+
+    assert "X-Amz-Signature=" in uri
+    assert resolved_on
+    assert threading.get_ident() not in resolved_on
+
+
+async def test_expiring_signing_credentials_are_refreshed_off_the_loop():
+    fetched_on = []
+
+    def fetch():
+        fetched_on.append(threading.get_ident())
+        expiry = datetime.now(timezone.utc) + timedelta(minutes=1)
+        return {
+            "access_key": f"key-{len(fetched_on)}",
+            "secret_key": "secret",
+            "token": "token",
+            "expiry_time": expiry.isoformat(),
+        }
+
+    source = RefreshableCredentials.create_from_metadata(fetch(), fetch, method="test")
+    credentials = await asyncio.to_thread(_SigningCredentials, source)
+    signed_with = credentials.access_key
+    fetched_on.clear()
+
+    credentials.refresh_if_needed()
+    await credentials._refresh
+
+    assert fetched_on
+    assert threading.get_ident() not in fetched_on
+    assert credentials.access_key != signed_with
@@ -36,6 +36,8 @@ Focus areas:
     - Enriches record with execution scope context
     - Populates aion_version_id from scope or falls back to app_settings
     - Handles exceptions gracefully
+    - Resolves only the fields a formatter reads, once each
+    - Captures the context once for a record passed to several handlers
 """
 
 import json
@@ -96,6 +98,24 @@ class TestAionLogRecord:
         for field in context_fields:
             assert getattr(rec, field) is None, f"{field} should be None"
 
+    @pytest.mark.parametrize("fmt, style", [
+        ("%(task_id)s %(trace_id)s %(message)s", "%"),
+        ("{task_id} {trace_id} {message}", "{"),
+        ("$task_id $trace_id $message", "$"),
+    ])
+    def test_a_plain_formatter_reads_context_fields(self, fmt, style):
+        """Formatters read fields from the record's __dict__, not as attributes."""
+        rec = _make_log_record()
+
+        assert logging.Formatter(fmt, style=style).format(rec) == "None None test message"
+
+    def test_a_field_set_on_the_record_is_formatted(self):
+        rec = _make_log_record()
+        rec.task_id = "explicit"
+
+        assert logging.Formatter("%(task_id)s").format(rec) == "explicit"
+
+
 class TestAionLogger:
     def _logger(self, name: str = "test_logger") -> AionLogger:
         logging.setLoggerClass(AionLogger)
@@ -396,11 +416,10 @@ class TestServerAionContextFilter:
         mock_scope.inbound.aion.version_id = None  # scope has no version
 
         with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
-            with patch("aion.server.settings.app_settings") as mock_settings:
-                mock_settings.version_id = "v9.9.9"
-                filter_obj.filter(rec)
-
-        assert rec.aion_version_id == "v9.9.9"
+            filter_obj.filter(rec)
+        with patch("aion.server.settings.app_settings") as mock_settings:
+            mock_settings.version_id = "v9.9.9"
+            assert rec.aion_version_id == "v9.9.9"
 
     def test_exception_in_scope_enrichment_handled_gracefully(self):
         """Exceptions during scope enrichment are caught and ignored."""
@@ -415,6 +434,133 @@ class TestServerAionContextFilter:
         # Record should have None values (not enriched)
         assert rec.trace_id is None
 
+    def test_fields_resolve_from_the_captured_scope_when_read(self):
+        """Fields are read from the scope the record was logged under, and only when read."""
+        filter_obj = self._filter()
+        rec = _make_log_record()
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "task-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        assert "task_id" not in rec.__dict__
+        assert rec.task_id == "task-1"
+        mock_scope.inbound.trace.baggage.copy.assert_not_called()
+
+    def test_a_field_is_resolved_once(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.trace.baggage = {"aion.sender.id": "user-1"}
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        assert rec.trace_baggage is rec.trace_baggage
+        assert rec.trace_baggage == {"aion.sender.id": "user-1"}
+
+    def test_a_value_set_on_the_record_wins(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+        rec.task_id = "explicit"
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "from-scope"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        assert rec.task_id == "explicit"
+
+    def test_context_is_captured_once_across_handlers(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=None) as get_scope:
+            filter_obj.filter(rec)
+            self._filter().filter(rec)
+
+        get_scope.assert_called_once()
+
+    def test_a_plain_formatter_prints_fields_of_the_captured_context(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "task-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        assert logging.Formatter("%(task_id)s %(message)s").format(rec) == "task-1 test message"
+
+    def test_a_context_captured_after_formatting_replaces_the_written_fields(self):
+        """A handler without the filter may format the record before one with it."""
+        rec = _make_log_record()
+        formatter = logging.Formatter("%(task_id)s")
+        assert formatter.format(rec) == "None"
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "task-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            self._filter().filter(rec)
+
+        assert rec.task_id == "task-1"
+        assert formatter.format(rec) == "task-1"
+
+    def test_the_stream_formatter_leaves_other_fields_unresolved(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "task-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        with patch("aion.server.agent.aion_agent.agent_manager") as mock_mgr:
+            mock_mgr.agent_id = None
+            assert "task-1" in LogStreamFormatter().format(rec)
+        mock_scope.inbound.trace.baggage.copy.assert_not_called()
+
+    def test_formatters_read_context_of_a_regular_log_record(self):
+        """Records of loggers created before AionLogger was installed are plain LogRecords."""
+        filter_obj = self._filter()
+        rec = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="x.py",
+            lineno=1, msg="hi", args=(), exc_info=None
+        )
+
+        mock_scope = MagicMock()
+        mock_scope.inbound.a2a.task_id = "task-plain"
+        mock_scope.inbound.aion.distribution_id = "dist-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=mock_scope):
+            filter_obj.filter(rec)
+
+        with patch("aion.server.agent.aion_agent.agent_manager") as mock_mgr:
+            mock_mgr.agent_id = None
+            assert "task-plain" in LogStreamFormatter().format(rec)
+        assert AionLogstashFilter().filter(rec) is True
+
+    def test_logstash_formatter_reads_every_field_from_the_context(self):
+        filter_obj = self._filter()
+        rec = _make_log_record()
+        rec.transaction_name = "explicit"
+
+        from aion.server.agent.execution.scope import AgentExecutionScope
+
+        scope = AgentExecutionScope()
+        scope.inbound.trace.baggage = {"aion.sender.id": "user-1"}
+        scope.inbound.aion.distribution_id = "dist-1"
+        with patch("aion.server.agent.execution.scope.get_execution_scope", return_value=scope):
+            filter_obj.filter(rec)
+
+        formatter = AionLogstashFormatter(client_id="c", node_name="n")
+        with patch("aion.server.logging.handlers.logstash.formatter.get_service_name", return_value="svc"):
+            data = json.loads(formatter.format(rec))
+
+        assert data["user.id"] == "user-1"
+        assert data["transaction.name"] == "explicit"
+        assert data["_tags"]["aion.distribution.id"] == "dist-1"
+
 
 class TestProcessRoleInStreamOutput:
     """aion serve interleaves three processes on one console.
@@ -0,0 +1,213 @@
+"""Tests for aion.server.metrics.
+
+Focus areas:
+  Instruments and rendering:
+    - Counters and gauges render with their labels, in the text format
+    - Histogram buckets are cumulative and end in +Inf, with count and sum
+    - Label values are escaped; families without samples are left out
+    - Labelled instruments refuse unlabelled updates and wrong label counts
+    - A registry refuses two instruments of one name
+
+  Collectors:
+    - Active tasks are read from the registry at scrape time
+    - Both database pools report in-use, idle, limit and waiting connections
+    - An uninitialized database manager reports nothing
+
+  Instrumented paths:
+    - The event pipeline counts events by type and times them
+    - Push deliveries are counted by outcome
+
+  Route:
+    - /metrics serves the registry and the route's collectors
+    - METRICS_ENABLED=false leaves the route out
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from a2a.types import TaskPushNotificationConfig, TaskState, TaskStatus, TaskStatusUpdateEvent
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aion.server.constants import METRICS_URL
+from aion.server.core.app.api.routes import AionExtraHTTPRoutes
+from aion.server.metrics import (
+    CONTENT_TYPE,
+    ActiveTasksCollector,
+    DbPoolCollector,
+    MetricsRegistry,
+    metrics_registry,
+    render_metrics,
+)
+from aion.server.metrics.instruments import EVENTS_PROCESSED, PUSH_DELIVERIES
+from aion.server.tasks import AuthenticatedPushNotificationSender
+
+
+def _render(*collectors) -> str:
+    return render_metrics(family for collector in collectors for family in collector.collect()).decode()
+
+
+def _value(instrument, *labels) -> float:
+    return instrument.labels(*labels).value
+
+
+class TestInstruments:
+    def test_counter_and_gauge_render_with_labels(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests served.", labelnames=("method",))
+        depth = registry.gauge("queue_depth", "Items queued.")
+        requests.labels("GET").inc()
+        requests.labels("GET").inc(2)
+        depth.set(4)
+        depth.dec()
+
+        assert _render(registry).splitlines() == [
+            "# HELP requests_total Requests served.",
+            "# TYPE requests_total counter",
+            'requests_total{method="GET"} 3',
+            "# HELP queue_depth Items queued.",
+            "# TYPE queue_depth gauge",
+            "queue_depth 3",
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            latency.observe(value)
+
+        lines = _render(registry).splitlines()[2:]
+        assert lines == [
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_count 4",
+            "latency_seconds_sum 3.65",
+        ]
+
+    def test_label_values_are_escaped_and_empty_families_skipped(self):
+        registry = MetricsRegistry()
+        registry.counter("unused_total", "Never incremented.", labelnames=("kind",))
+        errors = registry.counter("errors_total", "Errors.", labelnames=("message",))
+        errors.labels('say "hi"\\\n').inc()
+
+        assert _render(registry).splitlines() == [
+            "# HELP errors_total Errors.",
+            "# TYPE errors_total counter",
+            'errors_total{message="say \\"hi\\"\\\\\\n"} 1',
+        ]
+
+    def test_labelled_instruments_need_their_labels(self):
+        counter = MetricsRegistry().counter("events_total", "Events.", labelnames=("event",))
+
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+
+    def test_names_are_unique_per_registry(self):
+        registry = MetricsRegistry()
+        registry.counter("events_total", "Events.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("events_total", "Events.")
+
+    def test_nothing_to_render_is_an_empty_body(self):
+        assert render_metrics([]) == b""
+
+
+class TestCollectors:
+    def test_active_tasks_are_read_at_scrape_time(self):
+        registry = SimpleNamespace(active_task_count=0)
+        collector = ActiveTasksCollector(registry)
+        registry.active_task_count = 3
+
+        assert "aion_active_tasks 3" in _render(collector)
+
+    def test_db_pools_report_saturation(self):
+        pool = MagicMock()
+        pool.get_stats.return_value = {"pool_max": 10, "pool_size": 4, "pool_available": 1, "requests_waiting": 2}
+        engine_pool = MagicMock(_max_overflow=10)
+        engine_pool.checkedout.return_value = 5
+        engine_pool.checkedin.return_value = 0
+        engine_pool.size.return_value = 5
+        db_manager = MagicMock(is_initialized=True)
+        db_manager.get_pool.return_value = pool
+        db_manager.get_engine.return_value = SimpleNamespace(pool=engine_pool)
+
+        lines = _render(DbPoolCollector(db_manager)).splitlines()
+
+        assert 'aion_db_pool_connections{pool="psycopg",state="in_use"} 3' in lines
+        assert 'aion_db_pool_connections{pool="psycopg",state="idle"} 1' in lines
+        assert 'aion_db_pool_connections{pool="sqlalchemy",state="in_use"} 5' in lines
+        assert 'aion_db_pool_max_connections{pool="psycopg"} 10' in lines
+        assert 'aion_db_pool_max_connections{pool="sqlalchemy"} 15' in lines
+        assert 'aion_db_pool_waiting_requests{pool="psycopg"} 2' in lines
+
+    def test_uninitialized_db_manager_reports_nothing(self):
+        assert _render(DbPoolCollector(MagicMock(is_initialized=False))) == ""
+
+
+class TestInstrumentedPaths:
+    async def test_event_pipeline_counts_events_by_type(self):
+        from aion.server.agent.execution.event_pipeline import AionEventPipeline
+
+        before = _value(EVENTS_PROCESSED, "TaskStatusUpdateEvent")
+        pipeline = AionEventPipeline(event_queue=AsyncMock(), task_updater=AsyncMock(), task_started=True)
+        event = TaskStatusUpdateEvent(
+            task_id="task-1", context_id="ctx-1", status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+        )
+        with patch("aion.server.agent.execution.event_pipeline.exec_scope_get_task_manager", return_value=None):
+            await pipeline.process(event)
+
+        assert _value(EVENTS_PROCESSED, "TaskStatusUpdateEvent") == before + 1
+        assert "aion_event_processing_seconds_count" in _render(metrics_registry)
+
+    @pytest.mark.parametrize(
+        "response, outcome",
+        [
+            (httpx.Response(200), "delivered"),
+            (httpx.Response(401), "rejected"),
+            (httpx.TimeoutException("slow"), "timeout"),
+        ],
+    )
+    async def test_push_deliveries_are_counted_by_outcome(self, response, outcome):
+        def respond(request):
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        before = _value(PUSH_DELIVERIES, outcome)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        sender = AuthenticatedPushNotificationSender(httpx_client=client, config_store=AsyncMock())
+        event = TaskStatusUpdateEvent(task_id="task-1", status=TaskStatus(state=TaskState.TASK_STATE_WORKING))
+
+        await sender._dispatch_notification(event, TaskPushNotificationConfig(url="http://receiver/hook"), "task-1")
+
+        assert _value(PUSH_DELIVERIES, outcome) == before + 1
+
+
+class TestMetricsRoute:
+    def _app(self, collectors=()) -> FastAPI:
+        agent = SimpleNamespace(config=SimpleNamespace(configuration={}))
+        app = FastAPI()
+        AionExtraHTTPRoutes(agent, metrics_collectors=collectors).register(app)
+        return app
+
+    def test_serves_the_registry_and_collectors(self):
+        collector = ActiveTasksCollector(SimpleNamespace(active_task_count=2))
+
+        response = TestClient(self._app([collector])).get(METRICS_URL)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "# TYPE aion_tasks_started_total counter" in response.text
+        assert "aion_active_tasks 2" in response.text
+
+    def test_can_be_disabled(self):
+        with patch("aion.server.core.app.api.routes.app_settings.metrics_enabled", False):
+            response = TestClient(self._app()).get(METRICS_URL)
+
+        assert response.status_code == 404
@@ -0,0 +1,180 @@
+"""Tests for aion.server.opentelemetry.stages.
+
+Focus areas:
+  stage_span():
+    - Records task id, context id and extra attributes, skipping None values
+    - Nests under the current span
+    - Marks the span failed and re-raises when the block raises
+    - Sets no attributes on an unsampled trace
+
+  traced_stream():
+    - Spans the whole stream and counts its items
+    - Work done by the stream nests under its span, the consumer's does not
+    - A span the stream keeps current across its yields stays the parent
+    - Returns the stream itself on an unsampled trace
+    - Closing it early closes the wrapped stream, without failing the span
+
+  Request stages:
+    - Building a request context spans the interrupted-task discovery
+"""
+
+from unittest.mock import patch
+
+import pytest
+from a2a.server.context import ServerCallContext
+from a2a.types import Task, TaskState, TaskStatus
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.trace import StatusCode
+
+from aion.server.agent.execution.request_context_builder import AionRequestContextBuilder
+from aion.server.opentelemetry.stages import stage_span, traced_stream
+from aion.server.tasks.stores import InMemoryTaskStore
+
+
+@pytest.fixture
+def exporter():
+    """Routes stage spans to an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("aion.server.opentelemetry.stages._tracer", provider.get_tracer("test")):
+        yield exporter
+
+
+@pytest.fixture
+def unsampled():
+    provider = TracerProvider(sampler=ALWAYS_OFF)
+    with patch("aion.server.opentelemetry.stages._tracer", provider.get_tracer("test")):
+        yield
+
+
+def _spans(exporter) -> dict:
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+async def _numbers(count: int, log: list):
+    try:
+        for number in range(count):
+            with stage_span("aion.test.produce"):
+                pass
+            yield number
+    finally:
+        log.append("closed")
+
+
+class TestStageSpan:
+    def test_records_ids_and_attributes(self, exporter):
+        with stage_span("aion.test", task_id="task-1", context_id="ctx-1", attributes={"a": 1, "b": None}):
+            pass
+
+        span = _spans(exporter)["aion.test"]
+        assert dict(span.attributes) == {"a2a.task.id": "task-1", "a2a.context.id": "ctx-1", "a": 1}
+
+    def test_nests_under_the_current_span(self, exporter):
+        with stage_span("aion.outer"):
+            with stage_span("aion.inner"):
+                pass
+
+        spans = _spans(exporter)
+        assert spans["aion.inner"].parent.span_id == spans["aion.outer"].context.span_id
+
+    def test_marks_span_failed_and_reraises(self, exporter):
+        with pytest.raises(ValueError):
+            with stage_span("aion.test"):
+                raise ValueError("boom")
+
+        span = _spans(exporter)["aion.test"]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[0].name == "exception"
+
+    def test_unsampled_trace_gets_no_attributes(self, unsampled):
+        with stage_span("aion.test", task_id="task-1") as span:
+            assert not span.is_recording()
+
+
+class TestTracedStream:
+    async def test_spans_the_stream_and_counts_items(self, exporter):
+        log = []
+        stream = traced_stream("aion.test.stream", _numbers(3, log), task_id="task-1")
+
+        with stage_span("aion.consume"):
+            items = [item async for item in stream]
+
+        assert items == [0, 1, 2]
+        spans = _spans(exporter)
+        assert spans["aion.test.stream"].attributes["aion.stream.items"] == 3
+        assert spans["aion.test.stream"].attributes["a2a.task.id"] == "task-1"
+        assert spans["aion.test.stream"].events[0].name == "first_item"
+
+    async def test_only_the_streams_own_work_nests_under_it(self, exporter):
+        async for _ in traced_stream("aion.test.stream", _numbers(1, [])):
+            with stage_span("aion.test.consume"):
+                pass
+
+        produced = [span for span in exporter.get_finished_spans() if span.name == "aion.test.produce"]
+        consumed = _spans(exporter)["aion.test.consume"]
+        stream_span = _spans(exporter)["aion.test.stream"]
+        assert produced[0].parent.span_id == stream_span.context.span_id
+        assert consumed.parent is None
+
+    async def test_a_span_held_across_yields_stays_the_parent(self, exporter):
+        """A framework's span around a whole invocation parents every call in it."""
+        async def invocation():
+            with stage_span("aion.test.invocation"):
+                for _ in range(2):
+                    with stage_span("aion.test.llm"):
+                        pass
+                    yield
+
+        async for _ in traced_stream("aion.test.stream", invocation()):
+            pass
+
+        invocation_span = _spans(exporter)["aion.test.invocation"]
+        calls = [span for span in exporter.get_finished_spans() if span.name == "aion.test.llm"]
+        assert len(calls) == 2
+        assert all(call.parent.span_id == invocation_span.context.span_id for call in calls)
+        assert invocation_span.parent.span_id == _spans(exporter)["aion.test.stream"].context.span_id
+
+    async def test_unsampled_trace_returns_the_stream_itself(self, unsampled):
+        stream = _numbers(1, [])
+        assert traced_stream("aion.test.stream", stream) is stream
+
+    async def test_closing_early_closes_the_wrapped_stream(self, exporter):
+        log = []
+        stream = traced_stream("aion.test.stream", _numbers(5, log))
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert log == ["closed"]
+        span = _spans(exporter)["aion.test.stream"]
+        assert span.attributes["aion.stream.items"] == 1
+        assert span.status.status_code != StatusCode.ERROR
+
+    async def test_a_failing_stream_fails_its_span(self, exporter):
+        async def failing():
+            yield 1
+            raise RuntimeError("model unavailable")
+
+        with pytest.raises(RuntimeError):
+            async for _ in traced_stream("aion.test.stream", failing()):
+                pass
+
+        assert _spans(exporter)["aion.test.stream"].status.status_code == StatusCode.ERROR
+
+
+class TestRequestStages:
+    async def test_context_build_spans_interrupted_task_discovery(self, exporter):
+        store = InMemoryTaskStore()
+        task = Task(id="task-1", context_id="ctx-1", status=TaskStatus(state=TaskState.TASK_STATE_INPUT_REQUIRED))
+        await store.save(task, ServerCallContext())
+
+        await AionRequestContextBuilder(task_store=store).build(ServerCallContext(), context_id="ctx-1")
+
+        spans = _spans(exporter)
+        build = spans["aion.request_context.build"]
+        assert build.attributes["a2a.task.id"] == "task-1"
+        assert spans["aion.task.discover_interrupted"].parent.span_id == build.context.span_id
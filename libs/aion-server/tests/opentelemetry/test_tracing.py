@@ -24,9 +24,12 @@ Focus areas:
     - Hex string span_id is converted correctly
     - Invalid hex span_id falls back to INVALID_SPAN_ID (logs warning)
     - Unexpected exception during SpanContext construction returns None
+    - Inbound trace flags decide whether the continued trace is sampled
 
   init_tracing():
     - Sets a TracerProvider on global trace module
+    - Samples new traces at TRACE_SAMPLE_RATIO
+    - Exports sampled spans in batches only when an endpoint is set
 """
 
 from unittest.mock import MagicMock, patch, call
@@ -36,6 +39,10 @@ from opentelemetry import trace as otel_trace
 from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
 from opentelemetry.trace import INVALID_SPAN_ID, NonRecordingSpan, SpanContext, TraceFlags
 
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from aion.server.settings import AppSettings
 from aion.server.opentelemetry.tracing import (
     SpanInfo,
     generate_request_span_context,
@@ -279,6 +286,21 @@ class TestGenerateRequestSpanContext:
         assert span is not None
 
 
+    @pytest.mark.parametrize("flags, sampled", [("01", True), ("00", False), (None, True), ("zz", True)])
+    def test_inbound_trace_flags_decide_sampling(self, flags, sampled):
+        """A caller's unsampled trace stays unsampled, whatever the local ratio."""
+        with self._patch_logger():
+            ctx = generate_request_span_context(
+                trace_id=0x0102030405060708090a0b0c0d0e0f10,
+                span_id=0x0102030405060708,
+                trace_flags=flags,
+            )
+        provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(1.0)))
+        span = provider.get_tracer("test").start_span("request", context=ctx)
+        assert span.get_span_context().trace_flags.sampled is sampled
+        assert span.is_recording() is sampled
+
+
 class TestInitTracing:
     def test_sets_tracer_provider(self):
         """Verify that sets tracer provider."""
@@ -288,3 +310,37 @@ class TestInitTracing:
             # Argument should be a TracerProvider instance
             args = mock_trace.set_tracer_provider.call_args[0]
             assert isinstance(args[0], TracerProvider)
+
+    def _provider(self, **settings) -> TracerProvider:
+        with patch("aion.server.opentelemetry.tracing.trace") as mock_trace:
+            provider = init_tracing(AppSettings(**settings))
+        assert mock_trace.set_tracer_provider.call_args[0][0] is provider
+        return provider
+
+    def test_new_traces_sampled_at_ratio(self):
+        tracer = self._provider(TRACE_SAMPLE_RATIO=0).get_tracer("test")
+        assert not tracer.start_span("request").is_recording()
+
+        tracer = self._provider(TRACE_SAMPLE_RATIO=1).get_tracer("test")
+        assert tracer.start_span("request").is_recording()
+
+    def test_no_export_without_endpoint(self):
+        with patch("aion.server.opentelemetry.tracing._build_span_exporter") as build:
+            self._provider()
+        build.assert_not_called()
+
+    def test_sampled_spans_exported_in_batches(self):
+        exporter = InMemorySpanExporter()
+        with patch("aion.server.opentelemetry.tracing._build_span_exporter", return_value=exporter):
+            provider = self._provider(
+                TRACE_EXPORT_ENDPOINT="http://collector:4318/v1/traces",
+                TRACE_EXPORT_MAX_QUEUE_SIZE=10,
+                TRACE_EXPORT_MAX_BATCH_SIZE=5,
+            )
+        tracer = provider.get_tracer("test")
+        for index in range(3):
+            tracer.start_span(f"span-{index}").end()
+
+        assert exporter.get_finished_spans() == ()
+        provider.shutdown()
+        assert [span.name for span in exporter.get_finished_spans()] == ["span-0", "span-1", "span-2"]
@@ -0,0 +1,383 @@
+"""Tests for :class:`InMemoryTaskStore`.
+
+Focus areas:
+  - Context heads: the most recently created task of each context is tracked
+    as tasks are saved and deleted, so head lookups never scan the store.
+  - Context ids: offset pages follow each context's newest task, moving a
+    context back when that task is deleted.
+  - Context summaries: cursor pages follow last activity, and a cursor stays
+    valid while contexts keep moving.
+  - Context messages: windows walk conversation messages across task
+    boundaries in both directions, skipping typed non-message entries.
+  - Secondary indexes: context, state and timestamp lookups answer exactly
+    what a scan of every task would, including after a task is mutated in
+    place and saved again.
+"""
+
+import random
+
+import pytest
+from a2a.auth.user import User
+from a2a.server.context import ServerCallContext
+from a2a.types import Artifact, Message, Part, Role, Task, TaskState, TaskStatus, a2a_pb2
+from a2a.utils.errors import InvalidParamsError
+from a2a.utils.task import encode_page_token
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from aion.core.a2a.enums import A2AMetadataKey
+from aion.server.a2a.constants import ACTIVE_TASK_STATES
+from aion.server.tasks.stores import ContextHead, InMemoryTaskStore
+
+CALL_CONTEXT = ServerCallContext()
+
+
+def _make_task(
+        task_id: str,
+        context_id: str = "ctx-1",
+        state=TaskState.TASK_STATE_WORKING,
+        seconds: int | None = None,
+) -> Task:
+    task = Task(id=task_id, context_id=context_id, status=TaskStatus(state=state))
+    if seconds is not None:
+        task.status.timestamp.CopyFrom(Timestamp(seconds=seconds))
+    return task
+
+
+class _NamedUser(User):
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    @property
+    def user_name(self) -> str:
+        return self._name
+
+
+async def _list_all(store: InMemoryTaskStore, page_size: int, **filters) -> list[str]:
+    """Walk every page of a listing and return the task ids in order."""
+    ids, token = [], ""
+    while True:
+        response = await store.list(
+            a2a_pb2.ListTasksRequest(page_size=page_size, page_token=token, **filters),
+            CALL_CONTEXT,
+        )
+        ids.extend(task.id for task in response.tasks)
+        token = response.next_page_token
+        if not token:
+            return ids
+
+
+class TestContextHead:
+    async def test_empty_context_has_no_head(self):
+        store = InMemoryTaskStore()
+
+        assert await store.get_context_head("ctx-1") is None
+        assert await store.get_context_last_task("ctx-1") is None
+
+    async def test_the_newest_task_becomes_the_head(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-2"), CALL_CONTEXT)
+        await store.save(_make_task("task-3", context_id="ctx-2"), CALL_CONTEXT)
+
+        assert await store.get_context_head("ctx-1") == ContextHead(
+            task_id="task-2", state=TaskState.TASK_STATE_WORKING
+        )
+        assert (await store.get_context_last_task("ctx-2")).id == "task-3"
+
+    async def test_updating_the_head_refreshes_its_state(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-1", state=TaskState.TASK_STATE_INPUT_REQUIRED), CALL_CONTEXT)
+
+        head = await store.get_context_head("ctx-1")
+        assert head.state == TaskState.TASK_STATE_INPUT_REQUIRED
+
+    async def test_updating_an_older_task_leaves_the_head(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-2"), CALL_CONTEXT)
+        await store.save(_make_task("task-1", state=TaskState.TASK_STATE_COMPLETED), CALL_CONTEXT)
+
+        assert (await store.get_context_head("ctx-1")).task_id == "task-2"
+
+    async def test_deleting_the_head_falls_back_to_the_previous_task(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-2"), CALL_CONTEXT)
+
+        await store.delete("task-2", CALL_CONTEXT)
+        assert (await store.get_context_head("ctx-1")).task_id == "task-1"
+
+        await store.delete("task-1", CALL_CONTEXT)
+        assert await store.get_context_head("ctx-1") is None
+
+    async def test_interrupted_task_is_found_only_at_the_head(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1", state=TaskState.TASK_STATE_INPUT_REQUIRED), CALL_CONTEXT)
+
+        assert (await store.get_context_interrupted_task("ctx-1")).id == "task-1"
+
+        await store.save(_make_task("task-2", state=TaskState.TASK_STATE_COMPLETED), CALL_CONTEXT)
+        assert await store.get_context_interrupted_task("ctx-1") is None
+
+
+class TestList:
+    async def test_newest_status_first_and_unstamped_last(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("unstamped"), CALL_CONTEXT)
+        await store.save(_make_task("old", seconds=100), CALL_CONTEXT)
+        await store.save(_make_task("new", seconds=300), CALL_CONTEXT)
+        await store.save(_make_task("mid", seconds=200), CALL_CONTEXT)
+
+        assert await _list_all(store, page_size=2) == ["new", "mid", "old", "unstamped"]
+
+    async def test_timestamp_filter_is_inclusive(self):
+        store = InMemoryTaskStore()
+        for index, seconds in enumerate([100, 200, 300]):
+            await store.save(_make_task(f"task-{index}", seconds=seconds), CALL_CONTEXT)
+        await store.save(_make_task("unstamped"), CALL_CONTEXT)
+
+        response = await store.list(
+            a2a_pb2.ListTasksRequest(status_timestamp_after=Timestamp(seconds=200)),
+            CALL_CONTEXT,
+        )
+
+        assert [task.id for task in response.tasks] == ["task-2", "task-1"]
+        assert response.total_size == 2
+
+    async def test_a_token_outside_the_filtered_set_is_rejected(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1", context_id="ctx-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-2", context_id="ctx-2"), CALL_CONTEXT)
+
+        with pytest.raises(InvalidParamsError):
+            await store.list(
+                a2a_pb2.ListTasksRequest(context_id="ctx-1", page_token=encode_page_token("task-2")),
+                CALL_CONTEXT,
+            )
+
+    async def test_other_owners_tasks_are_not_listed(self):
+        store = InMemoryTaskStore()
+        other = ServerCallContext(user=_NamedUser("someone-else"))
+        await store.save(_make_task("mine", seconds=1), CALL_CONTEXT)
+        await store.save(_make_task("theirs", seconds=2), other)
+
+        assert await _list_all(store, page_size=10) == ["mine"]
+        assert await _list_all(store, page_size=10, context_id="ctx-1") == ["mine"]
+
+
+class TestContextIds:
+    async def test_contexts_follow_their_newest_task(self):
+        store = InMemoryTaskStore()
+        for task_id, context_id in (("t1", "A"), ("t3", "B"), ("t5", "A")):
+            await store.save(_make_task(task_id, context_id=context_id), CALL_CONTEXT)
+        # Activity alone does not move a context.
+        await store.save(_make_task("t3", context_id="B", state=TaskState.TASK_STATE_COMPLETED), CALL_CONTEXT)
+        assert await store.get_context_ids() == ["A", "B"]
+
+        await store.delete("t5", CALL_CONTEXT)
+
+        assert await store.get_context_ids() == ["B", "A"]
+
+        await store.delete("t1", CALL_CONTEXT)
+
+        assert await store.get_context_ids() == ["B"]
+
+
+class TestContextSummaries:
+    async def test_summaries_follow_last_activity(self):
+        store = InMemoryTaskStore()
+        await store.save(_make_task("task-1", context_id="ctx-1"), CALL_CONTEXT)
+        await store.save(_make_task("task-2", context_id="ctx-2"), CALL_CONTEXT)
+        await store.save(
+            _make_task("task-3", context_id="ctx-1", state=TaskState.TASK_STATE_INPUT_REQUIRED),
+            CALL_CONTEXT,
+        )
+
+        page = await store.get_context_summaries(page_size=10)
+
+        assert [summary.context_id for summary in page.contexts] == ["ctx-1", "ctx-2"]
+        assert page.contexts[0].task_count == 2
+        assert page.contexts[0].state == TaskState.TASK_STATE_INPUT_REQUIRED
+        assert page.next_cursor is None
+
+    async def test_a_cursor_survives_contexts_becoming_active(self):
+        store = InMemoryTaskStore()
+        for index in range(4):
+            await store.save(_make_task(f"task-{index}", context_id=f"ctx-{index}"), CALL_CONTEXT)
+
+        first = await store.get_context_summaries(page_size=2)
+        assert [summary.context_id for summary in first.contexts] == ["ctx-3", "ctx-2"]
+
+        # ctx-0 jumps to the front; the next page carries on where the first ended.
+        await store.save(_make_task("task-0", context_id="ctx-0"), CALL_CONTEXT)
+        second = await store.get_context_summaries(page_size=2, cursor=first.next_cursor)
+
+        assert [summary.context_id for summary in second.contexts] == ["ctx-1"]
+        assert second.next_cursor is None
+
+    async def test_a_foreign_cursor_is_rejected(self):
+        store = InMemoryTaskStore()
+
+        with pytest.raises(InvalidParamsError):
+            await store.get_context_summaries(page_size=2, cursor=encode_page_token("not-a-sequence"))
+
+
+def _message(text: str, message_type: str | None = None) -> Message:
+    message = Message(message_id=text, role=Role.ROLE_USER, parts=[Part(text=text)])
+    if message_type is not None:
+        message.metadata.update({A2AMetadataKey.MESSAGE_TYPE.value: message_type})
+    return message
+
+
+def _conversation_task(task_id: str, *texts: str, reply: str | None = None) -> Task:
+    task = _make_task(task_id)
+    task.history.extend(_message(text) for text in texts)
+    if reply is not None:
+        task.status.message.CopyFrom(_message(reply))
+    return task
+
+
+async def _texts(store: InMemoryTaskStore, **kwargs) -> list[str]:
+    return [item.message.message_id async for item in store.iter_context_messages("ctx-1", **kwargs)]
+
+
+class TestContextMessages:
+    @pytest.fixture
+    async def store(self):
+        store = InMemoryTaskStore()
+        first = _conversation_task("task-1", "m1", reply="m2")
+        first.history.append(_message("event", message_type="aion:event"))
+        await store.save(first, CALL_CONTEXT)
+        await store.save(_make_task("task-empty"), CALL_CONTEXT)
+        await store.save(_conversation_task("task-2", "m3", "m4", reply="m5"), CALL_CONTEXT)
+        return store
+
+    async def test_messages_come_newest_first_without_events(self, store):
+        assert await _texts(store) == ["m5", "m4", "m3", "m2", "m1"]
+
+    async def test_before_and_after_continue_across_tasks(self, store):
+        window = [item async for item in store.iter_context_messages("ctx-1", limit=2)]
+        assert [item.message.message_id for item in window] == ["m5", "m4"]
+        assert [item.task_id for item in window] == ["task-2", "task-2"]
+
+        assert await _texts(store, before=window[-1].cursor, limit=2) == ["m3", "m2"]
+        assert await _texts(store, after=window[-1].cursor) == ["m5"]
+
+        oldest = [item async for item in store.iter_context_messages("ctx-1")][-1]
+        assert await _texts(store, after=oldest.cursor, limit=3) == ["m2", "m3", "m4"]
+
+    async def test_a_foreign_cursor_is_rejected(self, store):
+        with pytest.raises(InvalidParamsError):
+            await _texts(store, before=encode_page_token("not-json"))
+        with pytest.raises(InvalidParamsError):
+            await _texts(store, before=encode_page_token('["unknown-task", 0]'))
+
+    async def test_task_artifacts_are_read_by_id(self, store):
+        task = await store.get("task-2", CALL_CONTEXT)
+        task.artifacts.append(Artifact(artifact_id="a1", parts=[Part(text="out")]))
+        await store.save(task, CALL_CONTEXT)
+
+        artifacts = await store.get_task_artifacts(["task-1", "task-2", "missing"])
+
+        assert list(artifacts) == ["task-2"]
+        assert artifacts["task-2"][0].artifact_id == "a1"
+
+
+class TestIndexesMatchAScan:
+    """Random saves, in-place updates and deletes, checked against brute force."""
+
+    @staticmethod
+    def _expected_listing(tasks: dict[str, Task], **filters) -> list[str]:
+        matching = [
+            task for task in tasks.values()
+            if task.context_id == filters.get("context_id", task.context_id)
+            and task.status.state == filters.get("status", task.status.state)
+        ]
+        matching.sort(
+            key=lambda task: (
+                task.status.HasField("timestamp"),
+                task.status.timestamp.ToJsonString() if task.status.HasField("timestamp") else "",
+                task.id,
+            ),
+            reverse=True,
+        )
+        return [task.id for task in matching]
+
+    async def test_random_workload(self):
+        rng = random.Random(7)
+        states = [
+            TaskState.TASK_STATE_WORKING,
+            TaskState.TASK_STATE_INPUT_REQUIRED,
+            TaskState.TASK_STATE_COMPLETED,
+        ]
+        store = InMemoryTaskStore()
+        tasks: dict[str, Task] = {}
+        created: list[str] = []
+        activity: list[str] = []
+
+        for step in range(400):
+            action = rng.random()
+            if action < 0.5 or not tasks:
+                task = _make_task(
+                    f"task-{step:03d}",
+                    context_id=f"ctx-{rng.randrange(8)}",
+                    state=rng.choice(states),
+                    seconds=rng.choice([None, rng.randrange(50)]),
+                )
+                tasks[task.id] = task
+                created.append(task.id)
+                activity.append(task.context_id)
+                await store.save(task, CALL_CONTEXT)
+            elif action < 0.8:
+                # Mutated in place before being saved again, as TaskManager does.
+                task = tasks[rng.choice(list(tasks))]
+                task.status.state = rng.choice(states)
+                task.status.timestamp.CopyFrom(Timestamp(seconds=rng.randrange(50)))
+                activity.append(task.context_id)
+                await store.save(task, CALL_CONTEXT)
+            else:
+                task_id = rng.choice(list(tasks))
+                del tasks[task_id]
+                await store.delete(task_id, CALL_CONTEXT)
+
+        assert await _list_all(store, page_size=7) == self._expected_listing(tasks)
+        assert await _list_all(store, page_size=3, context_id="ctx-2") == (
+            self._expected_listing(tasks, context_id="ctx-2")
+        )
+        assert await _list_all(
+            store, page_size=5, status=TaskState.TASK_STATE_INPUT_REQUIRED
+        ) == self._expected_listing(tasks, status=TaskState.TASK_STATE_INPUT_REQUIRED)
+
+        newest_first = [task_id for task_id in reversed(created) if task_id in tasks]
+        context_order = list(dict.fromkeys(tasks[task_id].context_id for task_id in newest_first))
+        assert await store.get_context_ids() == context_order
+        assert await store.get_context_ids(offset=2, limit=3) == context_order[2:5]
+
+        ctx_tasks = [task_id for task_id in newest_first if tasks[task_id].context_id == "ctx-3"]
+        assert [task.id for task in await store.get_context_tasks("ctx-3", offset=1, limit=4)] == ctx_tasks[1:5]
+
+        summaries, cursor = [], None
+        while True:
+            page = await store.get_context_summaries(page_size=3, cursor=cursor)
+            summaries.extend(page.contexts)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        live_contexts = {task.context_id for task in tasks.values()}
+        activity_order = [
+            context_id for context_id in dict.fromkeys(reversed(activity))
+            if context_id in live_contexts
+        ]
+        assert [summary.context_id for summary in summaries] == activity_order
+        for summary in summaries:
+            in_context = [task_id for task_id in newest_first if tasks[task_id].context_id == summary.context_id]
+            assert summary.task_count == len(in_context)
+            assert summary.state == tasks[in_context[0]].status.state
+
+        active = {task.id for task in await store.get_active_tasks()}
+        assert active == {task.id for task in tasks.values() if task.status.state in ACTIVE_TASK_STATES}
@@ -5,16 +5,26 @@ Focus areas:
     or the write must fail — never be silently rewritten.
   - Error transparency: an empty context and an unreachable database are
     different answers, and resume auto-discovery depends on telling them apart.
+  - Context heads: finding a context's latest task, and whether it waits to
+    be resumed, reads the head record instead of the context's tasks.
+  - Context summaries: one keyset-paged read of the contexts table, with an
+    opaque cursor holding the last position.
+  - Context ids: offset pages keep the newest-task order, not activity order.
+  - Context messages: windows are streamed from the repository with a keyset
+    cursor, and only the artifacts column is read for the window's tasks.
   - Listing: ordering, the page window, and the total size are the database's
     job, so only one page is ever materialized.
+  - Task leases: renewals are one statement per process, and a claim is
+    committed before the claimed tasks are read.
 """
 
 import uuid
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from a2a.types import Task, TaskState, TaskStatus, a2a_pb2
+from a2a.types import Artifact, Message, Task, TaskState, TaskStatus, a2a_pb2
 from a2a.utils.errors import InvalidParamsError
 from a2a.utils.task import encode_page_token
 
@@ -53,7 +63,34 @@ def repository():
 
 
 @pytest.fixture
-def store(repository):
+def contexts():
+    repo = MagicMock()
+    repo.find_by_context_id = AsyncMock(return_value=None)
+    repo.find_page = AsyncMock(return_value=[])
+    repo.find_context_ids = AsyncMock(return_value=[])
+    return repo
+
+
+def _make_head(task_id: str = TASK_UUID, state: str = "TASK_STATE_WORKING"):
+    head = MagicMock()
+    head.head_task_id = uuid.UUID(task_id)
+    head.head_state = state
+    return head
+
+
+@pytest.fixture
+def leases():
+    repo = MagicMock()
+    repo.acquire = AsyncMock(return_value="token-1")
+    repo.renew = AsyncMock(return_value=[])
+    repo.release = AsyncMock()
+    repo.claim_expired = AsyncMock(return_value=[])
+    repo.lock_held = AsyncMock(return_value=True)
+    return repo
+
+
+@pytest.fixture
+def store(repository, contexts, leases):
     """A store whose session and repository are stubbed out."""
     session = MagicMock()
     session.commit = AsyncMock()
@@ -67,6 +104,12 @@ def store(repository):
     ) as manager, patch(
         "aion.server.tasks.stores.postgres_task_store.TasksRepository",
         return_value=repository,
+    ), patch(
+        "aion.server.tasks.stores.postgres_task_store.ContextsRepository",
+        return_value=contexts,
+    ), patch(
+        "aion.server.tasks.stores.postgres_task_store.TaskLeasesRepository",
+        return_value=leases,
     ):
         manager.get_session = _session
         yield PostgresTaskStore()
@@ -92,29 +135,193 @@ class TestSaveIdentity:
 
 
 class TestContextLastTask:
-    async def test_empty_context_returns_none(self, store, repository):
-        repository.find.return_value = []
+    async def test_empty_context_returns_none(self, store, repository, contexts):
+        contexts.find_by_context_id.return_value = None
+
         assert await store.get_context_last_task("ctx-1") is None
+        repository.find_by_id.assert_not_awaited()
 
-    async def test_returns_the_most_recent_task(self, store, repository):
-        repository.find.return_value = [_make_entity(TASK_UUID)]
+    async def test_loads_the_head_task_by_its_id(self, store, repository, contexts):
+        contexts.find_by_context_id.return_value = _make_head()
+        repository.find_by_id.return_value = _make_entity(TASK_UUID)
 
         task = await store.get_context_last_task("ctx-1")
 
         assert task is not None and task.id == TASK_UUID
-        assert repository.find.await_args.kwargs["pagination"].limit == 1
+        assert repository.find_by_id.await_args.args[0] == uuid.UUID(TASK_UUID)
+        repository.find.assert_not_awaited()
 
     async def test_database_failure_is_not_reported_as_an_empty_context(
-        self, store, repository
+        self, store, contexts
     ):
         """Resume auto-discovery reads this call: a swallowed connection error
         would silently start a second task over work that already exists."""
-        repository.find.side_effect = ConnectionError("database is unreachable")
+        contexts.find_by_context_id.side_effect = ConnectionError("database is unreachable")
 
         with pytest.raises(ConnectionError):
             await store.get_context_last_task("ctx-1")
 
 
+class TestContextHead:
+    async def test_head_carries_the_task_id_and_state(self, store, contexts):
+        contexts.find_by_context_id.return_value = _make_head(state="TASK_STATE_INPUT_REQUIRED")
+
+        head = await store.get_context_head("ctx-1")
+
+        assert head.task_id == TASK_UUID
+        assert head.state == TaskState.TASK_STATE_INPUT_REQUIRED
+
+    async def test_a_finished_head_never_loads_a_task(self, store, repository, contexts):
+        """The common answer for a new message - nothing to resume - costs
+        one primary-key read of the head record."""
+        contexts.find_by_context_id.return_value = _make_head(state="TASK_STATE_COMPLETED")
+
+        assert await store.get_context_interrupted_task("ctx-1") is None
+        repository.find_by_id.assert_not_awaited()
+        repository.find.assert_not_awaited()
+
+    async def test_an_interrupted_head_is_loaded(self, store, repository, contexts):
+        contexts.find_by_context_id.return_value = _make_head(state="TASK_STATE_INPUT_REQUIRED")
+        entity = _make_entity(TASK_UUID)
+        entity.to_task = MagicMock(side_effect=lambda tid: Task(
+            id=tid,
+            context_id="ctx-1",
+            status=TaskStatus(state=TaskState.TASK_STATE_INPUT_REQUIRED),
+        ))
+        repository.find_by_id.return_value = entity
+
+        task = await store.get_context_interrupted_task("ctx-1")
+
+        assert task is not None and task.id == TASK_UUID
+
+
+def _make_context_record(context_id: str, minute: int):
+    record = MagicMock()
+    record.context_id = context_id
+    record.last_activity_at = datetime(2026, 1, 1, 12, minute, tzinfo=timezone.utc)
+    record.task_count = 3
+    record.head_state = "TASK_STATE_COMPLETED"
+    return record
+
+
+class TestContextSummaries:
+    async def test_one_extra_row_decides_the_next_cursor(self, store, contexts):
+        contexts.find_page.return_value = [
+            _make_context_record("ctx-3", 3),
+            _make_context_record("ctx-2", 2),
+            _make_context_record("ctx-1", 1),
+        ]
+
+        page = await store.get_context_summaries(page_size=2)
+
+        assert contexts.find_page.await_args.kwargs == {"limit": 3, "after": None}
+        assert [summary.context_id for summary in page.contexts] == ["ctx-3", "ctx-2"]
+        assert page.contexts[0].task_count == 3
+        assert page.contexts[0].state == TaskState.TASK_STATE_COMPLETED
+        assert page.next_cursor is not None
+
+    async def test_the_cursor_resumes_after_the_last_summary(self, store, contexts):
+        contexts.find_page.return_value = [
+            _make_context_record("ctx-3", 3),
+            _make_context_record("ctx-2", 2),
+        ]
+        first = await store.get_context_summaries(page_size=1)
+
+        contexts.find_page.return_value = []
+        await store.get_context_summaries(page_size=1, cursor=first.next_cursor)
+
+        assert contexts.find_page.await_args.kwargs["after"] == (
+            datetime(2026, 1, 1, 12, 3, tzinfo=timezone.utc),
+            "ctx-3",
+        )
+
+    async def test_the_last_page_has_no_cursor(self, store, contexts):
+        contexts.find_page.return_value = [_make_context_record("ctx-1", 1)]
+
+        page = await store.get_context_summaries(page_size=5)
+
+        assert page.next_cursor is None
+
+    @pytest.mark.parametrize("cursor", ["%%%", encode_page_token("[1]"), encode_page_token("nope")])
+    async def test_an_undecodable_cursor_is_rejected(self, store, contexts, cursor):
+        with pytest.raises(InvalidParamsError):
+            await store.get_context_summaries(page_size=5, cursor=cursor)
+
+        contexts.find_page.assert_not_awaited()
+
+    async def test_context_ids_read_the_contexts_table(self, store, repository, contexts):
+        contexts.find_context_ids.return_value = ["ctx-2", "ctx-1"]
+
+        assert await store.get_context_ids(offset=1, limit=2) == ["ctx-2", "ctx-1"]
+        pagination = contexts.find_context_ids.await_args.kwargs["pagination"]
+        assert (pagination.offset, pagination.limit) == (1, 2)
+
+    async def test_context_ids_keep_their_newest_task_order(self):
+        """Offset pages order by the newest task's creation, not by last activity."""
+        from sqlalchemy.dialects import postgresql
+
+        from aion.db.postgres.repositories.contexts.repository import ContextsRepository
+        from aion.db.postgres.types import Pagination
+
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(fetchall=lambda: []))
+        await ContextsRepository(session).find_context_ids(pagination=Pagination(limit=2, offset=1))
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN tasks ON tasks.id = contexts.head_task_id" in sql
+        assert "ORDER BY tasks.created_at DESC, contexts.context_id DESC" in sql
+        assert "last_activity_at" not in sql
+
+
+def _message_rows(*positions):
+    async def stream(*args, **kwargs):
+        for created_minute, task_id, index in positions:
+            created_at = datetime(2026, 1, 1, 12, created_minute, tzinfo=timezone.utc)
+            yield (created_at, uuid.UUID(task_id), index), Message(message_id=f"{task_id[:2]}-{index}")
+    return stream
+
+
+class TestContextMessages:
+    OTHER_UUID = "1f6c6b1e-9a2a-4a1e-9b3a-1f2e3d4c5b6a"
+
+    async def test_rows_are_streamed_with_their_cursor(self, store, repository):
+        repository.stream_messages = MagicMock(
+            side_effect=_message_rows((2, self.OTHER_UUID, 1), (1, TASK_UUID, 2)))
+
+        window = [item async for item in store.iter_context_messages("ctx-1", limit=2)]
+
+        assert [item.message.message_id for item in window] == ["1f-1", "0f-2"]
+        assert [item.task_id for item in window] == [self.OTHER_UUID, TASK_UUID]
+        assert repository.stream_messages.call_args.kwargs == {"before": None, "after": None, "limit": 2}
+
+        repository.stream_messages = MagicMock(side_effect=_message_rows())
+        [item async for item in store.iter_context_messages("ctx-1", before=window[-1].cursor)]
+
+        assert repository.stream_messages.call_args.kwargs["before"] == (
+            datetime(2026, 1, 1, 12, 1, tzinfo=timezone.utc),
+            uuid.UUID(TASK_UUID),
+            2,
+        )
+
+    @pytest.mark.parametrize("cursor", ["%%%", encode_page_token('["x", "y", 1]'), encode_page_token("[1]")])
+    async def test_an_undecodable_cursor_is_rejected(self, store, repository, cursor):
+        repository.stream_messages = MagicMock(side_effect=_message_rows())
+
+        with pytest.raises(InvalidParamsError):
+            [item async for item in store.iter_context_messages("ctx-1", after=cursor)]
+
+        repository.stream_messages.assert_not_called()
+
+    async def test_artifacts_are_keyed_by_task_id(self, store, repository):
+        artifact = Artifact(artifact_id="a1")
+        repository.find_task_artifacts = AsyncMock(return_value={uuid.UUID(TASK_UUID): [artifact]})
+
+        artifacts = await store.get_task_artifacts([TASK_UUID, "not-a-uuid"])
+
+        assert artifacts == {TASK_UUID: [artifact]}
+        repository.find_task_artifacts.assert_awaited_once_with([uuid.UUID(TASK_UUID)])
+
+
 class TestActiveTasks:
     """The query behind the startup reap of tasks a killed process left running."""
 
@@ -143,6 +350,104 @@ class TestActiveTasks:
         assert await store.get_active_tasks() == []
 
 
+class TestTaskLeases:
+    async def test_acquire_leases_the_task_to_the_owner(self, store, leases):
+        assert await store.acquire_task_lease(TASK_UUID, "host:1:a") == "token-1"
+
+        leases.acquire.assert_awaited_once_with(uuid.UUID(TASK_UUID), "host:1:a")
+
+    async def test_acquire_refuses_an_unaddressable_identifier(self, store, leases):
+        with pytest.raises(InvalidParamsError):
+            await store.acquire_task_lease("not-a-uuid", "host:1:a")
+
+        leases.acquire.assert_not_awaited()
+
+    async def test_renew_returns_the_tasks_still_held(self, store, leases):
+        leases.renew.return_value = [uuid.UUID(TASK_UUID)]
+
+        assert await store.renew_task_leases("host:1:a") == [TASK_UUID]
+        leases.renew.assert_awaited_once_with("host:1:a")
+
+    async def test_release_skips_identifiers_it_cannot_hold(self, store, leases):
+        await store.release_task_leases("host:1:a", [TASK_UUID, "not-a-uuid"])
+
+        leases.release.assert_awaited_once_with("host:1:a", [uuid.UUID(TASK_UUID)], None)
+
+    async def test_release_passes_each_tasks_token(self, store, leases):
+        """A token pairs with its task even when an identifier before it is skipped."""
+        await store.release_task_leases("host:1:a", ["not-a-uuid", TASK_UUID], ["token-0", "token-1"])
+
+        leases.release.assert_awaited_once_with("host:1:a", [uuid.UUID(TASK_UUID)], ["token-1"])
+
+    async def test_save_if_leased_writes_under_the_locked_lease(self, store, repository, leases):
+        assert await store.save_if_leased(_make_task(), "host:2:sweep") is True
+
+        leases.lock_held.assert_awaited_once_with(uuid.UUID(TASK_UUID), "host:2:sweep")
+        repository.save.assert_awaited_once()
+
+    async def test_save_if_leased_skips_a_task_whose_lease_changed_hands(self, store, repository, leases):
+        """A live process took the task over; its run must not be overwritten."""
+        leases.lock_held.return_value = False
+
+        assert await store.save_if_leased(_make_task(), "host:2:sweep") is False
+
+        repository.save.assert_not_awaited()
+
+    async def test_lease_check_locks_the_row(self):
+        from sqlalchemy.dialects import postgresql
+
+        from aion.db.postgres.repositories.leases.repository import TaskLeasesRepository
+
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=lambda: None))
+        assert await TaskLeasesRepository(session).lock_held(uuid.UUID(TASK_UUID), "host:2:sweep") is False
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "task_leases.owner = " in sql
+        assert sql.endswith("FOR UPDATE")
+
+    async def test_a_tokened_release_deletes_only_the_named_acquisitions(self):
+        """A lease acquired again since carries a new token and is not matched."""
+        from sqlalchemy.dialects import postgresql
+
+        from aion.db.postgres.repositories.leases.repository import TaskLeasesRepository
+
+        session = MagicMock()
+        session.execute = AsyncMock()
+        await TaskLeasesRepository(session).release("host:1:a", [uuid.UUID(TASK_UUID)], ["token-1"])
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "task_leases.owner = " in sql
+        assert "(task_leases.task_id, task_leases.token) IN " in sql
+
+    async def test_claim_loads_the_claimed_tasks(self, store, repository, leases):
+        leases.claim_expired.return_value = [uuid.UUID(TASK_UUID)]
+        repository.find_by_ids = AsyncMock(return_value=[_make_entity(TASK_UUID)])
+
+        tasks = await store.claim_orphaned_tasks("host:2:sweep", 60.0, 100)
+
+        assert [task.id for task in tasks] == [TASK_UUID]
+        leases.claim_expired.assert_awaited_once_with("host:2:sweep", 60.0, 100)
+        leases.release.assert_not_awaited()
+
+    async def test_claim_releases_leases_of_deleted_tasks(self, store, repository, leases):
+        """A lease outliving its task would otherwise be claimed on every sweep."""
+        gone = uuid.uuid4()
+        leases.claim_expired.return_value = [uuid.UUID(TASK_UUID), gone]
+        repository.find_by_ids = AsyncMock(return_value=[_make_entity(TASK_UUID)])
+
+        tasks = await store.claim_orphaned_tasks("host:2:sweep", 60.0, 100)
+
+        assert len(tasks) == 1
+        leases.release.assert_awaited_once_with("host:2:sweep", [gone])
+
+    async def test_nothing_expired_reads_no_tasks(self, store, repository, leases):
+        repository.find_by_ids = AsyncMock()
+
+        assert await store.claim_orphaned_tasks("host:2:sweep", 60.0, 100) == []
+        repository.find_by_ids.assert_not_awaited()
+
+
 class TestList:
     @staticmethod
     def _request(**kwargs) -> a2a_pb2.ListTasksRequest:
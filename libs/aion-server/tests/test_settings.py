@@ -25,3 +25,16 @@ class TestAppSettings:
         """Verify that Logstash configured when both set."""
         s = AppSettings(LOGSTASH_HOST="logs.host", LOGSTASH_PORT=5044)
         assert s.is_logstash_configured is True
+
+    def test_task_lease_heartbeat_must_be_shorter_than_the_ttl(self):
+        """A heartbeat at or past the TTL lets a live process's leases expire."""
+        with pytest.raises(ValueError, match="TASK_LEASE_HEARTBEAT_SECONDS"):
+            AppSettings(TASK_LEASE_TTL_SECONDS=10, TASK_LEASE_HEARTBEAT_SECONDS=10)
+
+    def test_trace_export_batch_must_fit_the_queue(self):
+        with pytest.raises(ValueError, match="TRACE_EXPORT_MAX_BATCH_SIZE"):
+            AppSettings(TRACE_EXPORT_MAX_QUEUE_SIZE=100, TRACE_EXPORT_MAX_BATCH_SIZE=200)
+
+    def test_trace_sample_ratio_is_a_fraction(self):
+        with pytest.raises(ValueError):
+            AppSettings(TRACE_SAMPLE_RATIO=1.5)
@@ -0,0 +1,102 @@
+"""Tests for task creation in AionActiveTaskRegistry.
+
+Creation is an insert-if-absent with no registry lock: the store round trips of
+unrelated tasks overlap, while concurrent requests for one task still share a
+single ActiveTask.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aion.server.agent.execution.active_task_registry import AionActiveTaskRegistry
+from aion.server.agent.execution.scope import clear_execution_scope, init_execution_scope
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def execution_scope():
+    """Provides the execution scope the registry stores the task manager in."""
+    init_execution_scope()
+    yield
+    clear_execution_scope()
+
+
+class _StoreGate:
+    """Holds every ``ActiveTask.start`` until released, counting those waiting."""
+
+    def __init__(self):
+        self.waiting = 0
+        self.released = asyncio.Event()
+        self.created = []
+
+    def active_task(self, **kwargs):
+        active_task = Mock(task_id=kwargs["task_id"])
+        active_task.start = self._start
+        active_task.aclose = AsyncMock()
+        self.created.append(active_task)
+        return active_task
+
+    async def _start(self, **kwargs):
+        self.waiting += 1
+        await self.released.wait()
+
+
+def _registry() -> AionActiveTaskRegistry:
+    return AionActiveTaskRegistry(agent_executor=Mock(), task_store=AsyncMock(), push_sender=None)
+
+
+async def _wait_until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never held")
+
+
+@pytest.mark.anyio
+async def test_unrelated_tasks_start_concurrently(execution_scope):
+    """A slow store must not hold back the creation of other tasks."""
+    registry = _registry()
+    gate = _StoreGate()
+
+    with patch("aion.server.agent.execution.active_task_registry.ActiveTask", side_effect=gate.active_task):
+        creations = [
+            asyncio.create_task(registry.get_or_create(f"task-{index}", call_context=Mock()))
+            for index in range(5)
+        ]
+        await _wait_until(lambda: gate.waiting == 5)
+        gate.released.set()
+        await asyncio.gather(*creations)
+
+    assert registry.active_task_count == 5
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_for_one_task_share_it(execution_scope):
+    registry = _registry()
+    gate = _StoreGate()
+
+    with patch("aion.server.agent.execution.active_task_registry.ActiveTask", side_effect=gate.active_task):
+        first = asyncio.create_task(registry.get_or_create("task-1", call_context=Mock()))
+        await _wait_until(lambda: gate.waiting == 1)
+        second = await registry.get_or_create("task-1", call_context=Mock())
+        gate.released.set()
+
+        assert await first is second
+    assert len(gate.created) == 1
+
+
+@pytest.mark.anyio
+async def test_closed_registry_refuses_new_tasks(execution_scope):
+    registry = _registry()
+    await registry.aclose()
+
+    with pytest.raises(RuntimeError):
+        await registry.get_or_create("task-1", call_context=Mock())
@@ -8,6 +8,8 @@ knows the execution is gone. A subscriber does not — it may have merely
 disconnected — which is why ``TerminalTaskProjection`` only reads.
 """
 
+import asyncio
+
 import pytest
 from a2a.types import Task, TaskState, TaskStatus
 from unittest.mock import AsyncMock, Mock, patch
@@ -63,6 +65,30 @@ async def _registry_holding(state: TaskState):
     return registry, store, active_task_cls.return_value
 
 
+async def _registry_holding_many(count: int, store: AsyncMock, **registry_kwargs):
+    """Build a registry with ``count`` registered tasks backed by ``store``."""
+    registry = AionActiveTaskRegistry(
+        agent_executor=Mock(),
+        task_store=store,
+        push_sender=None,
+        **registry_kwargs,
+    )
+
+    with patch(
+        "aion.server.agent.execution.active_task_registry.ActiveTask"
+    ) as active_task_cls:
+        active_task_cls.return_value.start = AsyncMock()
+        active_task_cls.return_value.aclose = AsyncMock()
+        for index in range(count):
+            await registry.get_or_create(
+                f"task-{index}",
+                call_context=Mock(),
+                context_id=CONTEXT_ID,
+            )
+
+    return registry
+
+
 def _settled(store: AsyncMock) -> Task:
     store.save.assert_awaited_once()
     return store.save.await_args.args[0]
@@ -147,3 +173,53 @@ class TestShutdownSettlement:
         await registry.aclose()
 
         store.save.assert_not_awaited()
+
+
+class TestShutdownSettlementBudget:
+    @pytest.mark.anyio
+    async def test_tasks_are_settled_concurrently_within_the_bound(self, execution_scope):
+        """Store round trips overlap, but never more than the configured number at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_save(task, *args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        store = AsyncMock()
+        store.get.side_effect = lambda task_id, *args, **kwargs: Task(
+            id=task_id, context_id=CONTEXT_ID,
+            status=TaskStatus(state=TaskState.TASK_STATE_WORKING))
+        store.save.side_effect = slow_save
+        registry = await _registry_holding_many(10, store, settlement_concurrency=3)
+
+        with patch("aion.server.agent.execution.active_task_registry.logger") as log:
+            await registry.aclose()
+
+        assert store.save.await_count == 10
+        assert peak == 3
+        log.info.assert_any_call(
+            "Shutdown settlement: %d settled, %d unchanged, %d failed, %d unsettled", 10, 0, 0, 0)
+
+    @pytest.mark.anyio
+    async def test_deadline_stops_settlement_and_reports_the_rest(self, execution_scope):
+        """Past the deadline shutdown moves on, counting the tasks it did not reach."""
+        async def hanging_save(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        store = AsyncMock()
+        store.get.side_effect = lambda task_id, *args, **kwargs: Task(
+            id=task_id, context_id=CONTEXT_ID,
+            status=TaskStatus(state=TaskState.TASK_STATE_WORKING))
+        store.save.side_effect = hanging_save
+        registry = await _registry_holding_many(
+            4, store, settlement_timeout=0.05, settlement_concurrency=2)
+
+        with patch("aion.server.agent.execution.active_task_registry.logger") as log:
+            await asyncio.wait_for(registry.aclose(), timeout=1)
+
+        log.warning.assert_called_once_with(
+            "Shutdown settlement: %d settled, %d unchanged, %d failed, %d unsettled", 0, 0, 0, 4)
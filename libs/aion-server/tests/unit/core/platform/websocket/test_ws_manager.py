@@ -314,6 +314,19 @@ class TestAionWebSocketManager:
 
         await ws_manager.stop()
 
+    async def test_state_changes_are_published(self, ws_manager, transport_factory):
+        """The proxy's metrics learn of every drop and reconnect through the callback."""
+        states = []
+        ws_manager._on_state_change = states.append
+        await ws_manager.start()
+
+        transport_factory.created[0].drop(OSError("boom"))
+        assert await wait_for(lambda: len(states) == 3)
+        await ws_manager.stop()
+
+        assert [(state["status"], state["reconnects"]) for state in states] == [
+            ("connected", 0), ("disconnected", 0), ("connected", 1), ("disconnected", 1)]
+
     async def test_a_crashing_loop_is_restarted(self, ws_manager):
         """A bug in the loop must not leave the agent silently offline."""
         calls = []
@@ -1,4 +1,4 @@
-"""Tests for resource teardown ordering in ``AppFactory.shutdown``."""
+"""Tests for resource teardown in ``AppFactory.shutdown`` and failed startup."""
 
 from unittest.mock import AsyncMock, Mock
 
@@ -87,3 +87,13 @@ async def test_shutdown_without_a_request_handler_is_a_no_op(factory):
     assert factory._request_handler is None
 
     await factory.shutdown()
+
+
+async def test_failed_initialization_abandons_the_module_import(factory):
+    """A startup failure must not leave a preloaded module import unawaited."""
+    factory.aion_agent.cancel_module_import = AsyncMock()
+    factory.db_factory.initialize = AsyncMock(side_effect=RuntimeError("db down"))
+
+    assert await factory.initialize() is None
+
+    factory.aion_agent.cancel_module_import.assert_awaited_once()
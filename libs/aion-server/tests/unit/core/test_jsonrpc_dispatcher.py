@@ -1,11 +1,14 @@
 """Wire-format tests for the Aion JSON-RPC dispatcher."""
 
+import json
 from collections.abc import AsyncGenerator
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from a2a.utils.errors import InvalidParamsError
 from sse_starlette.sse import EventSourceResponse
+from starlette.requests import Request
 
 from aion.server.core.app.handlers.jsonrpc_dispatcher import (
     AionJsonRpcDispatcher,
@@ -38,3 +41,61 @@ async def test_streaming_response_uses_lf_event_delimiters() -> None:
     assert b'\r' not in body
     assert body.count(b'\n\ndata: ') == 1
     assert body.endswith(b'\n\n')
+
+
+@pytest.mark.asyncio
+async def test_aion_method_client_errors_keep_their_error_code() -> None:
+    """A bad GetContexts cursor is the caller's mistake, not an internal error."""
+    body = json.dumps({
+        'jsonrpc': '2.0',
+        'id': 7,
+        'method': 'GetContexts',
+        'params': {'cursor': 'not-a-cursor'},
+    }).encode()
+
+    async def receive() -> dict[str, Any]:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    request = Request(
+        {'type': 'http', 'method': 'POST', 'path': '/', 'headers': [], 'query_string': b''},
+        receive,
+    )
+    handler = Mock()
+    handler.on_get_contexts_list = AsyncMock(side_effect=InvalidParamsError('Invalid cursor'))
+    dispatcher = AionJsonRpcDispatcher(request_handler=handler)
+
+    response = await dispatcher.handle_requests(request)
+
+    error = json.loads(response.body)['error']
+    assert error['code'] == -32602
+
+
+@pytest.mark.asyncio
+async def test_body_is_decoded_once_through_middleware_and_dispatcher() -> None:
+    """The context middleware and the dispatcher share one decoded body."""
+    import httpx
+    from a2a.utils import DEFAULT_RPC_URL
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.routing import Route
+
+    from aion.server.core.middlewares.aion_context import AionContextMiddleware
+
+    handler = Mock()
+    handler.on_get_contexts_list = AsyncMock(side_effect=InvalidParamsError('Invalid cursor'))
+    dispatcher = AionJsonRpcDispatcher(request_handler=handler)
+    app = Starlette(
+        routes=[Route(DEFAULT_RPC_URL, dispatcher.handle_requests, methods=['POST'])],
+        middleware=[Middleware(AionContextMiddleware)],
+    )
+    payload = {'jsonrpc': '2.0', 'id': 1, 'method': 'GetContexts', 'params': {'cursor': 'x'}}
+
+    with patch('starlette.requests.json', Mock(wraps=json)) as decoder:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url='http://test',
+        ) as client:
+            response = await client.post(DEFAULT_RPC_URL, json=payload)
+            await client.post(DEFAULT_RPC_URL, json={**payload, 'method': 'NoSuchMethod'})
+
+    assert response.json()['error']['code'] == -32602
+    assert decoder.loads.call_count == 2
@@ -1,16 +1,18 @@
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from a2a.server.context import ServerCallContext
-from a2a.types import TaskState
+from a2a.types import Artifact, Message, Part, Task, TaskState, TaskStatus
 
 from aion.server.core.app.handlers.request_handler import AionRequestHandler
 from aion.core.a2a import (
     ContextsList,
+    ContextsPage,
     Conversation,
     GetContextParams,
     GetContextsListParams,
     ConversationTaskStatus
 )
+from aion.server.tasks.stores import InMemoryTaskStore
 
 
 # !! Test Data Factories !!
@@ -37,6 +39,22 @@ def create_test_tasks(count=2):
     return tasks
 
 
+async def create_conversation_store():
+    """In-memory store holding one context of two tasks with two messages each."""
+    store = InMemoryTaskStore()
+    for index, state in ((1, TaskState.TASK_STATE_COMPLETED), (2, TaskState.TASK_STATE_INPUT_REQUIRED)):
+        task = Task(
+            id=f"task-{index}",
+            context_id="ctx",
+            status=TaskStatus(state=state),
+            history=[Message(message_id=f"q{index}", parts=[Part(text="question")])],
+            artifacts=[Artifact(artifact_id=f"a{index}", parts=[Part(text="result")])],
+        )
+        task.status.message.CopyFrom(Message(message_id=f"r{index}", parts=[Part(text="reply")]))
+        await store.save(task, ServerCallContext())
+    return store
+
+
 # !! Base Fixtures !!
 
 @pytest.fixture
@@ -191,6 +209,64 @@ class TestAionRequestHandler:
             offset=params.history_offset
         )
 
+    @pytest.mark.anyio
+    async def test_get_contexts_paged_returns_summaries(self, request_handler, mock_context, mock_store_manager,
+                                                        mock_task_store):
+        """A request naming a page size is answered from the store's context summaries."""
+        # Setup
+        params = GetContextsListParams(page_size=10, cursor="abc")
+        page = ContextsPage(contexts=[], next_cursor=None)
+
+        mock_store_manager.get_store.return_value = mock_task_store
+        mock_task_store.get_context_summaries.return_value = page
+
+        # Execute
+        result = await request_handler.on_get_contexts_list(params, mock_context)
+
+        # Verify
+        assert result is page
+        mock_task_store.get_context_summaries.assert_called_once_with(page_size=10, cursor="abc")
+        mock_task_store.get_context_ids.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_get_context_window_pages_backwards(self, request_handler, mock_context, mock_store_manager):
+        """A message limit answers with the newest messages and a cursor to older ones."""
+        # Setup
+        mock_store_manager.get_store.return_value = await create_conversation_store()
+
+        # Execute
+        first = await request_handler.on_get_context(GetContextParams(context_id="ctx", message_limit=3), mock_context)
+        rest = await request_handler.on_get_context(
+            GetContextParams(context_id="ctx", message_limit=3, before=first.next_cursor), mock_context)
+
+        # Verify
+        assert [message.message_id for message in first.history] == ["r2", "q2", "r1"]
+        assert [artifact.artifact_id for artifact in first.artifacts] == ["a2", "a1"]
+        assert first.status.state == TaskState.TASK_STATE_INPUT_REQUIRED
+        assert [message.message_id for message in rest.history] == ["q1"]
+        assert [artifact.artifact_id for artifact in rest.artifacts] == ["a1"]
+        assert rest.next_cursor is None
+
+    @pytest.mark.anyio
+    async def test_get_context_window_after_is_newest_first(self, request_handler, mock_context, mock_store_manager):
+        """An ``after`` window reads forward from the cursor but answers newest first."""
+        # Setup
+        mock_store_manager.get_store.return_value = await create_conversation_store()
+        newest = await request_handler.on_get_context(
+            GetContextParams(context_id="ctx", message_limit=3), mock_context)
+
+        # Execute
+        step = await request_handler.on_get_context(
+            GetContextParams(context_id="ctx", message_limit=1, after=newest.next_cursor), mock_context)
+        both = await request_handler.on_get_context(
+            GetContextParams(context_id="ctx", message_limit=2, after=newest.next_cursor), mock_context)
+
+        # Verify
+        assert [message.message_id for message in step.history] == ["q2"]
+        assert step.next_cursor is not None
+        assert [message.message_id for message in both.history] == ["r2", "q2"]
+        assert both.next_cursor is None
+
     @pytest.mark.parametrize("exception_msg,method_name", [
         ("Database error", "get_context_tasks"),
         ("Connection timeout", "get_context_ids"),
@@ -0,0 +1,171 @@
+"""Tests for the proxy's cache of agent cards, schemas and docs pages.
+
+These documents only change when an agent process is replaced, so the proxy
+answers repeat requests from memory. What matters is that a hit never reaches
+the agent, that the cached bytes are the rewritten ones, that conditional GETs
+are honoured, and that an agent restart drops what the proxy held for it.
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.testclient import TestClient
+
+from aion.proxy.cache import ProxyDocumentCache
+from aion.proxy.constants import AGENT_RESTARTED_MESSAGE
+from aion.proxy.middlewares import ProxyDocumentCacheMiddleware, ProxySwaggerUIFixMiddleware
+from aion.proxy.routes import ProxyRouter
+from aion.proxy.server import AionAgentProxyServer
+
+
+class CountingRequestHandler:
+    """Stands in for the forwarder, answering like an agent and counting calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def forward_request(self, agent_id: str, path: str, request: Request):
+        self.calls.append((request.method, agent_id, path))
+        if path == "openapi.json":
+            return JSONResponse({"openapi": "3.1.0", "servers": [{"url": "/"}]})
+        if path == "docs":
+            return HTMLResponse('<script>url: "/openapi.json"</script>')
+        if path == "missing.json":
+            return JSONResponse({"error": "nope"}, status_code=404)
+        return JSONResponse({"name": agent_id, "path": path})
+
+
+class FakeProxyServer:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.agent_urls = {"command-agent": "http://127.0.0.1:8001"}
+
+
+@pytest.fixture
+def cache():
+    return ProxyDocumentCache()
+
+
+@pytest.fixture
+def handler():
+    return CountingRequestHandler()
+
+
+@pytest.fixture
+def client(cache, handler):
+    app = FastAPI()
+    app.add_middleware(ProxySwaggerUIFixMiddleware)
+    app.add_middleware(ProxyDocumentCacheMiddleware, cache=cache)
+    ProxyRouter(agent_proxy_server=FakeProxyServer(app), request_handler=handler).register_routes()
+    return TestClient(app)
+
+
+CARD = "/agents/command-agent/.well-known/agent-card.json"
+
+
+def test_a_repeated_card_request_is_answered_without_the_agent(client, handler):
+    first = client.get(CARD)
+    second = client.get(CARD)
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert handler.calls == [("GET", "command-agent", ".well-known/agent-card.json")]
+
+
+def test_the_cached_schema_is_the_rewritten_one(client, cache, handler):
+    client.get("/agents/command-agent/openapi.json")
+
+    cached = cache.get("command-agent", "openapi.json")
+    assert json.loads(cached.body)["servers"][0]["url"] == "/agents/command-agent"
+
+    served = client.get("/agents/command-agent/openapi.json")
+    assert served.content == cached.body
+    assert len(handler.calls) == 1
+
+
+def test_a_current_etag_is_answered_with_not_modified(client):
+    etag = client.get(CARD).headers["etag"]
+
+    response = client.get(CARD, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_a_stale_etag_gets_the_full_document(client):
+    client.get(CARD)
+
+    response = client.get(CARD, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "command-agent"
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("post", CARD),
+        ("get", f"{CARD}?fresh=1"),
+        ("get", "/agents/command-agent/missing.json"),
+        ("get", "/agents/command-agent/tasks"),
+    ],
+)
+def test_other_requests_pass_through_uncached(client, cache, handler, method, path):
+    getattr(client, method)(path)
+    getattr(client, method)(path)
+
+    assert len(handler.calls) == 2
+    assert len(cache) == 0
+
+
+def test_a_head_request_does_not_fill_the_cache(client, cache):
+    client.head(CARD)
+
+    assert len(cache) == 0
+
+
+def test_invalidation_is_scoped_to_one_agent(cache):
+    cache.put("a", "openapi.json", b"{}")
+    cache.put("a", "docs", b"<html/>")
+    cache.put("b", "docs", b"<html/>")
+
+    assert cache.invalidate("a") == 2
+    assert cache.get("b", "docs") is not None
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+class TestControlMessages:
+    def test_an_agent_restart_drops_its_documents(self):
+        server = AionAgentProxyServer(agents={"a": "http://127.0.0.1:8001"})
+        server.document_cache.put("a", "docs", b"<html/>")
+
+        server.handle_control_message({"type": AGENT_RESTARTED_MESSAGE, "agent_id": "a"})
+
+        assert server.document_cache.get("a", "docs") is None
+
+    @pytest.mark.parametrize("message", ["garbage", {"type": "something-else"}])
+    def test_unknown_messages_leave_the_cache_alone(self, message):
+        server = AionAgentProxyServer(agents={"a": "http://127.0.0.1:8001"})
+        server.document_cache.put("a", "docs", b"<html/>")
+
+        server.handle_control_message(message)
+
+        assert len(server.document_cache) == 1
+
+
+def test_the_manifest_is_rendered_once_and_supports_conditional_get():
+    app = FastAPI()
+    ProxyRouter(agent_proxy_server=FakeProxyServer(app), request_handler=CountingRequestHandler()).register_routes()
+    client = TestClient(app)
+
+    first = client.get("/.well-known/manifest.json")
+    again = client.get("/.well-known/manifest.json", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert "command-agent" in first.json()["endpoints"]
+    assert again.status_code == 304
@@ -0,0 +1,112 @@
+"""Tests for the proxy's aggregated metrics.
+
+The proxy reports its own per-agent forwarding state and serves each agent's
+metrics alongside, labelled by agent, so one scrape covers the deployment.
+"""
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aion.proxy.constants import METRICS_URL, PLATFORM_LINK_STATE_MESSAGE
+from aion.proxy.handlers import RequestHandler
+from aion.proxy.metrics import ProxyMetricsCollector, relabel_agent_metrics, render_proxy_metrics
+from aion.proxy.routes import ProxyRouter
+from aion.proxy.server import AionAgentProxyServer
+
+AGENT_METRICS = """\
+# HELP aion_active_tasks Tasks executing in this process.
+# TYPE aion_active_tasks gauge
+aion_active_tasks 2
+# HELP aion_push_deliveries_total Push notification deliveries.
+# TYPE aion_push_deliveries_total counter
+aion_push_deliveries_total{outcome="delivered"} 5
+# HELP aion_event_processing_seconds Event time.
+# TYPE aion_event_processing_seconds histogram
+aion_event_processing_seconds_bucket{le="+Inf"} 7
+aion_event_processing_seconds_count 7
+aion_event_processing_seconds_sum 0.25
+"""
+
+
+def _handler(responses: dict) -> RequestHandler:
+    """A forwarder whose agents answer their metrics scrape from ``responses``."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        answer = responses[request.url.host]
+        if isinstance(answer, Exception):
+            raise answer
+        return httpx.Response(200, text=answer)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    return RequestHandler({host: f"http://{host}:8001" for host in responses}, client)
+
+
+def test_agent_metrics_are_labelled_and_grouped_by_family():
+    lines = relabel_agent_metrics({"alpha": AGENT_METRICS, "beta": AGENT_METRICS})
+
+    assert lines[:4] == [
+        "# HELP aion_active_tasks Tasks executing in this process.",
+        "# TYPE aion_active_tasks gauge",
+        'aion_active_tasks{agent_id="alpha"} 2',
+        'aion_active_tasks{agent_id="beta"} 2',
+    ]
+    assert 'aion_push_deliveries_total{agent_id="beta",outcome="delivered"} 5' in lines
+    assert 'aion_event_processing_seconds_bucket{agent_id="alpha",le="+Inf"} 7' in lines
+    assert lines.count("# TYPE aion_event_processing_seconds histogram") == 1
+    # A histogram's samples stay under its own TYPE line.
+    histogram = lines.index("# TYPE aion_event_processing_seconds histogram")
+    assert lines[histogram + 1:] == [
+        'aion_event_processing_seconds_bucket{agent_id="alpha",le="+Inf"} 7',
+        'aion_event_processing_seconds_count{agent_id="alpha"} 7',
+        'aion_event_processing_seconds_sum{agent_id="alpha"} 0.25',
+        'aion_event_processing_seconds_bucket{agent_id="beta",le="+Inf"} 7',
+        'aion_event_processing_seconds_count{agent_id="beta"} 7',
+        'aion_event_processing_seconds_sum{agent_id="beta"} 0.25',
+    ]
+
+
+def test_collector_reports_upstream_state():
+    handler = _handler({"alpha": ""})
+    upstream = handler.upstreams["alpha"]
+    upstream.request_answered(upstream.request_started())
+    upstream.request_started()
+
+    body = "\n".join(
+        f"{family.name} {sample.labels} {sample.value}"
+        for family in ProxyMetricsCollector(handler.upstreams, latency=handler.upstream_latency).collect()
+        for sample in family.samples
+    )
+
+    assert "aion_proxy_in_flight_requests (('agent_id', 'alpha'),) 2" in body
+    assert "aion_proxy_requests_total (('agent_id', 'alpha'),) 2" in body
+    assert "aion_proxy_circuit_state (('agent_id', 'alpha'), ('state', 'closed')) 1" in body
+    assert "aion_proxy_upstream_latency_seconds (('agent_id', 'alpha'), ('le', '+Inf')) 1" in body
+
+
+async def test_an_agent_that_does_not_answer_is_reported_down():
+    handler = _handler({"alpha": AGENT_METRICS, "beta": httpx.ConnectError("refused")})
+
+    body = (await render_proxy_metrics([], handler.upstreams, timeout=1.0)).decode()
+
+    assert 'aion_proxy_agent_scrape_up{agent_id="alpha"} 1' in body
+    assert 'aion_proxy_agent_scrape_up{agent_id="beta"} 0' in body
+    assert 'aion_active_tasks{agent_id="alpha"} 2' in body
+    assert 'agent_id="beta"} 2' not in body
+
+
+def test_metrics_route_reports_the_platform_link():
+    server = AionAgentProxyServer(agents={"alpha": "http://alpha:8001"})
+    server.handle_control_message(
+        {"type": PLATFORM_LINK_STATE_MESSAGE, "state": {"status": "connected", "reconnects": 3}}
+    )
+    app = FastAPI()
+    server.app = app
+    ProxyRouter(agent_proxy_server=server, request_handler=_handler({"alpha": AGENT_METRICS})).register_routes()
+
+    response = TestClient(app).get(METRICS_URL)
+
+    assert response.status_code == 200
+    assert "aion_platform_connected 1" in response.text
+    assert "aion_platform_reconnects_total 3" in response.text
+    assert 'aion_active_tasks{agent_id="alpha"} 2' in response.text
@@ -0,0 +1,233 @@
+"""Tests for per-agent upstream isolation in the proxy.
+
+Each agent has its own connection pool and circuit breaker, so an agent that
+keeps failing to answer is refused fast instead of tying up requests, and what
+the proxy reports about one agent never mixes with another.
+"""
+
+import httpx
+import pytest
+from fastapi import Request
+
+from aion.proxy.client import ProxyHttpClient
+from aion.proxy.exceptions import AgentTimeoutException, AgentUnavailableException
+from aion.proxy.handlers import RequestHandler
+from aion.proxy.upstream import CircuitBreaker, CircuitState
+from aion.server.settings import app_settings
+
+
+def make_request() -> Request:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+
+    return Request(scope, receive)
+
+
+class Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("aion.proxy.upstream.time.monotonic", clock)
+    return clock
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_a_success_resets_the_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_lets_one_trial_through_after_the_reset_timeout(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.allow_request() is True
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_a_failed_trial_reopens_the_circuit(self, clock):
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+
+class TestForwardingThroughTheBreaker:
+
+    @pytest.fixture(autouse=True)
+    def low_threshold(self, monkeypatch):
+        monkeypatch.setattr(app_settings, "proxy_circuit_failure_threshold", 2)
+        monkeypatch.setattr(app_settings, "proxy_circuit_reset_timeout_seconds", 60.0)
+
+    async def test_repeated_connect_failures_fail_fast(self):
+        attempts = []
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        handler = RequestHandler({"broken": "http://broken:8001"}, {"broken": client})
+
+        for _ in range(2):
+            with pytest.raises(AgentUnavailableException):
+                await handler.forward_request("broken", "", make_request())
+
+        with pytest.raises(AgentUnavailableException):
+            await handler.forward_request("broken", "", make_request())
+
+        assert len(attempts) == 2
+        metrics = handler.upstreams["broken"].metrics()
+        assert metrics.circuit_state == "open"
+        assert metrics.rejected_total == 1
+        assert metrics.in_flight == 0
+
+    async def test_timeouts_count_against_the_circuit(self):
+        def transport(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectTimeout("slow", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        handler = RequestHandler({"slow": "http://slow:8001"}, client)
+
+        for _ in range(2):
+            with pytest.raises(AgentTimeoutException):
+                await handler.forward_request("slow", "", make_request())
+
+        assert handler.upstreams["slow"].breaker.state is CircuitState.OPEN
+
+    async def test_pool_timeouts_do_not_count_against_the_circuit(self):
+        """An exhausted proxy pool is local saturation, not an unreachable agent."""
+        def transport(request: httpx.Request) -> httpx.Response:
+            raise httpx.PoolTimeout("no free connection", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        handler = RequestHandler({"busy": "http://busy:8001"}, client)
+
+        for _ in range(3):
+            with pytest.raises(AgentTimeoutException):
+                await handler.forward_request("busy", "", make_request())
+
+        assert handler.upstreams["busy"].breaker.state is CircuitState.CLOSED
+        assert handler.upstreams["busy"].metrics().in_flight == 0
+
+    async def test_a_failing_agent_does_not_affect_another(self):
+        def broken(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        clients = {
+            "broken": httpx.AsyncClient(transport=httpx.MockTransport(broken)),
+            "healthy": httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"ok"))
+            ),
+        }
+        handler = RequestHandler(
+            {"broken": "http://broken:8001", "healthy": "http://healthy:8002"},
+            clients,
+        )
+
+        for _ in range(3):
+            with pytest.raises(AgentUnavailableException):
+                await handler.forward_request("broken", "", make_request())
+
+        response = await handler.forward_request("healthy", "", make_request())
+        assert response.status_code == 200
+        assert handler.upstreams["healthy"].metrics().circuit_state == "closed"
+
+    async def test_an_error_status_is_an_answer_not_a_failure(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+        handler = RequestHandler({"agent": "http://agent:8001"}, client)
+
+        for _ in range(3):
+            response = await handler.forward_request("agent", "", make_request())
+            assert response.status_code == 500
+
+        metrics = handler.upstreams["agent"].metrics()
+        assert metrics.circuit_state == "closed"
+        assert metrics.failures_total == 0
+        assert metrics.latency_avg_ms is not None
+
+
+async def test_in_flight_covers_the_relayed_stream():
+    async def chunks():
+        yield b"data"
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+    )
+    handler = RequestHandler({"agent": "http://agent:8001"}, client)
+
+    response = await handler.forward_request("agent", "", make_request())
+    assert handler.upstreams["agent"].in_flight == 1
+
+    sent = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await response({"type": "http", "method": "POST"}, receive, send)
+
+    assert handler.upstreams["agent"].in_flight == 0
+    assert handler.upstreams["agent"].metrics().requests_total == 1
+
+
+async def test_every_agent_gets_its_own_pool(monkeypatch):
+    monkeypatch.setattr(app_settings, "proxy_max_connections_per_agent", 7)
+    manager = ProxyHttpClient()
+
+    async with manager.lifespan(["a", "b"]) as clients:
+        assert set(clients) == {"a", "b"}
+        assert clients["a"] is not clients["b"]
+        assert manager.get_client("a") is clients["a"]
+
+        with pytest.raises(RuntimeError):
+            manager.get_client("missing")
+
+    assert manager.clients == {}
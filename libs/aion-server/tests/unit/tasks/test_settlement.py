@@ -9,6 +9,9 @@ Two properties carry the design, and both are here rather than in the callers:
     exists.
   - A task that already carries a state of its own is never touched — an
     outcome the agent declared, or an interrupt it is genuinely waiting on.
+
+The orphan sweep only ever sees tasks whose lease expired; which leases expire
+is the store's answer, so here the store is a mock handing back its claims.
 """
 
 from unittest.mock import AsyncMock
@@ -25,19 +28,26 @@ def _task(task_id: str, state: TaskState) -> Task:
     return Task(id=task_id, context_id="ctx-1", status=TaskStatus(state=state))
 
 
+OWNER = "host:1:sweep"
+
+
 @pytest.fixture
 def store():
-    """A store holding one task the previous process left running."""
+    """A store holding one task whose lease a dead process let expire."""
     store = AsyncMock()
-    store.get_active_tasks.return_value = [
+    store.claim_orphaned_tasks.return_value = [
         _task("task-1", TaskState.TASK_STATE_WORKING)
     ]
     return store
 
 
+async def _sweep(store, batch_size: int = 100):
+    return await settle_orphaned_tasks(store, OWNER, lease_ttl=60.0, batch_size=batch_size)
+
+
 def _saved(store: AsyncMock) -> Task:
-    store.save.assert_awaited_once()
-    return store.save.await_args.args[0]
+    store.save_if_leased.assert_awaited_once()
+    return store.save_if_leased.await_args.args[0]
 
 
 class TestSettledTask:
@@ -95,36 +105,83 @@ class TestSettledTask:
 
 class TestSettleOrphanedTasks:
     async def test_writes_the_settled_task_back(self, store):
-        await settle_orphaned_tasks(store)
+        await _sweep(store)
 
         assert _saved(store).status.state == TaskState.TASK_STATE_FAILED
 
     async def test_names_the_restart_as_the_reason(self, store):
         """These tasks outlived their process, which a shutdown never allows."""
-        await settle_orphaned_tasks(store)
+        await _sweep(store)
 
         assert _saved(store).metadata[A2AMetadataKey.SETTLED_REASON.value] == (
             TaskSettlementReason.SERVER_RESTART.value
         )
 
-    async def test_nothing_active_writes_nothing(self, store):
-        store.get_active_tasks.return_value = []
+    async def test_claims_only_expired_leases_under_its_own_owner(self, store):
+        await _sweep(store)
 
-        await settle_orphaned_tasks(store)
+        store.claim_orphaned_tasks.assert_awaited_once_with(OWNER, 60.0, 100)
 
-        store.save.assert_not_awaited()
+    async def test_nothing_expired_writes_nothing(self, store):
+        store.claim_orphaned_tasks.return_value = []
+
+        report = await _sweep(store)
+
+        store.save_if_leased.assert_not_awaited()
+        store.release_task_leases.assert_not_awaited()
+        assert report.total == 0
 
     async def test_a_refused_write_does_not_strand_the_others(self, store):
         """One task the store refuses is not an answer about the rest."""
-        store.get_active_tasks.return_value = [
+        store.claim_orphaned_tasks.return_value = [
             _task("task-1", TaskState.TASK_STATE_WORKING),
             _task("task-2", TaskState.TASK_STATE_WORKING),
         ]
-        store.save.side_effect = [RuntimeError("write refused"), None]
+        store.save_if_leased.side_effect = [RuntimeError("write refused"), True]
 
-        await settle_orphaned_tasks(store)
+        await _sweep(store)
 
-        assert [call.args[0].id for call in store.save.await_args_list] == [
+        assert [call.args[0].id for call in store.save_if_leased.await_args_list] == [
             "task-1",
             "task-2",
         ]
+
+    async def test_releases_resolved_leases_and_keeps_refused_ones(self, store):
+        """A refused task keeps its claim, which expires and is retried by a later sweep."""
+        store.claim_orphaned_tasks.return_value = [
+            _task("task-1", TaskState.TASK_STATE_WORKING),
+            _task("task-2", TaskState.TASK_STATE_COMPLETED),
+            _task("task-3", TaskState.TASK_STATE_WORKING),
+        ]
+        store.save_if_leased.side_effect = [True, RuntimeError("write refused")]
+
+        report = await _sweep(store)
+
+        store.release_task_leases.assert_awaited_once_with(OWNER, ["task-1", "task-2"])
+        assert (report.settled, report.unchanged, report.failed) == (1, 1, 1)
+
+    async def test_writes_only_under_its_own_claim(self, store):
+        await _sweep(store)
+
+        assert store.save_if_leased.await_args.args[1] == OWNER
+        store.save.assert_not_awaited()
+
+    async def test_leaves_a_task_resumed_since_the_claim_to_its_new_owner(self, store):
+        """The lease changed hands, so the run is live and is not overwritten."""
+        store.save_if_leased.return_value = False
+
+        report = await _sweep(store)
+
+        store.release_task_leases.assert_awaited_once_with(OWNER, [])
+        assert (report.settled, report.unchanged) == (0, 1)
+
+    async def test_claims_batches_until_one_comes_back_short(self, store):
+        store.claim_orphaned_tasks.side_effect = [
+            [_task("task-1", TaskState.TASK_STATE_WORKING), _task("task-2", TaskState.TASK_STATE_WORKING)],
+            [_task("task-3", TaskState.TASK_STATE_WORKING)],
+        ]
+
+        report = await _sweep(store, batch_size=2)
+
+        assert store.claim_orphaned_tasks.await_count == 2
+        assert report.settled == 3
@@ -0,0 +1,278 @@
+"""Tests for task leases and the sweep that settles tasks whose lease expired.
+
+Replicas share one task store, so a task active in it may be running in a
+sibling or may have died with a killed process. The lease tells them apart:
+the registry of a live process keeps renewing it, a killed process stops. Here
+two registries over one store stand in for two replicas; one of them is killed
+by stopping everything it runs without a shutdown, as SIGKILL would.
+"""
+
+import asyncio
+import itertools
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from a2a.types import Task, TaskState, TaskStatus
+
+from aion.core.a2a.enums import A2AMetadataKey, TaskSettlementReason
+from aion.server.agent.execution.active_task_registry import AionActiveTaskRegistry
+from aion.server.agent.execution.scope import clear_execution_scope, init_execution_scope
+from aion.server.tasks import InMemoryTaskStore, OrphanedTaskSweeper
+
+HEARTBEAT = 0.02
+LEASE_TTL = 0.1
+
+
+class _LeasingStore(InMemoryTaskStore):
+    """An in-memory store that keeps leases the way a shared store does."""
+
+    supports_task_leases = True
+
+    def __init__(self):
+        # Settling runs with no request behind it, so every call is one owner.
+        super().__init__(owner_resolver=lambda context: "owner")
+        self.leases: dict[str, tuple[str, float]] = {}
+        self.tokens: dict[str, str] = {}
+        self._token_seq = itertools.count(1)
+
+    async def acquire_task_lease(self, task_id, owner):
+        self.leases[task_id] = (owner, time.monotonic())
+        self.tokens[task_id] = f"token-{next(self._token_seq)}"
+        return self.tokens[task_id]
+
+    async def renew_task_leases(self, owner):
+        held = [task_id for task_id, (holder, _) in self.leases.items() if holder == owner]
+        for task_id in held:
+            self.leases[task_id] = (owner, time.monotonic())
+        return held
+
+    async def release_task_leases(self, owner, task_ids, tokens=None):
+        for index, task_id in enumerate(task_ids):
+            if self.leases.get(task_id, (None,))[0] != owner:
+                continue
+            if tokens is not None and self.tokens.get(task_id) != tokens[index]:
+                continue
+            del self.leases[task_id]
+
+    async def save_if_leased(self, task, owner):
+        if self.leases.get(task.id, (None,))[0] != owner:
+            return False
+        await self.save(task)
+        return True
+
+    async def claim_orphaned_tasks(self, owner, lease_ttl, limit):
+        cutoff = time.monotonic() - lease_ttl
+        expired = [task_id for task_id, (_, at) in self.leases.items() if at < cutoff][:limit]
+        claimed = []
+        for task_id in expired:
+            self.leases[task_id] = (owner, time.monotonic())
+            self.tokens.pop(task_id, None)
+            task = await self.get(task_id)
+            if task is None:
+                del self.leases[task_id]
+            else:
+                claimed.append(task)
+        return claimed
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def execution_scope():
+    """Provides the execution scope the registry stores the task manager in."""
+    init_execution_scope()
+    yield
+    clear_execution_scope()
+
+
+@pytest.fixture
+async def store():
+    store = _LeasingStore()
+    for task_id in ("task-a", "task-b"):
+        await store.save(Task(
+            id=task_id, context_id="ctx-1",
+            status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+        ))
+    return store
+
+
+async def _resume(registry: AionActiveTaskRegistry, task_id: str) -> None:
+    """Start ``task_id`` again on ``registry``, as a follow-up request would."""
+    with patch("aion.server.agent.execution.active_task_registry.ActiveTask") as active_task_cls:
+        active_task_cls.return_value.start = AsyncMock()
+        active_task_cls.return_value.aclose = AsyncMock()
+        await registry.get_or_create(task_id, call_context=None, context_id="ctx-1")
+
+
+async def _replica(store, owner: str, task_id: str) -> AionActiveTaskRegistry:
+    """A registry leasing ``task_id``, as the replica running it would."""
+    registry = AionActiveTaskRegistry(
+        agent_executor=Mock(),
+        task_store=store,
+        push_sender=None,
+        lease_heartbeat=HEARTBEAT,
+        lease_owner=owner,
+    )
+    with patch("aion.server.agent.execution.active_task_registry.ActiveTask") as active_task_cls:
+        active_task_cls.return_value.start = AsyncMock()
+        active_task_cls.return_value.aclose = AsyncMock()
+        await registry.get_or_create(task_id, call_context=None, context_id="ctx-1")
+    return registry
+
+
+def _kill(registry: AionActiveTaskRegistry) -> None:
+    """Stop a replica the way SIGKILL does: its heartbeat ends and nothing is settled."""
+    registry._heartbeat_task.cancel()
+
+
+class TestOrphanedTaskSweep:
+    @pytest.mark.anyio
+    async def test_settles_the_killed_replicas_task_and_spares_the_live_one(self, store, execution_scope):
+        killed = await _replica(store, "host-1:10:a", "task-a")
+        live = await _replica(store, "host-2:10:b", "task-b")
+        sweeper = OrphanedTaskSweeper(store, lease_ttl=LEASE_TTL, interval=HEARTBEAT, owner="host-2:10:b:sweep")
+
+        _kill(killed)
+        sweeper.start()
+        await asyncio.sleep(LEASE_TTL * 4)
+        await sweeper.close()
+
+        orphan = await store.get("task-a")
+        assert orphan.status.state == TaskState.TASK_STATE_FAILED
+        assert orphan.metadata[A2AMetadataKey.SETTLED_REASON.value] == TaskSettlementReason.SERVER_RESTART.value
+        assert (await store.get("task-b")).status.state == TaskState.TASK_STATE_WORKING
+        assert sweeper.totals.settled == 1
+        assert "task-a" not in store.leases
+        assert store.leases["task-b"][0] == "host-2:10:b"
+
+        await live.aclose()
+
+    @pytest.mark.anyio
+    async def test_a_task_resumed_after_its_claim_is_not_overwritten(self, store, execution_scope):
+        """A live replica resuming a claimed task takes the lease, and the sweep yields."""
+        killed = await _replica(store, "host-1:10:a", "task-a")
+        live = await _replica(store, "host-2:10:b", "task-b")
+        _kill(killed)
+        await asyncio.sleep(LEASE_TTL * 1.5)
+
+        claim_orphaned_tasks = store.claim_orphaned_tasks
+
+        async def claim_then_resume(owner, lease_ttl, limit):
+            claimed = await claim_orphaned_tasks(owner, lease_ttl, limit)
+            if claimed:
+                await _resume(live, "task-a")
+            return claimed
+
+        with patch.object(store, "claim_orphaned_tasks", claim_then_resume):
+            report = await OrphanedTaskSweeper(store, lease_ttl=LEASE_TTL, interval=1.0).sweep()
+
+        assert (report.settled, report.unchanged) == (0, 1)
+        assert (await store.get("task-a")).status.state == TaskState.TASK_STATE_WORKING
+        assert store.leases["task-a"][0] == "host-2:10:b"
+        await live.aclose()
+
+    @pytest.mark.anyio
+    async def test_a_lease_younger_than_its_ttl_is_not_claimed(self, store, execution_scope):
+        """A process killed a moment ago is indistinguishable from a live one yet."""
+        killed = await _replica(store, "host-1:10:a", "task-a")
+        _kill(killed)
+
+        report = await OrphanedTaskSweeper(store, lease_ttl=60.0, interval=1.0).sweep()
+
+        assert report.total == 0
+        assert (await store.get("task-a")).status.state == TaskState.TASK_STATE_WORKING
+
+    @pytest.mark.anyio
+    async def test_a_stalled_replica_learns_its_lease_was_taken(self, store, execution_scope):
+        stalled = await _replica(store, "host-1:10:a", "task-a")
+        _kill(stalled)
+        await asyncio.sleep(LEASE_TTL * 1.5)
+        await OrphanedTaskSweeper(store, lease_ttl=LEASE_TTL, interval=1.0).sweep()
+
+        with patch("aion.server.agent.execution.active_task_registry.logger") as log:
+            await stalled._renew_leases()
+
+        log.warning.assert_called_once()
+        assert "task-a" not in stalled._leased
+
+    def test_refuses_a_store_without_leases(self):
+        with pytest.raises(ValueError):
+            OrphanedTaskSweeper(InMemoryTaskStore())
+
+
+class TestRegistryLeases:
+    @pytest.mark.anyio
+    async def test_a_finished_task_releases_its_lease_with_the_next_heartbeat(self, store, execution_scope):
+        registry = await _replica(store, "host-1:10:a", "task-a")
+
+        await registry._remove_task("task-a")
+        await asyncio.sleep(HEARTBEAT * 3)
+
+        assert "task-a" not in store.leases
+        await registry.aclose()
+
+    @pytest.mark.anyio
+    async def test_a_task_resumed_before_the_heartbeat_keeps_its_new_lease(self, store, execution_scope):
+        registry = await _replica(store, "host-1:10:a", "task-a")
+        await registry._remove_task("task-a")
+
+        await _resume(registry, "task-a")
+        await registry._renew_leases()
+
+        assert store.leases["task-a"][0] == "host-1:10:a"
+        assert "task-a" in registry._leased
+        await registry.aclose()
+
+    @pytest.mark.anyio
+    async def test_a_task_resumed_while_its_lease_is_released_keeps_the_new_one(self, store, execution_scope):
+        """The release names the finished acquisition, so the resumed one survives it."""
+        registry = await _replica(store, "host-1:10:a", "task-a")
+        registry._heartbeat_task.cancel()
+        await registry._remove_task("task-a")
+
+        releasing = asyncio.Event()
+        resumed = asyncio.Event()
+        release_task_leases = store.release_task_leases
+
+        async def slow_release(owner, task_ids, tokens=None):
+            releasing.set()
+            await resumed.wait()
+            await release_task_leases(owner, task_ids, tokens)
+
+        with patch.object(store, "release_task_leases", slow_release):
+            heartbeat = asyncio.ensure_future(registry._renew_leases())
+            await releasing.wait()
+            await _resume(registry, "task-a")
+            resumed.set()
+            await heartbeat
+
+        assert store.leases["task-a"][0] == "host-1:10:a"
+        assert registry._leased == {"task-a": store.tokens["task-a"]}
+        await registry._renew_leases()
+        assert "task-a" in registry._leased
+        await registry.aclose()
+
+    @pytest.mark.anyio
+    async def test_shutdown_keeps_the_leases_of_tasks_it_could_not_settle(self, store, execution_scope):
+        """A refused settlement is left to expire, so another replica retries it."""
+        registry = await _replica(store, "host-1:10:a", "task-a")
+
+        with patch.object(registry, "_settle_interrupted_task", AsyncMock(side_effect=RuntimeError("refused"))):
+            await registry.aclose()
+
+        assert store.leases["task-a"][0] == "host-1:10:a"
+        assert registry._heartbeat_task is None
+
+    @pytest.mark.anyio
+    async def test_shutdown_releases_the_leases_of_tasks_it_settled(self, store, execution_scope):
+        registry = await _replica(store, "host-1:10:a", "task-a")
+
+        await registry.aclose()
+
+        assert (await store.get("task-a")).status.state == TaskState.TASK_STATE_FAILED
+        assert store.leases == {}
@@ -0,0 +1,88 @@
+"""Tests for the event loop and uvicorn options chosen from server settings."""
+
+import asyncio
+
+import pytest
+
+from aion.server.settings import app_settings
+from aion.server.utils import serving
+
+
+@pytest.fixture
+def installed(monkeypatch):
+    """Control which optional packages look installed."""
+    modules: set[str] = set()
+    monkeypatch.setattr(serving, "_is_installed", lambda name: name in modules)
+    return modules
+
+
+class TestUvicornConfigOptions:
+
+    def test_defaults_leave_optional_limits_to_uvicorn(self, installed):
+        options = serving.uvicorn_config_options()
+
+        assert options == {
+            "http": "h11",
+            "backlog": app_settings.server_backlog,
+            "timeout_keep_alive": app_settings.server_keep_alive_timeout,
+        }
+
+    def test_configured_limits_are_passed_through(self, installed, monkeypatch):
+        monkeypatch.setattr(app_settings, "server_limit_concurrency", 500)
+        monkeypatch.setattr(app_settings, "server_h11_max_incomplete_event_size", 65536)
+
+        options = serving.uvicorn_config_options()
+
+        assert options["limit_concurrency"] == 500
+        assert options["h11_max_incomplete_event_size"] == 65536
+
+    @pytest.mark.parametrize(
+        "setting, available, expected",
+        [
+            ("auto", {"httptools"}, "httptools"),
+            ("auto", set(), "h11"),
+            ("httptools", set(), "h11"),
+            ("httptools", {"httptools"}, "httptools"),
+            ("h11", {"httptools"}, "h11"),
+        ],
+    )
+    def test_http_parser_selection(self, installed, monkeypatch, setting, available, expected):
+        installed.update(available)
+        monkeypatch.setattr(app_settings, "server_http", setting)
+
+        assert serving.uvicorn_config_options()["http"] == expected
+
+
+class TestNewEventLoop:
+
+    @pytest.mark.parametrize("setting", ["asyncio", "auto", "uvloop"])
+    def test_falls_back_to_asyncio_without_uvloop(self, installed, monkeypatch, setting):
+        monkeypatch.setattr(app_settings, "server_loop", setting)
+
+        loop = serving.new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+            assert "uvloop" not in type(loop).__module__
+        finally:
+            loop.close()
+
+    def test_asyncio_setting_never_imports_uvloop(self, installed, monkeypatch):
+        installed.add("uvloop")
+        monkeypatch.setattr(app_settings, "server_loop", "asyncio")
+
+        loop = serving.new_event_loop()
+        try:
+            assert "uvloop" not in type(loop).__module__
+        finally:
+            loop.close()
+
+    @pytest.mark.parametrize("setting", ["auto", "uvloop"])
+    def test_uses_uvloop_when_installed(self, monkeypatch, setting):
+        pytest.importorskip("uvloop")
+        monkeypatch.setattr(app_settings, "server_loop", setting)
+
+        loop = serving.new_event_loop()
+        try:
+            assert type(loop).__module__.startswith("uvloop")
+        finally:
+            loop.close()
@@ -1,4 +1,4 @@
-"""Tests for utility functions: url, templates, text, path, asyncio."""
+"""Tests for utility functions: url, templates, text, path, asyncio, timing."""
 
 import asyncio
 from pathlib import Path
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 from aion.server.utils.asyncio import has_event_loop
+from aion.server.utils.timing import StartupTimer
 from aion.core.utils.path import get_base_dir, get_config_path
 from aion.core.utils.text import colorize_text
 from aion.core.utils.url import parse_host_port
@@ -147,3 +148,30 @@ class TestHasEventLoop:
             return has_event_loop()
 
         assert asyncio.run(_check()) is True
+
+
+class TestStartupTimer:
+    def test_phases_are_reported_in_order_with_total(self):
+        """Phases keep completion order; repeated names add up; total closes the line."""
+        timer = StartupTimer()
+        with timer.phase("database"):
+            pass
+        timer.record("import", 1.5)
+        timer.record("import", 0.5)
+
+        report = timer.report()
+
+        assert list(timer.phases) == ["database", "import"]
+        assert timer.phases["import"] == 2.0
+        assert report.startswith("database=")
+        assert "import=2.000s" in report
+        assert report.split()[-1].startswith("total=")
+
+    def test_failed_phase_is_still_recorded(self):
+        """A phase that raises still shows how long it ran."""
+        timer = StartupTimer()
+        with pytest.raises(RuntimeError):
+            with timer.phase("plugins"):
+                raise RuntimeError("boom")
+
+        assert "plugins" in timer.phases
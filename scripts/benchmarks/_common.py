@@ -0,0 +1,47 @@
+"""Helpers shared by the benchmark scripts.
+
+Benchmarks import the libraries straight from the working tree, the same way the
+test suites do, so a change is measured before it is installed anywhere. Run
+them with the interpreter of a lib that has the dependencies they need, e.g.
+``libs/aion-server/.venv/bin/python scripts/benchmarks/server_tuning.py``.
+"""
+
+import math
+import sys
+from pathlib import Path
+from typing import Sequence
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+LIBS_DIR = ROOT_DIR / "libs"
+
+
+def use_working_tree() -> None:
+    """Put every lib's ``src`` directory ahead of installed copies."""
+    for src in sorted(LIBS_DIR.glob("aion-*/src")):
+        if str(src) not in sys.path:
+            sys.path.insert(0, str(src))
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` for ``q`` in [0, 100]."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """Print rows as a plain fixed-width table."""
+    cells = [[str(h) for h in headers]] + [[_format(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for index, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def _format(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return str(value)
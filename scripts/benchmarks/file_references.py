@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compare LangGraph checkpoint size and turn time with files inline or by reference.
+
+The first turn of a thread carries a file attachment of ``--size-mb`` megabytes;
+every later turn is text only. Each turn runs a two-node graph (a stand-in
+model node and a post-processing node) over a ``messages`` state, so every
+turn writes several checkpoints.
+
+``inline`` converts the attachment the way the server does by default, as a
+base64 file block in the message. ``reference`` stores the bytes in an
+in-memory file content store and puts a reference in the message; the model
+node resolves it with ``resolve_file_references`` before its (simulated)
+call, as a real graph would.
+
+Checkpoint size is the serialized size of everything the checkpointer holds
+after all turns; turn time is the wall time of ``ainvoke`` including checkpoint
+writes.
+
+Usage:
+    python scripts/benchmarks/file_references.py
+    python scripts/benchmarks/file_references.py --size-mb 16 --turns 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from _common import percentile, print_table, use_working_tree
+
+
+def build_graph(checkpointer, resolve):
+    from langchain_core.messages import AIMessage
+    from langgraph.graph import END, START, MessagesState, StateGraph
+
+    async def model(state):
+        messages = await resolve(state["messages"])
+        return {"messages": [AIMessage(content=f"seen {len(messages)} messages")]}
+
+    def postprocess(state):
+        return {"messages": [AIMessage(content="done")]}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("model", model)
+    builder.add_node("postprocess", postprocess)
+    builder.add_edge(START, "model")
+    builder.add_edge("model", "postprocess")
+    builder.add_edge("postprocess", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+async def run(mode: str, attachment: bytes, turns: int) -> tuple[int, list[float]]:
+    """Run ``turns`` turns of one thread; return checkpoint bytes and turn times."""
+    from a2a.types import Part
+    from langchain_core.messages import HumanMessage
+
+    from aion.langgraph.authoring.files import InMemoryFileContentStore, resolve_file_references
+    from aion.langgraph.server.checkpoint import BoundedInMemorySaver
+    from aion.langgraph.server.converters import A2AToLcConverter
+
+    store = InMemoryFileContentStore() if mode == "reference" else None
+    saver = BoundedInMemorySaver()
+
+    async def resolve(messages):
+        if store is None:
+            return messages
+        return await resolve_file_references(messages, store)
+
+    graph = build_graph(saver, resolve)
+    config = {"configurable": {"thread_id": mode}}
+    latencies = []
+    for turn in range(turns):
+        parts = [Part(text=f"turn {turn}")]
+        if turn == 0:
+            parts.append(Part(raw=attachment, media_type="application/pdf"))
+        started = time.perf_counter()
+        blocks = await A2AToLcConverter.afrom_parts(parts, file_store=store)
+        await graph.ainvoke({"messages": [HumanMessage(content=blocks)]}, config)
+        latencies.append(time.perf_counter() - started)
+    return saver.memory_usage().bytes, latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    use_working_tree()
+    attachment = os.urandom(int(args.size_mb * 1024 * 1024))
+    rows = []
+    for mode in ("inline", "reference"):
+        size, latencies = asyncio.run(run(mode, attachment, args.turns))
+        rows.append((
+            mode,
+            size / 1024 / 1024,
+            latencies[0] * 1000,
+            percentile(latencies[1:], 50) * 1000 if len(latencies) > 1 else float("nan"),
+            sum(latencies) * 1000,
+        ))
+
+    print(f"\n{args.turns} turns, {args.size_mb:g} MB attachment on the first turn\n")
+    print_table(["mode", "checkpoints MB", "first turn ms", "later turn p50 ms", "total ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
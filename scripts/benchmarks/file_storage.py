@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Measure what the filesystem file storage backend does to requests carrying files.
+
+Each request is a ``SendMessage`` with one attachment of ``--size-mb``
+megabytes, run through the request's file part preprocessor as the agent runs
+it. ``inline`` has no storage backend, so the bytes stay in the message;
+``filesystem (new)`` stores a distinct file per request and ``filesystem
+(duplicate)`` sends the same file every time, which is stored once.
+
+Request size is the JSON-RPC body the client sends. Stored message size is
+the message as it lands in the task's history, serialized as JSON the way the
+PostgreSQL store writes it. Latency is the preprocessing time per request,
+upload included.
+
+``serving`` fetches a stored file through the agent's ``/files`` route, in
+full and as a 1 MB range from the middle of the file.
+
+Usage:
+    python scripts/benchmarks/file_storage.py
+    python scripts/benchmarks/file_storage.py --size-mb 50 --requests 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from _common import percentile, print_table, use_working_tree
+
+BASE_URL = "http://agent:8001"
+
+
+def build_request(data: bytes):
+    from a2a.types import Message, Part, Role, SendMessageRequest
+
+    return SendMessageRequest(message=Message(
+        message_id="m1", role=Role.ROLE_USER, context_id="ctx-1",
+        parts=[Part(text="Describe the attachment."), Part(raw=data, media_type="image/png", filename="a.png")],
+    ))
+
+
+def json_size(message) -> int:
+    from google.protobuf.json_format import MessageToDict
+
+    return len(json.dumps(MessageToDict(message)).encode())
+
+
+async def run(mode: str, size: int, requests: int, root: str) -> tuple[int, int, list[float]]:
+    """Preprocess ``requests`` requests; return request bytes, stored bytes and latencies in ms."""
+    from aion.server.core.app.handlers.request_preprocessors import FilePartPreprocessor
+    from aion.server.files.a2a import A2AFileTransformer
+    from aion.server.files.storage import FilesystemFileStorageBackend, FileUploadManager
+
+    manager = None
+    if mode != "inline":
+        manager = FileUploadManager(FilesystemFileStorageBackend(root, BASE_URL))
+    preprocessor = FilePartPreprocessor(A2AFileTransformer(manager), wait_upload=True)
+
+    duplicate = os.urandom(size)
+    request_bytes = stored_bytes = 0
+    latencies = []
+    for _ in range(requests):
+        request = build_request(duplicate if mode == "filesystem (duplicate)" else os.urandom(size))
+        request_bytes = len(json.dumps({
+            "jsonrpc": "2.0", "id": 1, "method": "SendMessage",
+            "params": json.loads(json.dumps(_to_dict(request))),
+        }).encode())
+
+        started = time.perf_counter()
+        await preprocessor.process(request)
+        latencies.append((time.perf_counter() - started) * 1000)
+        stored_bytes = json_size(request.message)
+
+    return request_bytes, stored_bytes, latencies
+
+
+def _to_dict(message) -> dict:
+    from google.protobuf.json_format import MessageToDict
+
+    return MessageToDict(message)
+
+
+async def time_serving(size: int, fetches: int, root: str) -> tuple[float, float]:
+    """Return milliseconds to fetch a stored file in full and as a 1 MB range."""
+    import httpx
+    from fastapi import FastAPI
+
+    from aion.server.core.app.api import create_file_routes
+    from aion.server.files.storage import FilesystemFileStorageBackend
+
+    backend = FilesystemFileStorageBackend(root, BASE_URL)
+    file_id, uri = backend.generate_uri(mime_type="image/png", context_id="ctx-1")
+    await backend.upload(file_id, os.urandom(size), "image/png", context_id="ctx-1")
+    app = FastAPI()
+    app.router.routes.extend(create_file_routes(backend))
+    path = uri.removeprefix(BASE_URL)
+    middle = size // 2
+    byte_range = {"range": f"bytes={middle}-{middle + 1024 * 1024 - 1}"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL) as client:
+        async def fetch(headers=None) -> float:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+            return (time.perf_counter() - started) * 1000
+
+        full = min([await fetch() for _ in range(fetches)])
+        ranged = min([await fetch(byte_range) for _ in range(fetches)])
+    return full, ranged
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--fetches", type=int, default=10, help="Best of this many fetches is reported")
+    args = parser.parse_args()
+
+    use_working_tree()
+    size = int(args.size_mb * 1024 * 1024)
+
+    rows = []
+    for mode in ("inline", "filesystem (new)", "filesystem (duplicate)"):
+        with tempfile.TemporaryDirectory() as root:
+            request_bytes, stored_bytes, latencies = asyncio.run(run(mode, size, args.requests, root))
+            disk = sum(len(files) for _, _, files in os.walk(os.path.join(root, "objects")))
+        rows.append((
+            mode, request_bytes / 1e6, stored_bytes / 1e3,
+            percentile(latencies, 50), percentile(latencies, 99), disk,
+        ))
+
+    print(f"\n{args.requests} requests with a {args.size_mb:g} MB attachment\n")
+    print_table(
+        ["storage", "request MB", "stored message KB", "p50 ms", "p99 ms", "files on disk"],
+        rows,
+    )
+
+    with tempfile.TemporaryDirectory() as root:
+        full, ranged = asyncio.run(time_serving(size, args.fetches, root))
+    print(f"\nserving, best of {args.fetches}\n")
+    print_table(["fetch", "ms"], [(f"full {args.size_mb:g} MB", full), ("1 MB range", ranged)])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
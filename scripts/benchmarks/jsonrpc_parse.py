@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compare JSON-RPC request handling with the body decoded per reader or once.
+
+Each request is a ``SendMessage`` whose message carries one inline file part
+of the given size, posted through ``AionContextMiddleware`` to
+``AionJsonRpcDispatcher`` in-process (httpx ASGI transport, no sockets). The
+request handler answers immediately with a fixed message, so the time is the
+server's own request path: body reading, JSON decoding, protobuf parsing and
+response encoding.
+
+``per-reader`` restores the previous behaviour, where the middleware and the
+dispatcher each decoded the body with ``request.json()``; ``shared`` is the
+working tree, where the decoded body is shared between them.
+
+Usage:
+    python scripts/benchmarks/jsonrpc_parse.py
+    python scripts/benchmarks/jsonrpc_parse.py --sizes 1024 1048576 --requests 50
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, Mock, patch
+
+from _common import percentile, print_table, use_working_tree
+
+SIZES = (1024, 1024 * 1024, 10 * 1024 * 1024)
+
+
+def build_app():
+    from a2a.types import Message, Part, Role
+    from a2a.utils import DEFAULT_RPC_URL
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.routing import Route
+
+    from aion.server.core.app.handlers.jsonrpc_dispatcher import AionJsonRpcDispatcher
+    from aion.server.core.middlewares.aion_context import AionContextMiddleware
+
+    handler = Mock()
+    handler.on_message_send = AsyncMock(
+        return_value=Message(message_id="reply", role=Role.ROLE_AGENT, parts=[Part(text="ok")])
+    )
+    dispatcher = AionJsonRpcDispatcher(request_handler=handler)
+    return Starlette(
+        routes=[Route(DEFAULT_RPC_URL, dispatcher.handle_requests, methods=["POST"])],
+        middleware=[Middleware(AionContextMiddleware)],
+    )
+
+
+def build_body(size: int) -> bytes:
+    payload = base64.b64encode(b"\0" * (size * 3 // 4)).decode()
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "SendMessage",
+        "params": {
+            "message": {
+                "messageId": "m-1",
+                "role": "ROLE_USER",
+                "parts": [{"raw": payload, "mediaType": "application/pdf"}],
+            },
+        },
+    }).encode()
+
+
+async def run(mode: str, body: bytes, requests: int) -> tuple[list[float], int]:
+    """Post ``body`` ``requests`` times; return latencies and JSON decodes per request."""
+    import httpx
+    from a2a.utils import DEFAULT_RPC_URL
+
+    async def per_reader(request):
+        return await request.json()
+
+    decoder = Mock(wraps=json)
+    with ExitStack() as stack:
+        stack.enter_context(patch("starlette.requests.json", decoder))
+        if mode == "per-reader":
+            stack.enter_context(patch("aion.server.core.middlewares.aion_context.read_json_body", per_reader))
+            stack.enter_context(patch("aion.server.core.app.handlers.jsonrpc_dispatcher.read_json_body", per_reader))
+
+        transport = httpx.ASGITransport(app=build_app())
+        headers = {"Content-Type": "application/json", "A2A-Version": "1.0"}
+        latencies = []
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = await client.post(DEFAULT_RPC_URL, content=body, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if "result" not in response.json():
+                    raise RuntimeError(f"Unexpected response: {response.text[:200]}")
+    return latencies, decoder.loads.call_count // requests
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Body sizes in bytes")
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    use_working_tree()
+    rows = []
+    for size in args.sizes:
+        body = build_body(size)
+        for mode in ("per-reader", "shared"):
+            latencies, decodes = asyncio.run(run(mode, body, args.requests))
+            rows.append((
+                f"{len(body) / 1024:,.0f} KB",
+                mode,
+                decodes,
+                percentile(latencies, 50) * 1000,
+                percentile(latencies, 99) * 1000,
+            ))
+
+    print(f"\n{args.requests} SendMessage requests per body size\n")
+    print_table(["body", "mode", "decodes/request", "p50 ms", "p99 ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
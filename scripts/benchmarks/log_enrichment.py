@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Measure log records/sec through the server's handlers under a busy request scope.
+
+Each record is logged inside an active SDK span and an execution scope holding
+a distribution, a traceparent, ``--baggage`` inbound baggage entries and as many
+agent framework ones, the way a record logged while an agent handles a request
+is. The handlers write to a null stream, so the time is enrichment, filtering
+and formatting alone.
+
+Two handler setups are measured:
+
+``console``  the stream handler alone, which prints the task id and no other
+             context field.
+``logstash`` the stream handler plus a handler with the Logstash filter and
+             formatter, which read every field.
+
+``eager`` restores the previous context filter, which copied every field onto
+each record as it passed; ``lazy`` is the working tree, where the filter
+captures the context and formatters resolve the fields they read.
+
+Usage:
+    python scripts/benchmarks/log_enrichment.py
+    python scripts/benchmarks/log_enrichment.py --records 50000 --baggage 40
+"""
+
+import argparse
+import io
+import logging
+import sys
+import time
+
+from _common import print_table, use_working_tree
+
+
+class _NullStream(io.TextIOBase):
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+class EagerContextFilter(logging.Filter):
+    """The context filter as it was before fields were resolved lazily."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, '_aion_enriched', False):
+            self._enrich_otel(record)
+            self._enrich_server_context(record)
+            record._aion_enriched = True
+        return True
+
+    @staticmethod
+    def _enrich_otel(record: logging.LogRecord) -> None:
+        """Populate trace_id, span_id, span_name, and parent_span_id from the active OTel span."""
+        try:
+            from aion.server.opentelemetry.tracing import get_span_info
+
+            trace_span_info = get_span_info()
+            record.trace_id = getattr(trace_span_info, "trace_id_hex", None)
+            record.trace_span_id = getattr(trace_span_info, "span_id_hex", None)
+            record.trace_span_name = getattr(trace_span_info, "span_name", None)
+            record.trace_parent_span_id = getattr(trace_span_info, "parent_span_id_hex", None)
+        except Exception:
+            pass
+
+    @classmethod
+    def _enrich_server_context(cls, record: logging.LogRecord) -> None:
+        """Populate Aion deployment, task, and request fields from the current execution scope."""
+        try:
+            from aion.server.agent.execution.scope import get_execution_scope
+
+            scope = get_execution_scope()
+            if not scope:
+                return
+
+            ec_inbound = scope.inbound
+            ec_framework = scope.framework
+
+            record.trace_baggage = ec_inbound.trace.baggage.copy()
+            record.agent_trace_baggage = ec_framework.agent_framework.trace.baggage.copy()
+
+            record.transaction_id = ec_inbound.trace.transaction_id
+            record.transaction_name = ec_inbound.transaction_name
+
+            record.aion_distribution_id = ec_inbound.aion.distribution_id
+            record.aion_version_id = ec_inbound.aion.version_id or cls._get_app_version_id()
+            record.aion_agent_environment_id = ec_inbound.aion.environment_id
+
+            record.http_request_method = ec_inbound.request.method
+            record.http_request_target = ec_inbound.request.path
+
+            record.task_id = ec_inbound.a2a.task_id
+            record.a2a_rpc_method = ec_inbound.request.jrpc_method
+            record.a2a_task_status = ec_inbound.a2a.task_status
+        except Exception:
+            pass
+
+    @staticmethod
+    def _get_app_version_id() -> str:
+        """Return the running agent's version_id from app settings as a fallback."""
+        from aion.server.settings import app_settings
+        return app_settings.version_id
+
+
+def build_logger(mode: str, setup: str) -> logging.Logger:
+    from aion.core.logging import AionLogger
+    from aion.server.logging.filters import ServerAionContextFilter
+    from aion.server.logging.handlers.logstash import AionLogstashFilter, AionLogstashFormatter
+    from aion.server.logging.handlers.stream import LogStreamFormatter
+
+    context_filter = EagerContextFilter() if mode == "eager" else ServerAionContextFilter()
+
+    logger = AionLogger(f"bench.{mode}.{setup}", logging.INFO)
+    logger.propagate = False
+
+    stream = logging.StreamHandler(_NullStream())
+    stream.setFormatter(LogStreamFormatter())
+    stream.addFilter(context_filter)
+    logger.addHandler(stream)
+
+    if setup == "logstash":
+        logstash = logging.StreamHandler(_NullStream())
+        logstash.setFormatter(AionLogstashFormatter(client_id="bench", node_name="bench"))
+        logstash.addFilter(context_filter)
+        logstash.addFilter(AionLogstashFilter())
+        logger.addHandler(logstash)
+    return logger
+
+
+def enter_busy_scope(baggage: int) -> None:
+    from a2a.types import TaskState
+
+    from aion.server.agent.execution.scope import init_execution_scope
+
+    scope = init_execution_scope()
+    inbound = scope.inbound
+    inbound.aion.distribution_id = "distribution-1"
+    inbound.aion.version_id = "version-1"
+    inbound.aion.environment_id = "environment-1"
+    inbound.trace.traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    inbound.trace.baggage = {f"aion.key.{index}": f"value-{index}" for index in range(baggage)}
+    inbound.request.method = "POST"
+    inbound.request.path = "/"
+    inbound.request.jrpc_method = "SendMessage"
+    inbound.a2a.task_id = "task-1"
+    inbound.a2a.task_status = TaskState.TASK_STATE_WORKING
+    scope.framework.agent_framework.trace.baggage = {f"agent.key.{index}": str(index) for index in range(baggage)}
+
+
+def run(mode: str, setup: str, records: int) -> float:
+    """Log ``records`` records; return records/sec."""
+    logger = build_logger(mode, setup)
+    started = time.perf_counter()
+    for index in range(records):
+        logger.info("Processed chunk %d of the agent reply", index)
+    return records / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--baggage", type=int, default=20, help="Entries in each baggage dict")
+    parser.add_argument("--runs", type=int, default=3, help="Best of this many runs is reported")
+    args = parser.parse_args()
+
+    use_working_tree()
+    from opentelemetry.sdk.trace import TracerProvider
+
+    enter_busy_scope(args.baggage)
+    tracer = TracerProvider().get_tracer("bench")
+
+    rows = []
+    with tracer.start_as_current_span("request"), tracer.start_as_current_span("agent.stream"):
+        for setup in ("console", "logstash"):
+            results = {"eager": 0.0, "lazy": 0.0}
+            # Alternated, so drift over the run affects both modes alike.
+            for _ in range(args.runs):
+                for mode in results:
+                    results[mode] = max(results[mode], run(mode, setup, args.records))
+            for mode, rate in results.items():
+                rows.append((setup, mode, rate, rate / results["eager"]))
+
+    print(f"\n{args.records} records per run, best of {args.runs}, {args.baggage} baggage entries\n")
+    print_table(["handlers", "mode", "records/sec", "vs eager"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
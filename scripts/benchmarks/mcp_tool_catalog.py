@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Compare LangGraph turn latency with and without the MCP tool catalog cache.
+
+A turn is what a graph does on each invocation: ``load_aion_mcp_tools`` for the
+global metatools endpoint, then one tool call. A stub MCP server with a handful
+of tools runs in a child process on a free local port, so what is measured is
+the MCP handshake, ``tools/list`` and the call itself, not a remote service.
+
+Without the catalog every turn builds a new ``MultiServerMCPClient`` and lists
+the tools again; with it the listing happens once and later turns only pay for
+the tool call. The bearer token changes on every turn in both cases, as it
+would across JWT refreshes, to show that rotation does not defeat the cache.
+
+Usage:
+    python scripts/benchmarks/mcp_tool_catalog.py
+    python scripts/benchmarks/mcp_tool_catalog.py --turns 200 --tools 20
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from _common import percentile, print_table, use_working_tree
+
+MCP_PATH = "/mcp/capabilities/mcp.aion.metatools"
+
+
+def serve(port: int, tool_count: int) -> None:
+    """Child process: serve a stub MCP server over streamable HTTP."""
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP(
+        "stub",
+        host="127.0.0.1",
+        port=port,
+        streamable_http_path=MCP_PATH,
+        log_level="WARNING",
+    )
+
+    def make_tool(index: int):
+        def tool(text: str) -> str:
+            return f"{index}:{text}"
+
+        tool.__name__ = f"tool_{index}"
+        tool.__doc__ = f"Echo text through stub tool {index}."
+        return tool
+
+    for index in range(tool_count):
+        server.add_tool(make_tool(index))
+    server.run(transport="streamable-http")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    raise RuntimeError(f"stub MCP server on port {port} did not start")
+
+
+class RotatingTokenManager:
+    """Hands out a new bearer token on every call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_token(self) -> str:
+        self.calls += 1
+        return f"token-{self.calls}"
+
+
+async def run_turns(port: int, turns: int, cached: bool) -> list[float]:
+    """Run ``turns`` load-and-call turns; return each turn's latency."""
+    from aion.api.control_plane import CapabilityReference
+    from aion.langgraph.authoring.mcp import AionMcpToolCatalog, load_aion_mcp_tools
+
+    catalog = AionMcpToolCatalog() if cached else None
+    tokens = RotatingTokenManager()
+    latencies = []
+    for turn in range(turns):
+        started = time.perf_counter()
+        tools = await load_aion_mcp_tools(
+            capability_references=[CapabilityReference.global_mcp()],
+            jwt_manager=tokens,
+            base_url=f"http://127.0.0.1:{port}",
+            tool_catalog=catalog,
+        )
+        await tools[0].ainvoke({"text": f"turn {turn}"})
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--tools", type=int, default=10)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.tools)
+        return 0
+
+    use_working_tree()
+    port = free_port()
+    child = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port), "--tools", str(args.tools)],
+        env=os.environ.copy(),
+    )
+    rows = []
+    try:
+        wait_for_port(port)
+        for label, cached in (("uncached", False), ("catalog", True)):
+            latencies = asyncio.run(run_turns(port, args.turns, cached))
+            rows.append((
+                label,
+                sum(latencies) / len(latencies) * 1000,
+                percentile(latencies, 50) * 1000,
+                percentile(latencies, 99) * 1000,
+                latencies[0] * 1000,
+            ))
+    finally:
+        child.terminate()
+        child.wait()
+
+    print(f"\n{args.turns} turns against a stub MCP server with {args.tools} tools\n")
+    print_table(["mode", "mean ms", "p50 ms", "p99 ms", "first turn ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Measure what the Prometheus metrics cost on the hot paths and per scrape.
+
+``hot path`` runs ``--events`` agent events through ``AionEventPipeline``
+with no task manager, so routing an event is little more than the metrics
+the pipeline records for it. ``bare`` restores the pipeline's ``process`` as
+it was before metrics; ``instrumented`` is the working tree. It also times
+the single operations the instrumented paths perform, in nanoseconds.
+
+``scrape`` renders an agent's ``/metrics`` with every server instrument
+populated, and aggregates ``--agents`` such bodies the way the proxy's
+``/metrics`` does after scraping them, in microseconds per scrape.
+
+Usage:
+    python scripts/benchmarks/metrics.py
+    python scripts/benchmarks/metrics.py --events 200000 --agents 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+from _common import print_table, use_working_tree
+
+
+def bare_pipeline_class():
+    from a2a.types import Message, Task
+
+    from aion.server.a2a.utils import is_ephemeral_status_event
+    from aion.server.agent.execution.event_pipeline import AionEventPipeline
+
+    class BarePipeline(AionEventPipeline):
+        """The pipeline as it was before it recorded metrics."""
+
+        async def process(self, event) -> None:
+            await self._ensure_task_started()
+            event = await self._prepare_event(event)
+            event = await self._deduplicate_event(event)
+            if event is None:
+                return
+
+            if isinstance(event, (Task, Message)):
+                if isinstance(event, Task):
+                    await self._flush_pending_status_message(event)
+                await self._save_silently(event)
+            else:
+                await self._emit_to_client(event)
+
+            self._note_terminal_state(event)
+
+            if self._deduplicator is not None and not is_ephemeral_status_event(event):
+                self._deduplicator.apply_processed_item(event)
+
+    return BarePipeline
+
+
+def run_pipeline(events: int, instrumented: bool) -> float:
+    """Route ``events`` events through one pipeline; return events/sec."""
+    from a2a.types import TaskState, TaskStatus, TaskStatusUpdateEvent
+
+    from aion.server.agent.execution.event_pipeline import AionEventPipeline
+
+    event = TaskStatusUpdateEvent(task_id="task-1", status=TaskStatus(state=TaskState.TASK_STATE_WORKING))
+    pipeline_class = AionEventPipeline if instrumented else bare_pipeline_class()
+    pipeline = pipeline_class(event_queue=AsyncMock(), task_updater=AsyncMock(), task_started=True)
+    pipeline._emit_to_client = _emit
+
+    async def drive() -> float:
+        started = time.perf_counter()
+        for _ in range(events):
+            await pipeline.process(event)
+        return events / (time.perf_counter() - started)
+
+    with patch("aion.server.agent.execution.event_pipeline.exec_scope_get_task_manager", return_value=None):
+        return asyncio.run(drive())
+
+
+async def _emit(event) -> None:
+    pass
+
+
+def time_operation(operation, count: int) -> float:
+    """Return nanoseconds per call of ``operation``."""
+    started = time.perf_counter()
+    for _ in range(count):
+        operation()
+    return (time.perf_counter() - started) / count * 1e9
+
+
+def populate() -> None:
+    from aion.server.metrics.instruments import (
+        EVENT_PROCESSING_SECONDS,
+        EVENTS_PROCESSED,
+        PUSH_DELIVERIES,
+        PUSH_DELIVERY_SECONDS,
+        TASKS_STARTED,
+    )
+
+    TASKS_STARTED.inc(100)
+    for event in ("Task", "Message", "TaskStatusUpdateEvent", "TaskArtifactUpdateEvent"):
+        EVENTS_PROCESSED.labels(event).inc(1000)
+    for outcome in ("delivered", "rejected", "timeout", "error"):
+        PUSH_DELIVERIES.labels(outcome).inc(10)
+    for index in range(1000):
+        EVENT_PROCESSING_SECONDS.observe(index / 10000)
+        PUSH_DELIVERY_SECONDS.observe(index / 1000)
+
+
+def time_scrapes(agents: int, scrapes: int) -> tuple[float, float]:
+    """Return microseconds to render one agent scrape, and to aggregate ``agents`` of them."""
+    from types import SimpleNamespace
+
+    from aion.proxy.metrics import relabel_agent_metrics
+    from aion.server.metrics import ActiveTasksCollector, metrics_registry, render_metrics
+
+    collector = ActiveTasksCollector(SimpleNamespace(active_task_count=12))
+
+    def render() -> bytes:
+        return render_metrics([*metrics_registry.collect(), *collector.collect()])
+
+    body = render().decode()
+    bodies = {f"agent-{index}": body for index in range(agents)}
+
+    render_us = time_operation(render, scrapes) / 1000
+    aggregate_us = time_operation(lambda: relabel_agent_metrics(bodies), scrapes) / 1000
+    return render_us, aggregate_us
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--agents", type=int, default=10, help="Agents whose metrics the proxy aggregates")
+    parser.add_argument("--scrapes", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3, help="Best of this many pipeline runs is reported")
+    args = parser.parse_args()
+
+    use_working_tree()
+    from aion.server.metrics import MetricsRegistry
+
+    bare = instrumented = 0.0
+    # Best of alternated runs, so drift over the run affects both alike.
+    for _ in range(args.runs):
+        bare = max(bare, run_pipeline(args.events, instrumented=False))
+        instrumented = max(instrumented, run_pipeline(args.events, instrumented=True))
+    added_ns = (1 / instrumented - 1 / bare) * 1e9
+
+    print(f"\nhot path, {args.events} events, best of {args.runs}\n")
+    print_table(
+        ["pipeline", "events/sec", "vs bare", "added ns/event"],
+        [("bare", bare, 1.0, "-"), ("instrumented", instrumented, instrumented / bare, added_ns)],
+    )
+
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "Bench.")
+    labelled = registry.counter("bench_labelled_total", "Bench.", labelnames=("event",))
+    histogram = registry.histogram("bench_seconds", "Bench.")
+    count = args.events
+    print()
+    print_table(["operation", "ns/op"], [
+        ("counter.inc()", time_operation(counter.inc, count)),
+        ("counter.labels(value).inc()", time_operation(lambda: labelled.labels("Task").inc(), count)),
+        ("histogram.observe(value)", time_operation(lambda: histogram.observe(0.003), count)),
+        ("time.perf_counter()", time_operation(time.perf_counter, count)),
+    ])
+
+    populate()
+    render_us, aggregate_us = time_scrapes(args.agents, args.scrapes)
+    print(f"\nscrape, {args.scrapes} scrapes\n")
+    print_table(["scrape", "µs/scrape"], [
+        ("agent /metrics render", render_us),
+        (f"proxy aggregation of {args.agents} agents", aggregate_us),
+    ])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Measure upload throughput of the S3 file storage backend.
+
+``small files`` schedules ``--small-files`` files of ``--small-kb`` kilobytes
+at once through a ``FileUploadManager`` and waits for them all, at several
+``FILE_STORAGE_UPLOAD_CONCURRENCY`` values. ``large files`` uploads
+``--large-files`` files of ``--large-mb`` megabytes one after another as
+multipart uploads, at several ``FILE_STORAGE_S3_PART_CONCURRENCY`` values.
+
+By default the bucket is served by moto in a thread of this process, which
+measures the backend's own overhead rather than a network; pass
+``--endpoint-url`` to run against a real service such as MinIO, with
+credentials in the environment.
+
+Usage:
+    python scripts/benchmarks/s3_upload.py
+    python scripts/benchmarks/s3_upload.py --endpoint-url http://localhost:9000 --large-mb 128
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from uuid import uuid4
+
+from _common import print_table, use_working_tree
+
+UPLOAD_CONCURRENCY = (1, 8, 32)
+PART_CONCURRENCY = (1, 4, 8)
+
+
+async def new_backend(endpoint_url: str, **kwargs):
+    from aion.server.files.storage.backends.s3 import S3FileStorageBackend
+
+    backend = S3FileStorageBackend(f"bench-{uuid4().hex[:12]}", endpoint_url=endpoint_url, **kwargs)
+    await backend.start()
+    client = await backend._get_client()
+    await client.create_bucket(Bucket=backend._bucket)
+    return backend
+
+
+async def small_files(endpoint_url: str, count: int, size: int, upload_concurrency: int) -> float:
+    """Return seconds to store ``count`` files scheduled at once."""
+    from aion.server.files.storage import FileUploadManager
+
+    backend = await new_backend(endpoint_url, max_connections=upload_concurrency)
+    manager = FileUploadManager(backend, upload_concurrency=upload_concurrency)
+    files = [os.urandom(size) for _ in range(count)]
+
+    started = time.perf_counter()
+    uris = [manager.schedule(data, "image/png", context_id="ctx-1") for data in files]
+    await manager.wait(uris)
+    elapsed = time.perf_counter() - started
+
+    await manager.aclose()
+    return elapsed
+
+
+async def large_files(endpoint_url: str, count: int, size: int, part_concurrency: int) -> float:
+    """Return seconds to store ``count`` files one after another."""
+    backend = await new_backend(endpoint_url, part_concurrency=part_concurrency, max_connections=part_concurrency)
+    data = os.urandom(size)
+
+    started = time.perf_counter()
+    for _ in range(count):
+        file_id, _ = backend.generate_uri(mime_type="video/mp4", context_id="ctx-1")
+        await backend.upload(file_id, data, "video/mp4", context_id="ctx-1")
+    elapsed = time.perf_counter() - started
+
+    await backend.aclose()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", help="S3-compatible service to use instead of an in-process moto server")
+    parser.add_argument("--small-files", type=int, default=500)
+    parser.add_argument("--small-kb", type=int, default=64)
+    parser.add_argument("--large-files", type=int, default=3)
+    parser.add_argument("--large-mb", type=int, default=32)
+    args = parser.parse_args()
+
+    use_working_tree()
+    server = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        from moto.server import ThreadedMotoServer
+
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        for name, value in (("AWS_ACCESS_KEY_ID", "bench"), ("AWS_SECRET_ACCESS_KEY", "bench")):
+            os.environ.setdefault(name, value)
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint_url = f"http://{host}:{port}"
+
+    try:
+        small_size = args.small_kb * 1024
+        rows = []
+        for concurrency in UPLOAD_CONCURRENCY:
+            elapsed = asyncio.run(small_files(endpoint_url, args.small_files, small_size, concurrency))
+            rows.append((concurrency, args.small_files / elapsed, args.small_files * small_size / elapsed / 1e6))
+        print(f"\nsmall files: {args.small_files} files of {args.small_kb} KB scheduled at once\n")
+        print_table(["upload concurrency", "files/s", "MB/s"], rows)
+
+        large_size = args.large_mb * 1024 * 1024
+        rows = []
+        for concurrency in PART_CONCURRENCY:
+            elapsed = asyncio.run(large_files(endpoint_url, args.large_files, large_size, concurrency))
+            rows.append((concurrency, elapsed / args.large_files, args.large_files * large_size / elapsed / 1e6))
+        print(f"\nlarge files: {args.large_files} files of {args.large_mb} MB in 8 MB parts\n")
+        print_table(["part concurrency", "s per file", "MB/s"], rows)
+    finally:
+        if server is not None:
+            server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start time of ``aion serve`` with many agents.
+
+Writes an ``aion.yaml`` with ``--agents`` LangGraph agents into a temporary
+directory, then runs the serve startup (configuration loading, port
+reservation, one process per agent, startup confirmation) and shuts down
+again, ``--runs`` times. Each agent module sleeps ``--import-delay`` seconds at
+import, standing in for a graph whose import reads files or calls services.
+
+Both settings of ``AGENT_MODULE_PRELOAD`` are measured: with it on, each agent
+imports its module in a worker thread while its database and plugins are set
+up; with it off, the import follows plugin setup. Every run starts in a fresh
+interpreter, so imports are cold.
+
+Usage:
+    python scripts/benchmarks/serve_cold_start.py
+    python scripts/benchmarks/serve_cold_start.py --agents 10 --import-delay 1 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _common import percentile, print_table, use_working_tree
+
+AGENT_MODULE = '''
+import time
+
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+time.sleep({delay})
+
+
+def respond(state):
+    return {{"messages": []}}
+
+
+builder = StateGraph(MessagesState)
+builder.add_node("respond", respond)
+builder.add_edge(START, "respond")
+builder.add_edge("respond", END)
+graph = builder.compile()
+'''
+
+
+def write_project(directory: Path, agents: int, import_delay: float) -> None:
+    (directory / "agent.py").write_text(AGENT_MODULE.format(delay=import_delay))
+    lines = ["aion:", "  agents:"]
+    for index in range(agents):
+        lines += [f"    agent-{index}:", "      path: ./agent.py:graph", f"      name: Agent {index}"]
+    (directory / "aion.yaml").write_text("\n".join(lines) + "\n")
+
+
+async def start_and_stop() -> dict:
+    """Run one serve startup in this process; return its wall time and agent count."""
+    from aion.cli.handlers.serve import ServeHandler
+    from aion.core.config import AionConfigReader
+    from aion.server.utils.timing import StartupTimer
+
+    timer = StartupTimer()
+    with timer.phase("config"):
+        config = await asyncio.to_thread(AionConfigReader().load_and_validate_config)
+    handler = ServeHandler()
+    try:
+        started, failed, _ = await handler._startup(config=config, startup_timer=timer, startup_timeout=120)
+        seconds = timer.total
+    finally:
+        await handler.shutdown()
+    return {"seconds": seconds, "started": len(started), "failed": len(failed), "phases": timer.phases}
+
+
+def run_once(directory: Path, preload: bool) -> dict:
+    env = dict(os.environ, AGENT_MODULE_PRELOAD=str(preload).lower(), LOG_LEVEL="WARNING")
+    result = subprocess.run(
+        [sys.executable, __file__, "--child"],
+        cwd=directory, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--import-delay", type=float, default=1.0, help="Seconds each agent module sleeps at import")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    use_working_tree()
+    if args.child:
+        print(json.dumps(asyncio.run(start_and_stop())))
+        return 0
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_project(directory, args.agents, args.import_delay)
+        for preload in (False, True):
+            results = [run_once(directory, preload) for _ in range(args.runs)]
+            seconds = [result["seconds"] for result in results]
+            agents_phase = [result["phases"].get("agents", 0.0) for result in results]
+            rows.append((
+                "on" if preload else "off",
+                f"{min(r['started'] for r in results)}/{args.agents}",
+                percentile(seconds, 50),
+                percentile(agents_phase, 50),
+                max(seconds),
+            ))
+
+    print(f"\n{args.agents} agents, {args.import_delay:g}s module import, {args.runs} runs\n")
+    print_table(["preload", "started", "startup p50 s", "agents phase p50 s", "startup max s"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
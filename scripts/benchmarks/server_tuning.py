@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Compare requests/sec and latency of ``message/send`` across server tunings.
+
+Each configuration in the matrix - event loop x HTTP parser - runs a server in
+a child process built exactly as the agent and proxy servers are: its loop comes
+from ``aion.server.utils.serving.new_event_loop`` and its uvicorn options from
+``uvicorn_config_options``, both driven by the ``SERVER_*`` settings the child
+is started with. Configurations whose packages are not installed are skipped.
+
+The served app answers JSON-RPC ``message/send`` with a completed task, so what
+is measured is the server stack - loop, parser, keep-alive - rather than an
+agent's own work.
+
+Usage:
+    python scripts/benchmarks/server_tuning.py
+    python scripts/benchmarks/server_tuning.py --requests 20000 --concurrency 128
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+
+from _common import percentile, print_table, use_working_tree
+
+MATRIX = [
+    ("asyncio", "h11"),
+    ("asyncio", "httptools"),
+    ("uvloop", "h11"),
+    ("uvloop", "httptools"),
+]
+
+
+def serve(port: int) -> None:
+    """Child process: serve a minimal JSON-RPC app with the tuned server stack."""
+    use_working_tree()
+    import uvicorn
+    from aion.server.utils.serving import new_event_loop, uvicorn_config_options
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        request = json.loads(body)
+        message = request["params"]["message"]
+        result = {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": {
+                "task": {
+                    "id": str(uuid.uuid4()),
+                    "contextId": message.get("contextId") or str(uuid.uuid4()),
+                    "status": {"state": "TASK_STATE_COMPLETED"},
+                    "history": [message],
+                }
+            },
+        }
+        payload = json.dumps(result).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    config = uvicorn.Config(
+        app=app,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        access_log=False,
+        **uvicorn_config_options(),
+    )
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(uvicorn.Server(config).serve())
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def send_message_payload(index: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": index,
+        "method": "message/send",
+        "params": {
+            "message": {
+                "messageId": str(uuid.uuid4()),
+                "role": "ROLE_USER",
+                "parts": [{"text": "What is the weather like in Lisbon today?"}],
+            }
+        },
+    }
+
+
+async def load(port: int, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """Send ``requests`` calls with ``concurrency`` in flight; return wall time and latencies."""
+    import httpx
+
+    latencies: list[float] = []
+    counter = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+        async def worker():
+            for index in counter:
+                started = time.perf_counter()
+                response = await client.post("/", json=send_message_payload(index))
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        # Warm up connections before measuring.
+        await asyncio.gather(*(client.post("/", json=send_message_payload(-1)) for _ in range(concurrency)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - started, latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    rows = []
+    for loop_name, http_name in MATRIX:
+        missing = [name for name in (loop_name, http_name) if name in ("uvloop", "httptools")
+                   and importlib.util.find_spec(name) is None]
+        if missing:
+            rows.append((loop_name, http_name, "-", "-", "-", f"skipped ({', '.join(missing)} not installed)"))
+            continue
+
+        port = free_port()
+        env = {**os.environ, "SERVER_LOOP": loop_name, "SERVER_HTTP": http_name}
+        child = subprocess.Popen([sys.executable, __file__, "--serve", str(port)], env=env)
+        try:
+            wait_for_port(port)
+            elapsed, latencies = asyncio.run(load(port, args.requests, args.concurrency))
+        finally:
+            child.terminate()
+            child.wait()
+
+        rows.append((
+            loop_name,
+            http_name,
+            len(latencies) / elapsed,
+            percentile(latencies, 50) * 1000,
+            percentile(latencies, 99) * 1000,
+            "",
+        ))
+
+    print(f"\n{args.requests} message/send requests, {args.concurrency} concurrent\n")
+    print_table(["loop", "http", "req/s", "p50 ms", "p99 ms", "note"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Measure what the request stage spans cost, above all with tracing off.
+
+A simulated request opens a request span, as ``TracingMiddleware`` does, and
+runs the stages a ``message/send`` instruments - request context build,
+extension collection, the agent stream of ``--events`` events with one task
+event save per event, and one push delivery - each around an awaited no-op,
+so the time is the instrumentation alone. Each setup is run without stage
+spans, as before they were added, and with them:
+
+``no provider``   no tracer provider installed (a no-op tracer).
+``unsampled``     the provider ``init_tracing`` installs at
+                  ``TRACE_SAMPLE_RATIO=0``, which drops the trace.
+``sampled``       the same at ``TRACE_SAMPLE_RATIO=1``, without exporter.
+
+Usage:
+    python scripts/benchmarks/stage_spans.py
+    python scripts/benchmarks/stage_spans.py --requests 20000 --events 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from _common import print_table, use_working_tree
+
+
+async def _noop() -> None:
+    pass
+
+
+async def _events(count: int):
+    for index in range(count):
+        await _noop()
+        yield index
+
+
+async def request(tracer, traced: bool, events: int) -> None:
+    with tracer.start_as_current_span("POST /"):
+        await stages(traced, events)
+
+
+async def stages(traced: bool, events: int) -> None:
+    from aion.server.opentelemetry.stages import stage_span, traced_stream
+
+    def stage(name, **kwargs):
+        return stage_span(name, **kwargs) if traced else nullcontext()
+
+    ids = {"task_id": "task-1", "context_id": "context-1"}
+    with stage("aion.request_context.build", context_id="context-1"):
+        with stage("aion.task.discover_interrupted", context_id="context-1"):
+            await _noop()
+    with stage("aion.extensions.collect", **ids):
+        await _noop()
+
+    stream = _events(events)
+    if traced:
+        stream = traced_stream("aion.agent.stream", stream, **ids)
+    async for _ in stream:
+        with stage("aion.task.save_event", **ids, attributes={"aion.event.type": "TaskStatusUpdateEvent"}):
+            await _noop()
+
+    with stage("aion.push.get_configs", task_id="task-1"):
+        await _noop()
+    with stage("aion.push.deliver", task_id="task-1", attributes={"url.full": "http://receiver/hook"}):
+        await _noop()
+
+
+async def run(tracer, traced: bool, requests: int, events: int) -> float:
+    """Run ``requests`` simulated requests; return microseconds per request."""
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request(tracer, traced, events)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=20, help="Agent events per request")
+    args = parser.parse_args()
+
+    use_working_tree()
+    from opentelemetry import trace
+
+    from aion.server.opentelemetry.tracing import init_tracing
+    from aion.server.settings import AppSettings
+
+    def provider(ratio: float):
+        with patch("aion.server.opentelemetry.tracing.trace.set_tracer_provider"):
+            return init_tracing(AppSettings(TRACE_SAMPLE_RATIO=ratio))
+
+    tracers = {
+        "no provider": trace.get_tracer("bench"),
+        "unsampled": provider(0).get_tracer("bench"),
+        "sampled": provider(1).get_tracer("bench"),
+    }
+    spans = 6 + args.events
+    rows = []
+    for label, tracer in tracers.items():
+        with patch("aion.server.opentelemetry.stages._tracer", tracer):
+            bare = asyncio.run(run(tracer, False, args.requests, args.events))
+            staged = asyncio.run(run(tracer, True, args.requests, args.events))
+        rows.append((label, bare, staged, staged - bare, (staged - bare) * 1000 / spans))
+
+    print(f"\n{args.requests} requests of {args.events} agent events, {spans} stage spans each\n")
+    print_table(["tracing", "µs/request bare", "µs/request staged", "added µs", "added ns/span"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Measure task-creation throughput of ``AionActiveTaskRegistry`` by concurrency.
+
+Each run creates ``--tasks`` new tasks through ``get_or_create`` from a number
+of concurrent callers, against an in-memory store that answers every read
+after ``--store-ms`` milliseconds, as a database would. ``locked`` restores
+``get_or_create`` as it was, with the registry lock held while the task is
+built and registered; ``lock-free`` is the working tree. Creations/sec should
+grow with the callers for as long as the store round trip, not the registry,
+is what a creation waits on.
+
+Usage:
+    python scripts/benchmarks/task_creation.py
+    python scripts/benchmarks/task_creation.py --tasks 2000 --store-ms 5 --concurrency 1 16 256
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from unittest.mock import Mock
+
+from _common import print_table, use_working_tree
+
+
+def locked_registry_class():
+    from a2a.server.agent_execution.active_task import ActiveTask
+
+    from aion.server.agent.execution import active_task_registry as module
+
+    class LockedRegistry(module.AionActiveTaskRegistry):
+        """The registry as it was, creating tasks under its lock."""
+
+        async def get_or_create(
+            self, task_id, call_context, context_id=None, create_task_if_missing=False, initial_message=None,
+        ):
+            async with self._lock:
+                if self._closed:
+                    raise RuntimeError('ActiveTaskRegistry is closed')
+                if task_id in self._active_tasks:
+                    return self._active_tasks[task_id]
+
+                task_manager = module.AionTaskManager(
+                    task_id=task_id,
+                    context_id=context_id,
+                    task_store=self._task_store,
+                    initial_message=initial_message,
+                    context=call_context,
+                )
+                module.set_task_manager(task_manager)
+                push_sender = self._push_sender
+                if push_sender is not None:
+                    push_sender = module.TerminalTaskPushSender(inner=push_sender, task_manager=task_manager)
+                active_task = ActiveTask(
+                    agent_executor=self._agent_executor,
+                    task_id=task_id,
+                    task_manager=task_manager,
+                    push_sender=push_sender,
+                    on_cleanup=self._on_active_task_cleanup,
+                )
+                self._active_tasks[task_id] = active_task
+                self._task_managers[task_id] = task_manager
+                module.TASKS_STARTED.inc()
+
+            if self._leases_enabled:
+                await self._acquire_lease(task_id)
+
+            await active_task.start(call_context=call_context, create_task_if_missing=create_task_if_missing)
+            return active_task
+
+    return LockedRegistry
+
+
+def slow_store(store_ms: float):
+    from aion.server.tasks.stores.in_memory_task_store import InMemoryTaskStore
+
+    class SlowStore(InMemoryTaskStore):
+        """An in-memory store that answers reads after a database round trip."""
+
+        async def get(self, task_id, context=None):
+            await asyncio.sleep(store_ms / 1000)
+            return await super().get(task_id, context)
+
+    return SlowStore()
+
+
+def run(tasks: int, concurrency: int, store_ms: float, locked: bool) -> float:
+    """Create ``tasks`` tasks from ``concurrency`` callers; return creations/sec."""
+    from a2a.server.context import ServerCallContext
+
+    from aion.server.agent.execution.active_task_registry import AionActiveTaskRegistry
+    from aion.server.agent.execution.scope import init_execution_scope
+
+    registry_class = locked_registry_class() if locked else AionActiveTaskRegistry
+
+    async def drive() -> float:
+        init_execution_scope()
+        registry = registry_class(
+            agent_executor=Mock(),
+            task_store=slow_store(store_ms),
+            settlement_timeout=0,
+        )
+        call_context = ServerCallContext()
+        task_ids = iter(range(tasks))
+
+        async def caller() -> None:
+            for index in task_ids:
+                await registry.get_or_create(
+                    f"task-{index}", call_context=call_context, create_task_if_missing=True,
+                )
+
+        started = time.perf_counter()
+        await asyncio.gather(*(caller() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        await registry.aclose()
+        return tasks / elapsed
+
+    return asyncio.run(drive())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--store-ms", type=float, default=2.0, help="Simulated store round trip")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--runs", type=int, default=3, help="Best of this many runs is reported")
+    args = parser.parse_args()
+
+    use_working_tree()
+    # Closing each run's registry reports every task shutdown left unsettled.
+    logging.disable(logging.CRITICAL)
+
+    rows = []
+    for concurrency in args.concurrency:
+        locked = lock_free = 0.0
+        # Best of alternated runs, so drift over the run affects both alike.
+        for _ in range(args.runs):
+            locked = max(locked, run(args.tasks, concurrency, args.store_ms, locked=True))
+            lock_free = max(lock_free, run(args.tasks, concurrency, args.store_ms, locked=False))
+        rows.append((concurrency, locked, lock_free, lock_free / locked))
+
+    print(f"\n{args.tasks} tasks, {args.store_ms} ms store round trip, best of {args.runs}\n")
+    print_table(["callers", "locked creations/sec", "lock-free creations/sec", "lock-free vs locked"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Measure the request-path cost of tracing at several sampling ratios.
+
+Each simulated request opens a server span with ``--children`` nested child
+spans carrying a few attributes, the shape of a ``message/send`` through the
+middleware and executors. Spans are exported in batches over OTLP/HTTP to a
+collector running in this process on a loopback port, which decodes every
+export request and counts its spans. Export and collector share the CPU with
+the requests, as a sidecar collector would. Spans that end while the export
+queue is full are dropped, which the last column shows.
+
+``unexported`` is the previous setup: a bare ``TracerProvider`` that records
+every span and exports none. The ``ratio`` rows use the working tree's
+``init_tracing`` with ``TRACE_EXPORT_ENDPOINT`` pointed at the collector.
+
+Usage:
+    python scripts/benchmarks/trace_export.py
+    python scripts/benchmarks/trace_export.py --requests 20000 --ratios 0 0.01 0.1 1
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from _common import print_table, use_working_tree
+
+RATIOS = (0.0, 0.1, 1.0)
+
+
+class Collector(ThreadingHTTPServer):
+    """OTLP/HTTP trace receiver that counts the spans it is sent."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _CollectorHandler)
+        self.spans = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/traces"
+
+    def record(self, body: bytes) -> None:
+        from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+        request = ExportTraceServiceRequest.FromString(body)
+        spans = sum(len(scope.spans) for resource in request.resource_spans for scope in resource.scope_spans)
+        with self._lock:
+            self.requests += 1
+            self.spans += spans
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = self.requests = 0
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.server.record(self.rfile.read(int(self.headers["Content-Length"])))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def build_provider(ratio, endpoint: str):
+    from opentelemetry.sdk.trace import TracerProvider
+
+    from aion.server.opentelemetry.tracing import init_tracing
+    from aion.server.settings import AppSettings
+
+    if ratio is None:
+        return TracerProvider()
+    with patch("aion.server.opentelemetry.tracing.trace.set_tracer_provider"):
+        return init_tracing(AppSettings(TRACE_EXPORT_ENDPOINT=endpoint, TRACE_SAMPLE_RATIO=ratio))
+
+
+def run(provider, requests: int, children: int) -> float:
+    """Run ``requests`` simulated requests; return requests/sec."""
+    from opentelemetry.trace import SpanKind
+
+    tracer = provider.get_tracer("bench")
+    started = time.perf_counter()
+    for index in range(requests):
+        with tracer.start_as_current_span("POST /", kind=SpanKind.SERVER) as span:
+            span.set_attribute("a2a.rpc.method", "SendMessage")
+            for child in range(children):
+                with tracer.start_as_current_span(f"stage-{child}") as stage:
+                    stage.set_attribute("a2a.task.id", f"task-{index}")
+                    stage.set_attribute("a2a.context.id", "context-1")
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--children", type=int, default=6, help="Child spans per request")
+    parser.add_argument("--ratios", type=float, nargs="+", default=list(RATIOS))
+    args = parser.parse_args()
+
+    use_working_tree()
+    collector = Collector()
+    threading.Thread(target=collector.serve_forever, daemon=True).start()
+
+    rows = []
+    baseline = None
+    try:
+        for ratio in [None, *args.ratios]:
+            collector.reset()
+            provider = build_provider(ratio, collector.endpoint)
+            rate = run(provider, args.requests, args.children)
+            provider.shutdown()
+            baseline = baseline or rate
+            label = "unexported" if ratio is None else f"ratio {ratio:g}"
+            dropped = args.requests * (args.children + 1) - collector.spans if ratio == 1 else "-"
+            rows.append((label, rate, rate / baseline, collector.spans, collector.requests, dropped))
+    finally:
+        collector.shutdown()
+
+    print(f"\n{args.requests} requests of {args.children + 1} spans each\n")
+    print_table(["tracing", "requests/sec", "vs unexported", "spans exported", "export requests", "dropped"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())